@@ -27,144 +27,77 @@ External resources:
 .. _GitHub: https://github.com/PlotPyStack/PythonQwt
 """
 
-import warnings
-
-from qwt.color_map import QwtLinearColorMap  # noqa: F401
-from qwt.interval import QwtInterval
-from qwt.legend import QwtLegend, QwtLegendData, QwtLegendLabel  # noqa: F401
-from qwt.painter import QwtPainter  # noqa: F401
-from qwt.plot import QwtPlot  # noqa: F401
-from qwt.plot_canvas import QwtPlotCanvas  # noqa: F401
-from qwt.plot_curve import QwtPlotCurve as QPC  # see deprecated section
-from qwt.plot_curve import QwtPlotItem  # noqa: F401
-from qwt.plot_directpainter import QwtPlotDirectPainter  # noqa: F401
-from qwt.plot_grid import QwtPlotGrid as QPG  # see deprecated section
-from qwt.plot_marker import QwtPlotMarker  # noqa: F401
-from qwt.plot_renderer import QwtPlotRenderer  # noqa: F401
-from qwt.plot_series import (  # noqa: F401
-    QwtPlotSeriesItem,
-    QwtPointArrayData,
-    QwtSeriesData,
-    QwtSeriesStore,
-)
-from qwt.scale_div import QwtScaleDiv  # noqa: F401
-from qwt.scale_draw import (  # noqa: F401
-    QwtAbstractScaleDraw,
-    QwtDateTimeScaleDraw,
-    QwtScaleDraw,
-)
-from qwt.scale_engine import (  # noqa: F401
-    QwtDateTimeScaleEngine,
-    QwtLinearScaleEngine,
-    QwtLogScaleEngine,
-)
-from qwt.scale_map import QwtScaleMap  # noqa: F401
-from qwt.symbol import QwtSymbol as QSbl  # see deprecated section
-from qwt.text import QwtText  # noqa: F401
-from qwt.toqimage import array_to_qimage as toQImage  # noqa: F401
+import importlib
+import importlib.util
 
 __version__ = "0.16.3"
 QWT_VERSION_STR = "6.1.5"
 
-
-## ============================================================================
-## Deprecated classes and attributes (to be removed in next major release)
-## ============================================================================
-#  Remove deprecated QwtPlotItem.setAxis (replaced by setAxes)
-#  Remove deprecated QwtPlotCanvas.invalidatePaintCache (replaced by replot)
-## ============================================================================
-class QwtDoubleInterval(QwtInterval):
-    def __init__(self, minValue=0.0, maxValue=-1.0, borderFlags=None):
-        warnings.warn(
-            "`QwtDoubleInterval` has been removed in Qwt6: "
-            "please use `QwtInterval` instead",
-            RuntimeWarning,
-        )
-        super(QwtDoubleInterval, self).__init__(minValue, maxValue, borderFlags)
-
-
-## ============================================================================
-class QwtLog10ScaleEngine(QwtLogScaleEngine):
-    def __init__(self):
-        warnings.warn(
-            "`QwtLog10ScaleEngine` has been removed in Qwt6: "
-            "please use `QwtLogScaleEngine` instead",
-            RuntimeWarning,
-        )
-        super(QwtLog10ScaleEngine, self).__init__(10)
-
-
-## ============================================================================
-class QwtPlotPrintFilter(object):
-    def __init__(self):
-        raise NotImplementedError(
-            "`QwtPlotPrintFilter` has been removed in Qwt6: "
-            "please rely on `QwtPlotRenderer` instead"
-        )
-
-
-## ============================================================================
-class QwtPlotCurve(QPC):
-    @property
-    def Yfx(self):
-        raise NotImplementedError(
-            "`Yfx` attribute has been removed "
-            "(curve types are no longer implemented in Qwt6)"
-        )
-
-    @property
-    def Xfy(self):
-        raise NotImplementedError(
-            "`Yfx` attribute has been removed "
-            "(curve types are no longer implemented in Qwt6)"
-        )
-
-
-## ============================================================================
-class QwtSymbol(QSbl):
-    def draw(self, painter, *args):
-        warnings.warn(
-            "`draw` has been removed in Qwt6: "
-            "please rely on `drawSymbol` and `drawSymbols` instead",
-            RuntimeWarning,
-        )
-        from qtpy.QtCore import QPointF
-
-        if len(args) == 2:
-            self.drawSymbols(painter, [QPointF(*args)])
-        else:
-            self.drawSymbol(painter, *args)
-
-
-## ============================================================================
-class QwtPlotGrid(QPG):
-    def majPen(self):
-        warnings.warn(
-            "`majPen` has been removed in Qwt6: please use `majorPen` instead",
-            RuntimeWarning,
-        )
-        return self.majorPen()
-
-    def minPen(self):
-        warnings.warn(
-            "`minPen` has been removed in Qwt6: please use `minorPen` instead",
-            RuntimeWarning,
-        )
-        return self.minorPen()
-
-    def setMajPen(self, *args):
-        warnings.warn(
-            "`setMajPen` has been removed in Qwt6: please use `setMajorPen` instead",
-            RuntimeWarning,
-        )
-        return self.setMajorPen(*args)
-
-    def setMinPen(self, *args):
-        warnings.warn(
-            "`setMinPen` has been removed in Qwt6: please use `setMinorPen` instead",
-            RuntimeWarning,
-        )
-        return self.setMinorPen(*args)
-
-
-## ============================================================================
+# Public API: the submodules are only imported when one of their classes is
+# first accessed (PEP 562), so that importing `qwt` (or one of its lightweight
+# submodules, e.g. `qwt.scale_engine`) does not import the whole library
+_LAZY_EXPORTS = {
+    "QwtLinearColorMap": ("qwt.color_map", "QwtLinearColorMap"),
+    "QwtColumnSymbol": ("qwt.column_symbol", "QwtColumnSymbol"),
+    "QwtInterval": ("qwt.interval", "QwtInterval"),
+    "QwtLegend": ("qwt.legend", "QwtLegend"),
+    "QwtLegendData": ("qwt.legend", "QwtLegendData"),
+    "QwtLegendLabel": ("qwt.legend", "QwtLegendLabel"),
+    "QwtPainter": ("qwt.painter", "QwtPainter"),
+    "QwtPlot": ("qwt.plot", "QwtPlot"),
+    "QwtPlotCanvas": ("qwt.plot_canvas", "QwtPlotCanvas"),
+    "QwtCompactPlot": ("qwt.plot_compact", "QwtCompactPlot"),
+    "QwtHeadlessPlot": ("qwt.plot_headless", "QwtHeadlessPlot"),
+    "QwtPlotItem": ("qwt.plot_curve", "QwtPlotItem"),
+    "QwtPlotHistogram": ("qwt.plot_histogram", "QwtPlotHistogram"),
+    "QwtPlotDirectPainter": ("qwt.plot_directpainter", "QwtPlotDirectPainter"),
+    "QwtIntervalSymbol": ("qwt.plot_intervalcurve", "QwtIntervalSymbol"),
+    "QwtPlotIntervalCurve": ("qwt.plot_intervalcurve", "QwtPlotIntervalCurve"),
+    "QwtPlotMarker": ("qwt.plot_marker", "QwtPlotMarker"),
+    "QwtPlotRenderer": ("qwt.plot_renderer", "QwtPlotRenderer"),
+    "QwtIntervalArrayData": ("qwt.plot_series", "QwtIntervalArrayData"),
+    "QwtIntervalSample": ("qwt.plot_series", "QwtIntervalSample"),
+    "QwtPlotSeriesItem": ("qwt.plot_series", "QwtPlotSeriesItem"),
+    "QwtPointArrayData": ("qwt.plot_series", "QwtPointArrayData"),
+    "QwtSeriesData": ("qwt.plot_series", "QwtSeriesData"),
+    "QwtSeriesStore": ("qwt.plot_series", "QwtSeriesStore"),
+    "QwtScaleDiv": ("qwt.scale_div", "QwtScaleDiv"),
+    "QwtAbstractScaleDraw": ("qwt.scale_draw", "QwtAbstractScaleDraw"),
+    "QwtDateTimeScaleDraw": ("qwt.scale_draw", "QwtDateTimeScaleDraw"),
+    "QwtScaleDraw": ("qwt.scale_draw", "QwtScaleDraw"),
+    "QwtDateTimeScaleEngine": ("qwt.scale_engine", "QwtDateTimeScaleEngine"),
+    "QwtLinearScaleEngine": ("qwt.scale_engine", "QwtLinearScaleEngine"),
+    "QwtLogScaleEngine": ("qwt.scale_engine", "QwtLogScaleEngine"),
+    "QwtScaleMap": ("qwt.scale_map", "QwtScaleMap"),
+    "QwtText": ("qwt.text", "QwtText"),
+    "toQImage": ("qwt.toqimage", "array_to_qimage"),
+    # Deprecated classes and attributes (to be removed in next major release)
+    "QwtDoubleInterval": ("qwt._deprecated", "QwtDoubleInterval"),
+    "QwtLog10ScaleEngine": ("qwt._deprecated", "QwtLog10ScaleEngine"),
+    "QwtPlotPrintFilter": ("qwt._deprecated", "QwtPlotPrintFilter"),
+    "QwtPlotCurve": ("qwt._deprecated", "QwtPlotCurve"),
+    "QwtSymbol": ("qwt._deprecated", "QwtSymbol"),
+    "QwtPlotGrid": ("qwt._deprecated", "QwtPlotGrid"),
+}
+
+__all__ = ["QWT_VERSION_STR"] + list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    try:
+        modname, attrname = _LAZY_EXPORTS[name]
+    except KeyError:
+        # Submodules used to be imported with the package (e.g. `qwt.plot`)
+        modname = f"{__name__}.{name}"
+        if importlib.util.find_spec(modname) is None:
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}"
+            ) from None
+        return importlib.import_module(modname)
+    value = getattr(importlib.import_module(modname), attrname)
+    globals()[name] = value  # Next accesses won't go through __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the Qwt License
+# Copyright (c) 2002 Uwe Rathmann, for the original C++ code
+# Copyright (c) 2015 Pierre Raybaut, for the Python translation/optimization
+# (see LICENSE file for more details)
+
+"""
+Deprecated classes, exported by the `qwt` package for backward compatibility
+"""
+
+import warnings
+
+from qwt.interval import QwtInterval
+from qwt.plot_curve import QwtPlotCurve as QPC
+from qwt.plot_grid import QwtPlotGrid as QPG
+from qwt.scale_engine import QwtLogScaleEngine
+from qwt.symbol import QwtSymbol as QSbl
+
+
+## ============================================================================
+## Deprecated classes and attributes (to be removed in next major release)
+## ============================================================================
+#  Remove deprecated QwtPlotItem.setAxis (replaced by setAxes)
+#  Remove deprecated QwtPlotCanvas.invalidatePaintCache (replaced by replot)
+## ============================================================================
+class QwtDoubleInterval(QwtInterval):
+    def __init__(self, minValue=0.0, maxValue=-1.0, borderFlags=None):
+        warnings.warn(
+            "`QwtDoubleInterval` has been removed in Qwt6: "
+            "please use `QwtInterval` instead",
+            RuntimeWarning,
+        )
+        super(QwtDoubleInterval, self).__init__(minValue, maxValue, borderFlags)
+
+
+## ============================================================================
+class QwtLog10ScaleEngine(QwtLogScaleEngine):
+    def __init__(self):
+        warnings.warn(
+            "`QwtLog10ScaleEngine` has been removed in Qwt6: "
+            "please use `QwtLogScaleEngine` instead",
+            RuntimeWarning,
+        )
+        super(QwtLog10ScaleEngine, self).__init__(10)
+
+
+## ============================================================================
+class QwtPlotPrintFilter(object):
+    def __init__(self):
+        raise NotImplementedError(
+            "`QwtPlotPrintFilter` has been removed in Qwt6: "
+            "please rely on `QwtPlotRenderer` instead"
+        )
+
+
+## ============================================================================
+class QwtPlotCurve(QPC):
+    @property
+    def Yfx(self):
+        raise NotImplementedError(
+            "`Yfx` attribute has been removed "
+            "(curve types are no longer implemented in Qwt6)"
+        )
+
+    @property
+    def Xfy(self):
+        raise NotImplementedError(
+            "`Yfx` attribute has been removed "
+            "(curve types are no longer implemented in Qwt6)"
+        )
+
+
+## ============================================================================
+class QwtSymbol(QSbl):
+    def draw(self, painter, *args):
+        warnings.warn(
+            "`draw` has been removed in Qwt6: "
+            "please rely on `drawSymbol` and `drawSymbols` instead",
+            RuntimeWarning,
+        )
+        from qtpy.QtCore import QPointF
+
+        if len(args) == 2:
+            self.drawSymbols(painter, [QPointF(*args)])
+        else:
+            self.drawSymbol(painter, *args)
+
+
+## ============================================================================
+class QwtPlotGrid(QPG):
+    def majPen(self):
+        warnings.warn(
+            "`majPen` has been removed in Qwt6: please use `majorPen` instead",
+            RuntimeWarning,
+        )
+        return self.majorPen()
+
+    def minPen(self):
+        warnings.warn(
+            "`minPen` has been removed in Qwt6: please use `minorPen` instead",
+            RuntimeWarning,
+        )
+        return self.minorPen()
+
+    def setMajPen(self, *args):
+        warnings.warn(
+            "`setMajPen` has been removed in Qwt6: please use `setMajorPen` instead",
+            RuntimeWarning,
+        )
+        return self.setMajorPen(*args)
+
+    def setMinPen(self, *args):
+        warnings.warn(
+            "`setMinPen` has been removed in Qwt6: please use `setMinorPen` instead",
+            RuntimeWarning,
+        )
+        return self.setMinorPen(*args)
+
+
+## ============================================================================
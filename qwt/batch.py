@@ -0,0 +1,358 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the Qwt License
+# (see LICENSE file for more details)
+
+"""
+Batch export
+------------
+
+Headless export of many plots to files (PNG, SVG, PDF, ...), in a pool of
+worker processes.
+
+Each plot is described by a *plot spec*: a dictionary giving the file name
+and the content of the plot. Specs only contain basic types and arrays, so
+that they may be written in JSON files or pickled::
+
+    {
+        "filename": "sine.png",
+        "size": [800, 600],
+        "title": "Sine",
+        "grid": {},
+        "legend": "right",
+        "axes": {"bottom": {"title": "Time (s)"}, "left": {"scale": [-1, 1]}},
+        "curves": [
+            {"xdata": x, "ydata": y, "title": "sin(x)", "linecolor": "red"}
+        ],
+    }
+
+Supported keys:
+
+  * `filename` (required): output file name, the format is given by its
+    extension unless `format` is set
+  * `size` (default: `[800, 600]`) and `resolution` (default: 85 dpi):
+    size of the exported plot, in pixels (see :py:meth:`qwt.plot.QwtPlot.exportTo()`)
+  * `title`, `footer`: title and footer of the plot
+  * `background`: canvas background color
+  * `legend`: legend position (`"left"`, `"right"`, `"bottom"` or `"top"`)
+  * `grid`: keyword arguments of :py:meth:`qwt.plot_grid.QwtPlotGrid.make()`
+  * `axes`: axes options (`enabled`, `title`, `scale` as `[min, max]`, `log`), keyed
+    on the axis name (`"left"`, `"right"`, `"bottom"` or `"top"`)
+  * `curves`: list of keyword arguments of :py:meth:`qwt.plot_curve.QwtPlotCurve.make()`,
+    where `style` may be the name of a curve style (e.g. `"Sticks"`),
+    `linestyle` the name of a pen style (e.g. `"DashLine"`) and `x_axis`
+    and `y_axis` axis names (the axes of the curves are enabled)
+  * `factory`: function building the plot (a picklable callable or a
+    `"module:function"` string), called with the spec and returning a
+    :py:class:`qwt.plot.QwtPlot`: the other content keys are then ignored
+
+The workers use the `offscreen` Qt platform plugin by default (no display
+is required) and create one `QApplication` each, which is reused for all
+the plots they export::
+
+    from qwt import batch
+
+    report = batch.export_batch(specs, processes=8)
+    print(report["throughput"], "plots/s")
+
+The same is available from the command line, the specs being read from a
+JSON file or a pickle file (list of specs)::
+
+    python -m qwt.batch specs.json --processes 8 --output-dir report
+
+.. autofunction:: export_batch
+
+.. autofunction:: export_plot
+
+.. autofunction:: build_plot
+
+.. autofunction:: load_specs
+"""
+
+import argparse
+import importlib
+import json
+import multiprocessing
+import os
+import os.path as osp
+import pickle
+import sys
+import time
+import traceback
+
+#: Default size of the exported plots, in pixels
+DEFAULT_SIZE = (800, 600)
+
+#: Default resolution of the exported plots, in dots per inch
+DEFAULT_RESOLUTION = 85
+
+AXIS_NAMES = ("left", "right", "bottom", "top")  # same order as `QwtPlot.AXES`
+
+_APP = None
+
+
+def _init_worker():
+    global _APP
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from qtpy.QtWidgets import QApplication
+
+    _APP = QApplication.instance() or QApplication([])
+
+
+def _resolve_factory(factory):
+    if isinstance(factory, str):
+        module, name = factory.split(":")
+        factory = getattr(importlib.import_module(module), name)
+    return factory
+
+
+def build_plot(spec, headless=False):
+    """
+    Build a plot from a plot spec (a `QApplication` must exist)
+
+    Headless plots are rendered directly into images (see
+    :py:class:`qwt.plot_headless.QwtHeadlessPlot`): a `QGuiApplication` is
+    enough and the `legend` key is ignored.
+
+    :param dict spec: Plot spec
+    :param bool headless: If True, build a headless plot
+    :return: Plot (`qwt.plot.QwtPlot` or `qwt.plot_headless.QwtHeadlessPlot` instance)
+    """
+    from qtpy.QtCore import Qt
+    from qtpy.QtGui import QColor
+
+    from qwt.legend import QwtLegend
+    from qwt.plot import QwtPlot
+    from qwt.plot_curve import QwtPlotCurve
+    from qwt.plot_grid import QwtPlotGrid
+    from qwt.plot_headless import QwtHeadlessPlot
+    from qwt.scale_engine import QwtLogScaleEngine
+
+    if spec.get("factory") is not None:
+        return _resolve_factory(spec["factory"])(spec)
+    axes = dict(zip(AXIS_NAMES, QwtPlot.AXES))
+    plot = (QwtHeadlessPlot if headless else QwtPlot)(spec.get("title", ""))
+    if spec.get("footer"):
+        plot.setFooter(spec["footer"])
+    if spec.get("background") is not None:
+        plot.setCanvasBackground(QColor(spec["background"]))
+    if spec.get("grid") is not None:
+        QwtPlotGrid.make(plot, **spec["grid"])
+    for kwargs in spec.get("curves", ()):
+        kwargs = dict(kwargs)
+        if isinstance(kwargs.get("style"), str):
+            kwargs["style"] = getattr(QwtPlotCurve, kwargs["style"])
+        if isinstance(kwargs.get("linestyle"), str):
+            kwargs["linestyle"] = getattr(Qt, kwargs["linestyle"])
+        for key in ("x_axis", "y_axis"):
+            if isinstance(kwargs.get(key), str):
+                kwargs[key] = axes[kwargs[key]]
+        curve = QwtPlotCurve.make(plot=plot, **kwargs)
+        plot.enableAxis(curve.xAxis())
+        plot.enableAxis(curve.yAxis())
+    for name, options in spec.get("axes", {}).items():
+        axisId = axes[name]
+        plot.enableAxis(axisId, options.get("enabled", True))
+        if options.get("title") is not None:
+            plot.setAxisTitle(axisId, options["title"])
+        if options.get("log"):
+            plot.setAxisScaleEngine(axisId, QwtLogScaleEngine())
+        if options.get("scale") is not None:
+            plot.setAxisScale(axisId, *options["scale"])
+    if spec.get("legend") is not None and not headless:
+        position = {
+            "left": QwtPlot.LeftLegend,
+            "right": QwtPlot.RightLegend,
+            "bottom": QwtPlot.BottomLegend,
+            "top": QwtPlot.TopLegend,
+        }[spec["legend"]]
+        plot.insertLegend(QwtLegend(), position)
+    return plot
+
+
+def export_plot(spec, output_dir=None):
+    """
+    Build a plot from a plot spec and export it, in the current process
+
+    Errors are reported in the result instead of being raised, so that a
+    bad spec doesn't stop a batch.
+
+    :param dict spec: Plot spec
+    :param str output_dir: Directory of the relative file names, or None
+    :return: Result (dictionary with `filename`, `seconds`, `bytes` and `error` keys, `error` being None or the traceback of the error)
+    """
+    from qtpy.QtCore import QEvent
+
+    if _APP is None:
+        _init_worker()
+    t0 = time.perf_counter()
+    filename = spec.get("filename")
+    if filename is not None and output_dir is not None:
+        filename = osp.join(output_dir, filename)
+    result = {"filename": filename, "seconds": None, "bytes": None, "error": None}
+    try:
+        if filename is None:
+            raise ValueError("Missing filename in plot spec")
+        dirname = osp.dirname(osp.abspath(filename))
+        os.makedirs(dirname, exist_ok=True)
+        plot = build_plot(spec)
+        plot.replot()  # the scale divisions are updated when replotting
+        plot.exportTo(
+            filename,
+            size=tuple(spec.get("size", DEFAULT_SIZE)),
+            resolution=spec.get("resolution", DEFAULT_RESOLUTION),
+            format_=spec.get("format"),
+        )
+        del plot
+        # No event loop is running: delete the widgets scheduled for deletion
+        _APP.sendPostedEvents(None, QEvent.DeferredDelete)
+        result["bytes"] = osp.getsize(filename)
+    except Exception:
+        result["error"] = traceback.format_exc()
+    result["seconds"] = time.perf_counter() - t0
+    return result
+
+
+def _export_indexed(args):
+    index, spec, output_dir = args
+    return index, export_plot(spec, output_dir)
+
+
+def export_batch(specs, processes=None, output_dir=None, chunksize=1, stream=None):
+    """
+    Export plots in a pool of worker processes
+
+    The workers are started with the `spawn` method (the Qt state of the
+    calling process is not inherited) and each one creates a
+    `QApplication`, reused for all the plots it exports.
+
+    :param list specs: Plot specs (see :py:func:`build_plot()`)
+    :param int processes: Number of worker processes (default: number of CPUs), 0 to export in the current process
+    :param str output_dir: Directory of the relative file names, or None
+    :param int chunksize: Number of specs sent to a worker at once
+    :param stream: Stream where progress is written (e.g. `sys.stdout`), or None
+    :return: Report (dictionary with `metadata`, `processes`, `plots`, `failed`, `elapsed` (seconds), `throughput` (plots per second) and `results` (see :py:func:`export_plot()`, in the order of the specs) keys)
+    """
+    from qwt.benchmarks import environment_info
+
+    if processes is None:
+        processes = os.cpu_count() or 1
+    tasks = [(index, spec, output_dir) for index, spec in enumerate(specs)]
+    results = [None] * len(tasks)
+    t0 = time.perf_counter()
+    if processes == 0:
+        outcomes = map(_export_indexed, tasks)
+        pool = None
+    else:
+        context = multiprocessing.get_context("spawn")
+        pool = context.Pool(processes, initializer=_init_worker)
+        outcomes = pool.imap_unordered(_export_indexed, tasks, chunksize)
+    try:
+        for done, (index, result) in enumerate(outcomes, 1):
+            results[index] = result
+            if stream is not None:
+                status = "FAILED" if result["error"] else "%.3f s" % result["seconds"]
+                stream.write(
+                    "[%d/%d] %s %s\n" % (done, len(tasks), result["filename"], status)
+                )
+                stream.flush()
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+    elapsed = time.perf_counter() - t0
+    return {
+        "metadata": environment_info(),
+        "processes": processes,
+        "plots": len(results),
+        "failed": sum(1 for result in results if result["error"]),
+        "elapsed": elapsed,
+        "throughput": len(results) / elapsed if elapsed > 0.0 else None,
+        "results": results,
+    }
+
+
+def load_specs(filename):
+    """
+    Load plot specs from a JSON file or from a pickle file (`.pkl` or
+    `.pickle` extension)
+
+    :param str filename: File name
+    :return: List of plot specs
+    """
+    if osp.splitext(filename)[1].lower() in (".pkl", ".pickle"):
+        with open(filename, "rb") as fdesc:
+            specs = pickle.load(fdesc)
+    else:
+        with open(filename) as fdesc:
+            specs = json.load(fdesc)
+    if isinstance(specs, dict):
+        specs = [specs]
+    return specs
+
+
+def main(args=None):
+    """
+    Export plots from the command line
+
+    :param list args: Command line arguments (default: `sys.argv[1:]`)
+    :return: Exit code (1 if an export failed)
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m qwt.batch", description="PythonQwt batch export"
+    )
+    parser.add_argument("specs", nargs="+", help="JSON or pickle files of plot specs")
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=None,
+        help="worker processes, 0 to export in this process (default: CPU count)",
+    )
+    parser.add_argument("--output-dir", help="directory of the relative file names")
+    parser.add_argument(
+        "--format", help="file format overriding the file name extensions"
+    )
+    parser.add_argument(
+        "--chunksize",
+        type=int,
+        default=1,
+        help="specs sent to a worker at once (default: %(default)s)",
+    )
+    parser.add_argument("--report", help="save the export report to this JSON file")
+    parser.add_argument("--quiet", action="store_true", help="don't show progress")
+    options = parser.parse_args(args)
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+    specs = []
+    for filename in options.specs:
+        specs += load_specs(filename)
+    if options.format:
+        specs = [dict(spec, format=options.format) for spec in specs]
+    report = export_batch(
+        specs,
+        processes=options.processes,
+        output_dir=options.output_dir,
+        chunksize=options.chunksize,
+        stream=None if options.quiet else sys.stdout,
+    )
+    for result in report["results"]:
+        if result["error"]:
+            sys.stderr.write("%s:\n%s\n" % (result["filename"], result["error"]))
+    print(
+        "%d plots exported in %.2f s with %d process(es): %.1f plots/s, %d failed"
+        % (
+            report["plots"] - report["failed"],
+            report["elapsed"],
+            report["processes"],
+            report["throughput"] or 0.0,
+            report["failed"],
+        )
+    )
+    if options.report:
+        with open(options.report, "w") as fdesc:
+            json.dump(report, fdesc, indent=2)
+    return 1 if report["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
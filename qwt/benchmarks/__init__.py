@@ -0,0 +1,315 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the Qwt License
+# (see LICENSE file for more details)
+
+"""
+PythonQwt benchmarks
+====================
+
+Headless benchmark suite of PythonQwt, running on any platform (the `offscreen`
+Qt platform plugin is used by default, so that no display is required).
+
+Run the micro-benchmarks and save the results to a JSON file::
+
+    python -m qwt.benchmarks --output baseline.json
+
+Then, after changing the code, compare the new results to this baseline (the
+exit code is 1 if a benchmark is slower than the baseline by more than the
+threshold)::
+
+    python -m qwt.benchmarks --compare baseline.json --threshold 0.2
+
+Use ``--filter`` to select benchmarks (e.g. ``--filter symbol``), ``--quick``
+to only run each benchmark with its smallest data size and ``--help`` for the
+other options.
+
+The scenario benchmarks (see :py:mod:`qwt.benchmarks.scenarios`) measure the
+frame rate, the frame times and the peak memory of end-to-end workloads, and
+may be run with several Qt bindings::
+
+    python -m qwt.benchmarks scenarios --bindings pyqt5 pyside6 --output s.json
+
+The results are only comparable between runs on the same machine, with the
+same Qt binding: the Qt binding and versions are saved in the ``metadata``
+section of the JSON file.
+
+.. autofunction:: time_function
+
+.. autofunction:: run_benchmarks
+
+.. autofunction:: compare_results
+"""
+
+import argparse
+import json
+import os
+import platform
+import re
+import statistics
+import sys
+import time
+
+#: Default ratio above which a benchmark is considered as a regression
+DEFAULT_THRESHOLD = 0.2
+
+
+def time_function(func, repeat=5, min_time=0.05):
+    """
+    Time a function
+
+    The function is called once (warm-up), then the number of calls per
+    sample is adjusted so that each sample takes at least `min_time` seconds.
+
+    :param callable func: Function to be timed (no argument)
+    :param int repeat: Number of samples
+    :param float min_time: Minimum duration of a sample, in seconds
+    :return: Timing statistics, in seconds per call (dictionary with `min`, `median`, `mean`, `loops` and `repeat` keys)
+    """
+    func()
+    loops = 1
+    while True:
+        t0 = time.perf_counter()
+        for _i in range(loops):
+            func()
+        elapsed = time.perf_counter() - t0
+        if elapsed >= min_time:
+            break
+        if elapsed > 0.0:
+            loops = max(2 * loops, int(1.2 * loops * min_time / elapsed))
+        else:
+            loops *= 10
+    samples = [elapsed / loops]
+    for _i in range(repeat - 1):
+        t0 = time.perf_counter()
+        for _j in range(loops):
+            func()
+        samples.append((time.perf_counter() - t0) / loops)
+    return {
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.mean(samples),
+        "loops": loops,
+        "repeat": repeat,
+    }
+
+
+def environment_info():
+    """
+    :return: Dictionary describing the benchmark environment
+    """
+    import numpy as np
+    import qtpy
+
+    import qwt
+
+    binding_version = qtpy.PYSIDE_VERSION
+    if binding_version is None:
+        binding_version = qtpy.PYQT_VERSION
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "qwt": qwt.__version__,
+        "qt_api": qtpy.API_NAME,
+        "qt_binding": binding_version,
+        "qt": qtpy.QT_VERSION,
+        "qpa_platform": os.environ.get("QT_QPA_PLATFORM", ""),
+        "numpy": np.__version__,
+        "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+    }
+
+
+def benchmark_name(name, size):
+    """
+    :param str name: Benchmark name
+    :param size: Data size, or None
+    :return: Name of the benchmark for the data size (e.g. `replot[1000]`)
+    """
+    return name if size is None else "%s[%d]" % (name, size)
+
+
+def run_benchmarks(
+    benchmarks, pattern=None, quick=False, repeat=5, min_time=0.05, stream=None
+):
+    """
+    Run benchmarks
+
+    Each benchmark is a tuple `(name, setup, sizes)`: `setup(size)` prepares
+    the data for the data size `size` (an element of `sizes`, which may be
+    `(None,)`) and returns the function to be timed.
+
+    :param list benchmarks: Benchmarks
+    :param str pattern: Regular expression selecting the benchmarks by name
+    :param bool quick: If True, only run each benchmark with its smallest data size
+    :param int repeat: Number of samples
+    :param float min_time: Minimum duration of a sample, in seconds
+    :param stream: Stream where progress is written (e.g. `sys.stdout`), or None
+    :return: Results (dictionary with `metadata` and `results` keys)
+    """
+    from qtpy.QtWidgets import QApplication
+
+    app = QApplication.instance() or QApplication([])  # noqa: F841
+    regexp = None if pattern is None else re.compile(pattern)
+    results = {}
+    for name, setup, sizes in benchmarks:
+        if quick:
+            sizes = sizes[:1]
+        for size in sizes:
+            key = benchmark_name(name, size)
+            if regexp is not None and not regexp.search(key):
+                continue
+            func = setup(size)
+            results[key] = stats = time_function(func, repeat, min_time)
+            if stream is not None:
+                stream.write("%-48s %s\n" % (key, format_time(stats["median"])))
+                stream.flush()
+    return {"metadata": environment_info(), "results": results}
+
+
+def compare_results(baseline, results, threshold=DEFAULT_THRESHOLD):
+    """
+    Compare benchmark results to a baseline
+
+    The median times are compared: a benchmark is a regression if it is
+    slower than the baseline by more than `threshold` (relative), and an
+    improvement if it is faster by more than `threshold`.
+
+    :param dict baseline: Baseline results (see :py:func:`run_benchmarks()`)
+    :param dict results: New results
+    :param float threshold: Relative tolerance
+    :return: List of `(name, baseline_time, time, ratio, status)` tuples, where status is one of `"ok"`, `"regression"`, `"improvement"`, `"new"` or `"missing"`
+    """
+    old, new = baseline["results"], results["results"]
+    comparison = []
+    for name in list(old) + [name for name in new if name not in old]:
+        if name not in new:
+            comparison.append((name, old[name]["median"], None, None, "missing"))
+            continue
+        if name not in old:
+            comparison.append((name, None, new[name]["median"], None, "new"))
+            continue
+        told, tnew = old[name]["median"], new[name]["median"]
+        ratio = tnew / told if told > 0.0 else float("inf")
+        if ratio > 1.0 + threshold:
+            status = "regression"
+        elif ratio < 1.0 / (1.0 + threshold):
+            status = "improvement"
+        else:
+            status = "ok"
+        comparison.append((name, told, tnew, ratio, status))
+    return comparison
+
+
+def format_time(seconds):
+    """
+    :param seconds: Duration in seconds, or None
+    :return: Human-readable duration
+    """
+    if seconds is None:
+        return "-"
+    for unit, factor in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= factor:
+            return "%.3g %s" % (seconds / factor, unit)
+    return "%.3g ns" % (seconds * 1e9)
+
+
+def format_comparison(comparison):
+    """
+    :param list comparison: Comparison (see :py:func:`compare_results()`)
+    :return: Comparison table, as text
+    """
+    lines = ["%-48s %10s %10s %8s  %s" % ("Benchmark", "Baseline", "Time", "Ratio", "")]
+    for name, told, tnew, ratio, status in comparison:
+        lines.append(
+            "%-48s %10s %10s %8s  %s"
+            % (
+                name,
+                format_time(told),
+                format_time(tnew),
+                "-" if ratio is None else "%.2f" % ratio,
+                "" if status == "ok" else status.upper(),
+            )
+        )
+    return os.linesep.join(lines)
+
+
+def main(args=None):
+    """
+    Run the benchmark suite from the command line
+
+    :param list args: Command line arguments (default: `sys.argv[1:]`)
+    :return: Exit code (1 if a regression was found in compare mode)
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m qwt.benchmarks", description="PythonQwt benchmarks"
+    )
+    parser.add_argument(
+        "suite",
+        nargs="?",
+        default="micro",
+        choices=("micro", "scenarios"),
+        help="benchmark suite (default: %(default)s)",
+    )
+    parser.add_argument("--output", help="save results to this JSON file")
+    parser.add_argument(
+        "--compare", metavar="BASELINE", help="compare results to a JSON baseline"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="relative slowdown flagged as a regression (default: %(default)s)",
+    )
+    parser.add_argument("--filter", help="regular expression selecting benchmarks")
+    parser.add_argument("--quick", action="store_true", help="smallest data size only")
+    parser.add_argument(
+        "--bindings",
+        nargs="+",
+        metavar="QT_API",
+        help="Qt bindings of the scenarios (default: current binding)",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="samples (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.05,
+        help="minimum sample duration in seconds (default: %(default)s)",
+    )
+    options = parser.parse_args(args)
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+    if options.suite == "scenarios":
+        from qwt.benchmarks.scenarios import run_scenarios
+
+        results = run_scenarios(
+            pattern=options.filter,
+            bindings=options.bindings,
+            quick=options.quick,
+            stream=sys.stdout,
+        )
+    else:
+        from qwt.benchmarks.micro import MICRO_BENCHMARKS
+
+        results = run_benchmarks(
+            MICRO_BENCHMARKS,
+            pattern=options.filter,
+            quick=options.quick,
+            repeat=options.repeat,
+            min_time=options.min_time,
+            stream=sys.stdout,
+        )
+    if options.output:
+        with open(options.output, "w") as fdesc:
+            json.dump(results, fdesc, indent=2)
+    if options.compare:
+        with open(options.compare) as fdesc:
+            baseline = json.load(fdesc)
+        comparison = compare_results(baseline, results, options.threshold)
+        print()
+        print(format_comparison(comparison))
+        if any(row[-1] == "regression" for row in comparison):
+            return 1
+    return 0
@@ -0,0 +1,10 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the Qwt License
+# (see LICENSE file for more details)
+
+import sys
+
+from qwt.benchmarks import main
+
+sys.exit(main())
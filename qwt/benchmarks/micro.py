@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the Qwt License
+# (see LICENSE file for more details)
+
+"""
+Micro-benchmarks of the PythonQwt hot paths
+
+Each benchmark is defined by a setup function, which takes the data size as
+argument and returns the function to be timed (see
+:py:func:`qwt.benchmarks.run_benchmarks()`).
+"""
+
+import numpy as np
+from qtpy.QtCore import QPointF, QRectF, QSize, Qt
+from qtpy.QtGui import QBrush, QFont, QImage, QPainter, QPen, QPolygonF
+from qtpy.QtWidgets import QApplication
+
+from qwt.legend import QwtLegend
+from qwt.plot import QwtPlot
+from qwt.plot_canvas import QwtPlotCanvas
+from qwt.plot_curve import QwtPlotCurve, series_to_polyline
+from qwt.plot_series import QwtPointArrayData
+from qwt.scale_draw import QwtDateTimeScaleDraw, QwtScaleDraw
+from qwt.scale_engine import (
+    QwtDateTimeScaleEngine,
+    QwtLinearScaleEngine,
+    QwtLogScaleEngine,
+)
+from qwt.scale_map import QwtScaleMap
+from qwt.symbol import QwtSymbol
+from qwt.transform import QwtLogTransform
+
+ARRAY_SIZES = (1000, 100000, 1000000)
+SYMBOL_SIZES = (100, 1000, 10000)
+LABEL_SIZES = (10, 100)
+
+SYMBOL_STYLES = (
+    "Ellipse",
+    "Rect",
+    "Diamond",
+    "Triangle",
+    "DTriangle",
+    "UTriangle",
+    "LTriangle",
+    "RTriangle",
+    "Cross",
+    "XCross",
+    "HLine",
+    "VLine",
+    "Star1",
+    "Star2",
+    "Hexagon",
+)
+
+
+def _scale_map(log=False):
+    xMap = QwtScaleMap()
+    if log:
+        xMap.setTransformation(QwtLogTransform())
+        xMap.setScaleInterval(1e-3, 1e3)
+    else:
+        xMap.setScaleInterval(-1.0, 1.0)
+    xMap.setPaintInterval(0.0, 1000.0)
+    return xMap
+
+
+def _random_data(size, positive=False):
+    rng = np.random.default_rng(0)
+    if positive:
+        return 10.0 ** rng.uniform(-3.0, 3.0, size)
+    return rng.uniform(-1.0, 1.0, size)
+
+
+def setup_scale_map_transform(size):
+    xMap, data = _scale_map(), _random_data(size)
+    return lambda: xMap.transform(data)
+
+
+def setup_scale_map_transform_log(size):
+    xMap, data = _scale_map(log=True), _random_data(size, positive=True)
+    return lambda: xMap.transform(data)
+
+
+def setup_series_to_polyline(size):
+    xMap, yMap = _scale_map(), _scale_map()
+    series = QwtPointArrayData(np.linspace(-1.0, 1.0, size), _random_data(size))
+    polyline = QPolygonF()
+    return lambda: series_to_polyline(xMap, yMap, series, 0, size - 1, polyline)
+
+
+def _setup_symbol(style):
+    def setup(size):
+        symbol = QwtSymbol(
+            getattr(QwtSymbol, style),
+            QBrush(Qt.yellow),
+            QPen(Qt.blue),
+            QSize(8, 8),
+        )
+        rng = np.random.default_rng(0)
+        xy = rng.uniform(0.0, 400.0, (size, 2))
+        points = QPolygonF([QPointF(x, y) for x, y in xy])
+        image = QImage(400, 400, QImage.Format_ARGB32_Premultiplied)
+        image.fill(Qt.white)
+
+        def func():
+            painter = QPainter(image)
+            symbol.drawSymbols(painter, points)
+            painter.end()
+
+        return func
+
+    return setup
+
+
+def _setup_divide_scale(engine, x1, x2):
+    def setup(size):
+        intervals = [(x1, x1 + (x2 - x1) * (1 + i)) for i in range(10)]
+
+        def func():
+            for v1, v2 in intervals:
+                engine.divideScale(v1, v2, 8, 5)
+
+        return func
+
+    return setup
+
+
+def _setup_tick_label(scaleDrawClass, offset, cached):
+    def setup(size):
+        scaleDraw = scaleDrawClass()
+        font = QFont()
+        values = [offset + float(i) for i in range(size)]
+
+        def func():
+            if not cached:
+                scaleDraw.labelCache().clear()
+            for value in values:
+                scaleDraw.tickLabel(font, value)
+
+        return func
+
+    return setup
+
+
+def _make_plot(size=1000):
+    plot = QwtPlot("Benchmark")
+    plot.setAxisTitle(QwtPlot.xBottom, "Time (s)")
+    plot.setAxisTitle(QwtPlot.yLeft, "Amplitude")
+    plot.insertLegend(QwtLegend(), QwtPlot.RightLegend)
+    x = np.linspace(0.0, 100.0, size)
+    QwtPlotCurve.make(x, np.sin(x), "Sine", plot, linecolor="blue")
+    QwtPlotCurve.make(x, np.cos(x), "Cosine", plot, linecolor="red")
+    plot.resize(800, 600)
+    return plot
+
+
+def setup_layout_activate(size):
+    plot = _make_plot()
+    plot.replot()
+    layout = plot.plotLayout()
+
+    def func():
+        # Invalidating the layout also resets its memoized state
+        layout.invalidate()
+        layout.activate(plot, QRectF(plot.contentsRect()))
+
+    return func
+
+
+def setup_replot(size):
+    plot = _make_plot(size)
+    plot.canvas().setPaintAttribute(QwtPlotCanvas.ImmediatePaint, True)
+    plot.show()
+    # The canvas is only repainted once the window has been exposed
+    QApplication.processEvents()
+
+    def func():
+        plot.replot()
+
+    func.plot = plot  # Keep the plot alive as long as the function
+    return func
+
+
+MICRO_BENCHMARKS = [
+    ("scale_map.transform", setup_scale_map_transform, ARRAY_SIZES),
+    ("scale_map.transform.log", setup_scale_map_transform_log, ARRAY_SIZES),
+    ("series_to_polyline", setup_series_to_polyline, ARRAY_SIZES),
+]
+MICRO_BENCHMARKS += [
+    ("symbol.%s" % style.lower(), _setup_symbol(style), SYMBOL_SIZES)
+    for style in SYMBOL_STYLES
+]
+MICRO_BENCHMARKS += [
+    (
+        "scale_engine.divideScale.linear",
+        _setup_divide_scale(QwtLinearScaleEngine(), -1.0, 1.0),
+        (None,),
+    ),
+    (
+        "scale_engine.divideScale.log",
+        _setup_divide_scale(QwtLogScaleEngine(), 1e-3, 1e3),
+        (None,),
+    ),
+    (
+        "scale_engine.divideScale.datetime",
+        _setup_divide_scale(QwtDateTimeScaleEngine(), 1.7e9, 1.7e9 + 86400.0),
+        (None,),
+    ),
+    (
+        "scale_draw.tickLabel",
+        _setup_tick_label(QwtScaleDraw, 0.0, False),
+        LABEL_SIZES,
+    ),
+    (
+        "scale_draw.tickLabel.cached",
+        _setup_tick_label(QwtScaleDraw, 0.0, True),
+        LABEL_SIZES,
+    ),
+    (
+        "scale_draw.tickLabel.datetime",
+        _setup_tick_label(QwtDateTimeScaleDraw, 1.7e9, False),
+        LABEL_SIZES,
+    ),
+    ("plot_layout.activate", setup_layout_activate, (None,)),
+    ("replot", setup_replot, ARRAY_SIZES),
+]
@@ -0,0 +1,385 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the Qwt License
+# (see LICENSE file for more details)
+
+"""
+Scenario benchmarks of PythonQwt
+
+Each scenario drives plot widgets through a Qt timer, like an application
+would, and reports its frame rate, its median (p50) and 99th percentile
+(p99) frame times and the peak resident set size of the process:
+
+    - `strip_chart`: scrolling strip chart, N channels updated at X Hz
+      (like the `test_data.py` and `test_cpudemo.py` demos)
+    - `pan_zoom`: zoom then pan sweep over a 10M-point curve
+    - `grid`: build of a 100-plot grid, then resize sweep
+    - `export`: batch export of plots to PDF and PNG files
+
+Every scenario is run in a separate process (so that its peak memory is not
+affected by the other scenarios), possibly with several Qt bindings::
+
+    python -m qwt.benchmarks scenarios --bindings pyqt5 pyqt6 pyside6
+"""
+
+import json
+import os
+import os.path as osp
+import re
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+
+def peak_rss():
+    """
+    :return: Peak resident set size of the process, in MiB (None if unknown)
+    """
+    try:
+        import resource
+    except ImportError:
+        return _windows_peak_rss()
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        return rss / 1024.0**2  # bytes
+    return rss / 1024.0  # kilobytes
+
+
+def _windows_peak_rss():
+    try:
+        import ctypes
+        from ctypes import wintypes
+    except ImportError:
+        return None
+
+    class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+        _fields_ = [
+            ("cb", wintypes.DWORD),
+            ("PageFaultCount", wintypes.DWORD),
+            ("PeakWorkingSetSize", ctypes.c_size_t),
+            ("WorkingSetSize", ctypes.c_size_t),
+            ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+            ("PagefileUsage", ctypes.c_size_t),
+            ("PeakPagefileUsage", ctypes.c_size_t),
+        ]
+
+    counters = PROCESS_MEMORY_COUNTERS()
+    counters.cb = ctypes.sizeof(counters)
+    process = ctypes.windll.kernel32.GetCurrentProcess()
+    if not ctypes.windll.psapi.GetProcessMemoryInfo(
+        process, ctypes.byref(counters), counters.cb
+    ):
+        return None
+    return counters.PeakWorkingSetSize / 1024.0**2
+
+
+def frame_statistics(times, elapsed):
+    """
+    :param list times: Frame times, in seconds
+    :param float elapsed: Total duration of the scenario, in seconds
+    :return: Frame statistics (dictionary with `frames`, `fps`, `median` (p50), `p99` and `mean` keys, times in seconds)
+    """
+    times = np.asarray(times, dtype=float)
+    return {
+        "frames": int(times.size),
+        "fps": times.size / elapsed if elapsed > 0.0 else 0.0,
+        "median": float(np.percentile(times, 50)),
+        "p99": float(np.percentile(times, 99)),
+        "mean": float(times.mean()),
+    }
+
+
+def run_frames(step, frames, interval=0):
+    """
+    Call a function from a Qt timer, in a local event loop
+
+    :param callable step: Function drawing a frame, taking the frame index as argument
+    :param int frames: Number of frames
+    :param int interval: Timer interval, in milliseconds
+    :return: Frame statistics (see :py:func:`frame_statistics()`)
+    """
+    from qtpy.QtCore import QEventLoop, QTimer
+
+    times = []
+    loop = QEventLoop()
+    timer = QTimer()
+    timer.setInterval(interval)
+
+    def tick():
+        t0 = time.perf_counter()
+        step(len(times))
+        times.append(time.perf_counter() - t0)
+        if len(times) >= frames:
+            timer.stop()
+            loop.quit()
+
+    timer.timeout.connect(tick)
+    t0 = time.perf_counter()
+    timer.start()
+    if os.environ["QT_API"] == "pyside6":
+        loop.exec()
+    else:
+        loop.exec_()
+    return frame_statistics(times, time.perf_counter() - t0)
+
+
+def _immediate_plot(title=None):
+    from qwt.plot import QwtPlot
+    from qwt.plot_canvas import QwtPlotCanvas
+
+    plot = QwtPlot(title)
+    # Frames are painted when `replot` is called, so that they are timed
+    plot.canvas().setPaintAttribute(QwtPlotCanvas.ImmediatePaint, True)
+    return plot
+
+
+def _show(widget, width, height):
+    from qtpy.QtWidgets import QApplication
+
+    widget.resize(width, height)
+    widget.show()
+    # Widgets are only painted once their window has been exposed
+    QApplication.processEvents()
+
+
+def scenario_strip_chart(channels=8, rate=50, duration=5.0, samples=2000):
+    """
+    Scrolling strip chart: `channels` curves of `samples` points, shifted by
+    a new sample and replotted at `rate` Hz during `duration` seconds
+    """
+    from qwt.plot_curve import QwtPlotCurve
+
+    plot = _immediate_plot("Strip chart")
+    x = np.arange(samples, dtype=float)
+    rng = np.random.default_rng(0)
+    data = rng.standard_normal((channels, samples)).cumsum(axis=1) * 0.1
+    data += 5.0 * np.arange(channels)[:, np.newaxis]
+    curves = [
+        QwtPlotCurve.make(x, data[index], "Channel %d" % index, plot)
+        for index in range(channels)
+    ]
+    _show(plot, 800, 600)
+
+    def step(index):
+        data[:, :-1] = data[:, 1:]
+        data[:, -1] = data[:, -2] + 0.1 * rng.standard_normal(channels)
+        for curve, ydata in zip(curves, data):
+            curve.setData(x, ydata)
+        plot.replot()
+
+    result = run_frames(step, max(1, int(rate * duration)), int(1000 / rate))
+    result["target_fps"] = rate
+    return result
+
+
+def scenario_pan_zoom(points=10000000, frames=40):
+    """
+    Pan/zoom sweep over a curve of `points` points: the X axis is zoomed in
+    during the first half of the frames (down to 1/1000 of the data), then
+    panned over the data
+    """
+    from qwt.plot import QwtPlot
+    from qwt.plot_curve import QwtPlotCurve
+
+    plot = _immediate_plot("Pan/zoom")
+    x = np.linspace(0.0, 1000.0, points)
+    QwtPlotCurve.make(x, np.sin(x) + 0.1 * np.sin(97.0 * x), "Signal", plot)
+    plot.setAxisScale(QwtPlot.yLeft, -1.5, 1.5)
+    _show(plot, 800, 600)
+    zoom_frames = max(1, frames // 2)
+    widths = np.geomspace(1000.0, 1.0, zoom_frames)
+    centers = np.linspace(500.0, 10.0, frames - zoom_frames)
+
+    def step(index):
+        if index < zoom_frames:
+            center, width = 500.0, widths[index]
+        else:
+            center, width = centers[index - zoom_frames], 1.0
+        plot.setAxisScale(QwtPlot.xBottom, center - width / 2, center + width / 2)
+        plot.replot()
+
+    return run_frames(step, frames)
+
+
+def scenario_grid(plots=100, resizes=20, points=1000):
+    """
+    Build a grid of `plots` plots (curve of `points` points each), then
+    resize the window `resizes` times (each resize is a frame)
+    """
+    from qtpy.QtWidgets import QGridLayout, QWidget
+
+    from qwt.plot_curve import QwtPlotCurve
+
+    t0 = time.perf_counter()
+    window = QWidget()
+    layout = QGridLayout(window)
+    ncols = int(np.ceil(np.sqrt(plots)))
+    x = np.linspace(0.0, 10.0, points)
+    for index in range(plots):
+        plot = _immediate_plot("Plot %d" % index)
+        QwtPlotCurve.make(x, np.sin(x + index), plot=plot)
+        layout.addWidget(plot, index // ncols, index % ncols)
+    _show(window, 1200, 900)
+    build_time = time.perf_counter() - t0
+    widths = np.linspace(1200, 1800, resizes).astype(int)
+
+    def step(index):
+        width = int(widths[index])
+        window.resize(width, width * 3 // 4)
+        window.repaint()
+
+    result = run_frames(step, resizes)
+    result["build_time"] = build_time
+    return result
+
+
+def scenario_export(plots=10, formats=("pdf", "png"), points=10000):
+    """
+    Export `plots` plots (curve of `points` points each) to each file
+    format of `formats` (each exported file is a frame)
+    """
+    from qwt.plot_curve import QwtPlotCurve
+    from qwt.plot_renderer import QwtPlotRenderer
+
+    x = np.linspace(0.0, 10.0, points)
+    items = []
+    for index in range(plots):
+        plot = _immediate_plot("Plot %d" % index)
+        QwtPlotCurve.make(x, np.sin(x + index), "Sine", plot)
+        plot.resize(800, 600)
+        plot.replot()
+        items += [(plot, fmt) for fmt in formats]
+    renderer = QwtPlotRenderer()
+    with tempfile.TemporaryDirectory() as tmpdir:
+
+        def step(index):
+            plot, fmt = items[index]
+            filename = osp.join(tmpdir, "plot%d.%s" % (index, fmt))
+            renderer.renderDocument(plot, filename, (160, 120), 100, fmt)
+
+        return run_frames(step, len(items))
+
+
+SCENARIOS = {
+    "strip_chart": scenario_strip_chart,
+    "pan_zoom": scenario_pan_zoom,
+    "grid": scenario_grid,
+    "export": scenario_export,
+}
+
+#: Parameters of the scenarios in quick mode (smaller data, fewer frames)
+QUICK_PARAMETERS = {
+    "strip_chart": {"duration": 0.5},
+    "pan_zoom": {"points": 100000, "frames": 10},
+    "grid": {"plots": 9, "resizes": 5},
+    "export": {"plots": 2},
+}
+
+
+def run_scenario(name, quick=False):
+    """
+    Run a scenario in the current process
+
+    :param str name: Scenario name (see `SCENARIOS`)
+    :param bool quick: If True, run the scenario with smaller data
+    :return: Scenario results (see :py:func:`frame_statistics()`), with the peak resident set size of the process (`peak_rss` key, in MiB)
+    """
+    from qtpy.QtWidgets import QApplication
+
+    app = QApplication.instance() or QApplication([])  # noqa: F841
+    kwargs = QUICK_PARAMETERS[name] if quick else {}
+    result = SCENARIOS[name](**kwargs)
+    result["peak_rss"] = peak_rss()
+    return result
+
+
+def run_scenarios(pattern=None, bindings=None, quick=False, stream=None):
+    """
+    Run scenarios, each one in a separate process
+
+    :param str pattern: Regular expression selecting the scenarios by name
+    :param list bindings: Qt bindings (`QT_API` values, e.g. `["pyqt5", "pyside6"]`), or None for the current binding
+    :param bool quick: If True, run the scenarios with smaller data
+    :param stream: Stream where progress is written (e.g. `sys.stdout`), or None
+    :return: Results (dictionary with `metadata` and `results` keys), where the results are named after the scenario and the binding (e.g. `grid[pyqt5]`)
+    """
+    from qwt.benchmarks import environment_info, format_time
+
+    regexp = None if pattern is None else re.compile(pattern)
+    names = [name for name in SCENARIOS if regexp is None or regexp.search(name)]
+    root = osp.dirname(osp.dirname(osp.dirname(osp.abspath(__file__))))
+    results = {}
+    for binding in bindings or [None]:
+        env = dict(os.environ)
+        env.setdefault("QT_QPA_PLATFORM", "offscreen")
+        env["PYTHONPATH"] = os.pathsep.join(
+            [root] + ([env["PYTHONPATH"]] if env.get("PYTHONPATH") else [])
+        )
+        if binding is not None:
+            env["QT_API"] = binding
+        for name in names:
+            args = [sys.executable, "-m", "qwt.benchmarks.scenarios", name]
+            if quick:
+                args.append("--quick")
+            # Qt may be verbose: the standard error is not kept in memory
+            with tempfile.TemporaryFile() as stderr:
+                proc = subprocess.run(
+                    args, env=env, stdout=subprocess.PIPE, stderr=stderr
+                )
+                if proc.returncode != 0:
+                    if stream is not None:
+                        stderr.seek(max(0, stderr.tell() - 1024))
+                        lines = stderr.read().decode(errors="replace").splitlines()
+                        error = lines[-1] if lines else "exit code %d" % proc.returncode
+                        stream.write("%s[%s]: failed (%s)\n" % (name, binding, error))
+                    continue
+            result = json.loads(proc.stdout.decode().strip().splitlines()[-1])
+            key = "%s[%s]" % (name, result["qt_api"].lower())
+            results[key] = result
+            if stream is not None:
+                stream.write(
+                    "%-24s %7.1f fps  p50 %-9s p99 %-9s peak RSS %s MiB\n"
+                    % (
+                        key,
+                        result["fps"],
+                        format_time(result["median"]),
+                        format_time(result["p99"]),
+                        "?"
+                        if result["peak_rss"] is None
+                        else "%.0f" % result["peak_rss"],
+                    )
+                )
+                stream.flush()
+    return {"metadata": environment_info(), "results": results}
+
+
+def main(args=None):
+    """
+    Run a scenario and write its results (JSON) to the standard output
+
+    :param list args: Command line arguments (default: `sys.argv[1:]`)
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="python -m qwt.benchmarks.scenarios")
+    parser.add_argument("scenario", choices=list(SCENARIOS))
+    parser.add_argument("--quick", action="store_true", help="smaller data")
+    options = parser.parse_args(args)
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    result = run_scenario(options.scenario, options.quick)
+
+    import qtpy
+
+    result["qt_api"] = qtpy.API_NAME
+    result["qt"] = qtpy.QT_VERSION
+    print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
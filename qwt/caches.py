@@ -0,0 +1,325 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the Qwt License
+# (see LICENSE file for more details)
+
+"""
+Caches
+------
+
+Registry of the internal caches of PythonQwt.
+
+Each internal cache (font metrics, tick labels, backing stores, ...) is
+registered with a name, an approximate memory cost and an eviction policy:
+
+  * `lru`: the least recently used entries are evicted first,
+  * `fifo`: the oldest entries are evicted first,
+  * `clear`: the cache is cleared (its entries are rebuilt on demand).
+
+A global memory budget may be set, so that long-running processes bound the
+memory used by the caches: when the approximate memory used by the caches
+exceeds the budget, entries are evicted from the largest caches until the
+budget is met. The budget is checked when plots are replotted (at most
+every `BUDGET_CHECK_INTERVAL` seconds) and by :py:func:`enforce_budget()`::
+
+    from qwt import caches
+
+    caches.set_memory_budget(64 * 1024 * 1024)
+
+The budget may also be set with the `QWT_CACHE_BUDGET` environment variable,
+in bytes or with a `K`, `M` or `G` suffix (e.g. `QWT_CACHE_BUDGET=64M`).
+
+:py:func:`clear_all()` empties all caches, e.g. when the application is
+notified of memory pressure. The cache statistics are reported by
+:py:func:`qwt.stats.snapshot()`.
+
+.. autofunction:: register
+
+.. autofunction:: registered
+
+.. autofunction:: clear_all
+
+.. autofunction:: memory_usage
+
+.. autofunction:: set_memory_budget
+
+.. autofunction:: memory_budget
+
+.. autofunction:: enforce_budget
+
+.. autofunction:: check_budget
+
+.. autofunction:: parse_budget
+
+.. autofunction:: clear_dicts
+
+.. autofunction:: evict_lru
+
+.. autofunction:: pixmap_memory
+
+.. autoclass:: QwtRegisteredCache
+   :members:
+"""
+
+import os
+import time
+
+#: Environment variable setting the memory budget of the caches
+BUDGET_ENV = "QWT_CACHE_BUDGET"
+
+#: Minimum interval between two automatic checks of the memory budget (seconds)
+BUDGET_CHECK_INTERVAL = 0.5
+
+#: Default approximate memory cost of a cache entry, in bytes
+DEFAULT_ENTRY_COST = 256
+
+
+class QwtRegisteredCache(object):
+    """
+    An internal cache, registered in the cache registry
+
+    The cache owner increments `hits` and `misses` on lookups.
+
+    :param str name: Cache name
+    :param callable size: Function returning the number of cached entries
+    :param callable clear: Function removing all entries
+    :param callable evict: Function removing the given number of entries according to the eviction policy, or None (the cache is cleared instead)
+    :param str policy: Eviction policy (`"lru"`, `"fifo"` or `"clear"`)
+    :param int entryCost: Approximate memory cost of an entry, in bytes
+    :param callable memory: Function returning the approximate memory used by the cache in bytes, or None (`entryCost` times the number of entries)
+    """
+
+    __slots__ = (
+        "name",
+        "hits",
+        "misses",
+        "size",
+        "clear",
+        "evict",
+        "policy",
+        "entryCost",
+        "__memory",
+    )
+
+    def __init__(self, name, size, clear, evict, policy, entryCost, memory):
+        self.name = name
+        self.hits = 0
+        self.misses = 0
+        self.size = size
+        self.clear = clear
+        self.evict = evict
+        self.policy = policy
+        self.entryCost = entryCost
+        self.__memory = memory
+
+    def memory(self):
+        """
+        :return: Approximate memory used by the cache, in bytes
+        """
+        if self.__memory is not None:
+            return self.__memory()
+        return self.size() * self.entryCost
+
+    def trim(self):
+        """
+        Evict half of the entries (at least one), or clear the cache if its
+        policy is `clear`
+        """
+        if self.evict is None:
+            self.clear()
+        else:
+            self.evict(max(1, self.size() // 2))
+
+    def resetStats(self):
+        """
+        Reset the hit and miss counters (the cache content is unchanged)
+        """
+        self.hits = 0
+        self.misses = 0
+
+    def asDict(self):
+        """
+        :return: Dictionary with `hits`, `misses`, `hit_rate`, `size`, `memory` and `policy` keys
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else None,
+            "size": self.size(),
+            "memory": self.memory(),
+            "policy": self.policy,
+        }
+
+
+_CACHES = {}
+_BUDGET = None
+_LAST_CHECK = 0.0
+
+
+def register(
+    name,
+    size,
+    clear,
+    evict=None,
+    policy=None,
+    entryCost=DEFAULT_ENTRY_COST,
+    memory=None,
+):
+    """
+    Register an internal cache
+
+    :param str name: Cache name
+    :param callable size: Function returning the number of cached entries
+    :param callable clear: Function removing all entries
+    :param callable evict: Function removing the given number of entries according to the eviction policy, or None (the cache is cleared instead)
+    :param str policy: Eviction policy: `"lru"` (default if `evict` is given), `"fifo"` or `"clear"` (default otherwise)
+    :param int entryCost: Approximate memory cost of an entry, in bytes
+    :param callable memory: Function returning the approximate memory used by the cache in bytes, or None (`entryCost` times the number of entries)
+    :return: Registered cache (`QwtRegisteredCache` instance)
+    """
+    if policy is None:
+        policy = "clear" if evict is None else "lru"
+    cache = _CACHES.get(name)
+    if cache is None:
+        cache = _CACHES[name] = QwtRegisteredCache(
+            name, size, clear, evict, policy, entryCost, memory
+        )
+    return cache
+
+
+def registered():
+    """
+    :return: List of the registered caches, sorted by name
+    """
+    return [_CACHES[name] for name in sorted(_CACHES)]
+
+
+def clear_all():
+    """
+    Remove all entries of all caches
+    """
+    for cache in _CACHES.values():
+        cache.clear()
+
+
+def memory_usage():
+    """
+    :return: Approximate memory used by all caches, in bytes
+    """
+    return sum(cache.memory() for cache in _CACHES.values())
+
+
+def set_memory_budget(budget):
+    """
+    Set the memory budget of the caches
+
+    :param int budget: Memory budget in bytes, or None (no budget)
+    """
+    global _BUDGET
+    _BUDGET = budget
+    enforce_budget()
+
+
+def memory_budget():
+    """
+    :return: Memory budget of the caches in bytes, or None
+    """
+    return _BUDGET
+
+
+def enforce_budget():
+    """
+    Evict entries from the largest caches until the memory used by the
+    caches is within the budget
+
+    :return: Approximate memory used by all caches after eviction, in bytes, or None if there is no budget
+    """
+    global _LAST_CHECK
+    _LAST_CHECK = time.perf_counter()
+    if _BUDGET is None:
+        return None
+    usage = memory_usage()
+    candidates = list(_CACHES.values())
+    while usage > _BUDGET and candidates:
+        cache = max(candidates, key=QwtRegisteredCache.memory)
+        memory = cache.memory()
+        if memory == 0:
+            break
+        cache.trim()
+        if cache.memory() >= memory:  # the cache can't shrink any further
+            candidates.remove(cache)
+        usage = memory_usage()
+    return usage
+
+
+def check_budget():
+    """
+    Enforce the memory budget, unless it was checked less than
+    `BUDGET_CHECK_INTERVAL` seconds ago (called when plots are replotted)
+    """
+    if _BUDGET is not None:
+        if time.perf_counter() - _LAST_CHECK > BUDGET_CHECK_INTERVAL:
+            enforce_budget()
+
+
+def clear_dicts(dicts):
+    """
+    Clear dictionaries
+
+    :param dicts: Dictionaries
+    """
+    for entries in dicts:
+        entries.clear()
+
+
+def evict_lru(dicts, count):
+    """
+    Evict the first entries of ordered dictionaries (the least recently used
+    or the oldest entries, depending on how the dictionaries are ordered)
+
+    The first entry of each dictionary is evicted in turn.
+
+    :param dicts: Ordered dictionaries (`collections.OrderedDict`)
+    :param int count: Number of entries to evict
+    :return: Number of evicted entries
+    """
+    dicts = [entries for entries in dicts if entries]
+    evicted = 0
+    while dicts and evicted < count:
+        for entries in dicts[:]:
+            entries.popitem(last=False)
+            evicted += 1
+            if not entries:
+                dicts.remove(entries)
+            if evicted == count:
+                break
+    return evicted
+
+
+def pixmap_memory(pixmap):
+    """
+    :param QPixmap pixmap: Pixmap (or image), or None
+    :return: Approximate memory used by the pixmap, in bytes
+    """
+    if pixmap is None:
+        return 0
+    return pixmap.width() * pixmap.height() * pixmap.depth() // 8
+
+
+def parse_budget(text):
+    """
+    :param str text: Memory budget in bytes, or with a `K`, `M` or `G` suffix
+    :return: Memory budget in bytes
+    """
+    text = text.strip().upper()
+    factor = 1
+    for suffix, value in (("K", 1 << 10), ("M", 1 << 20), ("G", 1 << 30)):
+        if text.endswith(suffix):
+            text, factor = text[:-1], value
+            break
+    return int(float(text) * factor)
+
+
+if os.environ.get(BUDGET_ENV):
+    _BUDGET = parse_budget(os.environ[BUDGET_ENV])
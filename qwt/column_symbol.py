@@ -27,7 +27,7 @@ def qwtDrawBox(p, rect, pal, lw):
         polygon = QPolygonF(outerRect)
         if outerRect.width() > 2 * lw and outerRect.height() > 2 * lw:
             innerRect = outerRect.adjusted(lw, lw, -lw, -lw)
-            polygon = polygon.subtracted(innerRect)
+            polygon = polygon.subtracted(QPolygonF(innerRect))
         p.setPen(Qt.NoPen)
         p.setBrush(pal.dark())
         p.drawPolygon(polygon)
@@ -50,19 +50,28 @@ def qwtDrawPanel(painter, rect, pal, lw):
         lw = min([lw, rect.width() / 2.0 - 1.0])
         outerRect = rect.adjusted(0, 0, 1, 1)
         innerRect = outerRect.adjusted(lw, lw, -lw, -lw)
-        lines = [QPolygonF(), QPolygonF()]
-        lines[0] += outerRect.bottomLeft()
-        lines[0] += outerRect.topLeft()
-        lines[0] += outerRect.topRight()
-        lines[0] += innerRect.topRight()
-        lines[0] += innerRect.topLeft()
-        lines[0] += innerRect.bottomLeft()
-        lines[1] += outerRect.topRight()
-        lines[1] += outerRect.bottomRight()
-        lines[1] += outerRect.bottomLeft()
-        lines[1] += innerRect.bottomLeft()
-        lines[1] += innerRect.bottomRight()
-        lines[1] += innerRect.topRight()
+        lines = [
+            QPolygonF(
+                [
+                    outerRect.bottomLeft(),
+                    outerRect.topLeft(),
+                    outerRect.topRight(),
+                    innerRect.topRight(),
+                    innerRect.topLeft(),
+                    innerRect.bottomLeft(),
+                ]
+            ),
+            QPolygonF(
+                [
+                    outerRect.topRight(),
+                    outerRect.bottomRight(),
+                    outerRect.bottomLeft(),
+                    innerRect.bottomLeft(),
+                    innerRect.bottomRight(),
+                    innerRect.topRight(),
+                ]
+            ),
+        ]
         painter.setPen(Qt.NoPen)
         painter.setBrush(pal.light())
         painter.drawPolygon(lines[0])
@@ -125,7 +134,7 @@ class QwtColumnSymbol(object):
         painter.restore()
 
     def drawBox(self, painter, rect):
-        r = rect.toRect()
+        r = QRectF(rect.toRect())
         if self.__data.frameStyle == QwtColumnSymbol.Raised:
             qwtDrawPanel(painter, r, self.__data.palette, self.__data.lineWidth)
         elif self.__data.frameStyle == QwtColumnSymbol.Plain:
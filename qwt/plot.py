@@ -19,14 +19,26 @@ QwtPlotItem
    :members:
 """
 
+import concurrent.futures
+import itertools
 import math
 import weakref
 
 import numpy as np
-from qtpy.QtCore import QEvent, QObject, QRectF, QSize, Qt, Signal
-from qtpy.QtGui import QBrush, QColor, QFont, QPainter, QPalette
+from qtpy.QtCore import QEvent, QObject, QPointF, QRectF, QSize, Qt, Signal
+from qtpy.QtGui import (
+    QBrush,
+    QColor,
+    QFont,
+    QImage,
+    QPainter,
+    QPalette,
+    QPixmap,
+    QTransform,
+)
 from qtpy.QtWidgets import QApplication, QFrame, QSizePolicy, QWidget
 
+from qwt import caches, profiling
 from qwt.graphic import QwtGraphic
 from qwt.interval import QwtInterval
 from qwt.legend import QwtLegendData
@@ -63,6 +75,125 @@ def qwtSetTabOrder(first, second, with_children):
             w.setFocusProxy(px)
 
 
+#: Revisions of the plot items (see `QwtPlotItem.revision()`), unique across items
+_ITEM_REVISIONS = itertools.count()
+
+#: Render caches of the plot items (see `QwtPlotItem.RenderCache`): (key, image)
+_ITEM_RENDER_CACHES = weakref.WeakKeyDictionary()
+
+_RENDER_CACHE_STATS = caches.register(
+    "item_render_cache",
+    size=lambda: len(_ITEM_RENDER_CACHES),
+    clear=_ITEM_RENDER_CACHES.clear,
+    memory=lambda: sum(
+        caches.pixmap_memory(image) for _key, image in _ITEM_RENDER_CACHES.values()
+    ),
+)
+
+
+def qwtIsRasterPainter(painter, translation=False):
+    """
+    :param QPainter painter: Painter
+    :param bool translation: True if a world translation is accepted
+    :return: True if the painter paints on a raster paint device (widget, pixmap or image) without world transformation (or with a translation only)
+    """
+    transform = painter.transform()
+    if not transform.isIdentity():
+        if not translation or transform.type() != QTransform.TxTranslate:
+            return False
+    return isinstance(painter.device(), (QWidget, QPixmap, QImage))
+
+
+def qwtRenderItemImage(
+    plot, item, xMap, yMap, canvasRect, font, hints, antialiased, ratio
+):
+    """
+    Render a plot item into an image covering the canvas (this is called
+    in the worker threads of the plot, see :py:meth:`QwtPlot.setRenderThreadCount()`)
+
+    :param qwt.plot.QwtPlot plot: Plot
+    :param qwt.plot.QwtPlotItem item: Plot item
+    :param qwt.scale_map.QwtScaleMap xMap: Maps x-values into pixel coordinates
+    :param qwt.scale_map.QwtScaleMap yMap: Maps y-values into pixel coordinates
+    :param QRectF canvasRect: Contents rectangle of the canvas in painter coordinates
+    :param QFont font: Painter font
+    :param hints: Painter render hints
+    :param bool antialiased: True if the item is antialiased
+    :param float ratio: Device pixel ratio
+    :return: Tuple (image, position of the image in painter coordinates)
+    """
+    rect = canvasRect.toAlignedRect()
+    image = QImage(
+        int(math.ceil(rect.width() * ratio)),
+        int(math.ceil(rect.height() * ratio)),
+        QImage.Format_ARGB32_Premultiplied,
+    )
+    image.setDevicePixelRatio(ratio)
+    image.fill(Qt.transparent)
+    painter = QPainter(image)
+    painter.translate(-rect.x(), -rect.y())
+    painter.setFont(font)
+    painter.setRenderHints(hints)
+    painter.setRenderHint(QPainter.Antialiasing, antialiased)
+    with profiling.span("QwtPlotItem.draw", plot, item):
+        item.draw(painter, xMap, yMap, canvasRect)
+    painter.end()
+    return image, QPointF(rect.topLeft())
+
+
+def qwtDrawCachedItem(painter, item, xMap, yMap, canvasRect):
+    """
+    Draw a plot item from its render cache, rendering it first if the item,
+    its scale maps or the paint device have changed since it was cached
+
+    The render cache is only used on raster paint devices (widgets, pixmaps
+    and images) without world transformation: the item is drawn directly
+    otherwise (e.g. when printing or exporting to a vector format).
+
+    :param QPainter painter: Painter
+    :param qwt.plot.QwtPlotItem item: Plot item
+    :param qwt.scale_map.QwtScaleMap xMap: Maps x-values into pixel coordinates
+    :param qwt.scale_map.QwtScaleMap yMap: Maps y-values into pixel coordinates
+    :param QRectF canvasRect: Contents rectangle of the canvas in painter coordinates
+    """
+    if not qwtIsRasterPainter(painter):
+        item.draw(painter, xMap, yMap, canvasRect)
+        return
+    device = painter.device()
+    pixelRatio = device.devicePixelRatioF()
+    key = (
+        item.revision(),
+        QwtScaleMap(xMap),
+        QwtScaleMap(yMap),
+        (canvasRect.x(), canvasRect.y(), canvasRect.width(), canvasRect.height()),
+        device.width(),
+        device.height(),
+        pixelRatio,
+    )
+    cached = _ITEM_RENDER_CACHES.get(item)
+    if cached is not None and cached[0] == key:
+        _RENDER_CACHE_STATS.hits += 1
+        image = cached[1]
+    else:
+        _RENDER_CACHE_STATS.misses += 1
+        image = QImage(
+            int(round(device.width() * pixelRatio)),
+            int(round(device.height() * pixelRatio)),
+            QImage.Format_ARGB32_Premultiplied,
+        )
+        image.setDevicePixelRatio(pixelRatio)
+        image.fill(Qt.transparent)
+        imagePainter = QPainter(image)
+        imagePainter.setFont(painter.font())
+        imagePainter.setRenderHint(
+            QPainter.Antialiasing, painter.testRenderHint(QPainter.Antialiasing)
+        )
+        item.draw(imagePainter, xMap, yMap, canvasRect)
+        imagePainter.end()
+        _ITEM_RENDER_CACHES[item] = (key, image)
+    painter.drawImage(0, 0, image)
+
+
 class ItemList(list):
     def sortItems(self):
         self.sort(key=lambda item: item.z())
@@ -82,12 +213,18 @@ class QwtPlot_PrivateData(QObject):
 
         self.itemList = ItemList()
         self.titleLabel = None
+        self.titleText = None
         self.footerLabel = None
+        self.footerText = None
         self.canvas = None
         self.legend = None
         self.layout = None
         self.autoReplot = None
         self.flatStyle = None
+        self.axisStyle = None
+        self.renderThreadCount = 0
+        self.renderPool = None
+        self.renderPoolFinalizer = None
 
 
 class AxisData(object):
@@ -202,19 +339,11 @@ class QwtPlot(QFrame):
         self.setAutoReplot(False)
         self.setPlotLayout(self.__data.layout)
 
-        # title
-        self.__data.titleLabel = QwtTextLabel(self)
-        self.__data.titleLabel.setObjectName("QwtPlotTitle")
-        text = QwtText(title)
-        text.setRenderFlags(Qt.AlignCenter | Qt.TextWordWrap)
-        self.__data.titleLabel.setText(text)
-
-        # footer
-        self.__data.footerLabel = QwtTextLabel(self)
-        self.__data.footerLabel.setObjectName("QwtPlotFooter")
-        footer = QwtText()
-        footer.setRenderFlags(Qt.AlignCenter | Qt.TextWordWrap)
-        self.__data.footerLabel.setText(footer)
+        # title and footer: the labels are created on first use
+        self.__data.titleText = QwtText(title)
+        self.__data.titleText.setRenderFlags(Qt.AlignCenter | Qt.TextWordWrap)
+        self.__data.footerText = QwtText()
+        self.__data.footerText.setRenderFlags(Qt.AlignCenter | Qt.TextWordWrap)
 
         # legend
         self.__data.legend = None
@@ -233,22 +362,29 @@ class QwtPlot(QFrame):
 
         self.setSizePolicy(QSizePolicy.MinimumExpanding, QSizePolicy.MinimumExpanding)
 
+        if not self.__data.titleText.isEmpty():
+            self.titleLabel()
+        self.__updateTabOrder()
+
+        self.legendDataChanged.connect(self.updateLegendItems)
+
+    def __updateTabOrder(self):
+        axisWidgets = [data.scaleWidget for data in self.__axisData]
         focusChain = [
             self,
             self.__data.titleLabel,
-            self.axisWidget(self.xTop),
-            self.axisWidget(self.yLeft),
+            axisWidgets[self.xTop],
+            axisWidgets[self.yLeft],
             self.__data.canvas,
-            self.axisWidget(self.yRight),
-            self.axisWidget(self.xBottom),
+            axisWidgets[self.yRight],
+            axisWidgets[self.xBottom],
             self.__data.footerLabel,
         ]
-
+        # Sub-widgets which have not been created yet are left out
+        focusChain = [widget for widget in focusChain if widget is not None]
         for idx in range(len(focusChain) - 1):
             qwtSetTabOrder(focusChain[idx], focusChain[idx + 1], False)
 
-        self.legendDataChanged.connect(self.updateLegendItems)
-
     def insertItem(self, item):
         """
         Insert a plot item
@@ -370,22 +506,42 @@ class QwtPlot(QFrame):
         palette.setColor(QPalette.WindowText, QColor(ticks_color))
         palette.setColor(QPalette.Text, QColor(labels_color))
         self.setPalette(palette)
+        self.__data.axisStyle = (
+            axis_label_font,
+            axis_title_font,
+            scale_margin,
+            scale_spacing,
+            tick_lighter_factors,
+        )
         for axis_id in self.AXES:
-            scale_widget = self.axisWidget(axis_id)
-            scale_draw = self.axisScaleDraw(axis_id)
-            scale_widget.setFont(axis_label_font)
-            scale_widget.setMargin(scale_margin)
-            scale_widget.setSpacing(scale_spacing)
-            scale_title = scale_widget.title()
-            scale_title.setFont(axis_title_font)
-            scale_widget.setTitle(scale_title)
-            for tick_type, factor in enumerate(tick_lighter_factors):
-                scale_draw.setTickLighterFactor(tick_type, factor)
+            # Axis widgets which have not been created yet will be styled
+            # on creation (see `axisWidget()`)
+            if self.__axisData[axis_id].scaleWidget is not None:
+                self.__applyAxisStyle(axis_id)
         plot_title = self.title()
         plot_title.setFont(plot_title_font)
         self.setTitle(plot_title)
         self.__data.flatStyle = state
 
+    def __applyAxisStyle(self, axis_id):
+        (
+            axis_label_font,
+            axis_title_font,
+            scale_margin,
+            scale_spacing,
+            tick_lighter_factors,
+        ) = self.__data.axisStyle
+        scale_widget = self.axisWidget(axis_id)
+        scale_draw = self.axisScaleDraw(axis_id)
+        scale_widget.setFont(axis_label_font)
+        scale_widget.setMargin(scale_margin)
+        scale_widget.setSpacing(scale_spacing)
+        scale_title = scale_widget.title()
+        scale_title.setFont(axis_title_font)
+        scale_widget.setTitle(scale_title)
+        for tick_type, factor in enumerate(tick_lighter_factors):
+            scale_draw.setTickLighterFactor(tick_type, factor)
+
     def flatStyle(self):
         """
         :return: True if the flatStyle option is set.
@@ -400,35 +556,11 @@ class QwtPlot(QFrame):
         """Initialize axes"""
         self.__axisData = [AxisData() for axisId in self.AXES]
 
-        self.__axisData[self.yLeft].scaleWidget = QwtScaleWidget(
-            QwtScaleDraw.LeftScale, self
-        )
-        self.__axisData[self.yRight].scaleWidget = QwtScaleWidget(
-            QwtScaleDraw.RightScale, self
-        )
-        self.__axisData[self.xTop].scaleWidget = QwtScaleWidget(
-            QwtScaleDraw.TopScale, self
-        )
-        self.__axisData[self.xBottom].scaleWidget = QwtScaleWidget(
-            QwtScaleDraw.BottomScale, self
-        )
-
-        self.__axisData[self.yLeft].scaleWidget.setObjectName("QwtPlotAxisYLeft")
-        self.__axisData[self.yRight].scaleWidget.setObjectName("QwtPlotAxisYRight")
-        self.__axisData[self.xTop].scaleWidget.setObjectName("QwtPlotAxisXTop")
-        self.__axisData[self.xBottom].scaleWidget.setObjectName("QwtPlotAxisXBottom")
-
         for axisId in self.AXES:
             d = self.__axisData[axisId]
 
             d.scaleEngine = QwtLinearScaleEngine()
 
-            d.scaleWidget.setTransformation(d.scaleEngine.transformation())
-            d.scaleWidget.setMargin(2)
-
-            text = d.scaleWidget.title()
-            d.scaleWidget.setTitle(text)
-
             d.doAutoScale = True
             d.margin = 0.05
             d.minValue = 0.0
@@ -443,6 +575,43 @@ class QwtPlot(QFrame):
         self.__axisData[self.xBottom].isEnabled = True
         self.__axisData[self.xTop].isEnabled = False
 
+        # The scale widgets of the disabled axes are created on first use
+        # (see `axisWidget()`)
+        self.initAxisWidget(self.yLeft)
+        self.initAxisWidget(self.xBottom)
+
+    def initAxisWidget(self, axisId):
+        """
+        Create the scale widget of an axis
+
+        :param int axisId: Axis index
+        """
+        align, name = {
+            self.yLeft: (QwtScaleDraw.LeftScale, "QwtPlotAxisYLeft"),
+            self.yRight: (QwtScaleDraw.RightScale, "QwtPlotAxisYRight"),
+            self.xTop: (QwtScaleDraw.TopScale, "QwtPlotAxisXTop"),
+            self.xBottom: (QwtScaleDraw.BottomScale, "QwtPlotAxisXBottom"),
+        }[axisId]
+        d = self.__axisData[axisId]
+        d.scaleWidget = QwtScaleWidget(align, self)
+        d.scaleWidget.setObjectName(name)
+        if not d.isEnabled:
+            d.scaleWidget.hide()
+        d.scaleWidget.setTransformation(d.scaleEngine.transformation())
+        d.scaleWidget.setMargin(2)
+
+        text = d.scaleWidget.title()
+        d.scaleWidget.setTitle(text)
+
+        if self.__data.axisStyle is not None:
+            self.__applyAxisStyle(axisId)
+        if d.scaleDiv is not None:
+            d.scaleWidget.setScaleDiv(d.scaleDiv)
+            startDist, endDist = d.scaleWidget.getBorderDistHint()
+            d.scaleWidget.setBorderDist(startDist, endDist)
+        if self.__data.canvas is not None:
+            self.__updateTabOrder()
+
     def deleteAxesData(self):
         # XXX Is is really necessary in Python? (pure transcription of C++)
         for axisId in self.AXES:
@@ -453,8 +622,13 @@ class QwtPlot(QFrame):
         """
         :param int axisId: Axis index
         :return: Scale widget of the specified axis, or None if axisId is invalid.
+
+        The scale widgets of the axes which are disabled by default are
+        created on first use.
         """
         if self.axisValid(axisId):
+            if self.__axisData[axisId].scaleWidget is None:
+                self.initAxisWidget(axisId)
             return self.__axisData[axisId].scaleWidget
 
     def setAxisScaleEngine(self, axisId, scaleEngine):
@@ -471,9 +645,8 @@ class QwtPlot(QFrame):
         if self.axisValid(axisId) and scaleEngine is not None:
             d = self.__axisData[axisId]
             d.scaleEngine = scaleEngine
-            self.__axisData[axisId].scaleWidget.setTransformation(
-                scaleEngine.transformation()
-            )
+            if d.scaleWidget is not None:
+                d.scaleWidget.setTransformation(scaleEngine.transformation())
             d.isValid = False
             self.autoRefresh()
 
@@ -930,54 +1103,57 @@ class QwtPlot(QFrame):
             :py:meth:`setAxisScaleDiv()`, :py:meth:`replot()`,
             :py:meth:`QwtPlotItem.boundingRect()`
         """
-        intv = [QwtInterval() for _i in self.AXES]
-        itmList = self.itemList()
-        for item in itmList:
-            if not item.testItemAttribute(QwtPlotItem.AutoScale):
-                continue
-            if not item.isVisible():
-                continue
-            if self.axisAutoScale(item.xAxis()) or self.axisAutoScale(item.yAxis()):
-                rect = item.boundingRect()
-                if rect.width() >= 0.0:
-                    intv[item.xAxis()] |= QwtInterval(rect.left(), rect.right())
-                if rect.height() >= 0.0:
-                    intv[item.yAxis()] |= QwtInterval(rect.top(), rect.bottom())
-
-        for axisId in self.AXES:
-            d = self.__axisData[axisId]
-            minValue = d.minValue
-            maxValue = d.maxValue
-            stepSize = d.stepSize
-            if d.doAutoScale and intv[axisId].isValid():
-                d.isValid = False
-                minValue = intv[axisId].minValue()
-                maxValue = intv[axisId].maxValue()
-                minValue, maxValue, stepSize = d.scaleEngine.autoScale(
-                    d.maxMajor, minValue, maxValue, stepSize, d.margin
-                )
-            if not d.isValid:
-                d.scaleDiv = d.scaleEngine.divideScale(
-                    minValue, maxValue, d.maxMajor, d.maxMinor, stepSize
-                )
-                d.isValid = True
-            scaleWidget = self.axisWidget(axisId)
-            scaleWidget.setScaleDiv(d.scaleDiv)
-
-            # It is *really* necessary to update border dist!
-            # Otherwise, when tick labels are large enough, the ticks
-            # may not be aligned with canvas grid.
-            # See the following issues for more details:
-            # https://github.com/PlotPyStack/guiqwt/issues/57
-            # https://github.com/PlotPyStack/PythonQwt/issues/30
-            startDist, endDist = scaleWidget.getBorderDistHint()
-            scaleWidget.setBorderDist(startDist, endDist)
-
-        for item in itmList:
-            if item.testItemInterest(QwtPlotItem.ScaleInterest):
-                item.updateScaleDiv(
-                    self.axisScaleDiv(item.xAxis()), self.axisScaleDiv(item.yAxis())
-                )
+        with profiling.span("QwtPlot.updateAxes", self):
+            intv = [QwtInterval() for _i in self.AXES]
+            itmList = self.itemList()
+            for item in itmList:
+                if not item.testItemAttribute(QwtPlotItem.AutoScale):
+                    continue
+                if not item.isVisible():
+                    continue
+                if self.axisAutoScale(item.xAxis()) or self.axisAutoScale(item.yAxis()):
+                    rect = item.boundingRect()
+                    if rect.width() >= 0.0:
+                        intv[item.xAxis()] |= QwtInterval(rect.left(), rect.right())
+                    if rect.height() >= 0.0:
+                        intv[item.yAxis()] |= QwtInterval(rect.top(), rect.bottom())
+
+            for axisId in self.AXES:
+                d = self.__axisData[axisId]
+                minValue = d.minValue
+                maxValue = d.maxValue
+                stepSize = d.stepSize
+                if d.doAutoScale and intv[axisId].isValid():
+                    d.isValid = False
+                    minValue = intv[axisId].minValue()
+                    maxValue = intv[axisId].maxValue()
+                    minValue, maxValue, stepSize = d.scaleEngine.autoScale(
+                        d.maxMajor, minValue, maxValue, stepSize, d.margin
+                    )
+                if not d.isValid:
+                    d.scaleDiv = d.scaleEngine.divideScale(
+                        minValue, maxValue, d.maxMajor, d.maxMinor, stepSize
+                    )
+                    d.isValid = True
+                scaleWidget = d.scaleWidget
+                if scaleWidget is None:
+                    continue  # the scale division is assigned on creation
+                scaleWidget.setScaleDiv(d.scaleDiv)
+
+                # It is *really* necessary to update border dist!
+                # Otherwise, when tick labels are large enough, the ticks
+                # may not be aligned with canvas grid.
+                # See the following issues for more details:
+                # https://github.com/PlotPyStack/guiqwt/issues/57
+                # https://github.com/PlotPyStack/PythonQwt/issues/30
+                startDist, endDist = scaleWidget.getBorderDistHint()
+                scaleWidget.setBorderDist(startDist, endDist)
+
+            for item in itmList:
+                if item.testItemInterest(QwtPlotItem.ScaleInterest):
+                    item.updateScaleDiv(
+                        self.axisScaleDiv(item.xAxis()), self.axisScaleDiv(item.yAxis())
+                    )
 
     def setCanvas(self, canvas):
         """
@@ -994,6 +1170,7 @@ class QwtPlot(QFrame):
         if canvas == self.__data.canvas:
             return
         self.__data.canvas = canvas
+        self.__data.layout.invalidate()  # the new canvas needs a geometry
         if canvas is not None:
             canvas.setParent(self)
             canvas.installEventFilter(self)
@@ -1078,6 +1255,59 @@ class QwtPlot(QFrame):
         """
         return self.__data.autoReplot
 
+    def setRenderThreadCount(self, count):
+        """
+        Set the number of threads rendering the plot items
+
+        When the count is not zero, the visible items having the
+        `QwtPlotItem.ThreadedRendering` attribute are rendered concurrently
+        into images on a pool of worker threads, while the other items are
+        drawn by the calling thread. The images are then composited in the
+        z-order of the items. NumPy and Qt release the GIL while
+        transforming and painting large arrays of points, so that plots
+        with several heavy items use more than one CPU core.
+
+        Threaded rendering is only used on raster paint devices (widgets,
+        pixmaps and images): the items are drawn directly otherwise (e.g.
+        when printing or exporting to a vector format).
+
+        The worker threads are stopped when the count changes, and when the
+        plot is destroyed.
+
+        :param int count: Number of worker threads (0 disables threaded rendering, the default)
+
+        .. seealso::
+
+            :py:meth:`renderThreadCount()`
+        """
+        count = max(0, int(count))
+        if count != self.__data.renderThreadCount:
+            self.__data.renderThreadCount = count
+            if self.__data.renderPool is not None:
+                self.__data.renderPoolFinalizer.detach()
+                self.__data.renderPool.shutdown()
+            self.__data.renderPool = self.__data.renderPoolFinalizer = None
+            if count > 0:
+                pool = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=count, thread_name_prefix="QwtPlotRender"
+                )
+                # Shut the pool down when the plot is deleted (C++ side) or
+                # garbage collected (Python side), whichever comes first
+                finalizer = weakref.finalize(self, pool.shutdown, False)
+                self.destroyed.connect(finalizer)
+                self.__data.renderPool = pool
+                self.__data.renderPoolFinalizer = finalizer
+
+    def renderThreadCount(self):
+        """
+        :return: Number of threads rendering the plot items (0 if threaded rendering is disabled)
+
+        .. seealso::
+
+            :py:meth:`setRenderThreadCount()`
+        """
+        return self.__data.renderThreadCount
+
     def setTitle(self, title):
         """
         Change the plot's title
@@ -1089,12 +1319,20 @@ class QwtPlot(QFrame):
 
             :py:meth:`title()`
         """
-        current_title = self.__data.titleLabel.text()
+        current_title = self.title()
         if isinstance(title, QwtText) and current_title == title:
             return
         elif not isinstance(title, QwtText) and current_title.text() == title:
             return
-        self.__data.titleLabel.setText(title)
+        if self.__data.titleLabel is None:
+            if isinstance(title, QwtText):
+                self.__data.titleText = title
+            else:
+                self.__data.titleText.setText(title)
+            if not self.__data.titleText.isEmpty():
+                self.titleLabel()
+        else:
+            self.__data.titleLabel.setText(title)
         self.updateLayout()
 
     def title(self):
@@ -1105,12 +1343,23 @@ class QwtPlot(QFrame):
 
             :py:meth:`setTitle()`
         """
+        if self.__data.titleLabel is None:
+            return self.__data.titleText
         return self.__data.titleLabel.text()
 
     def titleLabel(self):
         """
         :return: Title label widget.
+
+        The label is created on first use.
         """
+        if self.__data.titleLabel is None:
+            label = QwtTextLabel(self)
+            label.setObjectName("QwtPlotTitle")
+            label.setText(self.__data.titleText)
+            self.__data.titleLabel = label
+            if self.__data.canvas is not None:
+                self.__updateTabOrder()
         return self.__data.titleLabel
 
     def setFooter(self, text):
@@ -1124,12 +1373,20 @@ class QwtPlot(QFrame):
 
             :py:meth:`footer()`
         """
-        current_footer = self.__data.footerLabel.text()
+        current_footer = self.footer()
         if isinstance(text, QwtText) and current_footer == text:
             return
         elif not isinstance(text, QwtText) and current_footer.text() == text:
             return
-        self.__data.footerLabel.setText(text)
+        if self.__data.footerLabel is None:
+            if isinstance(text, QwtText):
+                self.__data.footerText = text
+            else:
+                self.__data.footerText.setText(text)
+            if not self.__data.footerText.isEmpty():
+                self.footerLabel()
+        else:
+            self.__data.footerLabel.setText(text)
         self.updateLayout()
 
     def footer(self):
@@ -1140,12 +1397,23 @@ class QwtPlot(QFrame):
 
             :py:meth:`setFooter()`
         """
+        if self.__data.footerLabel is None:
+            return self.__data.footerText
         return self.__data.footerLabel.text()
 
     def footerLabel(self):
         """
         :return: Footer label widget.
+
+        The label is created on first use.
         """
+        if self.__data.footerLabel is None:
+            label = QwtTextLabel(self)
+            label.setObjectName("QwtPlotFooter")
+            label.setText(self.__data.footerText)
+            self.__data.footerLabel = label
+            if self.__data.canvas is not None:
+                self.__updateTabOrder()
         return self.__data.footerLabel
 
     def setPlotLayout(self, layout):
@@ -1247,109 +1515,117 @@ class QwtPlot(QFrame):
 
             :py:meth:`updateAxes()`, :py:meth:`setAutoReplot()`
         """
-        doAutoReplot = self.autoReplot()
-        self.setAutoReplot(False)
-        self.updateAxes()
+        with profiling.span("QwtPlot.replot", self):
+            doAutoReplot = self.autoReplot()
+            self.setAutoReplot(False)
+            self.updateAxes()
 
-        #  Maybe the layout needs to be updated, because of changed
-        #  axes labels. We need to process them here before painting
-        #  to avoid that scales and canvas get out of sync.
-        QApplication.sendPostedEvents(self, QEvent.LayoutRequest)
+            #  Maybe the layout needs to be updated, because of changed
+            #  axes labels. We need to process them here before painting
+            #  to avoid that scales and canvas get out of sync.
+            QApplication.sendPostedEvents(self, QEvent.LayoutRequest)
 
-        if self.__data.canvas:
-            try:
-                self.__data.canvas.replot()
-            except (AttributeError, TypeError):
-                self.__data.canvas.update(self.__data.canvas.contentsRect())
+            if self.__data.canvas:
+                try:
+                    self.__data.canvas.replot()
+                except (AttributeError, TypeError):
+                    self.__data.canvas.update(self.__data.canvas.contentsRect())
 
-        self.setAutoReplot(doAutoReplot)
+            self.setAutoReplot(doAutoReplot)
+        caches.check_budget()
 
     def get_layout_state(self):
-        return (
-            self.contentsRect(),
-            self.__data.titleLabel.text(),
-            self.__data.footerLabel.text(),
-            [
-                (self.axisEnabled(axisId), self.axisTitle(axisId).text())
-                for axisId in self.AXES
-            ],
-            self.__data.legend,
-        )
-
-    def updateLayout(self):
         """
-        Adjust plot content to its current size.
+        :return: Layout state of the plot (hashable snapshot of everything the geometry of its components depends on)
 
         .. seealso::
 
-            :py:meth:`resizeEvent()`
+            :py:meth:`qwt.plot_layout.QwtPlotLayout.layoutState()`
         """
-        #        state = self.get_layout_state()
-        #        if self.__layout_state is not None and\
-        #           state == self.__layout_state:
-        #            return
-        #        self.__layout_state = state
-
-        self.__data.layout.activate(self, self.contentsRect())
+        return self.plotLayout().layoutState(self, self.contentsRect())
 
-        titleRect = self.__data.layout.titleRect().toRect()
-        footerRect = self.__data.layout.footerRect().toRect()
-        scaleRect = [
-            self.__data.layout.scaleRect(axisId).toRect() for axisId in self.AXES
-        ]
-        legendRect = self.__data.layout.legendRect().toRect()
-        canvasRect = self.__data.layout.canvasRect().toRect()
+    def updateLayout(self):
+        """
+        Adjust plot content to its current size.
 
-        if self.__data.titleLabel.text():
-            self.__data.titleLabel.setGeometry(titleRect)
-            if not self.__data.titleLabel.isVisibleTo(self):
-                self.__data.titleLabel.show()
-        else:
-            self.__data.titleLabel.hide()
+        The geometry of the plot components is left unchanged when the
+        layout state has not changed since the last update (see
+        :py:meth:`qwt.plot_layout.QwtPlotLayout.layoutState()`).
 
-        if self.__data.footerLabel.text():
-            self.__data.footerLabel.setGeometry(footerRect)
-            if not self.__data.footerLabel.isVisibleTo(self):
-                self.__data.footerLabel.show()
-        else:
-            self.__data.footerLabel.hide()
+        .. seealso::
 
-        for axisId in self.AXES:
-            scaleWidget = self.axisWidget(axisId)
-            if self.axisEnabled(axisId):
-                if scaleRect[axisId] != scaleWidget.geometry():
-                    scaleWidget.setGeometry(scaleRect[axisId])
-                    startDist, endDist = scaleWidget.getBorderDistHint()
-                    scaleWidget.setBorderDist(startDist, endDist)
-
-                # -------------------------------------------------------------
-                # XXX: The following was commented to fix issue #35
-                # Note: the same code part in Qwt's original source code is
-                # annotated with the mention "do we need this code any
-                # longer ???"... I guess not :)
-                # if axisId in (self.xBottom, self.xTop):
-                #     r = QRegion(scaleRect[axisId])
-                #     if self.axisEnabled(self.yLeft):
-                #         r = r.subtracted(QRegion(scaleRect[self.yLeft]))
-                #     if self.axisEnabled(self.yRight):
-                #         r = r.subtracted(QRegion(scaleRect[self.yRight]))
-                #     r.translate(-scaleRect[axisId].x(), -scaleRect[axisId].y())
-                #     scaleWidget.setMask(r)
-                # -------------------------------------------------------------
-
-                if not scaleWidget.isVisibleTo(self):
-                    scaleWidget.show()
-            else:
-                scaleWidget.hide()
+            :py:meth:`resizeEvent()`
+        """
+        with profiling.span("QwtPlot.updateLayout", self):
+            layout = self.__data.layout
+            layout.activate(self, self.contentsRect())
+            state = layout.activatedState()
+            if state is not None and state is self.__layout_state:
+                return
+            self.__layout_state = state
+
+            titleRect = self.__data.layout.titleRect().toRect()
+            footerRect = self.__data.layout.footerRect().toRect()
+            scaleRect = [
+                self.__data.layout.scaleRect(axisId).toRect() for axisId in self.AXES
+            ]
+            legendRect = self.__data.layout.legendRect().toRect()
+            canvasRect = self.__data.layout.canvasRect().toRect()
+
+            titleLabel = self.__data.titleLabel
+            if titleLabel is not None:
+                if titleLabel.text():
+                    titleLabel.setGeometry(titleRect)
+                    if not titleLabel.isVisibleTo(self):
+                        titleLabel.show()
+                else:
+                    titleLabel.hide()
+
+            footerLabel = self.__data.footerLabel
+            if footerLabel is not None:
+                if footerLabel.text():
+                    footerLabel.setGeometry(footerRect)
+                    if not footerLabel.isVisibleTo(self):
+                        footerLabel.show()
+                else:
+                    footerLabel.hide()
+
+            for axisId in self.AXES:
+                if self.axisEnabled(axisId):
+                    scaleWidget = self.axisWidget(axisId)
+                    if scaleRect[axisId] != scaleWidget.geometry():
+                        scaleWidget.setGeometry(scaleRect[axisId])
+                        startDist, endDist = scaleWidget.getBorderDistHint()
+                        scaleWidget.setBorderDist(startDist, endDist)
+
+                    # -------------------------------------------------------------
+                    # XXX: The following was commented to fix issue #35
+                    # Note: the same code part in Qwt's original source code is
+                    # annotated with the mention "do we need this code any
+                    # longer ???"... I guess not :)
+                    # if axisId in (self.xBottom, self.xTop):
+                    #     r = QRegion(scaleRect[axisId])
+                    #     if self.axisEnabled(self.yLeft):
+                    #         r = r.subtracted(QRegion(scaleRect[self.yLeft]))
+                    #     if self.axisEnabled(self.yRight):
+                    #         r = r.subtracted(QRegion(scaleRect[self.yRight]))
+                    #     r.translate(-scaleRect[axisId].x(), -scaleRect[axisId].y())
+                    #     scaleWidget.setMask(r)
+                    # -------------------------------------------------------------
+
+                    if not scaleWidget.isVisibleTo(self):
+                        scaleWidget.show()
+                elif self.__axisData[axisId].scaleWidget is not None:
+                    self.__axisData[axisId].scaleWidget.hide()
 
-        if self.__data.legend:
-            if self.__data.legend.isEmpty():
-                self.__data.legend.hide()
-            else:
-                self.__data.legend.setGeometry(legendRect)
-                self.__data.legend.show()
+            if self.__data.legend:
+                if self.__data.legend.isEmpty():
+                    self.__data.legend.hide()
+                else:
+                    self.__data.legend.setGeometry(legendRect)
+                    self.__data.legend.show()
 
-        self.__data.canvas.setGeometry(canvasRect)
+            self.__data.canvas.setGeometry(canvasRect)
 
     def getCanvasMarginsHint(self, maps, canvasRect):
         """
@@ -1425,6 +1701,49 @@ class QwtPlot(QFrame):
         maps = [self.canvasMap(axisId) for axisId in self.AXES]
         self.drawItems(painter, QRectF(self.__data.canvas.contentsRect()), maps)
 
+    def drawCanvasLayer(self, painter, items):
+        """
+        Redraw some items of the canvas.
+
+        This is called by the canvas for each layer of its layered backing
+        store, instead of :py:meth:`drawCanvas()`.
+
+        :param QPainter painter: Painter used for drawing
+        :param list items: Plot items of the layer, in increasing z-order
+
+        .. seealso::
+
+            :py:attr:`qwt.plot_canvas.QwtPlotCanvas.LayeredBackingStore`
+        """
+        maps = [self.canvasMap(axisId) for axisId in self.AXES]
+        self.__drawItemList(
+            painter, items, QRectF(self.__data.canvas.contentsRect()), maps
+        )
+
+    def drawCanvasBand(self, painter, band):
+        """
+        Redraw the part of the canvas inside a vertical band.
+
+        This is called by the canvas when it scrolls its backing store,
+        instead of :py:meth:`drawCanvas()`: the items are drawn with
+        :py:meth:`QwtPlotItem.drawBand()`.
+
+        :param QPainter painter: Painter used for drawing, clipped to the band
+        :param QRectF band: Band to be painted, in canvas coordinates
+
+        .. seealso::
+
+            :py:attr:`qwt.plot_canvas.QwtPlotCanvas.ScrollBlit`
+        """
+        maps = [self.canvasMap(axisId) for axisId in self.AXES]
+        self.__drawItemList(
+            painter,
+            self.itemList(),
+            QRectF(self.__data.canvas.contentsRect()),
+            maps,
+            band,
+        )
+
     def drawItems(self, painter, canvasRect, maps):
         """
         Redraw the canvas.
@@ -1440,15 +1759,65 @@ class QwtPlot(QFrame):
             frame styles ( f.e `QFrame.Box` ) and it might be necessary to
             fix the margins manually using `QWidget.setContentsMargins()`
         """
-        for item in self.itemList():
-            if item and item.isVisible():
-                painter.save()
-                painter.setRenderHint(
-                    QPainter.Antialiasing,
-                    item.testRenderHint(QwtPlotItem.RenderAntialiased),
-                )
-                item.draw(painter, maps[item.xAxis()], maps[item.yAxis()], canvasRect)
-                painter.restore()
+        self.__drawItemList(painter, self.itemList(), canvasRect, maps)
+
+    def __renderItemsInPool(self, painter, items, canvasRect, maps):
+        # Submit the threaded items to the render pool: item -> future
+        pool = self.__data.renderPool
+        visible = [item for item in items if item and item.isVisible()]
+        threaded = [
+            item
+            for item in visible
+            if item.testItemAttribute(QwtPlotItem.ThreadedRendering)
+            and not item.testItemAttribute(QwtPlotItem.RenderCache)
+        ]
+        if len(visible) < 2 or not threaded or not qwtIsRasterPainter(painter, True):
+            return {}
+        font = QFont(painter.font())
+        hints = painter.renderHints()
+        ratio = painter.device().devicePixelRatioF()
+        futures = {}
+        for item in threaded:
+            futures[item] = pool.submit(
+                qwtRenderItemImage,
+                self,
+                item,
+                QwtScaleMap(maps[item.xAxis()]),
+                QwtScaleMap(maps[item.yAxis()]),
+                QRectF(canvasRect),
+                font,
+                hints,
+                item.testRenderHint(QwtPlotItem.RenderAntialiased),
+                ratio,
+            )
+        return futures
+
+    def __drawItemList(self, painter, items, canvasRect, maps, band=None):
+        # Wall time of the whole list: the threaded items are drawn concurrently
+        with profiling.span("QwtPlot.drawItems", self):
+            futures = {}
+            if band is None and self.__data.renderPool is not None:
+                futures = self.__renderItemsInPool(painter, items, canvasRect, maps)
+            for item in items:
+                future = futures.get(item)
+                if future is not None:
+                    image, position = future.result()
+                    painter.drawImage(position, image)
+                elif item and item.isVisible():
+                    painter.save()
+                    painter.setRenderHint(
+                        QPainter.Antialiasing,
+                        item.testRenderHint(QwtPlotItem.RenderAntialiased),
+                    )
+                    xMap, yMap = maps[item.xAxis()], maps[item.yAxis()]
+                    with profiling.span("QwtPlotItem.draw", self, item):
+                        if band is not None:
+                            item.drawBand(painter, xMap, yMap, canvasRect, band)
+                        elif item.testItemAttribute(QwtPlotItem.RenderCache):
+                            qwtDrawCachedItem(painter, item, xMap, yMap, canvasRect)
+                        else:
+                            item.draw(painter, xMap, yMap, canvasRect)
+                    painter.restore()
 
     def canvasMap(self, axisId):
         """
@@ -1588,6 +1957,7 @@ class QwtPlot(QFrame):
                 self.__data.legend.setParent(None)
                 del self.__data.legend
             self.__data.legend = legend
+            self.__data.layout.invalidate()  # the new legend needs a geometry
             if self.__data.legend:
                 self.legendDataChanged.connect(self.__data.legend.updateLegend)
                 if self.__data.legend.parent() is not self:
@@ -1608,13 +1978,13 @@ class QwtPlot(QFrame):
 
                 previousInChain = None
                 if lpos == self.LeftLegend:
-                    previousInChain = self.axisWidget(QwtPlot.xTop)
+                    previousInChain = self.__axisData[QwtPlot.xTop].scaleWidget
                 elif lpos == self.TopLegend:
                     previousInChain = self
                 elif lpos == self.RightLegend:
-                    previousInChain = self.axisWidget(QwtPlot.yRight)
+                    previousInChain = self.__axisData[QwtPlot.yRight].scaleWidget
                 elif lpos == self.BottomLegend:
-                    previousInChain = self.footerLabel()
+                    previousInChain = self.__data.footerLabel
 
                 if previousInChain is not None:
                     qwtSetTabOrder(previousInChain, legend, True)
@@ -1730,6 +2100,8 @@ class QwtPlotItem_PrivateData(QObject):
         QObject.__init__(self)
 
         self.plot = None
+        self.revision = next(_ITEM_REVISIONS)
+        self.canvasLayer = None
         self.isVisible = True
         self.attributes = 0
         self.interests = 0
@@ -1769,6 +2141,36 @@ class QwtPlotItem(object):
     Depending on the `QwtPlotItem.ItemAttribute` flags, an item is included
     into autoscaling or has an entry on the legend.
 
+    Item attributes:
+
+        * `QwtPlotItem.Legend`: The item is represented on the legend.
+
+        * `QwtPlotItem.AutoScale`: The boundingRect() of the item is
+          included in the autoscaling calculation as long as its width or
+          height is >= 0.0.
+
+        * `QwtPlotItem.Margins`: The item needs extra space to display
+          something outside its bounding rectangle.
+
+        * `QwtPlotItem.RenderCache`: The rendered item is cached in an image
+          (with transparency, at the device pixel ratio of the canvas),
+          which is drawn as long as the item (see :py:meth:`revision()`),
+          its scale maps and the canvas geometry are unchanged. This is
+          meant for heavy items (e.g. a curve with millions of points),
+          which are then not redrawn when other items change. The cache
+          costs 4 bytes per canvas pixel and is not used when printing or
+          exporting to a vector format. This attribute is not implemented
+          in Qwt C++ library.
+
+        * `QwtPlotItem.ThreadedRendering`: The item may be rendered into
+          an image by a worker thread of the plot, concurrently with the
+          other items (see :py:meth:`QwtPlot.setRenderThreadCount()`).
+          The item must not access widgets or pixmaps when drawn: this is
+          the case of curves (except with `QwtSymbol.Pixmap` symbols) and
+          grids, but not of markers with a label. Items having the
+          `QwtPlotItem.RenderCache` attribute are drawn from their cache
+          instead. This attribute is not implemented in Qwt C++ library.
+
     Before misusing the existing item classes it might be better to
     implement a new type of plot item
     ( don't implement a watermark as spectrogram ).
@@ -1813,6 +2215,8 @@ class QwtPlotItem(object):
     Legend = 0x01
     AutoScale = 0x02
     Margins = 0x04
+    RenderCache = 0x08
+    ThreadedRendering = 0x10
 
     # enum ItemInterest
     ScaleInterest = 0x01
@@ -1929,6 +2333,49 @@ class QwtPlotItem(object):
                 plot.attachItem(self, True)
             self.itemChanged()
 
+    def setCanvasLayer(self, layer):
+        """
+        Assign the item to a layer of the layered backing store of the canvas
+
+        By default (`layer` is None), the layer is derived from the z value
+        of the item and from the layer boundaries of the canvas. The items
+        of a layer are painted above the items of the lower layers, whatever
+        their z values.
+
+        :param layer: Layer index, or None
+        :type layer: int or None
+
+        .. seealso::
+
+            :py:meth:`canvasLayer()`,
+            :py:meth:`qwt.plot_canvas.QwtPlotCanvas.setLayerBoundaries()`
+        """
+        if self.__data.canvasLayer != layer:
+            self.__data.canvasLayer = layer
+            self.itemChanged()
+
+    def canvasLayer(self):
+        """
+        :return: Layer index of the item in the layered backing store of the canvas, or None (derived from the z value)
+
+        .. seealso::
+
+            :py:meth:`setCanvasLayer()`
+        """
+        return self.__data.canvasLayer
+
+    def revision(self):
+        """
+        Return the revision of the item
+
+        The revision changes each time :py:meth:`itemChanged()` is called:
+        the layered backing store of the canvas redraws a layer only when
+        the revision of one of its items has changed.
+
+        :return: Revision (unique across items)
+        """
+        return self.__data.revision
+
     def setTitle(self, title):
         """
         Set a new title
@@ -1974,6 +2421,8 @@ class QwtPlotItem(object):
                 self.__data.attributes &= ~attribute
             if attribute == QwtPlotItem.Legend:
                 self.legendChanged()
+            elif attribute == QwtPlotItem.RenderCache and not on:
+                _ITEM_RENDER_CACHES.pop(self, None)
             self.itemChanged()
 
     def testItemAttribute(self, attribute):
@@ -2132,6 +2581,7 @@ class QwtPlotItem(object):
 
             :py:meth:`QwtPlot.legendChanged()`, :py:meth:`QwtPlot.autoRefresh()`
         """
+        self.__data.revision = next(_ITEM_REVISIONS)
         plot = self.plot()
         if plot is not None:
             plot.autoRefresh()
@@ -2231,6 +2681,24 @@ class QwtPlotItem(object):
         """
         return self.__data.yAxis
 
+    def drawBand(self, painter, xMap, yMap, canvasRect, band):
+        """
+        Draw the part of the item inside a vertical band of the canvas
+
+        This is called by the canvas when it scrolls its backing store and
+        only repaints the exposed band (see
+        :py:attr:`qwt.plot_canvas.QwtPlotCanvas.ScrollBlit`): the painter
+        is clipped to the band. The default implementation draws the whole
+        item, series items only draw the samples around the band.
+
+        :param QPainter painter: Painter
+        :param qwt.scale_map.QwtScaleMap xMap: Maps x-values into pixel coordinates.
+        :param qwt.scale_map.QwtScaleMap yMap: Maps y-values into pixel coordinates.
+        :param QRectF canvasRect: Contents rectangle of the canvas
+        :param QRectF band: Band to be painted, in painter coordinates
+        """
+        self.draw(painter, xMap, yMap, canvasRect)
+
     def boundingRect(self):
         """
         :return: An invalid bounding rect: QRectF(1.0, 1.0, -2.0, -2.0)
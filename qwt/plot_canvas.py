@@ -13,6 +13,7 @@ QwtPlotCanvas
    :members:
 """
 
+import bisect
 import weakref
 from collections.abc import Sequence
 
@@ -32,8 +33,10 @@ from qtpy.QtGui import (
 )
 from qtpy.QtWidgets import QFrame, QStyle, QStyleOption, QStyleOptionFrame
 
+from qwt import caches, profiling
 from qwt.null_paintdevice import QwtNullPaintDevice
 from qwt.painter import QwtPainter
+from qwt.plot_hud import QwtPerformanceHud, hud_enabled_by_environment
 
 
 class Border(object):
@@ -326,14 +329,60 @@ class StyleSheet(object):
         self.background = StyleSheetBackground()
 
 
+class CanvasLayer(object):
+    def __init__(self):
+        self.signature = None
+        self.pixmap = None
+
+
+_CANVAS_DATA = weakref.WeakSet()
+
+
+def _backing_stores():
+    return [
+        data
+        for data in _CANVAS_DATA
+        if data.backingStore is not None and not data.backingStore.isNull()
+    ]
+
+
+def _clear_backing_stores():
+    for data in _backing_stores():
+        data.backingStore = QPixmap()
+        data.layers = []
+
+
+def _backing_store_memory():
+    memory = 0
+    for data in _backing_stores():
+        memory += caches.pixmap_memory(data.backingStore)
+        for layer in data.layers:
+            memory += caches.pixmap_memory(layer.pixmap)
+    return memory
+
+
+_BACKING_STORE_STATS = caches.register(
+    "canvas_backing_store",
+    size=lambda: len(_backing_stores()),
+    clear=_clear_backing_stores,
+    memory=_backing_store_memory,
+)
+
+
 class QwtPlotCanvas_PrivateData(QObject):
     def __init__(self):
         QObject.__init__(self)
+        _CANVAS_DATA.add(self)
 
         self.focusIndicator = QwtPlotCanvas.NoFocusIndicator
         self.borderRadius = 0
         self.paintAttributes = 0
         self.backingStore = None
+        self.layers = []
+        self.layerBoundaries = (20.0,)
+        self.scrollSource = None
+        self.scrollMaps = None
+        self.hud = None
         self.styleSheet = StyleSheet()
         self.styleSheet.hasBorder = False
 
@@ -404,6 +453,65 @@ class QwtPlotCanvas(QFrame):
                 :py:meth:`replot()`, :py:meth:`QWidget.repaint()`,
                 :py:meth:`QWidget.update()`
 
+        * `QwtPlotCanvas.PerformanceHud`:
+
+            Paint a performance overlay on top of the plot items
+            (see :py:class:`qwt.plot_hud.QwtPerformanceHud`): frames per
+            second, duration of the last replot steps, points drawn and
+            whether the frame was copied from the backing store.
+
+            The overlay is not painted into the backing store. It is
+            enabled for all canvases when the `QWT_PERFORMANCE_HUD`
+            environment variable is set (to a value other than `0`).
+
+            This option is not implemented in Qwt C++ library.
+
+        * `QwtPlotCanvas.LayeredBackingStore`:
+
+            Split the backing store into layers (enables `BackingStore`).
+
+            Each layer is a pixmap holding the plot items of a z-range
+            (see :py:meth:`setLayerBoundaries()`) or the items assigned to
+            it (see :py:meth:`qwt.plot.QwtPlotItem.setCanvasLayer()`). The
+            first layer also holds the canvas background. When the canvas
+            is repainted, only the layers whose items have changed (see
+            :py:meth:`qwt.plot.QwtPlotItem.revision()`), or whose scale
+            maps have changed, are redrawn: the other layers are composited
+            as they are. With the default boundaries, a streaming curve
+            doesn't redraw the background and the grid.
+
+            Items must call :py:meth:`qwt.plot.QwtPlotItem.itemChanged()`
+            when their appearance changes (all setters of the PythonQwt
+            items do so): :py:meth:`replot()` doesn't invalidate the
+            layers, :py:meth:`invalidateBackingStore()` does. Layers are
+            drawn with :py:meth:`qwt.plot.QwtPlot.drawCanvasLayer()`, hence
+            without reimplementations of `QwtPlot.drawItems()`.
+
+            This option is not implemented in Qwt C++ library.
+
+        * `QwtPlotCanvas.ScrollBlit`:
+
+            Scroll the backing store when the scale maps are translated
+            (enables `BackingStore`).
+
+            When the canvas is replotted and the only change of the scale
+            maps is a horizontal translation by a whole number of pixels
+            (e.g. the x axis of a strip chart advancing by a few pixels per
+            frame), the content of the backing store is scrolled and only
+            the exposed band is repainted: the plot items are drawn with
+            :py:meth:`qwt.plot.QwtPlotItem.drawBand()`, which draws only
+            the samples around the band for series items with increasing
+            x-values. The canvas is repainted completely when the scale
+            maps change otherwise.
+
+            With this option, the application guarantees that the items
+            haven't changed outside of the exposed band (e.g. the samples
+            are only appended), and that the canvas background is invariant
+            under horizontal translation (e.g. a plain color). The option is
+            ignored with `LayeredBackingStore`.
+
+            This option is not implemented in Qwt C++ library.
+
     Focus indicators:
 
         * `QwtPlotCanvas.NoFocusIndicator`:
@@ -437,6 +545,9 @@ class QwtPlotCanvas(QFrame):
     Opaque = 2
     HackStyledBackground = 4
     ImmediatePaint = 8
+    PerformanceHud = 16
+    LayeredBackingStore = 32
+    ScrollBlit = 64
 
     # enum FocusIndicator
     NoFocusIndicator, CanvasFocusIndicator, ItemFocusIndicator = list(range(3))
@@ -457,6 +568,8 @@ class QwtPlotCanvas(QFrame):
         self.setPaintAttribute(QwtPlotCanvas.BackingStore, False)
         self.setPaintAttribute(QwtPlotCanvas.Opaque, True)
         self.setPaintAttribute(QwtPlotCanvas.HackStyledBackground, True)
+        if hud_enabled_by_environment():
+            self.setPaintAttribute(QwtPlotCanvas.PerformanceHud, True)
 
     def plot(self):
         """
@@ -475,6 +588,9 @@ class QwtPlotCanvas(QFrame):
             * `QwtPlotCanvas.Opaque`
             * `QwtPlotCanvas.HackStyledBackground`
             * `QwtPlotCanvas.ImmediatePaint`
+            * `QwtPlotCanvas.PerformanceHud`
+            * `QwtPlotCanvas.LayeredBackingStore`
+            * `QwtPlotCanvas.ScrollBlit`
 
         :param int attribute: Paint attribute
         :param bool on: On/Off
@@ -497,9 +613,27 @@ class QwtPlotCanvas(QFrame):
                     self.__data.backingStore = self.grab(self.rect())
             else:
                 self.__data.backingStore = None
+                self.__data.layers = []
+        elif attribute == self.LayeredBackingStore:
+            self.__data.layers = []
+            if on:
+                self.setPaintAttribute(self.BackingStore, True)
+            self.update()
+        elif attribute == self.ScrollBlit:
+            self.__data.scrollSource = None
+            self.__data.scrollMaps = None
+            if on:
+                self.setPaintAttribute(self.BackingStore, True)
         elif attribute == self.Opaque:
             if on:
                 self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        elif attribute == self.PerformanceHud:
+            if on:
+                self.__data.hud = QwtPerformanceHud(self.plot())
+            else:
+                self.__data.hud.detach()
+                self.__data.hud = None
+            self.update()
         elif attribute in (self.HackStyledBackground, self.ImmediatePaint):
             pass
 
@@ -522,10 +656,69 @@ class QwtPlotCanvas(QFrame):
         """
         return self.__data.backingStore
 
+    def performanceHud(self):
+        """
+        :return: Performance overlay, might be None
+
+        .. seealso::
+
+            :py:meth:`setPaintAttribute()`
+        """
+        return self.__data.hud
+
     def invalidateBackingStore(self):
-        """Invalidate the internal backing store"""
+        """Invalidate the internal backing store (and all its layers)"""
         if self.__data.backingStore:
             self.__data.backingStore = QPixmap()
+        self.__data.layers = []
+        self.__data.scrollSource = None
+
+    def setLayerBoundaries(self, boundaries):
+        """
+        Set the z values separating the layers of the layered backing store
+
+        An item with a z value lower than the first boundary belongs to the
+        first layer (with the canvas background), an item with a z value
+        between the first and the second boundaries to the second layer,
+        and so on. The default boundary (20) separates the grid (z=10) from
+        the curves (z=20) and the markers (z=30).
+
+        :param list boundaries: Increasing z values
+
+        .. seealso::
+
+            :py:meth:`layerBoundaries()`, :py:meth:`layerIndex()`,
+            :py:meth:`qwt.plot.QwtPlotItem.setCanvasLayer()`
+        """
+        self.__data.layerBoundaries = tuple(sorted(boundaries))
+        self.__data.layers = []
+        self.update()
+
+    def layerBoundaries(self):
+        """
+        :return: Z values separating the layers of the layered backing store
+
+        .. seealso::
+
+            :py:meth:`setLayerBoundaries()`
+        """
+        return self.__data.layerBoundaries
+
+    def layerIndex(self, item):
+        """
+        :param qwt.plot.QwtPlotItem item: Plot item
+        :return: Index of the layer of the item in the layered backing store
+
+        .. seealso::
+
+            :py:meth:`setLayerBoundaries()`,
+            :py:meth:`qwt.plot.QwtPlotItem.setCanvasLayer()`
+        """
+        boundaries = self.__data.layerBoundaries
+        layer = item.canvasLayer()
+        if layer is not None:
+            return max(0, min(layer, len(boundaries)))
+        return bisect.bisect_right(boundaries, item.z())
 
     def setFocusIndicator(self, focusIndicator):
         """
@@ -578,6 +771,13 @@ class QwtPlotCanvas(QFrame):
         return self.__data.borderRadius
 
     def event(self, event):
+        if event.type() == QEvent.ParentChange:
+            # The canvas may be created without a parent and then attached
+            # with `QwtPlot.setCanvas()`
+            parent = self.parentWidget()
+            self.__plot = None if parent is None else weakref.ref(parent)
+            if self.__data.hud is not None:
+                self.__data.hud.setPlot(parent)
         if event.type() == QEvent.PolishRequest:
             if self.testPaintAttribute(self.Opaque):
                 self.setAttribute(Qt.WA_OpaquePaintEvent, True)
@@ -586,69 +786,283 @@ class QwtPlotCanvas(QFrame):
         return QFrame.event(self, event)
 
     def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setClipRegion(event.region())
-        if (
-            self.testPaintAttribute(self.BackingStore)
-            and self.__data.backingStore is not None
-        ):
-            bs = self.__data.backingStore
-            pixelRatio = bs.devicePixelRatio()
-            if bs.size() != self.size() * pixelRatio:
-                bs = QwtPainter.backingStore(self, self.size())
+        with profiling.span("QwtPlotCanvas.paintEvent", self.plot()):
+            painter = QPainter(self)
+            painter.setClipRegion(event.region())
+            fromBackingStore = False
+            if (
+                self.testPaintAttribute(self.BackingStore)
+                and self.__data.backingStore is not None
+                and self.testPaintAttribute(self.LayeredBackingStore)
+            ):
+                fromBackingStore = self.__updateLayers()
+                painter.drawPixmap(0, 0, self.__data.backingStore)
+            elif (
+                self.testPaintAttribute(self.BackingStore)
+                and self.__data.backingStore is not None
+            ):
+                bs = self.__data.backingStore
+                pixelRatio = bs.devicePixelRatio()
+                if bs.size() != self.size() * pixelRatio and self.__scroll():
+                    _BACKING_STORE_STATS.misses += 1
+                elif bs.size() != self.size() * pixelRatio:
+                    _BACKING_STORE_STATS.misses += 1
+                    bs = QwtPainter.backingStore(self, self.size())
+                    if self.testAttribute(Qt.WA_StyledBackground):
+                        p = QPainter(bs)
+                        qwtFillBackground(p, self)
+                        self.drawCanvas(p, True)
+                    else:
+                        p = QPainter()
+                        if self.__data.borderRadius <= 0.0:
+                            #                        print('**DEBUG: QwtPlotCanvas.paintEvent')
+                            QwtPainter.fillPixmap(self, bs)
+                            p.begin(bs)
+                            self.drawCanvas(p, False)
+                        else:
+                            p.begin(bs)
+                            qwtFillBackground(p, self)
+                            self.drawCanvas(p, True)
+                        if self.frameWidth() > 0:
+                            self.drawBorder(p)
+                        p.end()
+                    # Store the regenerated pixmap back: the C++ original uses a
+                    # reference into the stored pixmap, whereas the rebinding above
+                    # only updates the local variable.
+                    self.__data.backingStore = bs
+                    self.__data.scrollMaps = self.__scrollMaps()
+                else:
+                    _BACKING_STORE_STATS.hits += 1
+                    fromBackingStore = True
+                painter.drawPixmap(0, 0, self.__data.backingStore)
+            else:
                 if self.testAttribute(Qt.WA_StyledBackground):
-                    p = QPainter(bs)
-                    qwtFillBackground(p, self)
-                    self.drawCanvas(p, True)
+                    if self.testAttribute(Qt.WA_OpaquePaintEvent):
+                        qwtFillBackground(painter, self)
+                        self.drawCanvas(painter, True)
+                    else:
+                        self.drawCanvas(painter, False)
                 else:
-                    p = QPainter()
-                    if self.__data.borderRadius <= 0.0:
-                        #                        print('**DEBUG: QwtPlotCanvas.paintEvent')
-                        QwtPainter.fillPixmap(self, bs)
-                        p.begin(bs)
-                        self.drawCanvas(p, False)
+                    if self.testAttribute(Qt.WA_OpaquePaintEvent):
+                        if self.autoFillBackground():
+                            qwtFillBackground(painter, self)
+                            qwtDrawBackground(painter, self)
                     else:
-                        p.begin(bs)
-                        qwtFillBackground(p, self)
-                        self.drawCanvas(p, True)
+                        if self.borderRadius() > 0.0:
+                            clipPath = QPainterPath()
+                            clipPath.addRect(self.rect())
+                            clipPath = clipPath.subtracted(self.borderPath(self.rect()))
+                            painter.save()
+                            painter.setClipPath(clipPath, Qt.IntersectClip)
+                            qwtFillBackground(painter, self)
+                            qwtDrawBackground(painter, self)
+                            painter.restore()
+                    self.drawCanvas(painter, False)
                     if self.frameWidth() > 0:
-                        self.drawBorder(p)
-                    p.end()
-                # Store the regenerated pixmap back: the C++ original uses a
-                # reference into the stored pixmap, whereas the rebinding above
-                # only updates the local variable.
-                self.__data.backingStore = bs
-            painter.drawPixmap(0, 0, self.__data.backingStore)
+                        self.drawBorder(painter)
+            if self.hasFocus() and self.focusIndicator() == self.CanvasFocusIndicator:
+                self.drawFocusIndicator(painter)
+            if self.__data.hud is not None:
+                self.__data.hud.draw(
+                    painter, QRectF(self.contentsRect()), fromBackingStore
+                )
+
+    def __scrollMaps(self):
+        plot = self.plot()
+        if plot is None or not self.testPaintAttribute(self.ScrollBlit):
+            return None
+        return [plot.canvasMap(axisId) for axisId in plot.AXES]
+
+    def __scrollShift(self, maps):
+        """
+        :param list maps: Current scale maps
+        :return: Horizontal translation of the scale maps since the backing store was painted, in pixels, or None if the scale maps have changed otherwise
+        """
+        previous = self.__data.scrollMaps
+        xAxes, yAxes = set(), set()
+        for item in self.plot().itemList():
+            xAxes.add(item.xAxis())
+            yAxes.add(item.yAxis())
+        for axisId in yAxes:
+            if maps[axisId] != previous[axisId]:
+                return None
+        shift = None
+        for axisId in xAxes:
+            old, new = previous[axisId], maps[axisId]
+            if (
+                old.transformation() is not None
+                or new.transformation() is not None
+                or old.p1() != new.p1()
+                or old.p2() != new.p2()
+                or abs(new.sDist() - old.sDist()) > 1e-9 * abs(old.sDist())
+            ):
+                return None
+            axisShift = new.transform(old.s1()) - old.p1()
+            if shift is None:
+                shift = axisShift
+            elif abs(axisShift - shift) > 1e-6:
+                return None
+        return shift
+
+    def __scroll(self):
+        """
+        Scroll the previous backing store and repaint the exposed band, if
+        the scale maps have only been translated horizontally since it was
+        painted
+
+        :return: True if the backing store was scrolled
+        """
+        source = self.__data.scrollSource
+        self.__data.scrollSource = None
+        maps = self.__scrollMaps()
+        if (
+            source is None
+            or maps is None
+            or self.__data.scrollMaps is None
+            or source.size() != self.size() * source.devicePixelRatio()
+        ):
+            return False
+        shift = self.__scrollShift(maps)
+        if shift is None:
+            return False
+        pixelRatio = source.devicePixelRatio()
+        dx = int(round(shift * pixelRatio))
+        cr = self.contentsRect()
+        if dx == 0 or abs(shift * pixelRatio - dx) > 1e-3 or abs(shift) >= cr.width():
+            return False
+        source.scroll(
+            dx,
+            0,
+            QRect(
+                int(round(cr.x() * pixelRatio)),
+                int(round(cr.y() * pixelRatio)),
+                int(round(cr.width() * pixelRatio)),
+                int(round(cr.height() * pixelRatio)),
+            ),
+        )
+        #  The band is widened to repaint the end of the previous drawing
+        #  (e.g. the cap of the last segment of a curve)
+        width = min(abs(dx) / pixelRatio + 2, cr.width())
+        if dx < 0:
+            band = QRectF(cr.x() + cr.width() - width, cr.y(), width, cr.height())
         else:
+            band = QRectF(cr.x(), cr.y(), width, cr.height())
+        painter = QPainter(source)
+        painter.setClipRect(band)
+        if self.testAttribute(Qt.WA_StyledBackground):
+            hackStyledBackground = self.__hackStyledBackground(True)
+            qwtFillBackground(painter, self)
+            self.__drawBackground(painter, hackStyledBackground)
+            self.__drawItems(painter, None, band)
+            if hackStyledBackground:
+                self.__drawStyledBorder(painter)
+        else:
+            if self.__data.borderRadius <= 0.0:
+                rect = band.toAlignedRect()
+                pm = QPixmap(rect.size())
+                QwtPainter.fillPixmap(self, pm, rect.topLeft())
+                painter.drawPixmap(rect.topLeft(), pm)
+            else:
+                qwtFillBackground(painter, self)
+                self.__drawBackground(painter, False)
+            self.__drawItems(painter, None, band)
+        painter.end()
+        self.__data.backingStore = source
+        self.__data.scrollMaps = maps
+        return True
+
+    def __updateLayers(self):
+        """
+        Redraw the layers whose items have changed and composite them into
+        the backing store
+
+        :return: True if the backing store is unchanged
+        """
+        plot = self.plot()
+        layerItems = [[] for _index in range(len(self.__data.layerBoundaries) + 1)]
+        maps = None
+        if plot is not None:
+            for item in plot.itemList():
+                layerItems[self.layerIndex(item)].append(item)
+            maps = tuple(plot.canvasMap(axisId) for axisId in plot.AXES)
+        cr = self.contentsRect()
+        common = (
+            self.width(),
+            self.height(),
+            self.devicePixelRatioF(),
+            (cr.x(), cr.y(), cr.width(), cr.height()),
+            maps,
+        )
+        background = (
+            self.palette().cacheKey(),
+            self.styleSheet(),
+            self.frameStyle(),
+            self.lineWidth(),
+            self.__data.borderRadius,
+            self.autoFillBackground(),
+            self.testAttribute(Qt.WA_StyledBackground),
+        )
+        if len(self.__data.layers) != len(layerItems):
+            self.__data.layers = [CanvasLayer() for _items in layerItems]
+        changed = self.__data.backingStore.isNull()
+        for index, items in enumerate(layerItems):
+            signature = (
+                common,
+                background if index == 0 else None,
+                tuple((id(item), item.revision()) for item in items),
+            )
+            layer = self.__data.layers[index]
+            if layer.signature != signature:
+                _BACKING_STORE_STATS.misses += 1
+                layer.pixmap = self.__drawLayer(index, items)
+                layer.signature = signature
+                changed = True
+        if not changed:
+            _BACKING_STORE_STATS.hits += 1
+            return True
+        bs = QwtPainter.backingStore(self, self.size())
+        bs.fill(Qt.transparent)
+        painter = QPainter(bs)
+        for layer in self.__data.layers:
+            painter.drawPixmap(0, 0, layer.pixmap)
+        if self.testAttribute(Qt.WA_StyledBackground):
+            if self.__hackStyledBackground(True):
+                self.__drawStyledBorder(painter)
+        elif self.frameWidth() > 0:
+            self.drawBorder(painter)
+        painter.end()
+        self.__data.backingStore = bs
+        return False
+
+    def __drawLayer(self, index, items):
+        """
+        Draw a layer of the layered backing store
+
+        :param int index: Layer index (the first layer holds the background)
+        :param list items: Plot items of the layer
+        :return: Layer pixmap
+        """
+        pm = QwtPainter.backingStore(self, self.size())
+        if index == 0:
             if self.testAttribute(Qt.WA_StyledBackground):
-                if self.testAttribute(Qt.WA_OpaquePaintEvent):
-                    qwtFillBackground(painter, self)
-                    self.drawCanvas(painter, True)
-                else:
-                    self.drawCanvas(painter, False)
+                painter = QPainter(pm)
+                qwtFillBackground(painter, self)
+                self.__drawBackground(painter, self.__hackStyledBackground(True))
+            elif self.__data.borderRadius <= 0.0:
+                QwtPainter.fillPixmap(self, pm)
+                painter = QPainter(pm)
             else:
-                if self.testAttribute(Qt.WA_OpaquePaintEvent):
-                    if self.autoFillBackground():
-                        qwtFillBackground(painter, self)
-                        qwtDrawBackground(painter, self)
-                else:
-                    if self.borderRadius() > 0.0:
-                        clipPath = QPainterPath()
-                        clipPath.addRect(self.rect())
-                        clipPath = clipPath.subtracted(self.borderPath(self.rect()))
-                        painter.save()
-                        painter.setClipPath(clipPath, Qt.IntersectClip)
-                        qwtFillBackground(painter, self)
-                        qwtDrawBackground(painter, self)
-                        painter.restore()
-                self.drawCanvas(painter, False)
-                if self.frameWidth() > 0:
-                    self.drawBorder(painter)
-        if self.hasFocus() and self.focusIndicator() == self.CanvasFocusIndicator:
-            self.drawFocusIndicator(painter)
+                painter = QPainter(pm)
+                qwtFillBackground(painter, self)
+                self.__drawBackground(painter, False)
+        else:
+            pm.fill(Qt.transparent)
+            painter = QPainter(pm)
+        self.__drawItems(painter, items)
+        painter.end()
+        return pm
 
-    def drawCanvas(self, painter, withBackground):
-        hackStyledBackground = False
+    def __hackStyledBackground(self, withBackground):
         if (
             withBackground
             and self.testAttribute(Qt.WA_StyledBackground)
@@ -670,32 +1084,45 @@ class QwtPlotCanvas(QFrame):
                 and not self.__data.styleSheet.borderPath.isEmpty()
             ):
                 #  We have a border with at least one rounded corner
-                hackStyledBackground = True
+                return True
+        return False
+
+    def drawCanvas(self, painter, withBackground):
+        hackStyledBackground = self.__hackStyledBackground(withBackground)
         if withBackground:
-            painter.save()
-            if self.testAttribute(Qt.WA_StyledBackground):
-                if hackStyledBackground:
-                    #  paint background without border
-                    painter.setPen(Qt.NoPen)
-                    painter.setBrush(self.__data.styleSheet.background.brush)
-                    painter.setBrushOrigin(self.__data.styleSheet.background.origin)
-                    painter.setClipPath(self.__data.styleSheet.borderPath)
-                    painter.drawRect(self.contentsRect())
-                else:
-                    qwtDrawStyledBackground(self, painter)
-            elif self.autoFillBackground():
+            self.__drawBackground(painter, hackStyledBackground)
+        self.__drawItems(painter, None)
+        if withBackground and hackStyledBackground:
+            #  Now paint the border on top
+            self.__drawStyledBorder(painter)
+
+    def __drawBackground(self, painter, hackStyledBackground):
+        painter.save()
+        if self.testAttribute(Qt.WA_StyledBackground):
+            if hackStyledBackground:
+                #  paint background without border
                 painter.setPen(Qt.NoPen)
-                painter.setBrush(self.palette().brush(self.backgroundRole()))
-                if self.__data.borderRadius > 0.0 and self.rect() == self.frameRect():
-                    if self.frameWidth() > 0:
-                        painter.setClipPath(self.borderPath(self.rect()))
-                        painter.drawRect(self.rect())
-                    else:
-                        painter.setRenderHint(QPainter.Antialiasing, True)
-                        painter.drawPath(self.borderPath(self.rect()))
-                else:
+                painter.setBrush(self.__data.styleSheet.background.brush)
+                painter.setBrushOrigin(self.__data.styleSheet.background.origin)
+                painter.setClipPath(self.__data.styleSheet.borderPath)
+                painter.drawRect(self.contentsRect())
+            else:
+                qwtDrawStyledBackground(self, painter)
+        elif self.autoFillBackground():
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(self.palette().brush(self.backgroundRole()))
+            if self.__data.borderRadius > 0.0 and self.rect() == self.frameRect():
+                if self.frameWidth() > 0:
+                    painter.setClipPath(self.borderPath(self.rect()))
                     painter.drawRect(self.rect())
-            painter.restore()
+                else:
+                    painter.setRenderHint(QPainter.Antialiasing, True)
+                    painter.drawPath(self.borderPath(self.rect()))
+            else:
+                painter.drawRect(self.rect())
+        painter.restore()
+
+    def __drawItems(self, painter, items, band=None):
         painter.save()
         if not self.__data.styleSheet.borderPath.isEmpty():
             painter.setClipPath(self.__data.styleSheet.borderPath, Qt.IntersectClip)
@@ -707,13 +1134,18 @@ class QwtPlotCanvas(QFrame):
                 painter.setClipRect(self.contentsRect(), Qt.IntersectClip)
         plot = self.plot()
         if plot is not None:
-            plot.drawCanvas(painter)
+            if band is not None:
+                plot.drawCanvasBand(painter, band)
+            elif items is None:
+                plot.drawCanvas(painter)
+            else:
+                plot.drawCanvasLayer(painter, items)
         painter.restore()
-        if withBackground and hackStyledBackground:
-            #  Now paint the border on top
-            opt = QStyleOptionFrame()
-            opt.initFrom(self)
-            self.style().drawPrimitive(QStyle.PE_Frame, opt, painter, self)
+
+    def __drawStyledBorder(self, painter):
+        opt = QStyleOptionFrame()
+        opt.initFrom(self)
+        self.style().drawPrimitive(QStyle.PE_Frame, opt, painter, self)
 
     def drawBorder(self, painter):
         """
@@ -788,8 +1220,22 @@ class QwtPlotCanvas(QFrame):
     def replot(self):
         """
         Invalidate the paint cache and repaint the canvas
+
+        With the `LayeredBackingStore` paint attribute, the layers are not
+        invalidated: the layers whose items have changed are redrawn when
+        the canvas is repainted. With the `ScrollBlit` paint attribute, the
+        backing store may be scrolled instead of being repainted.
         """
-        self.invalidateBackingStore()
+        if not self.testPaintAttribute(self.LayeredBackingStore):
+            source = self.__data.backingStore
+            self.invalidateBackingStore()
+            if (
+                self.testPaintAttribute(self.ScrollBlit)
+                and source is not None
+                and not source.isNull()
+            ):
+                #  Kept for scrolling, if the scale maps are only translated
+                self.__data.scrollSource = source
         if self.testPaintAttribute(self.ImmediatePaint):
             self.repaint(self.contentsRect())
         else:
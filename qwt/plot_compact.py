@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the Qwt License
+# (see LICENSE file for more details)
+
+"""
+QwtCompactPlot
+--------------
+
+.. autoclass:: QwtCompactPlot
+   :members:
+"""
+
+import weakref
+
+from qtpy.QtCore import QPointF, QRectF, Qt
+from qtpy.QtGui import QPainter, QPalette
+from qtpy.QtWidgets import QWidget
+
+from qwt import caches, profiling
+from qwt.painter import QwtPainter
+from qwt.plot import QwtPlot
+
+_COMPACT_PLOTS = weakref.WeakSet()
+
+
+def _backing_stores():
+    stores = [plot.backingStore() for plot in _COMPACT_PLOTS]
+    return [store for store in stores if store is not None]
+
+
+def _clear_backing_stores():
+    for plot in list(_COMPACT_PLOTS):
+        if plot.backingStore() is not None:
+            plot.invalidateBackingStore()
+
+
+_BACKING_STORE_STATS = caches.register(
+    "compact_plot_backing_store",
+    size=lambda: len(_backing_stores()),
+    clear=_clear_backing_stores,
+    memory=lambda: sum(caches.pixmap_memory(pm) for pm in _backing_stores()),
+)
+
+
+class QwtCompactPlot(QwtPlot):
+    """
+    A lightweight plot widget, painting all its components at once
+
+    `QwtCompactPlot` has the same API as :py:class:`qwt.plot.QwtPlot` (plot
+    items, axes, title, footer, layout), but only the plot widget itself is
+    shown on screen: the canvas, the scale widgets and the title/footer
+    labels are kept hidden and are only used to hold the configuration and
+    the geometry computed by the plot layout. The title, the axes and the
+    canvas are painted from the `paintEvent` of the plot into a single
+    backing store, which is regenerated on `replot()` and when the layout
+    changes.
+
+    This saves the show/move/resize/paint event dispatching of the
+    sub-widgets, which is significant for dashboards showing hundreds of
+    small plots.
+
+    .. warning::
+
+        Since the canvas is not shown, the interaction classes working on
+        the canvas widget (event filters, pickers, direct painter, ...) are
+        not supported. `canvasMap()`, `transform()` and `invTransform()`
+        work as for `QwtPlot`, in the coordinate system of the canvas
+        (see `canvas().geometry()` for its position in the plot).
+
+    .. py:class:: QwtCompactPlot([title=""], [parent=None])
+
+        :param str title: Title text
+        :param QWidget parent: Parent widget
+    """
+
+    def __init__(self, *args):
+        self.__backingStore = None
+        self.__layoutPending = True
+        QwtPlot.__init__(self, *args)
+        self.hideComponents()
+        _COMPACT_PLOTS.add(self)
+
+    def hideComponents(self):
+        """
+        Hide the sub-widgets of the plot
+
+        The sub-widgets which are created later on (see
+        :py:meth:`qwt.plot.QwtPlot.axisWidget()`) are hidden when the layout
+        is updated.
+        """
+        for child in self.children():
+            if isinstance(child, QWidget) and not child.isHidden():
+                child.hide()
+
+    def invalidateBackingStore(self):
+        """Invalidate the backing store and schedule a repaint"""
+        self.__backingStore = None
+        self.update()
+
+    def backingStore(self):
+        """
+        :return: Backing store, might be None
+        """
+        return self.__backingStore
+
+    def replot(self):
+        """
+        Redraw the plot
+
+        .. seealso::
+
+            :py:meth:`qwt.plot.QwtPlot.replot()`
+        """
+        with profiling.span("QwtPlot.replot", self):
+            doAutoReplot = self.autoReplot()
+            self.setAutoReplot(False)
+            self.updateAxes()
+            # The scale widgets are hidden: they don't post layout requests
+            # when their size hints change
+            self.updateLayout()
+            self.setAutoReplot(doAutoReplot)
+        caches.check_budget()
+
+    def updateLayout(self):
+        """
+        Adjust plot content to its current size
+
+        The layout is only calculated before the plot is painted (or when
+        the canvas maps are requested): the geometries of the hidden
+        sub-widgets are then updated, without showing them.
+
+        .. seealso::
+
+            :py:meth:`qwt.plot.QwtPlot.updateLayout()`
+        """
+        self.__layoutPending = True
+        self.invalidateBackingStore()
+
+    def activateLayout(self):
+        """
+        Calculate the pending layout and update the geometries of the hidden
+        sub-widgets
+
+        .. seealso::
+
+            :py:meth:`updateLayout()`
+        """
+        with profiling.span("QwtPlot.updateLayout", self):
+            canvas = self.canvas()
+            if not self.__layoutPending or canvas is None:
+                return
+            self.__layoutPending = False
+            layout = self.plotLayout()
+            layout.activate(self, self.contentsRect())
+
+            self.hideComponents()
+            for text, labelGetter, rect in (
+                (self.title(), self.titleLabel, layout.titleRect()),
+                (self.footer(), self.footerLabel, layout.footerRect()),
+            ):
+                if not text.isEmpty():
+                    labelGetter().setGeometry(rect.toRect())
+            for axisId in self.AXES:
+                if self.axisEnabled(axisId):
+                    scaleWidget = self.axisWidget(axisId)
+                    scaleRect = layout.scaleRect(axisId).toRect()
+                    if scaleRect != scaleWidget.geometry():
+                        scaleWidget.setGeometry(scaleRect)
+                        # Hidden widgets don't receive resize events
+                        scaleWidget.layoutScale(False)
+                        startDist, endDist = scaleWidget.getBorderDistHint()
+                        scaleWidget.setBorderDist(startDist, endDist)
+            legend = self.legend()
+            if legend is not None and not legend.isEmpty():
+                legend.setGeometry(layout.legendRect().toRect())
+            canvasRect = layout.canvasRect().toRect()
+            if canvasRect != canvas.geometry():
+                canvas.setGeometry(canvasRect)
+                # Done by the canvas resize event filter for QwtPlot
+                self.updateCanvasMargins()
+                self.activateLayout()
+
+    def canvasMap(self, axisId):
+        """
+        :param int axisId: Axis
+        :return: Map for the axis on the canvas. With this map pixel coordinates can translated to plot coordinates and vice versa.
+
+        .. seealso::
+
+            :py:meth:`qwt.plot.QwtPlot.canvasMap()`
+        """
+        self.activateLayout()
+        return QwtPlot.canvasMap(self, axisId)
+
+    def paintEvent(self, event):
+        with profiling.span("QwtCompactPlot.paintEvent", self):
+            self.activateLayout()
+            if self.__backingStore is None or self.__backingStore.isNull():
+                _BACKING_STORE_STATS.misses += 1
+                self.__backingStore = QwtPainter.backingStore(self, self.size())
+                QwtPainter.fillPixmap(self, self.__backingStore)
+                painter = QPainter(self.__backingStore)
+                self.drawContents(painter)
+                painter.end()
+            else:
+                _BACKING_STORE_STATS.hits += 1
+            painter = QPainter(self)
+            painter.setClipRegion(event.region())
+            painter.drawPixmap(0, 0, self.__backingStore)
+
+    def __initPainter(self, painter, widget):
+        # Same initial state as a painter opened on the (hidden) widget
+        painter.translate(QPointF(widget.pos()))
+        painter.setFont(widget.font())
+        painter.setPen(widget.palette().color(QPalette.WindowText))
+
+    def drawContents(self, painter):
+        """
+        Draw the frame, the title, the footer, the legend, the axes and the
+        canvas of the plot
+
+        :param QPainter painter: Painter
+        """
+        self.drawFrame(painter)
+        for text, labelGetter in (
+            (self.title(), self.titleLabel),
+            (self.footer(), self.footerLabel),
+        ):
+            if not text.isEmpty():
+                label = labelGetter()
+                painter.save()
+                self.__initPainter(painter, label)
+                if label.frameWidth() > 0:
+                    label.drawFrame(painter)
+                label.drawContents(painter)
+                painter.restore()
+        legend = self.legend()
+        if legend is not None and not legend.isEmpty():
+            legend.renderLegend(painter, QRectF(legend.geometry()), False)
+        for axisId in self.AXES:
+            if self.axisEnabled(axisId):
+                scaleWidget = self.axisWidget(axisId)
+                painter.save()
+                self.__initPainter(painter, scaleWidget)
+                scaleWidget.draw(painter)
+                painter.restore()
+        canvas = self.canvas()
+        painter.save()
+        self.__initPainter(painter, canvas)
+        painter.setClipRect(canvas.rect(), Qt.IntersectClip)
+        canvas.drawCanvas(painter, True)
+        if canvas.frameWidth() > 0:
+            canvas.drawBorder(painter)
+        painter.restore()
@@ -20,6 +20,7 @@ import numpy as np
 from qtpy.QtCore import QLineF, QPointF, QRectF, QSize, Qt
 from qtpy.QtGui import QBrush, QColor, QPainter, QPen, QPolygonF
 
+from qwt import stats
 from qwt._math import qwtSqr
 from qwt.graphic import QwtGraphic
 from qwt.plot import QwtPlot, QwtPlotItem, QwtPlotItem_PrivateData
@@ -64,6 +65,39 @@ def qwtVerifyRange(size, i1, i2):
     return i2 - i1 + 1
 
 
+def qpolygonf_as_array(polyline, size):
+    """
+    Resize a polyline (QtGui.QPolygonF object) to `size` points and return
+    a writable NumPy view of its memory, without copying.
+
+    Shrinking the polyline does not release its memory, so that a polyline
+    may be reused as a grow-only buffer across paint events.
+    This feature is compatible with PyQt5, PyQt6 and PySide6 (requires QtPy).
+
+    :param QtGui.QPolygonF polyline: Polyline
+    :param int size: Number of points
+    :return: NumPy array of shape (size, 2) sharing the polyline memory
+    :rtype: numpy.ndarray
+    """
+    if QT_API == "pyqt5":  # PyQt5 does not wrap QVector.resize
+        count = polyline.size()
+        if size < count:
+            polyline.remove(size, count - size)
+        elif size > count:
+            polyline.fill(QPointF(), size)
+    else:
+        polyline.resize(size)
+    if size == 0:
+        return np.empty((0, 2), dtype=np.float64)
+    if QT_API.startswith("pyside"):  # PySide (obviously...)
+        address = shiboken.getCppPointer(polyline.data())[0]
+        buffer = (ctypes.c_double * 2 * size).from_address(address)
+    else:  # PyQt
+        buffer = polyline.data()
+        buffer.setsize(16 * size)  # 16 bytes per point: 8 bytes per X,Y value (float64)
+    return np.frombuffer(buffer, np.float64).reshape(size, 2)
+
+
 def array2d_to_qpolygonf(xdata, ydata):
     """
     Utility function to convert two 1D-NumPy arrays representing curve data
@@ -79,32 +113,38 @@ def array2d_to_qpolygonf(xdata, ydata):
     """
     if not (xdata.size == ydata.size == xdata.shape[0] == ydata.shape[0]):
         raise ValueError("Arguments must be 1D NumPy arrays with same size")
-    size = xdata.size
-    if QT_API.startswith("pyside"):  # PySide (obviously...)
-        polyline = QPolygonF()
-        polyline.resize(size)
-        address = shiboken.getCppPointer(polyline.data())[0]
-        buffer = (ctypes.c_double * 2 * size).from_address(address)
-    else:  # PyQt
-        if QT_API == "pyqt6":
-            polyline = QPolygonF([QPointF(0, 0)] * size)
-        else:
-            polyline = QPolygonF(size)
-        buffer = polyline.data()
-        buffer.setsize(16 * size)  # 16 bytes per point: 8 bytes per X,Y value (float64)
-    memory = np.frombuffer(buffer, np.float64)
-    memory[: (size - 1) * 2 + 1 : 2] = np.asarray(xdata, dtype=np.float64)
-    memory[1 : (size - 1) * 2 + 2 : 2] = np.asarray(ydata, dtype=np.float64)
+    polyline = QPolygonF()
+    memory = qpolygonf_as_array(polyline, xdata.size)
+    memory[:, 0] = xdata
+    memory[:, 1] = ydata
     return polyline
 
 
-def series_to_polyline(xMap, yMap, series, from_, to):
+def series_to_polyline(xMap, yMap, series, from_, to, polyline=None):
     """
     Convert series data to QPolygon(F) polyline
+
+    The scale maps are applied directly into the polyline memory, so that
+    no intermediate array is allocated for the transformed coordinates.
+
+    :param qwt.scale_map.QwtScaleMap xMap: Maps x-values into pixel coordinates.
+    :param qwt.scale_map.QwtScaleMap yMap: Maps y-values into pixel coordinates.
+    :param series: Series data (e.g. `QwtPointArrayData` instance)
+    :param int from_: Index of the first point
+    :param int to: Index of the last point
+    :param polyline: Polyline to be reused as buffer (a new one is created if None)
+    :type polyline: QtGui.QPolygonF or None
+    :return: Polyline
+    :rtype: QtGui.QPolygonF
     """
-    xdata = xMap.transform(series.xData()[from_ : to + 1])
-    ydata = yMap.transform(series.yData()[from_ : to + 1])
-    return array2d_to_qpolygonf(xdata, ydata)
+    xdata = series.xData()[from_ : to + 1]
+    ydata = series.yData()[from_ : to + 1]
+    if polyline is None:
+        polyline = QPolygonF()
+    memory = qpolygonf_as_array(polyline, min(xdata.size, ydata.size))
+    xMap.transform_array(xdata, out=memory[:, 0])
+    yMap.transform_array(ydata, out=memory[:, 1])
+    return polyline
 
 
 class QwtPlotCurve_PrivateData(QwtPlotItem_PrivateData):
@@ -117,6 +157,7 @@ class QwtPlotCurve_PrivateData(QwtPlotItem_PrivateData):
         self.legendAttributes = QwtPlotCurve.LegendShowLine
         self.pen = QPen(Qt.black)
         self.brush = QBrush()
+        self.polylineBuffer = QPolygonF()
 
 
 class QwtPlotCurve(QwtPlotSeriesItem, QwtSeriesStore):
@@ -568,6 +609,38 @@ class QwtPlotCurve(QwtPlotSeriesItem, QwtSeriesStore):
                 )
                 painter.restore()
 
+    def drawBand(self, painter, xMap, yMap, canvasRect, band):
+        """
+        Draw the samples around a vertical band of the canvas
+
+        The band is widened by the pen width and by the symbol size, so that
+        the lines and the symbols of the samples outside the band, which
+        overlap the band, are drawn.
+
+        :param QPainter painter: Painter
+        :param qwt.scale_map.QwtScaleMap xMap: Maps x-values into pixel coordinates.
+        :param qwt.scale_map.QwtScaleMap yMap: Maps y-values into pixel coordinates.
+        :param QRectF canvasRect: Contents rectangle of the canvas
+        :param QRectF band: Band to be painted, in painter coordinates
+
+        .. seealso::
+
+            :py:meth:`qwt.plot_series.QwtPlotSeriesItem.drawBand()`
+        """
+        margin = 1.0 + self.__data.pen.widthF()
+        symbol = self.__data.symbol
+        if symbol and symbol.style() != QwtSymbol.NoSymbol:
+            size = symbol.boundingRect().size()
+            margin += max(size.width(), size.height())
+        QwtPlotSeriesItem.drawBand(
+            self,
+            painter,
+            xMap,
+            yMap,
+            canvasRect,
+            band.adjusted(-margin, 0.0, margin, 0.0),
+        )
+
     def drawCurve(self, painter, style, xMap, yMap, canvasRect, from_, to):
         """
         Draw the line part (without symbols) of a curve interval.
@@ -616,8 +689,12 @@ class QwtPlotCurve(QwtPlotSeriesItem, QwtSeriesStore):
             self.__data.brush.style() != Qt.NoBrush
             and self.__data.brush.color().alpha() > 0
         )
-        polyline = series_to_polyline(xMap, yMap, self.data(), from_, to)
+        polyline = series_to_polyline(
+            xMap, yMap, self.data(), from_, to, self.__data.polylineBuffer
+        )
         painter.drawPolyline(polyline)
+        size = polyline.size()
+        stats.count(self.plot(), points_transformed=size, points_painted=size)
         if doFill:
             self.fillCurve(painter, xMap, yMap, canvasRect, polyline)
 
@@ -652,6 +729,8 @@ class QwtPlotCurve(QwtPlotSeriesItem, QwtSeriesStore):
             else:
                 painter.drawLine(QLineF(x0, yi, xi, yi))
         painter.restore()
+        size = to - from_ + 1
+        stats.count(self.plot(), points_transformed=size, points_painted=2 * size)
 
     def drawDots(self, painter, xMap, yMap, canvasRect, from_, to):
         """
@@ -673,8 +752,12 @@ class QwtPlotCurve(QwtPlotSeriesItem, QwtSeriesStore):
             self.__data.brush.style() != Qt.NoBrush
             and self.__data.brush.color().alpha() > 0
         )
-        polyline = series_to_polyline(xMap, yMap, self.data(), from_, to)
+        polyline = series_to_polyline(
+            xMap, yMap, self.data(), from_, to, self.__data.polylineBuffer
+        )
         painter.drawPoints(polyline)
+        size = polyline.size()
+        stats.count(self.plot(), points_transformed=size, points_painted=size)
         if doFill:
             self.fillCurve(painter, xMap, yMap, canvasRect, polyline)
 
@@ -720,6 +803,7 @@ class QwtPlotCurve(QwtPlotSeriesItem, QwtSeriesStore):
             polygon[ip] = QPointF(xi, yi)
             ip += 2
         painter.drawPolyline(polygon)
+        stats.count(self.plot(), points_transformed=to - from_ + 1, points_painted=size)
         if self.__data.brush.style() != Qt.NoBrush:
             self.fillCurve(painter, xMap, yMap, canvasRect, polygon)
 
@@ -832,9 +916,16 @@ class QwtPlotCurve(QwtPlotSeriesItem, QwtSeriesStore):
         chunkSize = 500
         for i in range(from_, to + 1, chunkSize):
             n = min([chunkSize, to - i + 1])
-            points = series_to_polyline(xMap, yMap, self.data(), i, i + n - 1)
+            points = series_to_polyline(
+                xMap, yMap, self.data(), i, i + n - 1, self.__data.polylineBuffer
+            )
             if points.size() > 0:
                 symbol.drawSymbols(painter, points)
+                stats.count(
+                    self.plot(),
+                    points_transformed=points.size(),
+                    symbols_drawn=points.size(),
+                )
 
     def setBaseline(self, value):
         """
@@ -0,0 +1,697 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the Qwt License
+# (see LICENSE file for more details)
+
+"""
+QwtHeadlessPlot
+---------------
+
+.. autoclass:: QwtHeadlessPlot
+   :members:
+"""
+
+import math
+import os
+
+import numpy as np
+from qtpy.QtCore import QBuffer, QByteArray, QIODevice, QRectF, Qt
+from qtpy.QtGui import QBrush, QColor, QFont, QImage, QPainter, QPalette
+
+from qwt import profiling
+from qwt.interval import QwtInterval
+from qwt.plot import AxisData, ItemList, QwtPlot, QwtPlotItem
+from qwt.scale_draw import QwtScaleDraw
+from qwt.scale_engine import QwtLinearScaleEngine
+from qwt.scale_map import QwtScaleMap
+from qwt.text import QwtText
+
+QT_API = os.environ["QT_API"]
+
+if QT_API.startswith("pyqt"):
+    from qtpy import sip
+
+#: Resolution at which the plot is laid out (the image is scaled for other resolutions)
+LAYOUT_DPI = 96.0
+
+
+def qwtHeadlessFont(pointSize):
+    font = QFont()
+    font.setPointSize(pointSize)
+    return font
+
+
+def qwtArrayImage(array):
+    """Return an image painting directly into a (height, width, 4) array"""
+    height, width = array.shape[:2]
+    if QT_API.startswith("pyqt"):
+        # A pointer is required: the image of a buffer object is read-only
+        # for PyQt, and would be detached (copied) when painted
+        data = sip.voidptr(array.ctypes.data)
+    else:
+        data = array.data
+    return QImage(data, width, height, 4 * width, QImage.Format_ARGB32_Premultiplied)
+
+
+def qwtSetImageResolution(image, dpi):
+    dotsPerMeter = int(round(dpi / 0.0254))
+    image.setDotsPerMeterX(dotsPerMeter)
+    image.setDotsPerMeterY(dotsPerMeter)
+
+
+class HeadlessAxisData(AxisData):
+    def __init__(self):
+        AxisData.__init__(self)
+        self.title = None  # QwtText
+        self.scaleDraw = None  # QwtScaleDraw (replacing the scale widget)
+        self.extent = 0  # Extent of the scale, in pixels
+        self.titleHeight = 0  # Height of the title, in pixels
+
+
+class QwtHeadlessPlot_PrivateData(object):
+    def __init__(self):
+        self.title = QwtText()
+        self.footer = QwtText()
+        self.itemList = ItemList()
+        self.canvasBackground = QBrush(Qt.white)
+        self.palette = QPalette()
+        self.palette.setColor(QPalette.WindowText, QColor(Qt.darkGray))
+        self.palette.setColor(QPalette.Text, QColor("#444444"))
+        self.titleFont = qwtHeadlessFont(12)
+        self.footerFont = qwtHeadlessFont(10)
+        self.axisTitleFont = qwtHeadlessFont(11)
+        self.axisLabelFont = qwtHeadlessFont(10)
+        self.margin = 5
+        self.spacing = 4
+        self.canvasRect = QRectF()
+        self.bounds = QRectF()  # Plot rectangle, without the margins and the titles
+
+
+class QwtHeadlessPlot(object):
+    """
+    A plot rendered into images without widgets
+
+    `QwtHeadlessPlot` lays out and renders a title, a footer, up to four
+    axes and the plot items (curves, grids, markers, ...) directly into a
+    `QImage`, without creating the canvas, scale and label widgets of
+    :py:class:`qwt.plot.QwtPlot`: only a `QGuiApplication` is required,
+    which makes it suitable for server processes producing images.
+
+    The items are attached to the plot as usual (e.g. with
+    `QwtPlotCurve.make(x, y, plot=plot)`) and the API is a subset of the
+    API of `QwtPlot` (title, footer, axes and canvas background), so that
+    the same code may build both kinds of plots. The legend is not
+    supported.
+
+    The plot is laid out in the flat style of `QwtPlot` at 96 dpi: for
+    other resolutions, the image is scaled as a high-DPI screen would be
+    (fonts, pens and layout), so that the aspect of the plot doesn't
+    depend on the resolution.
+
+    Images may be returned as a `QImage`, as a NumPy array sharing the
+    memory of the image (the plot is painted directly into the array,
+    which may be reused from one image to the next) or as PNG data::
+
+        plot = QwtHeadlessPlot("Sine")
+        QwtPlotCurve.make(x, np.sin(x), plot=plot)
+        pixels = plot.toArray(800, 600)  # (600, 800, 4) array, BGRA
+        data = plot.toPng(800, 600, dpi=192)
+
+    .. py:class:: QwtHeadlessPlot([title=""])
+
+        :param title: Title of the plot
+        :type title: qwt.text.QwtText or str
+    """
+
+    yLeft, yRight, xBottom, xTop = QwtPlot.AXES
+    AXES = QwtPlot.AXES
+
+    def __init__(self, title=""):
+        self.__data = QwtHeadlessPlot_PrivateData()
+        self.__axisData = [HeadlessAxisData() for axisId in self.AXES]
+        for axisId, align in (
+            (self.yLeft, QwtScaleDraw.LeftScale),
+            (self.yRight, QwtScaleDraw.RightScale),
+            (self.xBottom, QwtScaleDraw.BottomScale),
+            (self.xTop, QwtScaleDraw.TopScale),
+        ):
+            d = self.__axisData[axisId]
+            d.isEnabled = axisId in (self.yLeft, self.xBottom)
+            d.scaleEngine = QwtLinearScaleEngine()
+            d.doAutoScale = True
+            d.margin = 0.05
+            d.minValue = 0.0
+            d.maxValue = 1000.0
+            d.stepSize = 0.0
+            d.maxMinor = 5
+            d.maxMajor = 8
+            d.isValid = False
+            d.title = QwtText()
+            d.scaleDraw = QwtScaleDraw()
+            d.scaleDraw.setAlignment(align)
+            for tick_type, factor in enumerate((150, 125, 100)):
+                d.scaleDraw.setTickLighterFactor(tick_type, factor)
+        self.setTitle(title)
+
+    # ----------------------------------------------------------------------
+    # Items (see `QwtPlotItem.attach()`)
+    def attachItem(self, plotItem, on):
+        """
+        Attach/Detach a plot item
+
+        :param qwt.plot.QwtPlotItem plotItem: Plot item
+        :param bool on: When true attach the item, otherwise detach it
+        """
+        if on:
+            self.__data.itemList.insertItem(plotItem)
+        else:
+            self.__data.itemList.removeItem(plotItem)
+
+    def itemList(self, rtti=None):
+        """
+        A list of attached plot items.
+
+        :param int rtti: Runtime type identification (None for all items)
+        :return: List of all attached plot items of a specific type, sorted in increasing z-order
+        """
+        if rtti is None:
+            return self.__data.itemList
+        return [item for item in self.__data.itemList if item.rtti() == rtti]
+
+    def autoRefresh(self):
+        """
+        Called when an item has changed (the plot is rendered on demand)
+        """
+        pass
+
+    def updateLegend(self, plotItem=None):
+        """
+        Called when the legend data of an item has changed (the legend is not supported)
+        """
+        pass
+
+    # ----------------------------------------------------------------------
+    # Texts and colors
+    def setTitle(self, title):
+        """
+        Change the plot's title
+
+        :param title: New title
+        :type title: str or qwt.text.QwtText
+        """
+        if not isinstance(title, QwtText):
+            title = QwtText(title)
+        title.setRenderFlags(Qt.AlignCenter | Qt.TextWordWrap)
+        self.__data.title = title
+
+    def title(self):
+        """
+        :return: Title of the plot
+        """
+        return self.__data.title
+
+    def setFooter(self, text):
+        """
+        Change the text the footer
+
+        :param text: New text of the footer
+        :type text: str or qwt.text.QwtText
+        """
+        if not isinstance(text, QwtText):
+            text = QwtText(text)
+        text.setRenderFlags(Qt.AlignCenter | Qt.TextWordWrap)
+        self.__data.footer = text
+
+    def footer(self):
+        """
+        :return: Text of the footer
+        """
+        return self.__data.footer
+
+    def setCanvasBackground(self, brush):
+        """
+        Change the background of the plotting area
+
+        :param QBrush brush: New background brush
+        """
+        self.__data.canvasBackground = QBrush(brush)
+
+    def canvasBackground(self):
+        """
+        :return: Background brush of the plotting area.
+        """
+        return self.__data.canvasBackground
+
+    def setPalette(self, palette):
+        """
+        Set the palette of the plot
+
+        `QPalette.Window` is the background of the plot, `QPalette.WindowText`
+        the color of the scale ticks and of the texts, and `QPalette.Text`
+        the color of the tick labels.
+
+        :param QPalette palette: Palette
+        """
+        self.__data.palette = QPalette(palette)
+
+    def palette(self):
+        """
+        :return: Palette of the plot
+        """
+        return self.__data.palette
+
+    # ----------------------------------------------------------------------
+    # Axes
+    def enableAxis(self, axisId, tf=True):
+        """
+        Enable or disable a specified axis
+
+        :param int axisId: Axis index
+        :param bool tf: True (enabled) or False (disabled)
+        """
+        self.__axisData[axisId].isEnabled = tf
+
+    def axisEnabled(self, axisId):
+        """
+        :param int axisId: Axis index
+        :return: True, if a specified axis is enabled
+        """
+        return self.__axisData[axisId].isEnabled
+
+    def setAxisTitle(self, axisId, title):
+        """
+        Change the title of a specified axis
+
+        :param int axisId: Axis index
+        :param title: axis title
+        :type title: qwt.text.QwtText or str
+        """
+        if not isinstance(title, QwtText):
+            title = QwtText(title)
+        title.setRenderFlags(Qt.AlignHCenter | Qt.TextExpandTabs | Qt.TextWordWrap)
+        self.__axisData[axisId].title = title
+
+    def axisTitle(self, axisId):
+        """
+        :param int axisId: Axis index
+        :return: Title of a specified axis
+        """
+        return self.__axisData[axisId].title
+
+    def setAxisScaleEngine(self, axisId, scaleEngine):
+        """
+        Change the scale engine for an axis
+
+        :param int axisId: Axis index
+        :param qwt.scale_engine.QwtScaleEngine scaleEngine: Scale engine
+        """
+        d = self.__axisData[axisId]
+        d.scaleEngine = scaleEngine
+        d.isValid = False
+
+    def axisScaleEngine(self, axisId):
+        """
+        :param int axisId: Axis index
+        :return: Scale engine for a specific axis
+        """
+        return self.__axisData[axisId].scaleEngine
+
+    def setAxisAutoScale(self, axisId, on=True):
+        """
+        Enable autoscaling for a specified axis
+
+        :param int axisId: Axis index
+        :param bool on: On/Off
+        """
+        d = self.__axisData[axisId]
+        d.doAutoScale = on
+        d.isValid = False
+
+    def axisAutoScale(self, axisId):
+        """
+        :param int axisId: Axis index
+        :return: True, if autoscaling is enabled
+        """
+        return self.__axisData[axisId].doAutoScale
+
+    def setAxisScale(self, axisId, min_, max_, stepSize=0):
+        """
+        Disable autoscaling and specify a fixed scale for a selected axis.
+
+        :param int axisId: Axis index
+        :param float min_: Minimum of the scale
+        :param float max_: Maximum of the scale
+        :param float stepSize: Major step size. If <code>step == 0</code>, the step size is calculated automatically using the maxMajor setting.
+        """
+        d = self.__axisData[axisId]
+        d.doAutoScale = False
+        d.isValid = False
+        d.minValue = min_
+        d.maxValue = max_
+        d.stepSize = stepSize
+
+    def setAxisMaxMajor(self, axisId, maxMajor):
+        """
+        Set the maximum number of major scale intervals for a specified axis
+
+        :param int axisId: Axis index
+        :param int maxMajor: Maximum number of major steps
+        """
+        d = self.__axisData[axisId]
+        d.maxMajor = max(1, min(maxMajor, 10000))
+        d.isValid = False
+
+    def setAxisMaxMinor(self, axisId, maxMinor):
+        """
+        Set the maximum number of minor scale intervals for a specified axis
+
+        :param int axisId: Axis index
+        :param int maxMinor: Maximum number of minor steps
+        """
+        d = self.__axisData[axisId]
+        d.maxMinor = max(0, min(maxMinor, 100))
+        d.isValid = False
+
+    def axisScaleDraw(self, axisId):
+        """
+        :param int axisId: Axis index
+        :return: Scale draw of a specified axis
+        """
+        return self.__axisData[axisId].scaleDraw
+
+    def axisScaleDiv(self, axisId):
+        """
+        :param int axisId: Axis index
+        :return: The scale division of a specified axis (None before the first rendering)
+        """
+        return self.__axisData[axisId].scaleDiv
+
+    def updateAxes(self):
+        """
+        Rebuild the axes scales (see :py:meth:`qwt.plot.QwtPlot.updateAxes()`)
+        """
+        with profiling.span("QwtPlot.updateAxes", self):
+            intv = [QwtInterval() for _i in self.AXES]
+            for item in self.itemList():
+                if not item.testItemAttribute(QwtPlotItem.AutoScale):
+                    continue
+                if not item.isVisible():
+                    continue
+                if self.axisAutoScale(item.xAxis()) or self.axisAutoScale(item.yAxis()):
+                    rect = item.boundingRect()
+                    if rect.width() >= 0.0:
+                        intv[item.xAxis()] |= QwtInterval(rect.left(), rect.right())
+                    if rect.height() >= 0.0:
+                        intv[item.yAxis()] |= QwtInterval(rect.top(), rect.bottom())
+            for axisId in self.AXES:
+                d = self.__axisData[axisId]
+                minValue = d.minValue
+                maxValue = d.maxValue
+                stepSize = d.stepSize
+                if d.doAutoScale and intv[axisId].isValid():
+                    d.isValid = False
+                    minValue = intv[axisId].minValue()
+                    maxValue = intv[axisId].maxValue()
+                    minValue, maxValue, stepSize = d.scaleEngine.autoScale(
+                        d.maxMajor, minValue, maxValue, stepSize, d.margin
+                    )
+                if not d.isValid:
+                    d.scaleDiv = d.scaleEngine.divideScale(
+                        minValue, maxValue, d.maxMajor, d.maxMinor, stepSize
+                    )
+                    d.isValid = True
+                d.scaleDraw.setTransformation(d.scaleEngine.transformation())
+                d.scaleDraw.setScaleDiv(d.scaleDiv)
+            for item in self.itemList():
+                if item.testItemInterest(QwtPlotItem.ScaleInterest):
+                    item.updateScaleDiv(
+                        self.axisScaleDiv(item.xAxis()), self.axisScaleDiv(item.yAxis())
+                    )
+
+    # ----------------------------------------------------------------------
+    # Layout and rendering
+    def __titleHeight(self, text, font, width):
+        if text.isEmpty():
+            return 0
+        return math.ceil(text.heightForWidth(width, font))
+
+    def updateLayout(self, rect):
+        """
+        Lay out the plot in a rectangle: the axes scales must be up to date
+        (see :py:meth:`updateAxes()`)
+
+        :param QRectF rect: Bounding rectangle of the plot
+        """
+        data = self.__data
+        r = QRectF(rect).adjusted(data.margin, data.margin, -data.margin, -data.margin)
+        height = self.__titleHeight(data.title, data.titleFont, r.width())
+        if height:
+            r.setTop(r.top() + height + data.spacing)
+        height = self.__titleHeight(data.footer, data.footerFont, r.width())
+        if height:
+            r.setBottom(r.bottom() - height - data.spacing)
+        dims = {}
+        for axisId in self.AXES:
+            d = self.__axisData[axisId]
+            if d.isEnabled:
+                length = (
+                    r.height() if axisId in (self.yLeft, self.yRight) else r.width()
+                )
+                d.extent = math.ceil(d.scaleDraw.extent(data.axisLabelFont)) + 1
+                d.titleHeight = self.__titleHeight(d.title, data.axisTitleFont, length)
+                dims[axisId] = d.extent
+                if d.titleHeight:
+                    dims[axisId] += d.titleHeight + data.spacing
+        data.bounds = r
+        # The border distance hints depend on the length of the scales:
+        # the first pass sets the lengths, the second one adjusts them
+        for _i in range(2):
+            left = r.left() + dims.get(self.yLeft, 0)
+            right = r.right() - dims.get(self.yRight, 0)
+            top = r.top() + dims.get(self.xTop, 0)
+            bottom = r.bottom() - dims.get(self.xBottom, 0)
+            for axisId in dims:
+                # Room for the tick labels overlapping the ends of the scale
+                start, end = self.__axisData[axisId].scaleDraw.getBorderDistHint(
+                    data.axisLabelFont
+                )
+                if axisId in (self.yLeft, self.yRight):
+                    top = max(top, r.top() + start)
+                    bottom = min(bottom, r.bottom() - end)
+                else:
+                    left = max(left, r.left() + start)
+                    right = min(right, r.right() - end)
+            canvasRect = QRectF(left, top, max(right - left, 1), max(bottom - top, 1))
+            data.canvasRect = canvasRect
+            for axisId in dims:
+                sd = self.__axisData[axisId].scaleDraw
+                if axisId in (self.yLeft, self.yRight):
+                    x = left if axisId == self.yLeft else canvasRect.right()
+                    sd.move(x, top)
+                    sd.setLength(canvasRect.height())
+                else:
+                    y = top if axisId == self.xTop else canvasRect.bottom()
+                    sd.move(left, y)
+                    sd.setLength(canvasRect.width())
+
+    def canvasRect(self):
+        """
+        :return: Rectangle of the plotting area (see :py:meth:`updateLayout()`)
+        """
+        return QRectF(self.__data.canvasRect)
+
+    def canvasMap(self, axisId):
+        """
+        :param int axisId: Axis
+        :return: Map for the axis on the plotting area (see :py:meth:`updateLayout()`)
+        """
+        sd = self.__axisData[axisId].scaleDraw
+        map_ = QwtScaleMap(sd.scaleMap())
+        if not self.__axisData[axisId].isEnabled:
+            rect = self.__data.canvasRect
+            if axisId in (self.yLeft, self.yRight):
+                map_.setPaintInterval(rect.bottom(), rect.top())
+            else:
+                map_.setPaintInterval(rect.left(), rect.right())
+        return map_
+
+    def render(self, painter, rect):
+        """
+        Update the axes, lay out the plot and render it
+
+        :param QPainter painter: Painter
+        :param QRectF rect: Bounding rectangle of the plot, in painter coordinates
+        """
+        data = self.__data
+        self.updateAxes()
+        self.updateLayout(rect)
+        canvasRect = data.canvasRect
+        painter.save()
+        painter.fillRect(rect, data.palette.brush(QPalette.Window))
+        painter.fillRect(canvasRect, data.canvasBackground)
+        maps = [self.canvasMap(axisId) for axisId in self.AXES]
+        for item in self.itemList():
+            if item.isVisible():
+                painter.save()
+                painter.setClipRect(canvasRect, Qt.IntersectClip)
+                painter.setRenderHint(
+                    QPainter.Antialiasing,
+                    item.testRenderHint(QwtPlotItem.RenderAntialiased),
+                )
+                with profiling.span("QwtPlotItem.draw", self, item):
+                    item.draw(
+                        painter, maps[item.xAxis()], maps[item.yAxis()], canvasRect
+                    )
+                painter.restore()
+        painter.setPen(data.palette.color(QPalette.WindowText))
+        for axisId in self.AXES:
+            d = self.__axisData[axisId]
+            if d.isEnabled:
+                painter.setFont(data.axisLabelFont)
+                d.scaleDraw.draw(painter, data.palette)
+                if d.titleHeight:
+                    self.__drawAxisTitle(painter, axisId)
+        bounds = data.bounds
+        for text, font, top in (
+            (data.title, data.titleFont, None),
+            (data.footer, data.footerFont, bounds.bottom() + data.spacing),
+        ):
+            if not text.isEmpty():
+                height = self.__titleHeight(text, font, bounds.width())
+                if top is None:
+                    top = bounds.top() - data.spacing - height
+                painter.setFont(font)
+                text.draw(painter, QRectF(bounds.left(), top, bounds.width(), height))
+        painter.restore()
+
+    def __drawAxisTitle(self, painter, axisId):
+        data = self.__data
+        d = self.__axisData[axisId]
+        canvasRect = data.canvasRect
+        offset = d.extent + data.spacing
+        painter.save()
+        painter.setFont(data.axisTitleFont)
+        if axisId == self.yLeft:
+            painter.translate(canvasRect.left() - offset, canvasRect.bottom())
+            painter.rotate(-90.0)
+            flags = Qt.AlignBottom
+        elif axisId == self.yRight:
+            painter.translate(canvasRect.right() + offset, canvasRect.top())
+            painter.rotate(90.0)
+            flags = Qt.AlignBottom
+        elif axisId == self.xBottom:
+            painter.translate(canvasRect.left(), canvasRect.bottom() + offset)
+            flags = Qt.AlignTop
+        else:
+            painter.translate(canvasRect.left(), canvasRect.top() - offset)
+            flags = Qt.AlignBottom
+        if axisId in (self.yLeft, self.yRight):
+            length = canvasRect.height()
+        else:
+            length = canvasRect.width()
+        title = d.title
+        title.setRenderFlags(
+            Qt.AlignHCenter | Qt.TextExpandTabs | Qt.TextWordWrap | flags
+        )
+        y = -d.titleHeight if flags == Qt.AlignBottom else 0.0
+        title.draw(painter, QRectF(0.0, y, length, d.titleHeight))
+        painter.restore()
+
+    # ----------------------------------------------------------------------
+    # Images
+    def renderImage(self, image, dpi=LAYOUT_DPI):
+        """
+        Render the plot into an image, which is entirely covered
+
+        The plot is laid out at 96 dpi and scaled by `dpi / 96`, then the
+        resolution of the image is set to `dpi`.
+
+        :param QImage image: Image
+        :param float dpi: Resolution of the image, in dots per inch
+        """
+        ratio = dpi / LAYOUT_DPI
+        qwtSetImageResolution(image, LAYOUT_DPI)
+        image.setDevicePixelRatio(ratio)
+        painter = QPainter(image)
+        self.render(
+            painter, QRectF(0, 0, image.width() / ratio, image.height() / ratio)
+        )
+        painter.end()
+        image.setDevicePixelRatio(1.0)
+        qwtSetImageResolution(image, dpi)
+
+    def toImage(self, width, height, dpi=LAYOUT_DPI):
+        """
+        Render the plot into a new image
+
+        :param int width: Width of the image, in pixels
+        :param int height: Height of the image, in pixels
+        :param float dpi: Resolution of the image, in dots per inch
+        :return: Image (`QImage` instance, premultiplied ARGB32 format)
+        """
+        image = QImage(width, height, QImage.Format_ARGB32_Premultiplied)
+        self.renderImage(image, dpi)
+        return image
+
+    def toArray(self, width, height, dpi=LAYOUT_DPI, out=None):
+        """
+        Render the plot into a NumPy array, without copying: the plot is
+        painted directly into the memory of the array
+
+        The pixels are opaque and stored in the native byte order of the
+        premultiplied ARGB32 format of Qt, i.e. (B, G, R, A) on little-endian
+        platforms: use `array[..., 2::-1]` for an RGB view.
+
+        :param int width: Width of the image, in pixels
+        :param int height: Height of the image, in pixels
+        :param float dpi: Resolution of the image, in dots per inch
+        :param numpy.ndarray out: C-contiguous `uint8` array of shape (height, width, 4) to be reused, or None (a new array is allocated)
+        :return: Array of shape (height, width, 4) and type `uint8`
+        """
+        if out is None:
+            out = np.empty((height, width, 4), np.uint8)
+        elif (
+            out.shape != (height, width, 4)
+            or out.dtype != np.uint8
+            or not out.flags.c_contiguous
+        ):
+            raise ValueError("Invalid output array")
+        self.renderImage(qwtArrayImage(out), dpi)
+        return out
+
+    def toPng(self, width, height, dpi=LAYOUT_DPI):
+        """
+        Render the plot into PNG data
+
+        :param int width: Width of the image, in pixels
+        :param int height: Height of the image, in pixels
+        :param float dpi: Resolution of the image, in dots per inch
+        :return: PNG data
+        :rtype: bytes
+
+        .. seealso::
+
+            :py:meth:`toBytes()`
+        """
+        return self.toBytes(width, height, dpi)
+
+    def toBytes(self, width, height, dpi=LAYOUT_DPI, format_="PNG", quality=-1):
+        """
+        Render the plot into encoded image data
+
+        :param int width: Width of the image, in pixels
+        :param int height: Height of the image, in pixels
+        :param float dpi: Resolution of the image, in dots per inch
+        :param str format_: Image format supported by `QImageWriter` (e.g. "PNG", "JPG" or "BMP")
+        :param int quality: Quality of the compression (0 to 100), or -1 (default)
+        :return: Image data
+        :rtype: bytes
+        """
+        byteArray = QByteArray()
+        buffer = QBuffer(byteArray)
+        buffer.open(QIODevice.WriteOnly)
+        ok = self.toImage(width, height, dpi).save(buffer, format_, quality)
+        buffer.close()
+        if not ok:
+            raise ValueError("Unsupported image format: %r" % format_)
+        return bytes(byteArray.data())
@@ -0,0 +1,821 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the Qwt License
+# Copyright (c) 2002 Uwe Rathmann, for the original C++ code
+# Copyright (c) 2015 Pierre Raybaut, for the Python translation/optimization
+# (see LICENSE file for more details)
+
+"""
+QwtPlotHistogram
+----------------
+
+.. autoclass:: QwtPlotHistogram
+   :members:
+"""
+
+import numpy as np
+from qtpy.QtCore import QRectF, Qt
+from qtpy.QtGui import QBrush, QPainter, QPen, QPolygonF
+
+from qwt import stats
+from qwt.column_symbol import QwtColumnSymbol
+from qwt.graphic import QwtGraphic
+from qwt.plot import QwtPlot, QwtPlotItem, QwtPlotItem_PrivateData
+from qwt.plot_curve import qpolygonf_as_array
+from qwt.plot_intervalcurve import qwtDecimatePolyline
+from qwt.plot_series import (
+    QwtIntervalArrayData,
+    QwtPlotSeriesItem,
+    QwtSeriesData,
+    QwtSeriesStore,
+)
+from qwt.qthelpers import qcolor_from_str
+from qwt.text import QwtText
+
+
+def qwtMergedRuns(lower, upper, value=None):
+    """
+    Find the runs of bins painted inside the same pixel (the bins being
+    sorted)
+
+    Only the bins narrower than a pixel are merged, with the next bins
+    whose edges are painted at the same pixels: a wider bin is a run of
+    its own.
+
+    :param numpy.ndarray lower: Lower edges of the bins, in paint device coordinates
+    :param numpy.ndarray upper: Upper edges of the bins, in paint device coordinates
+    :param value: Values of the bins, in paint device coordinates: if not None, the runs are also split where the pixel of the values changes
+    :type value: numpy.ndarray or None
+    :return: Tuple of arrays (starts, stops): indexes of the first and last bins of the runs
+    """
+    first, last = np.floor(lower), np.floor(upper)  # aliased rasterization
+    narrow = np.abs(upper - lower) < 1.0
+    breaks = (
+        ~(narrow[1:] & narrow[:-1])
+        | (first[1:] != first[:-1])
+        | (last[1:] != last[:-1])
+    )
+    if value is not None:
+        pixels = np.floor(value)
+        breaks |= pixels[1:] != pixels[:-1]
+    starts = np.concatenate(([0], np.flatnonzero(breaks) + 1))
+    stops = np.concatenate((starts[1:], [lower.size])) - 1
+    return starts, stops
+
+
+def qwtMergeBins(lower, upper, value, baseline=None):
+    """
+    Merge the bins painted inside the same pixel (the bins being sorted,
+    see :py:func:`qwtMergedRuns()`)
+
+    :param numpy.ndarray lower: Lower edges of the bins, in paint device coordinates
+    :param numpy.ndarray upper: Upper edges of the bins, in paint device coordinates
+    :param numpy.ndarray value: Values of the bins, in paint device coordinates
+    :param baseline: Baseline, in paint device coordinates, or None
+    :type baseline: float or None
+    :return: Tuple of arrays (lower, upper, value1, value2): edges of the merged bins, and extent of their values (baseline included)
+    """
+    starts, stops = qwtMergedRuns(lower, upper)
+    value1 = np.minimum.reduceat(value, starts)
+    value2 = np.maximum.reduceat(value, starts)
+    if baseline is not None:
+        value1 = np.minimum(value1, baseline)
+        value2 = np.maximum(value2, baseline)
+    return lower[starts], upper[stops], value1, value2
+
+
+class QwtPlotHistogram_PrivateData(QwtPlotItem_PrivateData):
+    def __init__(self):
+        QwtPlotItem_PrivateData.__init__(self)
+        self.baseline = 0.0
+        self.style = QwtPlotHistogram.Columns
+        self.symbol = None
+        self.pen = QPen()
+        self.brush = QBrush()
+        self.paintAttributes = QwtPlotHistogram.MergeBins
+        self.sorted = (None, False)
+        self.polygonBuffer = QPolygonF()
+
+
+class QwtPlotHistogram(QwtPlotSeriesItem, QwtSeriesStore):
+    """
+    A plot item, that represents a series of bins
+
+    A histogram displays a series of bins, each bin being an interval
+    (e.g. of x-values) with a value (e.g. the number of samples in this
+    interval): with the `Qt.Vertical` orientation (default), the bins are
+    x-intervals and the columns are vertical, and with the `Qt.Horizontal`
+    orientation, the bins are y-intervals and the columns are horizontal.
+
+    The bins are stored in NumPy arrays (see
+    :py:class:`qwt.plot_series.QwtIntervalArrayData`), and the output of
+    `numpy.histogram()` may be displayed directly::
+
+        QwtPlotHistogram.make(*np.histogram(data, bins=100), plot=plot)
+
+    Columns drawn with the pen and the brush of the histogram (no symbol),
+    or with a column symbol of the `QwtColumnSymbol.Box` style without a
+    raised frame, are painted in batches (`QPainter.drawRects()`), whose
+    coordinates are computed by NumPy.
+
+    When the bins are sorted in increasing order, only the bins inside the
+    canvas (or the band being repainted, see
+    :py:meth:`qwt.plot.QwtPlotItem.drawBand()`) are painted, and with the
+    `QwtPlotHistogram.MergeBins` paint attribute (default), the bins painted
+    inside the same pixel are merged, so that the painting cost is bounded
+    by the size of the canvas (bins wider than a pixel are never merged).
+
+    Histogram styles:
+
+      * `QwtPlotHistogram.Outline`: Draw an outline around the area, that is
+        build by all bins, using the pen, and fill it with the brush
+      * `QwtPlotHistogram.Columns`: Draw a column for each bin, with the
+        symbol if any (see :py:meth:`setSymbol()`), or with the pen and the
+        brush otherwise
+      * `QwtPlotHistogram.Lines`: Draw a line for each bin, using the pen
+      * `QwtPlotHistogram.UserStyle`: Styles >= `UserStyle` are reserved for
+        derived classes that overload `drawSeries()`
+
+    Paint attributes:
+
+      * `QwtPlotHistogram.MergeBins`: Merge the bins painted inside the same
+        pixel (when the bins are sorted)
+
+    .. py:class:: QwtPlotHistogram([title=None])
+
+        :param title: Title of the histogram
+        :type title: qwt.text.QwtText or str or None
+    """
+
+    # enum HistogramStyle
+    Outline, Columns, Lines = list(range(3))
+    UserStyle = 100
+
+    # enum PaintAttribute
+    MergeBins = 0x01
+
+    def __init__(self, title=None):
+        if title is None:
+            title = QwtText("")
+        if not isinstance(title, QwtText):
+            title = QwtText(title)
+        self.__data = None
+        QwtPlotSeriesItem.__init__(self, title)
+        QwtSeriesStore.__init__(self)
+        self.init()
+
+    @classmethod
+    def make(
+        cls,
+        counts=None,
+        edges=None,
+        title=None,
+        plot=None,
+        z=None,
+        x_axis=None,
+        y_axis=None,
+        orientation=None,
+        style=None,
+        baseline=None,
+        symbol=None,
+        linecolor=None,
+        linewidth=None,
+        fillcolor=None,
+        antialiased=False,
+    ):
+        """
+        Create and setup a new `QwtPlotHistogram` object (convenience function).
+
+        :param counts: List/array of the values of the bins
+        :param edges: List/array of the edges of the bins (one more than values)
+        :param title: Histogram title
+        :type title: qwt.text.QwtText or str or None
+        :param plot: Plot to attach the histogram to
+        :type plot: qwt.plot.QwtPlot or None
+        :param z: Z-value
+        :type z: float or None
+        :param x_axis: histogram X-axis (default: QwtPlot.xBottom)
+        :type x_axis: int or None
+        :param y_axis: histogram Y-axis (default: QwtPlot.yLeft)
+        :type y_axis: int or None
+        :param orientation: orientation of the columns (default: Qt.Vertical)
+        :type orientation: Qt.Orientation or None
+        :param style: histogram style (`QwtPlotHistogram.Outline`, `QwtPlotHistogram.Columns`, `QwtPlotHistogram.Lines`)
+        :type style: int or None
+        :param baseline: baseline of the columns (default: 0.0)
+        :type baseline: float or None
+        :param symbol: column symbol
+        :type symbol: qwt.column_symbol.QwtColumnSymbol or None
+        :param linecolor: color of the pen (default: black)
+        :type linecolor: QColor or str or None
+        :param linewidth: width of the pen
+        :type linewidth: float or None
+        :param fillcolor: color of the brush (default: no brush)
+        :type fillcolor: QColor or str or None
+        :param bool antialiased: if True, enable antialiasing rendering
+
+        .. seealso::
+
+            :py:meth:`setSamples()`, :py:meth:`setPen()`, :py:meth:`attach()`
+        """
+        item = cls(title)
+        if z is not None:
+            item.setZ(z)
+        if counts is not None or edges is not None:
+            if counts is None or edges is None:
+                raise ValueError("Missing counts or edges parameter")
+            item.setSamples(counts, edges)
+        x_axis = QwtPlot.xBottom if x_axis is None else x_axis
+        y_axis = QwtPlot.yLeft if y_axis is None else y_axis
+        item.setAxes(x_axis, y_axis)
+        if orientation is not None:
+            item.setOrientation(orientation)
+        if style is not None:
+            item.setStyle(style)
+        if baseline is not None:
+            item.setBaseline(baseline)
+        if symbol is not None:
+            item.setSymbol(symbol)
+        linecolor = qcolor_from_str(linecolor, Qt.black)
+        linewidth = 1.0 if linewidth is None else linewidth
+        item.setPen(QPen(linecolor, linewidth))
+        if fillcolor is not None:
+            item.setBrush(QBrush(qcolor_from_str(fillcolor, Qt.white)))
+        item.setRenderHint(cls.RenderAntialiased, antialiased)
+        if plot is not None:
+            item.attach(plot)
+        return item
+
+    def init(self):
+        """Initialize internal members"""
+        self.__data = QwtPlotHistogram_PrivateData()
+        self.setItemAttribute(QwtPlotItem.Legend, True)
+        self.setItemAttribute(QwtPlotItem.AutoScale, True)
+        self.setData(QwtIntervalArrayData())
+        self.setOrientation(Qt.Vertical)
+        self.setZ(20.0)
+
+    def rtti(self):
+        """:return: `QwtPlotItem.Rtti_PlotHistogram`"""
+        return QwtPlotItem.Rtti_PlotHistogram
+
+    def setPaintAttribute(self, attribute, on=True):
+        """
+        Specify an attribute how to draw the histogram
+
+        Supported paint attributes:
+
+            * `QwtPlotHistogram.MergeBins`
+
+        :param int attribute: Paint attribute
+        :param bool on: On/Off
+
+        .. seealso::
+
+            :py:meth:`testPaintAttribute()`
+        """
+        if on:
+            self.__data.paintAttributes |= attribute
+        else:
+            self.__data.paintAttributes &= ~attribute
+        self.itemChanged()
+
+    def testPaintAttribute(self, attribute):
+        """
+        :param int attribute: Paint attribute
+        :return: True, when attribute is enabled
+
+        .. seealso::
+
+            :py:meth:`setPaintAttribute()`
+        """
+        return bool(self.__data.paintAttributes & attribute)
+
+    def setSamples(self, *args):
+        """
+        Initialize the bins
+
+        .. py:method:: setSamples(data):
+            :noindex:
+
+            :param data: Series data (values of the bins, lower and upper edges)
+            :type data: qwt.plot_series.QwtIntervalArrayData
+
+        .. py:method:: setSamples(counts, edges):
+            :noindex:
+
+            Initialize contiguous bins, e.g. from the output of
+            `numpy.histogram()`
+
+            :param counts: List/array of the values of the bins
+            :param edges: List/array of the edges of the bins (one more than values)
+        """
+        if len(args) == 1 and isinstance(args[0], QwtSeriesData):
+            self.setData(args[0])
+        elif len(args) == 2:
+            counts = np.asarray(args[0], float)
+            edges = np.asarray(args[1], float)
+            if edges.ndim != 1 or edges.size != counts.size + 1:
+                raise ValueError("Edges must be a 1D array of size len(counts) + 1")
+            self.setData(QwtIntervalArrayData(counts, edges[:-1], edges[1:]))
+        else:
+            raise TypeError(
+                "%s().setSamples() takes 1 or 2 argument(s) (%s given)"
+                % (self.__class__.__name__, len(args))
+            )
+
+    def setStyle(self, style):
+        """
+        Set the histogram's drawing style
+
+        :param int style: Histogram style
+
+        .. seealso::
+
+            :py:meth:`style()`
+        """
+        if style != self.__data.style:
+            self.__data.style = style
+            self.legendChanged()
+            self.itemChanged()
+
+    def style(self):
+        """
+        :return: Style of the histogram
+
+        .. seealso::
+
+            :py:meth:`setStyle()`
+        """
+        return self.__data.style
+
+    def setPen(self, pen):
+        """
+        Assign a pen, that is used in a style() depending way.
+
+        :param QPen pen: New pen
+
+        .. seealso::
+
+            :py:meth:`pen()`, :py:meth:`brush()`
+        """
+        if pen != self.__data.pen:
+            self.__data.pen = QPen(pen)
+            self.legendChanged()
+            self.itemChanged()
+
+    def pen(self):
+        """
+        :return: Pen used in a style() depending way.
+
+        .. seealso::
+
+            :py:meth:`setPen()`, :py:meth:`brush()`
+        """
+        return self.__data.pen
+
+    def setBrush(self, brush):
+        """
+        Assign a brush, that is used in a style() depending way.
+
+        :param QBrush brush: New brush
+
+        .. seealso::
+
+            :py:meth:`brush()`, :py:meth:`pen()`
+        """
+        if brush != self.__data.brush:
+            self.__data.brush = QBrush(brush)
+            self.legendChanged()
+            self.itemChanged()
+
+    def brush(self):
+        """
+        :return: Brush used in a style() depending way.
+
+        .. seealso::
+
+            :py:meth:`setBrush()`, :py:meth:`pen()`
+        """
+        return self.__data.brush
+
+    def setSymbol(self, symbol):
+        """
+        Assign a symbol
+
+        In Columns style, the symbol is used to draw the columns, instead
+        of the pen and the brush.
+
+        :param qwt.column_symbol.QwtColumnSymbol symbol: Symbol, or None
+
+        .. seealso::
+
+            :py:meth:`symbol()`, :py:meth:`setStyle()`
+        """
+        if symbol != self.__data.symbol:
+            self.__data.symbol = symbol
+            self.legendChanged()
+            self.itemChanged()
+
+    def symbol(self):
+        """
+        :return: Current symbol or None, when no symbol has been assigned
+
+        .. seealso::
+
+            :py:meth:`setSymbol()`
+        """
+        return self.__data.symbol
+
+    def setBaseline(self, value):
+        """
+        Set the value of the baseline
+
+        Each column representing a bin is drawn from the baseline to the
+        value of the bin. The default value of the baseline is 0.0.
+
+        :param float value: Value of the baseline
+
+        .. seealso::
+
+            :py:meth:`baseline()`
+        """
+        if self.__data.baseline != value:
+            self.__data.baseline = value
+            self.itemChanged()
+
+    def baseline(self):
+        """
+        :return: Value of the baseline
+
+        .. seealso::
+
+            :py:meth:`setBaseline()`
+        """
+        return self.__data.baseline
+
+    def boundingRect(self):
+        """
+        :return: Bounding rectangle of all bins, baseline included, or an invalid rectangle, when no bins are available
+        """
+        rect = QwtPlotSeriesItem.boundingRect(self)
+        if rect.width() < 0:
+            return rect
+        baseline = self.__data.baseline
+        if self.orientation() == Qt.Horizontal:
+            if rect.left() > baseline:
+                rect.setLeft(baseline)
+            elif rect.right() < baseline:
+                rect.setRight(baseline)
+        else:
+            # Series data rectangles have the values on the x axis
+            rect = QRectF(rect.y(), rect.x(), rect.height(), rect.width())
+            if rect.top() > baseline:
+                rect.setTop(baseline)
+            elif rect.bottom() < baseline:
+                rect.setBottom(baseline)
+        return rect
+
+    def __maps(self, xMap, yMap):
+        """Return the maps of the bins and of the values"""
+        if self.orientation() == Qt.Vertical:
+            return xMap, yMap
+        return yMap, xMap
+
+    def __isSorted(self):
+        """Return True if the bins are sorted in increasing order"""
+        data = self.data()
+        if self.__data.sorted[0] is not data:
+            result = False
+            if isinstance(data, QwtIntervalArrayData):
+                lower, upper = data.lowerData(), data.upperData()
+                result = bool(
+                    np.all(lower[1:] >= lower[:-1])
+                    and np.all(upper[1:] >= upper[:-1])
+                    and np.all(upper >= lower)
+                )
+            self.__data.sorted = (data, result)
+        return self.__data.sorted[1]
+
+    def __sortedRange(self, binMap, p1, p2, from_, to):
+        """Restrict the range of the bins to the bins painted in [p1, p2]"""
+        data = self.data()
+        margin = 1.0 + self.__data.pen.widthF()
+        v1 = binMap.invTransform(p1 - margin)
+        v2 = binMap.invTransform(p2 + margin)
+        first = int(np.searchsorted(data.upperData(), min(v1, v2), "left"))
+        last = int(np.searchsorted(data.lowerData(), max(v1, v2), "right")) - 1
+        return max(from_, first), min(to, last)
+
+    def drawBand(self, painter, xMap, yMap, canvasRect, band):
+        """
+        Draw the bins inside a vertical band of the canvas
+
+        When the bins are sorted in increasing order, only the bins inside
+        the band (widened by the pen width) are drawn.
+
+        :param QPainter painter: Painter
+        :param qwt.scale_map.QwtScaleMap xMap: Maps x-values into pixel coordinates.
+        :param qwt.scale_map.QwtScaleMap yMap: Maps y-values into pixel coordinates.
+        :param QRectF canvasRect: Contents rectangle of the canvas
+        :param QRectF band: Band to be painted, in painter coordinates
+
+        .. seealso::
+
+            :py:meth:`qwt.plot_series.QwtPlotSeriesItem.drawBand()`
+        """
+        size = self.dataSize()
+        if self.orientation() == Qt.Vertical and size > 1 and self.__isSorted():
+            from_, to = self.__sortedRange(xMap, band.left(), band.right(), 0, size - 1)
+            if to - from_ < size - 1:
+                stats.count(self.plot(), polylines_clipped=1)
+            self.drawSeries(painter, xMap, yMap, canvasRect, from_, to)
+        else:
+            self.draw(painter, xMap, yMap, canvasRect)
+
+    def drawSeries(self, painter, xMap, yMap, canvasRect, from_, to):
+        """
+        Draw a subset of the histogram samples
+
+        :param QPainter painter: Painter
+        :param qwt.scale_map.QwtScaleMap xMap: Maps x-values into pixel coordinates.
+        :param qwt.scale_map.QwtScaleMap yMap: Maps y-values into pixel coordinates.
+        :param QRectF canvasRect: Contents rectangle of the canvas
+        :param int from_: Index of the first sample to be painted
+        :param int to: Index of the last sample to be painted. If to < 0 the histogram will be painted to its last sample.
+
+        .. seealso::
+
+            :py:meth:`drawOutline()`, :py:meth:`drawColumns()`,
+            :py:meth:`drawLines()`
+        """
+        numSamples = self.dataSize()
+        if not painter or numSamples <= 0:
+            return
+        if to < 0:
+            to = numSamples - 1
+        from_, to = max(0, from_), min(to, numSamples - 1)
+        binMap, valueMap = self.__maps(xMap, yMap)
+        sortedBins = self.__isSorted()
+        if sortedBins:
+            # Culling: the bins outside the canvas are not painted
+            if self.orientation() == Qt.Vertical:
+                p1, p2 = canvasRect.left(), canvasRect.right()
+            else:
+                p1, p2 = canvasRect.top(), canvasRect.bottom()
+            first, last = self.__sortedRange(binMap, p1, p2, from_, to)
+            if (first, last) != (from_, to):
+                stats.count(self.plot(), polylines_clipped=1)
+            from_, to = first, last
+        if from_ > to:
+            return
+        lower, upper, value = self.__transform(binMap, valueMap, from_, to)
+        baseline = valueMap.transform(self.__data.baseline)
+        merge = (
+            self.__data.paintAttributes & self.MergeBins
+            and sortedBins
+            and lower.size > abs(upper[-1] - lower[0]) + 1
+        )
+        if merge:
+            stats.count(self.plot(), polylines_decimated=1)
+        painter.save()
+        style = self.__data.style
+        if style == self.Outline:
+            self.drawOutline(painter, lower, upper, value, baseline, merge)
+        elif style == self.Columns:
+            if merge:
+                lower, upper, value1, value2 = qwtMergeBins(
+                    lower, upper, value, baseline
+                )
+            else:
+                value1, value2 = np.full(value.size, baseline), value
+            self.drawColumns(painter, lower, upper, value1, value2)
+        elif style == self.Lines:
+            if merge:
+                # The lines of the merged bins are painted at the same pixels
+                starts, stops = qwtMergedRuns(lower, upper, value)
+                lower, upper, value = lower[starts], upper[stops], value[starts]
+            self.drawLines(painter, lower, upper, value, value)
+        painter.restore()
+
+    def __transform(self, binMap, valueMap, from_, to):
+        """Return the bins in paint device coordinates"""
+        data = self.data()
+        if isinstance(data, QwtIntervalArrayData):
+            value = data.valueData()[from_ : to + 1]
+            lower = data.lowerData()[from_ : to + 1]
+            upper = data.upperData()[from_ : to + 1]
+        else:
+            samples = [data.sample(i) for i in range(from_, to + 1)]
+            value = np.array([sample.value for sample in samples], float)
+            lower = np.array([s.interval.minValue() for s in samples], float)
+            upper = np.array([s.interval.maxValue() for s in samples], float)
+        stats.count(self.plot(), points_transformed=3 * value.size)
+        return (
+            binMap.transform_array(lower),
+            binMap.transform_array(upper),
+            valueMap.transform_array(value),
+        )
+
+    def __setPoints(self, points, bins, values):
+        if self.orientation() == Qt.Vertical:
+            points[:, 0], points[:, 1] = bins, values
+        else:
+            points[:, 0], points[:, 1] = values, bins
+
+    def drawOutline(self, painter, lower, upper, value, baseline, merge=False):
+        """
+        Draw a histogram in Outline style
+
+        The outline is a step polyline, going down to the baseline at the
+        first and last bins and at the gaps between bins. It is drawn with
+        the pen, and the area below it (the columns) is filled with the brush.
+
+        :param QPainter painter: Painter
+        :param numpy.ndarray lower: Lower edges of the bins, in paint device coordinates
+        :param numpy.ndarray upper: Upper edges of the bins, in paint device coordinates
+        :param numpy.ndarray value: Values of the bins, in paint device coordinates
+        :param float baseline: Baseline, in paint device coordinates
+        :param bool merge: If True, the bins painted inside the same pixel are merged: the outline is reduced to the first, minimum, maximum and last points of each run of merged bins (the bins must be sorted)
+
+        .. seealso::
+
+            :py:meth:`drawSeries()`
+        """
+        brush = self.__data.brush
+        if brush.style() != Qt.NoBrush:
+            # The columns are filled much faster than the outline polygon
+            if merge:
+                columns = qwtMergeBins(lower, upper, value, baseline)
+            else:
+                columns = lower, upper, np.full(value.size, baseline), value
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(brush)
+            rects = self.__rects(*columns).tolist()
+            painter.drawRects([QRectF(*rect) for rect in rects])
+        pen = self.__data.pen
+        if pen.style() == Qt.NoPen:
+            return
+        size = value.size
+        gaps = upper[:-1] != lower[1:]
+        if merge and not gaps.any():
+            self.__drawMergedOutline(painter, lower, upper, value, baseline)
+            return
+        # Four points for each bin: the first and last ones are on the
+        # baseline only at the first and last bins and around the gaps
+        points = np.empty((size, 4, 2))
+        self.__setPoints(points[:, 0], lower, value)
+        self.__setPoints(points[:, 1], lower, value)
+        self.__setPoints(points[:, 2], upper, value)
+        self.__setPoints(points[:, 3], upper, value)
+        axis = 1 if self.orientation() == Qt.Vertical else 0
+        points[1:, 0, axis][gaps] = baseline
+        points[:-1, 3, axis][gaps] = baseline
+        points[0, 0, axis] = points[-1, 3, axis] = baseline
+        points = points.reshape(-1, 2)
+        if merge:
+            bins, values = qwtDecimatePolyline(points[:, 1 - axis], points[:, axis])
+            points = np.empty((bins.size, 2))
+            self.__setPoints(points, bins, values)
+        self.__drawPolyline(painter, points)
+
+    def __drawMergedOutline(self, painter, lower, upper, value, baseline):
+        """Draw the outline of contiguous bins, merged inside each pixel"""
+        starts, stops = qwtMergedRuns(lower, upper)
+        # First, minimum, maximum and last values of each run, then the
+        # upper edge of the last bin (the outline starts and ends on the
+        # baseline)
+        bins = np.empty((starts.size, 5))
+        bins[:, :4] = lower[starts, None]
+        bins[:, 4] = upper[stops]
+        values = np.empty((starts.size, 5))
+        values[:, 0] = value[starts]
+        values[:, 1] = np.minimum.reduceat(value, starts)
+        values[:, 2] = np.maximum.reduceat(value, starts)
+        values[:, 3] = values[:, 4] = value[stops]
+        points = np.empty((bins.size + 2, 2))
+        self.__setPoints(points[1:-1], bins.ravel(), values.ravel())
+        self.__setPoints(points[:1], lower[0], baseline)
+        self.__setPoints(points[-1:], upper[-1], baseline)
+        self.__drawPolyline(painter, points)
+
+    def __drawPolyline(self, painter, points):
+        polyline = self.__data.polygonBuffer
+        qpolygonf_as_array(polyline, len(points))[:] = points
+        painter.setPen(self.__data.pen)
+        painter.setBrush(Qt.NoBrush)
+        painter.drawPolyline(polyline)
+        stats.count(self.plot(), points_painted=len(points))
+
+    def __rects(self, lower, upper, value1, value2):
+        """Return the rectangles (x, y, width, height) of the columns"""
+        # Corners of the columns, rounded to the pixel like QRectF.toRect()
+        corners = np.empty((lower.size, 2, 2))
+        self.__setPoints(corners[:, 0], lower, value1)
+        self.__setPoints(corners[:, 1], upper, value2)
+        corners.sort(axis=1)
+        rects = np.round(corners).reshape(lower.size, 4)
+        rects[:, 2:] -= rects[:, :2]
+        return rects
+
+    def drawColumns(self, painter, lower, upper, value1, value2):
+        """
+        Draw a histogram in Columns style
+
+        The columns are drawn with the symbol if any, or with the pen and
+        the brush otherwise. Columns without symbol and columns drawn by
+        a `QwtColumnSymbol.Box` symbol without a raised frame are painted
+        in batches.
+
+        :param QPainter painter: Painter
+        :param numpy.ndarray lower: Lower edges of the bins, in paint device coordinates
+        :param numpy.ndarray upper: Upper edges of the bins, in paint device coordinates
+        :param numpy.ndarray value1: First values of the columns (e.g. baseline), in paint device coordinates
+        :param numpy.ndarray value2: Second values of the columns, in paint device coordinates
+
+        .. seealso::
+
+            :py:meth:`drawSeries()`, :py:meth:`qwt.column_symbol.QwtColumnSymbol`
+        """
+        size = lower.size
+        rects = self.__rects(lower, upper, value1, value2)
+        symbol = self.__data.symbol
+        if symbol is None or symbol.style() == QwtColumnSymbol.NoStyle:
+            painter.setPen(self.__data.pen)
+            painter.setBrush(self.__data.brush)
+            painter.drawRects([QRectF(*rect) for rect in rects.tolist()])
+        elif symbol.style() == QwtColumnSymbol.Box and symbol.frameStyle() in (
+            QwtColumnSymbol.NoFrame,
+            QwtColumnSymbol.Plain,
+        ):
+            # Same rendering as QwtColumnSymbol.drawBox(), frames first
+            palette = symbol.palette()
+            painter.setPen(Qt.NoPen)
+            rects[:, 2:] += 1
+            lw = symbol.lineWidth()
+            if symbol.frameStyle() == QwtColumnSymbol.Plain and lw > 0:
+                painter.setBrush(palette.dark())
+                painter.drawRects([QRectF(*rect) for rect in rects.tolist()])
+                extent = rects[:, 2:].min(axis=1) - 1  # outer rects: 1 pixel larger
+                lw = np.clip(np.minimum(lw, 0.5 * extent - 1), 0, None)
+                rects[:, :2] += lw[:, None]
+                rects[:, 2:] -= 2 * lw[:, None]
+                rects = rects[(rects[:, 2] > 0) & (rects[:, 3] > 0)]
+            painter.setBrush(palette.window())
+            painter.drawRects([QRectF(*rect) for rect in rects.tolist()])
+        else:
+            for rect in rects.tolist():
+                symbol.draw(painter, QRectF(*rect))
+        stats.count(self.plot(), symbols_drawn=size)
+
+    def drawLines(self, painter, lower, upper, value1, value2):
+        """
+        Draw a histogram in Lines style
+
+        :param QPainter painter: Painter
+        :param numpy.ndarray lower: First bin coordinates of the lines, in paint device coordinates
+        :param numpy.ndarray upper: Second bin coordinates of the lines, in paint device coordinates
+        :param numpy.ndarray value1: First value coordinates of the lines, in paint device coordinates
+        :param numpy.ndarray value2: Second value coordinates of the lines, in paint device coordinates
+
+        .. seealso::
+
+            :py:meth:`drawSeries()`
+        """
+        size = lower.size
+        lines = self.__data.polygonBuffer
+        points = qpolygonf_as_array(lines, 2 * size).reshape(size, 2, 2)
+        self.__setPoints(points[:, 0], lower, value1)
+        self.__setPoints(points[:, 1], upper, value2)
+        painter.setPen(self.__data.pen)
+        painter.drawLines(lines)
+        stats.count(self.plot(), points_painted=2 * size)
+
+    def legendIcon(self, index, size):
+        """
+        :param int index: Index of the legend entry (ignored as there is only one)
+        :param QSizeF size: Icon size
+        :return: Icon representing the histogram on the legend
+
+        .. seealso::
+
+            :py:meth:`qwt.plot.QwtPlotItem.setLegendIconSize()`,
+            :py:meth:`qwt.plot.QwtPlotItem.legendData()`
+        """
+        if size.isEmpty():
+            return QwtGraphic()
+        graphic = QwtGraphic()
+        graphic.setDefaultSize(size)
+        graphic.setRenderHint(QwtGraphic.RenderPensUnscaled, True)
+        painter = QPainter(graphic)
+        painter.setRenderHint(
+            QPainter.Antialiasing, self.testRenderHint(QwtPlotItem.RenderAntialiased)
+        )
+        rect = QRectF(0, 0, size.width(), size.height())
+        symbol = self.__data.symbol
+        if symbol is not None and self.__data.style == self.Columns:
+            painter.fillRect(rect, symbol.palette().window())
+        else:
+            painter.fillRect(rect, self.__data.brush)
+        painter.end()
+        return graphic
@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the Qwt License
+# (see LICENSE file for more details)
+
+"""
+QwtPerformanceHud
+-----------------
+
+.. autoclass:: QwtPerformanceHud
+   :members:
+"""
+
+import collections
+import os
+import time
+import weakref
+
+from qtpy.QtCore import QRectF, Qt
+from qtpy.QtGui import QColor, QFont, QFontMetricsF
+
+from qwt import profiling, stats
+
+#: Environment variable enabling the performance overlay of all plot canvases
+HUD_ENV = "QWT_PERFORMANCE_HUD"
+
+
+def hud_enabled_by_environment():
+    """
+    :return: True if the `QWT_PERFORMANCE_HUD` environment variable enables the performance overlay
+    """
+    return os.environ.get(HUD_ENV, "") not in ("", "0")
+
+
+class QwtPerformanceHud(object):
+    """
+    Performance overlay of a plot canvas
+
+    The overlay shows:
+
+      * the number of frames painted during the last second,
+      * the duration of the last `updateAxes()`, layout update and drawing
+        of the plot items (see :py:mod:`qwt.profiling`),
+      * the number of points sent to the painter by the last drawing of the
+        plot items and the number of points of the plot data,
+      * whether the last frame was copied from the backing store of the
+        canvas or redrawn.
+
+    The overlay is painted on top of the canvas, after the plot items and
+    outside of the backing store: it doesn't invalidate the backing store.
+
+    .. seealso::
+
+        :py:attr:`qwt.plot_canvas.QwtPlotCanvas.PerformanceHud`
+
+    .. py:class:: QwtPerformanceHud(plot)
+
+        :param qwt.plot.QwtPlot plot: Plot, or None
+    """
+
+    def __init__(self, plot):
+        self.__plot = None
+        self.__durations = {}
+        self.__pendingDrawTime = 0.0
+        self.__drawTime = 0.0
+        self.__frames = collections.deque()
+        self.__fromBackingStore = False
+        self.__pointsPainted = 0
+        self.__lastPointsPainted = 0
+        self.setPlot(plot)
+
+    def plot(self):
+        """
+        :return: Measured plot, or None
+        """
+        ref = self.__plot
+        return None if ref is None else ref()
+
+    def setPlot(self, plot):
+        """
+        Measure the replot pipeline of another plot
+
+        The plot is referenced weakly: the span listener is registered in a
+        weak dictionary, keyed by the plot, and must not keep it alive.
+
+        :param qwt.plot.QwtPlot plot: Plot, or None
+
+        .. seealso::
+
+            :py:meth:`detach()`
+        """
+        previous = self.plot()
+        if plot is previous:
+            return
+        if previous is not None:
+            profiling.set_listener(previous, None)
+        self.__plot = None if plot is None else weakref.ref(plot)
+        self.__lastPointsPainted = 0
+        if plot is not None:
+            profiling.set_listener(plot, self.spanFinished)
+
+    def detach(self):
+        """
+        Stop measuring the replot pipeline of the plot
+        """
+        self.setPlot(None)
+
+    def spanFinished(self, name, start, end, item):
+        """
+        Span listener (see :py:func:`qwt.profiling.set_listener()`)
+
+        :param str name: Span name
+        :param float start: Start time
+        :param float end: End time
+        :param item: Plot item, or None
+        """
+        if name == "QwtPlot.drawItems":
+            # Wall time, measured by the thread drawing the plot: the item
+            # spans may come from the render threads and overlap
+            self.__pendingDrawTime += end - start
+        elif name != "QwtPlotItem.draw":
+            self.__durations[name] = end - start
+
+    def duration(self, name):
+        """
+        :param str name: Span name (e.g. `"QwtPlot.updateAxes"`)
+        :return: Duration of the last span, in seconds, or None
+        """
+        return self.__durations.get(name)
+
+    def registerFrame(self, fromBackingStore):
+        """
+        Register a new frame
+
+        :param bool fromBackingStore: True if the frame was copied from the backing store
+        """
+        now = time.perf_counter()
+        frames = self.__frames
+        frames.append(now)
+        while frames[0] < now - 1.0:
+            frames.popleft()
+        self.__fromBackingStore = fromBackingStore
+        if not fromBackingStore:
+            self.__drawTime = self.__pendingDrawTime
+            self.__pendingDrawTime = 0.0
+        plot = self.plot()
+        if plot is not None:
+            painted = stats.plot_counters(plot).points_painted
+            if painted < self.__lastPointsPainted:  # counters were reset
+                self.__lastPointsPainted = 0
+            if not fromBackingStore:
+                self.__pointsPainted = painted - self.__lastPointsPainted
+            self.__lastPointsPainted = painted
+
+    def lines(self):
+        """
+        :return: Text of the overlay (list of lines)
+        """
+        pointsInData = 0
+        plot = self.plot()
+        if plot is not None:
+            for item in plot.itemList():
+                if item.isVisible() and hasattr(item, "dataSize"):
+                    pointsInData += item.dataSize()
+
+        def ms(name):
+            duration = self.__durations.get(name)
+            return "-" if duration is None else "%.2f" % (duration * 1e3)
+
+        return [
+            "%d fps, %s"
+            % (
+                len(self.__frames),
+                "backing store" if self.__fromBackingStore else "redrawn",
+            ),
+            "axes %s, layout %s, draw %.2f ms"
+            % (
+                ms("QwtPlot.updateAxes"),
+                ms("QwtPlot.updateLayout"),
+                self.__drawTime * 1e3,
+            ),
+            "points %d / %d" % (self.__pointsPainted, pointsInData),
+        ]
+
+    def draw(self, painter, rect, fromBackingStore):
+        """
+        Register a new frame and draw the overlay
+
+        :param QPainter painter: Painter
+        :param QRectF rect: Contents rectangle of the canvas
+        :param bool fromBackingStore: True if the frame was copied from the backing store
+        """
+        self.registerFrame(fromBackingStore)
+        lines = self.lines()
+        painter.save()
+        font = QFont(painter.font())
+        font.setStyleHint(QFont.Monospace)
+        font.setFamily("monospace")
+        font.setPointSizeF(max(6.0, 0.8 * font.pointSizeF()))
+        painter.setFont(font)
+        fm = QFontMetricsF(font)
+        margin = 4.0
+        width = max(fm.boundingRect(line).width() for line in lines)
+        height = fm.height() * len(lines)
+        box = QRectF(
+            rect.left() + margin,
+            rect.top() + margin,
+            width + 2 * margin,
+            height + 2 * margin,
+        )
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(0, 0, 0, 160))
+        painter.drawRect(box)
+        painter.setPen(QColor(Qt.white))
+        for index, line in enumerate(lines):
+            painter.drawText(
+                QRectF(
+                    box.left() + margin,
+                    box.top() + margin + index * fm.height(),
+                    width,
+                    fm.height(),
+                ),
+                Qt.AlignLeft | Qt.AlignVCenter,
+                line,
+            )
+        painter.restore()
@@ -0,0 +1,799 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the Qwt License
+# Copyright (c) 2002 Uwe Rathmann, for the original C++ code
+# Copyright (c) 2015 Pierre Raybaut, for the Python translation/optimization
+# (see LICENSE file for more details)
+
+"""
+QwtPlotIntervalCurve
+--------------------
+
+.. autoclass:: QwtPlotIntervalCurve
+   :members:
+
+QwtIntervalSymbol
+~~~~~~~~~~~~~~~~~
+
+.. autoclass:: QwtIntervalSymbol
+   :members:
+"""
+
+import numpy as np
+from qtpy.QtCore import QLineF, QRectF, Qt
+from qtpy.QtGui import QBrush, QPainter, QPen, QPolygonF
+
+from qwt import stats
+from qwt.graphic import QwtGraphic
+from qwt.plot import QwtPlot, QwtPlotItem, QwtPlotItem_PrivateData
+from qwt.plot_curve import qpolygonf_as_array
+from qwt.plot_series import (
+    QwtIntervalArrayData,
+    QwtPlotSeriesItem,
+    QwtSeriesData,
+    QwtSeriesStore,
+)
+from qwt.qthelpers import qcolor_from_str
+from qwt.text import QwtText
+
+
+def qwtDecimateIntervals(value, lower, upper):
+    """
+    Merge the runs of overlapping intervals painted at the same pixel (the
+    values being sorted)
+
+    Each interval of a run overlaps the previous one, so that the union of
+    the run is an interval: the disjoint intervals of a pixel column are
+    kept apart, and each run keeps the value of its first sample.
+
+    :param numpy.ndarray value: Values, in paint device coordinates
+    :param numpy.ndarray lower: Lower bounds, in paint device coordinates
+    :param numpy.ndarray upper: Upper bounds, in paint device coordinates
+    :return: Tuple of arrays (value, lower, upper), lower and upper being the union of the merged intervals
+    """
+    pixels = np.floor(value)  # pixel of the aliased rasterization
+    lower, upper = np.minimum(lower, upper), np.maximum(lower, upper)
+    breaks = (
+        (pixels[1:] != pixels[:-1])
+        | (lower[1:] > upper[:-1])
+        | (upper[1:] < lower[:-1])
+    )
+    starts = np.concatenate(([0], np.flatnonzero(breaks) + 1))
+    return (
+        value[starts],
+        np.minimum.reduceat(lower, starts),
+        np.maximum.reduceat(upper, starts),
+    )
+
+
+def qwtDecimatePolyline(value, bound):
+    """
+    Reduce a polyline (whose values are sorted) to the first, minimum,
+    maximum and last points painted at each pixel, which are enough to
+    paint the same pixels
+
+    :param numpy.ndarray value: Values, in paint device coordinates
+    :param numpy.ndarray bound: Bounds, in paint device coordinates
+    :return: Tuple of arrays (value, bound)
+    """
+    pixels = np.floor(value)
+    starts = np.concatenate(([0], np.flatnonzero(pixels[1:] != pixels[:-1]) + 1))
+    stops = np.concatenate((starts[1:], [value.size])) - 1
+    points = np.empty((starts.size, 4, 2))
+    points[:, :3, 0] = value[starts, None]
+    points[:, 3, 0] = value[stops]
+    points[:, 0, 1] = bound[starts]
+    points[:, 1, 1] = np.minimum.reduceat(bound, starts)
+    points[:, 2, 1] = np.maximum.reduceat(bound, starts)
+    points[:, 3, 1] = bound[stops]
+    points = points.reshape(-1, 2)
+    return points[:, 0], points[:, 1]
+
+
+class QwtIntervalSymbol(object):
+    """
+    A drawing primitive for displaying an interval like an error bar
+
+    Symbol styles:
+
+      * `QwtIntervalSymbol.NoSymbol`: No symbol
+      * `QwtIntervalSymbol.Bar`: The interval is displayed as a line, with
+        caps at its bounds when the width of the symbol is greater than 0
+      * `QwtIntervalSymbol.Box`: The interval is displayed as a rectangle,
+        whose width is the width of the symbol
+
+    .. py:class:: QwtIntervalSymbol([style=QwtIntervalSymbol.NoSymbol], [width=0], [pen=None], [brush=None])
+
+        :param int style: Symbol style
+        :param int width: Width of the caps or of the boxes, in pixels
+        :param QPen pen: Pen (default: black)
+        :param QBrush brush: Brush of the boxes (default: no brush)
+    """
+
+    # enum Style
+    NoSymbol = -1
+    Bar, Box = list(range(2))
+    UserSymbol = 1000
+
+    def __init__(self, style=NoSymbol, width=0, pen=None, brush=None):
+        self.__style = style
+        self.__width = width
+        self.__pen = QPen(Qt.black) if pen is None else QPen(pen)
+        self.__brush = QBrush() if brush is None else QBrush(brush)
+
+    def setStyle(self, style):
+        """
+        :param int style: Symbol style
+        """
+        self.__style = style
+
+    def style(self):
+        """
+        :return: Symbol style
+        """
+        return self.__style
+
+    def setWidth(self, width):
+        """
+        :param int width: Width of the caps or of the boxes, in pixels
+        """
+        self.__width = width
+
+    def width(self):
+        """
+        :return: Width of the caps or of the boxes, in pixels
+        """
+        return self.__width
+
+    def setPen(self, pen):
+        """
+        :param QPen pen: Pen
+        """
+        self.__pen = QPen(pen)
+
+    def pen(self):
+        """
+        :return: Pen
+        """
+        return self.__pen
+
+    def setBrush(self, brush):
+        """
+        :param QBrush brush: Brush of the boxes
+        """
+        self.__brush = QBrush(brush)
+
+    def brush(self):
+        """
+        :return: Brush of the boxes
+        """
+        return self.__brush
+
+
+class QwtPlotIntervalCurve_PrivateData(QwtPlotItem_PrivateData):
+    def __init__(self):
+        QwtPlotItem_PrivateData.__init__(self)
+        self.style = QwtPlotIntervalCurve.Tube
+        self.symbol = None
+        self.pen = QPen(Qt.black)
+        self.brush = QBrush(Qt.white)
+        self.paintAttributes = QwtPlotIntervalCurve.Decimate
+        self.polygonBuffer = QPolygonF()
+        self.linesBuffer = QPolygonF()
+
+
+class QwtPlotIntervalCurve(QwtPlotSeriesItem, QwtSeriesStore):
+    """
+    A plot item, that represents a series of intervals
+
+    An interval curve displays intervals, e.g. error bars or the range of
+    measurements, at a series of values: with the `Qt.Vertical` orientation
+    (default), the intervals are y-intervals at x-values, and with the
+    `Qt.Horizontal` orientation, they are x-intervals at y-values.
+
+    The samples are stored in NumPy arrays (see
+    :py:class:`qwt.plot_series.QwtIntervalArrayData`) and painted with a
+    few batched drawing calls, whose coordinates are computed by NumPy:
+    a filled band ("tube") between the lower and upper bounds, and interval
+    symbols (see :py:class:`QwtIntervalSymbol`) like error bars.
+
+    When the values are sorted in increasing order, only the samples
+    inside the canvas (or the band being repainted, see
+    :py:meth:`qwt.plot.QwtPlotItem.drawBand()`) are painted, and with
+    the `QwtPlotIntervalCurve.Decimate` paint attribute (default), the
+    bounds of the tube are reduced to a few points per pixel and the
+    overlapping bars painted at the same pixel are merged, so that the
+    painting cost of dense samples is bounded by the size of the canvas.
+    Bars with caps and boxes are never merged.
+
+    Curve styles:
+
+      * `QwtPlotIntervalCurve.NoCurve`: Don't draw a curve (only the symbols)
+      * `QwtPlotIntervalCurve.Tube`: Fill the area between the lower and the
+        upper bounds with the brush, and draw the bounds with the pen
+      * `QwtPlotIntervalCurve.UserCurve`: Styles >= `UserCurve` are reserved
+        for derived classes that overload `drawSeries()`
+
+    Paint attributes:
+
+      * `QwtPlotIntervalCurve.Decimate`: Decimate the bounds of the tube
+        and merge the overlapping bars (without caps) painted at the same
+        pixel (when the values are sorted)
+
+    .. py:class:: QwtPlotIntervalCurve([title=None])
+
+        :param title: Title of the curve
+        :type title: qwt.text.QwtText or str or None
+    """
+
+    # enum CurveStyle
+    NoCurve = -1
+    Tube = 0
+    UserCurve = 100
+
+    # enum PaintAttribute
+    Decimate = 0x01
+
+    def __init__(self, title=None):
+        if title is None:
+            title = QwtText("")
+        if not isinstance(title, QwtText):
+            title = QwtText(title)
+        self.__data = None
+        QwtPlotSeriesItem.__init__(self, title)
+        QwtSeriesStore.__init__(self)
+        self.init()
+
+    @classmethod
+    def make(
+        cls,
+        xdata=None,
+        lower=None,
+        upper=None,
+        title=None,
+        plot=None,
+        z=None,
+        x_axis=None,
+        y_axis=None,
+        orientation=None,
+        style=None,
+        symbol=None,
+        linecolor=None,
+        linewidth=None,
+        linestyle=None,
+        fillcolor=None,
+        antialiased=False,
+        finite=None,
+    ):
+        """
+        Create and setup a new `QwtPlotIntervalCurve` object (convenience function).
+
+        :param xdata: List/array of values (x-values with the `Qt.Vertical` orientation)
+        :param lower: List/array of the lower bounds of the intervals
+        :param upper: List/array of the upper bounds of the intervals
+        :param title: Curve title
+        :type title: qwt.text.QwtText or str or None
+        :param plot: Plot to attach the curve to
+        :type plot: qwt.plot.QwtPlot or None
+        :param z: Z-value
+        :type z: float or None
+        :param x_axis: curve X-axis (default: QwtPlot.xBottom)
+        :type x_axis: int or None
+        :param y_axis: curve Y-axis (default: QwtPlot.yLeft)
+        :type y_axis: int or None
+        :param orientation: orientation of the intervals (default: Qt.Vertical)
+        :type orientation: Qt.Orientation or None
+        :param style: curve style (`QwtPlotIntervalCurve.NoCurve`, `QwtPlotIntervalCurve.Tube`)
+        :type style: int or None
+        :param symbol: interval symbol
+        :type symbol: QwtIntervalSymbol or None
+        :param linecolor: color of the bounds of the tube
+        :type linecolor: QColor or str or None
+        :param linewidth: width of the bounds of the tube
+        :type linewidth: float or None
+        :param linestyle: pen style of the bounds of the tube
+        :type linestyle: Qt.PenStyle or None
+        :param fillcolor: fill color of the tube (default: white)
+        :type fillcolor: QColor or str or None
+        :param bool antialiased: if True, enable antialiasing rendering
+        :param bool finite: if True, keep only finite samples (remove all infinity and not a number values), otherwise do not filter samples
+
+        .. seealso::
+
+            :py:meth:`setSamples()`, :py:meth:`setPen()`, :py:meth:`attach()`
+        """
+        item = cls(title)
+        if z is not None:
+            item.setZ(z)
+        if xdata is not None or lower is not None or upper is not None:
+            for name, array in (("xdata", xdata), ("lower", lower), ("upper", upper)):
+                if array is None:
+                    raise ValueError("Missing %s parameter" % name)
+            item.setSamples(xdata, lower, upper, finite=finite)
+        x_axis = QwtPlot.xBottom if x_axis is None else x_axis
+        y_axis = QwtPlot.yLeft if y_axis is None else y_axis
+        item.setAxes(x_axis, y_axis)
+        if orientation is not None:
+            item.setOrientation(orientation)
+        if style is not None:
+            item.setStyle(style)
+        if symbol is not None:
+            item.setSymbol(symbol)
+        linecolor = qcolor_from_str(linecolor, Qt.black)
+        linewidth = 1.0 if linewidth is None else linewidth
+        linestyle = Qt.SolidLine if linestyle is None else linestyle
+        item.setPen(QPen(linecolor, linewidth, linestyle))
+        item.setBrush(QBrush(qcolor_from_str(fillcolor, Qt.white)))
+        item.setRenderHint(cls.RenderAntialiased, antialiased)
+        if plot is not None:
+            item.attach(plot)
+        return item
+
+    def init(self):
+        """Initialize internal members"""
+        self.__data = QwtPlotIntervalCurve_PrivateData()
+        self.setItemAttribute(QwtPlotItem.Legend, True)
+        self.setItemAttribute(QwtPlotItem.AutoScale, True)
+        self.setData(QwtIntervalArrayData())
+        self.setOrientation(Qt.Vertical)
+        self.setZ(19.0)
+
+    def rtti(self):
+        """:return: `QwtPlotItem.Rtti_PlotIntervalCurve`"""
+        return QwtPlotItem.Rtti_PlotIntervalCurve
+
+    def setPaintAttribute(self, attribute, on=True):
+        """
+        Specify an attribute how to draw the curve
+
+        Supported paint attributes:
+
+            * `QwtPlotIntervalCurve.Decimate`
+
+        :param int attribute: Paint attribute
+        :param bool on: On/Off
+
+        .. seealso::
+
+            :py:meth:`testPaintAttribute()`
+        """
+        if on:
+            self.__data.paintAttributes |= attribute
+        else:
+            self.__data.paintAttributes &= ~attribute
+        self.itemChanged()
+
+    def testPaintAttribute(self, attribute):
+        """
+        :param int attribute: Paint attribute
+        :return: True, when attribute is enabled
+
+        .. seealso::
+
+            :py:meth:`setPaintAttribute()`
+        """
+        return bool(self.__data.paintAttributes & attribute)
+
+    def setSamples(self, *args, **kwargs):
+        """
+        Initialize the samples
+
+        .. py:method:: setSamples(data):
+            :noindex:
+
+            :param data: Series data
+            :type data: qwt.plot_series.QwtIntervalArrayData
+
+        .. py:method:: setSamples(value, lower, upper, [finite=None]):
+            :noindex:
+
+            Same as `setData(QwtIntervalArrayData(value, lower, upper, finite))`
+
+            :param value: List/array of values
+            :param lower: List/array of the lower bounds of the intervals
+            :param upper: List/array of the upper bounds of the intervals
+            :param bool finite: if True (default), keep only finite samples
+        """
+        if len(args) == 1 and not kwargs and isinstance(args[0], QwtSeriesData):
+            self.setData(args[0])
+        elif len(args) == 3:
+            self.setData(QwtIntervalArrayData(*args, **kwargs))
+        else:
+            raise TypeError(
+                "%s().setSamples() takes 1 or 3 argument(s) (%s given)"
+                % (self.__class__.__name__, len(args))
+            )
+
+    def setStyle(self, style):
+        """
+        Set the curve's drawing style
+
+        :param int style: Curve style (`QwtPlotIntervalCurve.NoCurve` or `QwtPlotIntervalCurve.Tube`)
+
+        .. seealso::
+
+            :py:meth:`style()`
+        """
+        if style != self.__data.style:
+            self.__data.style = style
+            self.legendChanged()
+            self.itemChanged()
+
+    def style(self):
+        """
+        :return: Style of the curve
+
+        .. seealso::
+
+            :py:meth:`setStyle()`
+        """
+        return self.__data.style
+
+    def setSymbol(self, symbol):
+        """
+        Assign a symbol, drawn for each interval
+
+        :param QwtIntervalSymbol symbol: Symbol, or None (no symbol)
+
+        .. seealso::
+
+            :py:meth:`symbol()`
+        """
+        if symbol != self.__data.symbol:
+            self.__data.symbol = symbol
+            self.legendChanged()
+            self.itemChanged()
+
+    def symbol(self):
+        """
+        :return: Current symbol or None, when no symbol has been assigned
+
+        .. seealso::
+
+            :py:meth:`setSymbol()`
+        """
+        return self.__data.symbol
+
+    def setPen(self, pen):
+        """
+        Assign the pen used to draw the bounds of the tube
+
+        :param QPen pen: New pen
+
+        .. seealso::
+
+            :py:meth:`pen()`, :py:meth:`brush()`
+        """
+        if pen != self.__data.pen:
+            self.__data.pen = QPen(pen)
+            self.legendChanged()
+            self.itemChanged()
+
+    def pen(self):
+        """
+        :return: Pen used to draw the bounds of the tube
+
+        .. seealso::
+
+            :py:meth:`setPen()`, :py:meth:`brush()`
+        """
+        return self.__data.pen
+
+    def setBrush(self, brush):
+        """
+        Assign the brush used to fill the tube
+
+        :param QBrush brush: New brush
+
+        .. seealso::
+
+            :py:meth:`brush()`, :py:meth:`pen()`
+        """
+        if brush != self.__data.brush:
+            self.__data.brush = QBrush(brush)
+            self.legendChanged()
+            self.itemChanged()
+
+    def brush(self):
+        """
+        :return: Brush used to fill the tube
+
+        .. seealso::
+
+            :py:meth:`setBrush()`, :py:meth:`pen()`
+        """
+        return self.__data.brush
+
+    def boundingRect(self):
+        """
+        :return: Bounding rectangle of all samples, or an invalid rectangle, when no samples are available
+        """
+        rect = QwtPlotSeriesItem.boundingRect(self)
+        if self.orientation() == Qt.Horizontal:
+            rect = QRectF(rect.y(), rect.x(), rect.height(), rect.width())
+        return rect
+
+    def __maps(self, xMap, yMap):
+        """Return the maps of the values and of the intervals"""
+        if self.orientation() == Qt.Vertical:
+            return xMap, yMap
+        return yMap, xMap
+
+    def __margin(self):
+        """Return the extent of the samples around their value, in pixels"""
+        margin = 1.0 + self.__data.pen.widthF()
+        symbol = self.__data.symbol
+        if symbol is not None and symbol.style() != QwtIntervalSymbol.NoSymbol:
+            margin += 0.5 * symbol.width() + symbol.pen().widthF()
+        return margin
+
+    def __sortedRange(self, valueMap, p1, p2, from_, to):
+        """Restrict the range of the samples to the values painted in [p1, p2]"""
+        value = self.data().valueData()
+        v1 = valueMap.invTransform(p1)
+        v2 = valueMap.invTransform(p2)
+        first = max(from_, int(np.searchsorted(value, min(v1, v2), "left")) - 1)
+        last = min(to, int(np.searchsorted(value, max(v1, v2), "right")))
+        return first, last
+
+    def drawBand(self, painter, xMap, yMap, canvasRect, band):
+        """
+        Draw the samples around a vertical band of the canvas
+
+        When the x-values of the samples are sorted in increasing order,
+        only the samples inside the band (widened by the pen width and by
+        the symbol width), and the samples next to it, are drawn.
+
+        :param QPainter painter: Painter
+        :param qwt.scale_map.QwtScaleMap xMap: Maps x-values into pixel coordinates.
+        :param qwt.scale_map.QwtScaleMap yMap: Maps y-values into pixel coordinates.
+        :param QRectF canvasRect: Contents rectangle of the canvas
+        :param QRectF band: Band to be painted, in painter coordinates
+
+        .. seealso::
+
+            :py:meth:`qwt.plot_series.QwtPlotSeriesItem.drawBand()`
+        """
+        data = self.data()
+        if (
+            self.orientation() == Qt.Vertical
+            and isinstance(data, QwtIntervalArrayData)
+            and data.size() > 1
+            and data.isSorted()
+        ):
+            margin = self.__margin()
+            from_, to = self.__sortedRange(
+                xMap,
+                band.left() - margin,
+                band.right() + margin,
+                0,
+                data.size() - 1,
+            )
+            if to - from_ < data.size() - 1:
+                stats.count(self.plot(), polylines_clipped=1)
+            self.drawSeries(painter, xMap, yMap, canvasRect, from_, to)
+        else:
+            self.draw(painter, xMap, yMap, canvasRect)
+
+    def drawSeries(self, painter, xMap, yMap, canvasRect, from_, to):
+        """
+        Draw an interval of the curve
+
+        :param QPainter painter: Painter
+        :param qwt.scale_map.QwtScaleMap xMap: Maps x-values into pixel coordinates.
+        :param qwt.scale_map.QwtScaleMap yMap: Maps y-values into pixel coordinates.
+        :param QRectF canvasRect: Contents rectangle of the canvas
+        :param int from_: Index of the first sample to be painted
+        :param int to: Index of the last sample to be painted. If to < 0 the curve will be painted to its last sample.
+
+        .. seealso::
+
+            :py:meth:`drawTube()`, :py:meth:`drawSymbols()`
+        """
+        numSamples = self.dataSize()
+        if not painter or numSamples <= 0:
+            return
+        if to < 0:
+            to = numSamples - 1
+        from_, to = max(0, from_), min(to, numSamples - 1)
+        data = self.data()
+        valueMap, intervalMap = self.__maps(xMap, yMap)
+        if isinstance(data, QwtIntervalArrayData) and data.isSorted():
+            # Culling: the samples outside the canvas are not painted
+            margin = self.__margin()
+            if self.orientation() == Qt.Vertical:
+                p1, p2 = canvasRect.left() - margin, canvasRect.right() + margin
+            else:
+                p1, p2 = canvasRect.top() - margin, canvasRect.bottom() + margin
+            first, last = self.__sortedRange(valueMap, p1, p2, from_, to)
+            if (first, last) != (from_, to):
+                stats.count(self.plot(), polylines_clipped=1)
+            from_, to = first, last
+        if from_ > to:
+            return
+        value, lower, upper = self.__transform(valueMap, intervalMap, from_, to)
+        decimate = (
+            self.__data.paintAttributes & self.Decimate
+            and isinstance(data, QwtIntervalArrayData)
+            and data.isSorted()
+            and value.size > 2 * (abs(value[-1] - value[0]) + 1)
+        )
+        symbol = self.__data.symbol
+        if symbol is None or symbol.style() == QwtIntervalSymbol.NoSymbol:
+            symbol = None
+        # Caps and boxes are wider than a pixel: they can't be merged
+        mergeBars = (
+            decimate
+            and symbol is not None
+            and symbol.style() == QwtIntervalSymbol.Bar
+            and symbol.width() <= 0
+        )
+        decimateTube = decimate and self.__data.style == self.Tube
+        if mergeBars or decimateTube:
+            stats.count(self.plot(), polylines_decimated=1)
+        if self.__data.style == self.Tube:
+            lowerLine, upperLine = (value, lower), (value, upper)
+            if decimateTube:
+                lowerLine = qwtDecimatePolyline(value, lower)
+                upperLine = qwtDecimatePolyline(value, upper)
+            painter.save()
+            self.drawTube(painter, lowerLine, upperLine)
+            painter.restore()
+        if symbol is not None:
+            if mergeBars:
+                value, lower, upper = qwtDecimateIntervals(value, lower, upper)
+            painter.save()
+            self.drawSymbols(painter, symbol, value, lower, upper)
+            painter.restore()
+
+    def __transform(self, valueMap, intervalMap, from_, to):
+        """Return the samples in paint device coordinates"""
+        data = self.data()
+        if isinstance(data, QwtIntervalArrayData):
+            value = data.valueData()[from_ : to + 1]
+            lower = data.lowerData()[from_ : to + 1]
+            upper = data.upperData()[from_ : to + 1]
+        else:
+            samples = [data.sample(i) for i in range(from_, to + 1)]
+            value = np.array([sample.value for sample in samples], float)
+            lower = np.array([s.interval.minValue() for s in samples], float)
+            upper = np.array([s.interval.maxValue() for s in samples], float)
+        stats.count(self.plot(), points_transformed=3 * value.size)
+        return (
+            valueMap.transform_array(value),
+            intervalMap.transform_array(lower),
+            intervalMap.transform_array(upper),
+        )
+
+    def __points(self, buffer, size):
+        """Return the (size, 2) coordinates array of a reused polygon"""
+        return qpolygonf_as_array(buffer, size)
+
+    def __setPoints(self, points, value, bound):
+        if self.orientation() == Qt.Vertical:
+            points[:, 0], points[:, 1] = value, bound
+        else:
+            points[:, 0], points[:, 1] = bound, value
+
+    def drawTube(self, painter, lowerLine, upperLine):
+        """
+        Draw a tube
+
+        The area between the lower and the upper bounds is filled with the
+        brush, and the bounds are drawn with the pen.
+
+        :param QPainter painter: Painter
+        :param tuple lowerLine: Values and lower bounds arrays, in paint device coordinates
+        :param tuple upperLine: Values and upper bounds arrays, in paint device coordinates
+
+        .. seealso::
+
+            :py:meth:`drawSymbols()`
+        """
+        size = upperLine[0].size
+        polygon = self.__data.polygonBuffer
+        points = self.__points(polygon, size + lowerLine[0].size)
+        self.__setPoints(points[:size], *upperLine)
+        self.__setPoints(points[size:], lowerLine[0][::-1], lowerLine[1][::-1])
+        brush = self.__data.brush
+        if brush.style() != Qt.NoBrush:
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(brush)
+            painter.drawPolygon(polygon, Qt.WindingFill)
+        pen = self.__data.pen
+        if pen.style() != Qt.NoPen:
+            # Both bounds, as pairs of points of a single batch of lines
+            lines = self.__data.linesBuffer
+            pairs = self.__points(lines, 2 * (len(points) - 2))
+            start = 0
+            for bounds in (points[:size], points[size:]):
+                stop = start + 2 * (len(bounds) - 1)
+                segments = pairs[start:stop].reshape(-1, 2, 2)
+                segments[:, 0] = bounds[:-1]
+                segments[:, 1] = bounds[1:]
+                start = stop
+            painter.setPen(pen)
+            painter.setBrush(Qt.NoBrush)
+            painter.drawLines(lines)
+        stats.count(self.plot(), points_painted=len(points))
+
+    def drawSymbols(self, painter, symbol, value, lower, upper):
+        """
+        Draw the interval symbols
+
+        :param QPainter painter: Painter
+        :param QwtIntervalSymbol symbol: Interval symbol
+        :param numpy.ndarray value: Values, in paint device coordinates
+        :param numpy.ndarray lower: Lower bounds, in paint device coordinates
+        :param numpy.ndarray upper: Upper bounds, in paint device coordinates
+
+        .. seealso::
+
+            :py:meth:`drawTube()`
+        """
+        size = value.size
+        half = 0.5 * symbol.width()
+        painter.setPen(symbol.pen())
+        if symbol.style() == QwtIntervalSymbol.Bar:
+            # Bars and caps, as pairs of points of a single batch of lines
+            painter.setBrush(Qt.NoBrush)
+            lines = self.__data.linesBuffer
+            count = 3 if half > 0 else 1
+            points = self.__points(lines, 2 * count * size).reshape(size, count, 2, 2)
+            self.__setPoints(points[:, 0, 0], value, lower)
+            self.__setPoints(points[:, 0, 1], value, upper)
+            if count == 3:
+                for index, bound in ((1, lower), (2, upper)):
+                    self.__setPoints(points[:, index, 0], value - half, bound)
+                    self.__setPoints(points[:, index, 1], value + half, bound)
+            painter.drawLines(lines)
+        elif symbol.style() == QwtIntervalSymbol.Box:
+            # Rectangles (x, y, width, height) computed by NumPy: a single
+            # batch of rectangles is faster than polygons or wide lines
+            corners = np.empty((size, 2, 2))
+            self.__setPoints(corners[:, 0], value - half, lower)
+            self.__setPoints(corners[:, 1], value + half, upper)
+            corners.sort(axis=1)
+            corners[:, 1] -= corners[:, 0]
+            rects = corners.reshape(size, 4).T.tolist()
+            painter.setBrush(symbol.brush())
+            painter.drawRects(list(map(QRectF, *rects)))
+        stats.count(self.plot(), symbols_drawn=size)
+
+    def legendIcon(self, index, size):
+        """
+        :param int index: Index of the legend entry (ignored as there is only one)
+        :param QSizeF size: Icon size
+        :return: Icon representing the curve on the legend
+
+        .. seealso::
+
+            :py:meth:`qwt.plot.QwtPlotItem.setLegendIconSize()`,
+            :py:meth:`qwt.plot.QwtPlotItem.legendData()`
+        """
+        if size.isEmpty():
+            return QwtGraphic()
+        graphic = QwtGraphic()
+        graphic.setDefaultSize(size)
+        graphic.setRenderHint(QwtGraphic.RenderPensUnscaled, True)
+        painter = QPainter(graphic)
+        painter.setRenderHint(
+            QPainter.Antialiasing, self.testRenderHint(QwtPlotItem.RenderAntialiased)
+        )
+        rect = QRectF(0, 0, size.width(), size.height())
+        if self.__data.style == self.Tube:
+            painter.fillRect(rect, self.__data.brush)
+        symbol = self.__data.symbol
+        if symbol is not None and symbol.style() != QwtIntervalSymbol.NoSymbol:
+            painter.setPen(symbol.pen())
+            center = rect.center()
+            if self.orientation() == Qt.Vertical:
+                painter.drawLine(
+                    QLineF(center.x(), rect.top(), center.x(), rect.bottom())
+                )
+            else:
+                painter.drawLine(
+                    QLineF(rect.left(), center.y(), rect.right(), center.y())
+                )
+        painter.end()
+        return graphic
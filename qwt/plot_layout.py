@@ -20,8 +20,7 @@ from qtpy.QtGui import QFont, QRegion
 
 from qwt.plot import QwtPlot
 from qwt.scale_draw import QwtAbstractScaleDraw
-from qwt.scale_widget import QwtScaleWidget
-from qwt.text import QwtText
+from qwt.text import QwtText, font_key_cached
 
 QWIDGETSIZE_MAX = (1 << 24) - 1
 
@@ -49,7 +48,7 @@ class FooterData(object):
 class ScaleData(object):
     def __init__(self):
         self.isEnabled = None
-        self.scaleWidget = QwtScaleWidget()
+        self.scaleWidget = None  # QwtScaleWidget
         self.scaleFont = QFont()
         self.start = None
         self.end = None
@@ -88,7 +87,7 @@ class QwtPlotLayout_LayoutData(object):
         # title
         self.title.frameWidth = 0
         self.title.text = QwtText()
-        if plot.titleLabel():
+        if not plot.title().isEmpty():
             label = plot.titleLabel()
             self.title.text = label.text()
             if not self.title.text.testPaintAttribute(QwtText.PaintUsingTextFont):
@@ -97,7 +96,7 @@ class QwtPlotLayout_LayoutData(object):
         # footer
         self.footer.frameWidth = 0
         self.footer.text = QwtText()
-        if plot.footerLabel():
+        if not plot.footer().isEmpty():
             label = plot.footerLabel()
             self.footer.text = label.text()
             if not self.footer.text.testPaintAttribute(QwtText.PaintUsingTextFont):
@@ -158,6 +157,7 @@ class QwtPlotLayout_PrivateData(QObject):
         self.legendRatio = None
         self.canvasMargin = [0] * len(QwtPlot.AXES)
         self.alignCanvasToScales = [False] * len(QwtPlot.AXES)
+        self.layoutState = None
 
 
 class QwtPlotLayout(object):
@@ -553,6 +553,7 @@ class QwtPlotLayout(object):
         self.__data.canvasRect = QRectF()
         for axis in QwtPlot.AXES:
             self.__data.scaleRect[axis] = QRectF()
+        self.__data.layoutState = None
 
     def minimumSizeHint(self, plot):
         """
@@ -653,8 +654,12 @@ class QwtPlotLayout(object):
             + 1
         )
         h += max([ch, minCanvasSize.height()])
-        for label in [plot.titleLabel(), plot.footerLabel()]:
-            if label and not label.text().isEmpty():
+        for text, labelGetter in (
+            (plot.title(), plot.titleLabel),
+            (plot.footer(), plot.footerLabel),
+        ):
+            if not text.isEmpty():
+                label = labelGetter()
                 centerOnCanvas = not plot.axisEnabled(
                     QwtPlot.yLeft
                 ) and plot.axisEnabled(QwtPlot.yRight)
@@ -1034,14 +1039,116 @@ class QwtPlotLayout(object):
                     else:
                         sRect.setLeft(canvasRect.right())
 
+    def layoutState(self, plot, plotRect, options=0x00):
+        """
+        Snapshot of everything the geometry of the components depends on.
+
+        The snapshot includes the plot rectangle, the layout options and
+        parameters, the title and footer texts and fonts, the axis enable
+        flags, the size and border distance hints of the scale widgets
+        and the legend geometry.
+
+        :param qwt.plot.QwtPlot plot: Plot to be layout
+        :param QRectF plotRect: Rectangle where to place the components
+        :param options: Layout options
+        :return: Hashable layout state
+
+        .. seealso::
+
+            :py:meth:`activate()`, :py:meth:`activatedState()`
+        """
+        data = self.__data
+        labels = []
+        for text, labelGetter in (
+            (plot.title(), plot.titleLabel),
+            (plot.footer(), plot.footerLabel),
+        ):
+            if text.isEmpty():
+                labels.append(None)
+            else:
+                label = labelGetter()
+                labels.append(
+                    (
+                        text.text(),
+                        int(text.renderFlags()),
+                        font_key_cached(text.usedFont(label.font())),
+                        label.frameWidth(),
+                    )
+                )
+        scales = []
+        for axis in QwtPlot.AXES:
+            if plot.axisEnabled(axis):
+                scaleWidget = plot.axisWidget(axis)
+                hint = scaleWidget.sizeHint()
+                scales.append(
+                    (
+                        hint.width(),
+                        hint.height(),
+                        scaleWidget.getBorderDistHint(),
+                        scaleWidget.startBorderDist(),
+                        scaleWidget.endBorderDist(),
+                        scaleWidget.margin(),
+                        scaleWidget.spacing(),
+                        scaleWidget.title().text(),
+                        font_key_cached(scaleWidget.font()),
+                    )
+                )
+            else:
+                scales.append(None)
+        legend = plot.legend()
+        if legend is None or legend.isEmpty():
+            legendState = None
+        else:
+            hint = legend.sizeHint()
+            legendState = (hint.width(), hint.height(), legend.frameWidth())
+        canvasLayout = plot.canvas().layout()
+        if canvasLayout is None:
+            canvasMargins = None
+        else:
+            mgn = canvasLayout.contentsMargins()
+            canvasMargins = (mgn.left(), mgn.top(), mgn.right(), mgn.bottom())
+        return (
+            QRectF(plotRect).getRect(),
+            int(options),
+            data.spacing,
+            data.legendPos,
+            data.legendRatio,
+            tuple(data.canvasMargin),
+            tuple(data.alignCanvasToScales),
+            tuple(labels),
+            tuple(scales),
+            legendState,
+            canvasMargins,
+        )
+
+    def activatedState(self):
+        """
+        :return: Layout state of the last activation, or None if the layout has been invalidated since
+
+        The returned object is not replaced when `activate()` finds that the
+        layout state has not changed, so that callers may check with an identity
+        test whether the geometry of the components has been recalculated.
+
+        .. seealso::
+
+            :py:meth:`activate()`, :py:meth:`layoutState()`
+        """
+        return self.__data.layoutState
+
     def activate(self, plot, plotRect, options=0x00):
         """
         Recalculate the geometry of all components.
 
+        The calculation is skipped when the layout state (see
+        `layoutState()`) has not changed since the last activation.
+
         :param qwt.plot.QwtPlot plot: Plot to be layout
         :param QRectF plotRect: Rectangle where to place the components
         :param options: Layout options
         """
+        state = self.layoutState(plot, plotRect, options)
+        if state == self.__data.layoutState:
+            return
         self.invalidate()
         rect = QRectF(plotRect)
         self.__data.layoutData.init(plot, rect)
@@ -1165,3 +1272,4 @@ class QwtPlotLayout(object):
             self.__data.legendRect = self.alignLegend(
                 self.__data.canvasRect, self.__data.legendRect
             )
+        self.__data.layoutState = state
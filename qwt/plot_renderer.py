@@ -30,8 +30,6 @@ from qtpy.QtGui import (
     QPen,
     QTransform,
 )
-from qtpy.QtPrintSupport import QPrinter
-from qtpy.QtSvg import QSvgGenerator
 from qtpy.QtWidgets import QFileDialog
 
 from qwt.painter import QwtPainter
@@ -242,6 +240,8 @@ class QwtPlotRenderer(QObject):
         documentRect = QRectF(0.0, 0.0, size.width(), size.height())
         fmt = format_.lower()
         if fmt in ("pdf", "ps"):
+            from qtpy.QtPrintSupport import QPrinter
+
             printer = QPrinter()
             if fmt == "pdf":
                 try:
@@ -265,6 +265,8 @@ class QwtPlotRenderer(QObject):
             self.render(plot, painter, documentRect)
             painter.end()
         elif fmt == "svg":
+            from qtpy.QtSvg import QSvgGenerator
+
             generator = QSvgGenerator()
             generator.setTitle(title)
             generator.setFileName(filename)
@@ -309,25 +311,32 @@ class QwtPlotRenderer(QObject):
             :py:meth:`render()`,
             :py:meth:`qwt.painter.QwtPainter.setRoundingAlignment()`
         """
+        # QtPrintSupport and QtSvg are only imported when needed: rendering
+        # to a QImage or a QPixmap must not load them
         if isinstance(dest, QPaintDevice):
             w = dest.width()
             h = dest.height()
             rect = QRectF(0, 0, w, h)
-        elif isinstance(dest, QPrinter):
-            w = dest.width()
-            h = dest.height()
-            rect = QRectF(0, 0, w, h)
-            aspect = rect.width() / rect.height()
-            if aspect < 1.0:
-                rect.setHeight(aspect * rect.width())
-        elif isinstance(dest, QSvgGenerator):
-            rect = dest.viewBoxF()
-            if rect.isEmpty():
-                rect.setRect(0, 0, dest.width(), dest.height())
-            if rect.isEmpty():
-                rect.setRect(0, 0, 800, 600)
         else:
-            raise TypeError("Unsupported destination type %s" % type(dest))
+            from qtpy.QtPrintSupport import QPrinter
+
+            if isinstance(dest, QPrinter):
+                w = dest.width()
+                h = dest.height()
+                rect = QRectF(0, 0, w, h)
+                aspect = rect.width() / rect.height()
+                if aspect < 1.0:
+                    rect.setHeight(aspect * rect.width())
+            else:
+                from qtpy.QtSvg import QSvgGenerator
+
+                if not isinstance(dest, QSvgGenerator):
+                    raise TypeError("Unsupported destination type %s" % type(dest))
+                rect = dest.viewBoxF()
+                if rect.isEmpty():
+                    rect.setRect(0, 0, dest.width(), dest.height())
+                if rect.isEmpty():
+                    rect.setRect(0, 0, 800, 600)
         p = QPainter(dest)
         self.render(plot, p, rect)
 
@@ -376,8 +385,8 @@ class QwtPlotRenderer(QObject):
         for axisId in QwtPlot.AXES:
             canvasMargins[axisId] = layout.canvasMargin(axisId)
             if self.__data.layoutFlags & self.FrameWithScales:
-                scaleWidget = plot.axisWidget(axisId)
-                if scaleWidget:
+                if plot.axisEnabled(axisId):
+                    scaleWidget = plot.axisWidget(axisId)
                     mgn = scaleWidget.contentsMargins()
                     baseLineDists[axisId] = max(
                         [mgn.left(), mgn.top(), mgn.right(), mgn.bottom()]
@@ -428,22 +437,20 @@ class QwtPlotRenderer(QObject):
 
         if (
             not self.__data.discardFlags & self.DiscardTitle
-        ) and plot.titleLabel().text():
+        ) and not plot.title().isEmpty():
             self.renderTitle(plot, painter, layout.titleRect())
 
         if (
             not self.__data.discardFlags & self.DiscardFooter
-        ) and plot.titleLabel().text():
+        ) and not plot.footer().isEmpty():
             self.renderFooter(plot, painter, layout.footerRect())
 
-        if (
-            not self.__data.discardFlags & self.DiscardLegend
-        ) and plot.titleLabel().text():
+        if not self.__data.discardFlags & self.DiscardLegend:
             self.renderLegend(plot, painter, layout.legendRect())
 
         for axisId in QwtPlot.AXES:
-            scaleWidget = plot.axisWidget(axisId)
-            if scaleWidget:
+            if plot.axisEnabled(axisId):
+                scaleWidget = plot.axisWidget(axisId)
                 mgn = scaleWidget.contentsMargins()
                 baseDist = max([mgn.left(), mgn.top(), mgn.right(), mgn.bottom()])
                 startDist, endDist = scaleWidget.getBorderDistHint()
@@ -461,8 +468,8 @@ class QwtPlotRenderer(QObject):
 
         for axisId in QwtPlot.AXES:
             if self.__data.layoutFlags & self.FrameWithScales:
-                scaleWidget = plot.axisWidget(axisId)
-                if scaleWidget:
+                if plot.axisEnabled(axisId):
+                    scaleWidget = plot.axisWidget(axisId)
                     scaleWidget.setMargin(baseLineDists[axisId])
             layout.setCanvasMargin(canvasMargins[axisId])
 
@@ -27,6 +27,18 @@ QwtPointArrayData
 .. autoclass:: QwtPointArrayData
    :members:
 
+QwtIntervalSample
+~~~~~~~~~~~~~~~~~
+
+.. autoclass:: QwtIntervalSample
+   :members:
+
+QwtIntervalArrayData
+~~~~~~~~~~~~~~~~~~~~
+
+.. autoclass:: QwtIntervalArrayData
+   :members:
+
 QwtSeriesStore
 ~~~~~~~~~~~~~~
 
@@ -37,6 +49,8 @@ QwtSeriesStore
 import numpy as np
 from qtpy.QtCore import QPointF, QRectF, Qt
 
+from qwt import stats
+from qwt.interval import QwtInterval
 from qwt.plot import QwtPlotItem, QwtPlotItem_PrivateData
 from qwt.text import QwtText
 
@@ -97,6 +111,38 @@ class QwtPlotSeriesItem(QwtPlotItem):
         """
         self.drawSeries(painter, xMap, yMap, canvasRect, 0, -1)
 
+    def drawBand(self, painter, xMap, yMap, canvasRect, band):
+        """
+        Draw the samples around a vertical band of the canvas
+
+        When the x-values of the samples are sorted in increasing order
+        (as in a strip chart), only the samples inside the band, and the
+        samples next to it, are drawn. The whole series is drawn otherwise.
+
+        :param QPainter painter: Painter
+        :param qwt.scale_map.QwtScaleMap xMap: Maps x-values into pixel coordinates.
+        :param qwt.scale_map.QwtScaleMap yMap: Maps y-values into pixel coordinates.
+        :param QRectF canvasRect: Contents rectangle of the canvas
+        :param QRectF band: Band to be painted, in painter coordinates
+
+        .. seealso::
+
+            :py:meth:`qwt.plot.QwtPlotItem.drawBand()`
+        """
+        data = self.data()
+        if isinstance(data, QwtPointArrayData) and data.size() > 1:
+            x = data.xData()
+            if np.all(x[1:] >= x[:-1]):
+                x1 = xMap.invTransform(band.left())
+                x2 = xMap.invTransform(band.right())
+                from_ = max(0, int(np.searchsorted(x, min(x1, x2), "left")) - 1)
+                to = min(x.size - 1, int(np.searchsorted(x, max(x1, x2), "right")))
+                if to - from_ < x.size - 1:
+                    stats.count(self.plot(), polylines_clipped=1)
+                self.drawSeries(painter, xMap, yMap, canvasRect, from_, to)
+                return
+        self.draw(painter, xMap, yMap, canvasRect)
+
     def drawSeries(self, painter, xMap, yMap, canvasRect, from_, to):
         """
         Draw a subset of the samples
@@ -289,6 +335,116 @@ class QwtPointArrayData(QwtSeriesData):
         return self.__y
 
 
+class QwtIntervalSample(object):
+    """
+    A sample of the types (x1-x2, y) or (x, y1-y2)
+
+    .. py:class:: QwtIntervalSample(value, interval)
+
+        :param float value: Value
+        :param qwt.interval.QwtInterval interval: Interval
+    """
+
+    def __init__(self, value=0.0, interval=None):
+        self.value = value
+        self.interval = QwtInterval() if interval is None else interval
+
+
+class QwtIntervalArrayData(QwtSeriesData):
+    """
+    Interface for iterating over three array objects: values, and lower and
+    upper bounds of the intervals
+
+    The samples are intervals at a value: for vertical intervals (e.g.
+    error bars in y), the values are x-values and the bounds are y-values.
+
+    .. py:class:: QwtIntervalArrayData(value, lower, upper, [finite=None])
+
+        :param value: Array of values
+        :type value: list or tuple or numpy.array
+        :param lower: Array of the lower bounds
+        :type lower: list or tuple or numpy.array
+        :param upper: Array of the upper bounds
+        :type upper: list or tuple or numpy.array
+        :param bool finite: if True (default), keep only finite samples (remove all infinity and not a number values), otherwise do not filter samples
+    """
+
+    def __init__(self, value=None, lower=None, upper=None, finite=None):
+        QwtSeriesData.__init__(self)
+        arrays = [
+            np.array([], float) if array is None else np.asarray(array, float)
+            for array in (value, lower, upper)
+        ]
+        for array in arrays:
+            if array.ndim != 1:
+                raise ValueError("Arguments must be 1D arrays")
+        size = min(array.size for array in arrays)
+        arrays = [array[:size] for array in arrays]
+        if finite if finite is not None else True:
+            indexes = np.logical_and.reduce([np.isfinite(array) for array in arrays])
+            if not indexes.all():
+                arrays = [array[indexes] for array in arrays]
+        self.__value, self.__lower, self.__upper = arrays
+        self.__sorted = None
+
+    def boundingRect(self):
+        """
+        Calculate the bounding rectangle of the samples, with the values
+        as x-values (the rectangle is transposed by horizontal items)
+
+        :return: Bounding rectangle
+        """
+        if self.__value.size == 0:
+            return QRectF(1.0, 1.0, -2.0, -2.0)
+        vmin = self.__value.min()
+        vmax = self.__value.max()
+        imin = min(self.__lower.min(), self.__upper.min())
+        imax = max(self.__lower.max(), self.__upper.max())
+        return QRectF(vmin, imin, vmax - vmin, imax - imin)
+
+    def size(self):
+        """
+        :return: Size of the data set
+        """
+        return self.__value.size
+
+    def sample(self, index):
+        """
+        :param int index: Index
+        :return: Sample at position `index`
+        :rtype: QwtIntervalSample
+        """
+        interval = QwtInterval(self.__lower[index], self.__upper[index])
+        return QwtIntervalSample(self.__value[index], interval)
+
+    def valueData(self):
+        """
+        :return: Array of the values
+        """
+        return self.__value
+
+    def lowerData(self):
+        """
+        :return: Array of the lower bounds
+        """
+        return self.__lower
+
+    def upperData(self):
+        """
+        :return: Array of the upper bounds
+        """
+        return self.__upper
+
+    def isSorted(self):
+        """
+        :return: True, if the values are sorted in increasing order (computed once)
+        """
+        if self.__sorted is None:
+            value = self.__value
+            self.__sorted = bool(np.all(value[1:] >= value[:-1]))
+        return self.__sorted
+
+
 class QwtSeriesStore(object):
     """
     Class storing a `QwtSeriesData` object
@@ -0,0 +1,279 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the Qwt License
+# (see LICENSE file for more details)
+
+"""
+Profiling
+---------
+
+Opt-in tracing of the rendering pipeline of the plots.
+
+When tracing is enabled, named spans are recorded around `QwtPlot.replot`,
+`QwtPlot.updateAxes`, `QwtPlot.updateLayout`, `QwtPlotCanvas.paintEvent`,
+the drawing of the plot items (`QwtPlot.drawItems`), the `draw` call of each
+plot item and the paint events of the scale widgets.
+Each span is tagged with the plot (and the item) it belongs to, so that a
+trace shows which plot and which item blows the frame budget.
+
+Traces are exported in the Chrome trace event format (JSON), which may be
+opened in `chrome://tracing` or in `Perfetto <https://ui.perfetto.dev>`_::
+
+    from qwt import profiling
+
+    profiling.enable()
+    ...  # Show or replot some plots
+    profiling.export_chrome_trace("trace.json")
+
+Tracing may also be enabled without changing the application code by setting
+the `QWT_TRACE` environment variable to the name of the trace file, which is
+written when the application exits.
+
+When tracing is disabled (the default), the cost of a span is a function
+call returning a shared no-op context manager.
+
+The spans of a plot may also be passed to a listener (see
+:py:func:`set_listener()`), independently of tracing: this is how the
+performance overlay of the plot canvas measures the replot pipeline.
+
+.. autofunction:: enable
+
+.. autofunction:: disable
+
+.. autofunction:: is_enabled
+
+.. autofunction:: span
+
+.. autofunction:: set_listener
+
+.. autofunction:: events
+
+.. autofunction:: clear
+
+.. autofunction:: chrome_trace
+
+.. autofunction:: export_chrome_trace
+"""
+
+import atexit
+import collections
+import json
+import os
+import threading
+import time
+import weakref
+
+#: Environment variable enabling tracing: name of the trace file, written at exit
+TRACE_ENV = "QWT_TRACE"
+
+_TRACER = None
+_LISTENERS = weakref.WeakKeyDictionary()
+_HAS_LISTENERS = False
+
+
+def object_identity(obj):
+    """
+    :param obj: Plot, plot item or any other object
+    :return: String identifying the object in traces (class name, title or object name, and address)
+    """
+    label = ""
+    if hasattr(obj, "objectName"):
+        label = obj.objectName()
+    if not label and hasattr(obj, "title"):
+        title = obj.title()
+        label = title.text() if hasattr(title, "text") else title
+    return "%s(%r)@%x" % (type(obj).__name__, str(label), id(obj))
+
+
+class _NullSpan(object):
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class QwtTraceSpan(object):
+    """
+    A span of the rendering pipeline, recorded when it exits
+
+    :param QwtTracer tracer: Tracer, or None
+    :param callable listener: Span listener of the plot, or None
+    :param str name: Span name
+    :param plot: Plot, or None
+    :param item: Plot item, or None
+    """
+
+    __slots__ = ("tracer", "listener", "name", "plot", "item", "start")
+
+    def __init__(self, tracer, listener, name, plot, item):
+        self.tracer = tracer
+        self.listener = listener
+        self.name = name
+        self.plot = plot
+        self.item = item
+        self.start = None
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        end = time.perf_counter()
+        if self.tracer is not None:
+            self.tracer.record(self.name, self.start, end, self.plot, self.item)
+        if self.listener is not None:
+            self.listener(self.name, self.start, end, self.item)
+        return False
+
+
+class QwtTracer(object):
+    """
+    Recorder of trace events
+
+    :param int max_events: Maximum number of events (the oldest events are dropped)
+    """
+
+    def __init__(self, max_events):
+        self.events = collections.deque(maxlen=max_events)
+        self.origin = time.perf_counter()
+        self.pid = os.getpid()
+
+    def record(self, name, start, end, plot=None, item=None):
+        """
+        Record a complete event
+
+        :param str name: Event name
+        :param float start: Start time (`time.perf_counter()`)
+        :param float end: End time (`time.perf_counter()`)
+        :param plot: Plot, or None
+        :param item: Plot item, or None
+        """
+        args = {}
+        if plot is not None:
+            args["plot"] = object_identity(plot)
+        if item is not None:
+            args["item"] = object_identity(item)
+        self.events.append(
+            {
+                "name": name,
+                "cat": "qwt",
+                "ph": "X",
+                "ts": (start - self.origin) * 1e6,
+                "dur": (end - start) * 1e6,
+                "pid": self.pid,
+                "tid": threading.get_ident(),
+                "args": args,
+            }
+        )
+
+
+def enable(max_events=1000000):
+    """
+    Enable tracing
+
+    The events recorded so far are kept if tracing is already enabled.
+
+    :param int max_events: Maximum number of recorded events (the oldest events are dropped)
+    """
+    global _TRACER
+    if _TRACER is None:
+        _TRACER = QwtTracer(max_events)
+
+
+def disable():
+    """
+    Disable tracing and discard the recorded events
+    """
+    global _TRACER
+    _TRACER = None
+
+
+def is_enabled():
+    """
+    :return: True if tracing is enabled
+    """
+    return _TRACER is not None
+
+
+def span(name, plot=None, item=None):
+    """
+    Return a context manager recording a span of the rendering pipeline
+
+    :param str name: Span name (e.g. `"QwtPlot.replot"`)
+    :param plot: Plot the span belongs to, or None
+    :param item: Plot item the span belongs to, or None
+    :return: Context manager (a shared no-op context manager if tracing is disabled)
+    """
+    tracer = _TRACER
+    listener = None
+    if _HAS_LISTENERS and plot is not None:
+        try:
+            listener = _LISTENERS.get(plot)
+        except TypeError:  # not weakly referenceable, hence without listener
+            pass
+    if tracer is None and listener is None:
+        return _NULL_SPAN
+    return QwtTraceSpan(tracer, listener, name, plot, item)
+
+
+def set_listener(plot, listener):
+    """
+    Set the span listener of a plot
+
+    The listener is called when a span tagged with the plot exits, whether
+    tracing is enabled or not.
+
+    :param plot: Plot
+    :param callable listener: Function called with the span name, start and end times (`time.perf_counter()`) and plot item (or None), or None to remove the listener
+    """
+    global _HAS_LISTENERS
+    if listener is None:
+        _LISTENERS.pop(plot, None)
+    else:
+        _LISTENERS[plot] = listener
+    _HAS_LISTENERS = len(_LISTENERS) > 0
+
+
+def events():
+    """
+    :return: List of the recorded events (Chrome trace event dictionaries)
+    """
+    if _TRACER is None:
+        return []
+    return list(_TRACER.events)
+
+
+def clear():
+    """
+    Discard the recorded events
+    """
+    if _TRACER is not None:
+        _TRACER.events.clear()
+
+
+def chrome_trace():
+    """
+    :return: Recorded events, in the Chrome trace event format
+    """
+    return {"traceEvents": events(), "displayTimeUnit": "ms"}
+
+
+def export_chrome_trace(filename):
+    """
+    Write the recorded events to a Chrome trace JSON file
+
+    :param str filename: File name
+    """
+    with open(filename, "w") as fdesc:
+        json.dump(chrome_trace(), fdesc)
+
+
+if os.environ.get(TRACE_ENV):
+    enable()
+    atexit.register(export_chrome_trace, os.environ[TRACE_ENV])
@@ -0,0 +1,269 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the Qwt License
+# (see LICENSE file for more details)
+
+"""
+Render service
+--------------
+
+Rendering of plots for `asyncio` applications (e.g. the rendering stage of
+an asynchronous HTTP server), without blocking the event loop.
+
+Coroutines submit render jobs to a :py:class:`QwtRenderService` and await the
+encoded image. A job is a plot spec (see :py:func:`qwt.batch.build_plot()`),
+which is rendered by a headless plot (see
+:py:class:`qwt.plot_headless.QwtHeadlessPlot`) in a pool of worker threads or
+processes. The following keys of the spec set the image:
+
+  * `size` (default: `[800, 600]`): size of the image, in pixels
+  * `resolution` (default: 96 dpi): resolution of the image
+  * `format` (default: `"png"`): image format (e.g. `"png"`, `"jpg"` or `"bmp"`)
+  * `quality` (default: -1): quality of the compression (0 to 100)
+
+Jobs wait in a bounded queue: when it is full, :py:meth:`QwtRenderService.render()`
+waits for a free slot (backpressure), unless `block` is False, in which
+case `asyncio.QueueFull` is raised at once (e.g. to answer "503 Service
+Unavailable"). Each job may have a timeout, covering the time spent in the
+queue and the rendering::
+
+    from qwt.render_service import QwtRenderService
+
+    async def handler(request):
+        data = await service.render(spec, timeout=2.0)
+        ...
+
+    async def main():
+        async with QwtRenderService(workers=4, maxQueueSize=64) as service:
+            ...
+
+Worker threads share the `QGuiApplication` of the process, which is created
+(with the `offscreen` platform plugin by default) if there is none, and the
+process-wide caches of tick labels and font metrics, which are thread-safe. Worker
+processes are started with the `spawn` method and create their own
+application: their jobs must be picklable, and rendering isn't limited by
+the GIL of the calling process.
+
+.. autoclass:: QwtRenderService
+   :members:
+
+.. autofunction:: render_spec
+"""
+
+import asyncio
+import concurrent.futures
+import multiprocessing
+import os
+import time
+
+from qwt.batch import DEFAULT_SIZE
+
+#: Default resolution of the images, in dots per inch
+DEFAULT_RESOLUTION = 96
+
+_APP = None
+
+
+def _init_application():
+    global _APP
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from qtpy.QtGui import QGuiApplication
+
+    _APP = QGuiApplication.instance() or QGuiApplication([])
+
+
+def render_spec(spec):
+    """
+    Render a plot spec into encoded image data, in the current thread (a
+    `QGuiApplication` must exist)
+
+    :param dict spec: Plot spec (see :py:func:`qwt.batch.build_plot()`), whose `factory` must return a :py:class:`qwt.plot_headless.QwtHeadlessPlot`
+    :return: Image data
+    :rtype: bytes
+    """
+    from qwt.batch import build_plot
+
+    width, height = spec.get("size", DEFAULT_SIZE)
+    plot = build_plot(spec, headless=True)
+    return plot.toBytes(
+        width,
+        height,
+        spec.get("resolution", DEFAULT_RESOLUTION),
+        spec.get("format", "png"),
+        spec.get("quality", -1),
+    )
+
+
+class QwtRenderJob(object):
+    __slots__ = ("spec", "future", "submitted")
+
+    def __init__(self, spec, future):
+        self.spec = spec
+        self.future = future
+        self.submitted = time.perf_counter()
+
+
+class QwtRenderService(object):
+    """
+    An `asyncio` render service with a bounded queue
+
+    The service must be started and closed in the event loop, either
+    explicitly (:py:meth:`start()` and :py:meth:`close()`) or as an
+    asynchronous context manager.
+
+    :param int workers: Number of worker threads or processes
+    :param bool processes: If True, render in worker processes instead of threads
+    :param int maxQueueSize: Maximum number of jobs waiting for a worker
+    :param float timeout: Default timeout of the jobs, in seconds, or None
+    """
+
+    def __init__(self, workers=1, processes=False, maxQueueSize=16, timeout=None):
+        self.__workers = workers
+        self.__processes = processes
+        self.__maxQueueSize = maxQueueSize
+        self.__timeout = timeout
+        self.__queue = None
+        self.__futures = set()
+        self.__tasks = []
+        self.__executor = None
+        self.__stats = dict.fromkeys(
+            ("submitted", "rendered", "failed", "timeouts", "rejected"), 0
+        )
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def isRunning(self):
+        """
+        :return: True if the service is started
+        """
+        return self.__queue is not None
+
+    async def start(self):
+        """
+        Start the workers
+        """
+        if self.isRunning():
+            return
+        if self.__processes:
+            self.__executor = concurrent.futures.ProcessPoolExecutor(
+                self.__workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_application,
+            )
+        else:
+            _init_application()
+            self.__executor = concurrent.futures.ThreadPoolExecutor(
+                self.__workers, thread_name_prefix="QwtRenderService"
+            )
+        # The queue is created in the running loop (required by Python 3.9)
+        self.__queue = asyncio.Queue(self.__maxQueueSize)
+        self.__tasks = [
+            asyncio.ensure_future(self.__dispatch()) for _i in range(self.__workers)
+        ]
+
+    async def close(self):
+        """
+        Stop the workers: the pending jobs are cancelled, after the
+        renderings in progress are completed
+
+        The coroutines awaiting a job, including those waiting for a free
+        slot in the queue, get a `RuntimeError`.
+        """
+        if not self.isRunning():
+            return
+        self.__queue = None
+        futures, self.__futures = self.__futures, set()
+        for future in futures:
+            future.cancel()
+        for task in self.__tasks:
+            task.cancel()
+        await asyncio.gather(*self.__tasks, return_exceptions=True)
+        self.__tasks = []
+        executor, self.__executor = self.__executor, None
+        await asyncio.get_running_loop().run_in_executor(None, executor.shutdown)
+
+    async def __dispatch(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            job = await self.__queue.get()
+            if job.future.done():  # cancelled, or timed out in the queue
+                continue
+            try:
+                result = await loop.run_in_executor(
+                    self.__executor, render_spec, job.spec
+                )
+            except asyncio.CancelledError:
+                job.future.cancel()
+                raise
+            except Exception as exc:
+                self.__stats["failed"] += 1
+                if not job.future.done():
+                    job.future.set_exception(exc)
+            else:
+                self.__stats["rendered"] += 1
+                if not job.future.done():
+                    job.future.set_result(result)
+
+    async def render(self, spec, timeout=None, block=True):
+        """
+        Render a plot spec
+
+        :param dict spec: Plot spec (see :py:func:`render_spec()`)
+        :param float timeout: Timeout in seconds, from the submission of the job (default: timeout of the service)
+        :param bool block: If False, raise `asyncio.QueueFull` instead of waiting when the queue is full
+        :return: Image data
+        :rtype: bytes
+        :raises asyncio.TimeoutError: if the image isn't rendered in time (the rendering itself can't be interrupted: its result is discarded)
+        :raises RuntimeError: if the service isn't running, or is closed before the image is rendered
+        """
+        if not self.isRunning():
+            raise RuntimeError("Render service is not running")
+        if timeout is None:
+            timeout = self.__timeout
+        queue = self.__queue
+        job = QwtRenderJob(spec, asyncio.get_running_loop().create_future())
+        if not block:
+            try:
+                queue.put_nowait(job)
+            except asyncio.QueueFull:
+                self.__stats["rejected"] += 1
+                raise
+        self.__stats["submitted"] += 1
+        # Outstanding jobs are cancelled by close()
+        self.__futures.add(job.future)
+        job.future.add_done_callback(self.__futures.discard)
+        try:
+            if block:
+                # Waiting for a free slot ends when the job is cancelled
+                put = asyncio.ensure_future(queue.put(job))
+                job.future.add_done_callback(lambda _future: put.cancel())
+                await asyncio.wait_for(put, timeout)
+                if timeout is not None:
+                    timeout = max(0.0, timeout - time.perf_counter() + job.submitted)
+            return await asyncio.wait_for(job.future, timeout)
+        except asyncio.TimeoutError:
+            self.__stats["timeouts"] += 1
+            raise
+        except asyncio.CancelledError:
+            if job.future.cancelled() and queue is not self.__queue:
+                raise RuntimeError("Render service was closed") from None
+            raise
+        finally:
+            job.future.cancel()
+
+    def queueSize(self):
+        """
+        :return: Number of jobs waiting for a worker
+        """
+        return 0 if self.__queue is None else self.__queue.qsize()
+
+    def stats(self):
+        """
+        :return: Dictionary with the number of `submitted`, `rendered`, `failed`, `timeouts` and `rejected` jobs, and the current `queued` jobs
+        """
+        return dict(self.__stats, queued=self.queueSize())
@@ -17,9 +17,19 @@ QwtScaleDraw
 
 .. autoclass:: QwtScaleDraw
    :members:
+
+QwtScaleLabelCache
+------------------
+
+.. autoclass:: QwtScaleLabelCache
+   :members:
 """
 
+import itertools
 import math
+import threading
+import weakref
+from collections import OrderedDict
 from datetime import datetime
 
 from qtpy.QtCore import (
@@ -29,15 +39,24 @@ from qtpy.QtCore import (
     QPointF,
     QRect,
     QRectF,
+    QSizeF,
     Qt,
     qFuzzyCompare,
 )
-from qtpy.QtGui import QFontMetrics, QPalette, QTransform
+from qtpy.QtGui import (
+    QFontMetrics,
+    QPaintEngine,
+    QPainter,
+    QPalette,
+    QPixmap,
+    QTransform,
+)
 
+from qwt import caches
 from qwt._math import qwtRadians
 from qwt.scale_div import QwtScaleDiv
 from qwt.scale_map import QwtScaleMap
-from qwt.text import QwtText
+from qwt.text import QwtText, font_key_cached
 
 # Plain-int aliases for Qt alignment flags. Qt6 exposes alignment flags as
 # IntEnum members and bitwise operations on them go through Python's
@@ -51,6 +70,168 @@ _ALIGN_TOP = int(Qt.AlignTop)
 _ALIGN_BOTTOM = int(Qt.AlignBottom)
 
 
+_LABEL_CACHE_LIMIT = 2048  # max tick labels kept by a `QwtScaleLabelCache`
+_LABEL_PIXMAP_CACHE_LIMIT = 256  # max pre-rendered labels per `QwtScaleDraw`
+
+# Source of the per-instance label cache tokens (see `labelCacheKey`). Unlike
+# ``id(self)``, a token can't be reused by another scale draw.
+_LABEL_CACHE_TOKENS = itertools.count()
+
+_LABEL_CACHES = weakref.WeakSet()
+_SCALE_DRAWS = weakref.WeakSet()
+_SCALE_DRAW_DATA = weakref.WeakSet()
+
+
+def _evict_labels(count):
+    for cache in list(_LABEL_CACHES):
+        count -= cache.evict(count)
+        if count <= 0:
+            break
+
+
+def _clear_metrics():
+    for draw in _SCALE_DRAWS:
+        draw._metrics_cache.clear()
+
+
+def _label_pixmap_caches():
+    return [
+        data.labelPixmapCache
+        for data in _SCALE_DRAW_DATA
+        if data.labelPixmapCache is not None
+    ]
+
+
+_LABEL_STATS = caches.register(
+    "scale_labels",
+    size=lambda: sum(len(cache) for cache in _LABEL_CACHES),
+    clear=lambda: caches.clear_dicts(list(_LABEL_CACHES)),
+    evict=_evict_labels,
+    entryCost=1500,
+)
+_METRICS_STATS = caches.register(
+    "scale_metrics",
+    size=lambda: sum(len(draw._metrics_cache) for draw in _SCALE_DRAWS),
+    clear=_clear_metrics,
+    entryCost=150,
+)
+_LABEL_PIXMAP_STATS = caches.register(
+    "scale_label_pixmaps",
+    size=lambda: sum(len(cache) for cache in _label_pixmap_caches()),
+    clear=lambda: caches.clear_dicts(_label_pixmap_caches()),
+    evict=lambda count: caches.evict_lru(_label_pixmap_caches(), count),
+    memory=lambda: sum(
+        caches.pixmap_memory(pixmap)
+        for cache in _label_pixmap_caches()
+        for pixmap, _origin in cache.values()
+    ),
+)
+
+
+class QwtScaleLabelCache(object):
+    """
+    A bounded LRU cache of tick labels and label sizes
+
+    Entries are keyed on the label formatter (see
+    :py:meth:`QwtAbstractScaleDraw.labelCacheKey()`), the value of the tick
+    and the font key. As the key doesn't depend on the scale division, cached
+    labels survive scale division changes (e.g. when panning): the labels of
+    the ticks which are still visible are not rebuilt.
+
+    A label cache may be shared between several scale draws (see
+    :py:meth:`QwtAbstractScaleDraw.setLabelCache()`). By default, all scale
+    draws share the same cache. Its methods are thread-safe, as scale draws
+    may be laid out by several threads (e.g. :py:mod:`qwt.render_service`).
+
+    .. py:class:: QwtScaleLabelCache([maxSize=2048])
+
+        :param int maxSize: Maximum number of cached labels
+    """
+
+    def __init__(self, maxSize=_LABEL_CACHE_LIMIT):
+        self.__maxSize = maxSize
+        self.__entries = OrderedDict()
+        self.__lock = threading.Lock()
+        _LABEL_CACHES.add(self)
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def setMaxSize(self, maxSize):
+        """
+        Set the maximum number of cached labels
+
+        :param int maxSize: Maximum number of cached labels
+
+        .. seealso::
+
+            :py:meth:`maxSize()`
+        """
+        with self.__lock:
+            self.__maxSize = maxSize
+            while len(self.__entries) > maxSize:
+                self.__entries.popitem(last=False)
+
+    def maxSize(self):
+        """
+        :return: Maximum number of cached labels
+
+        .. seealso::
+
+            :py:meth:`setMaxSize()`
+        """
+        return self.__maxSize
+
+    def lookup(self, key):
+        """
+        Find a cached label
+
+        :param tuple key: Cache key
+        :return: Tuple (tick label, text size) or None
+        """
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None:
+                _LABEL_STATS.hits += 1
+                self.__entries.move_to_end(key)
+            else:
+                _LABEL_STATS.misses += 1
+        return entry
+
+    def insert(self, key, entry):
+        """
+        Insert a label into the cache, evicting the least recently used
+        label if the cache is full
+
+        :param tuple key: Cache key
+        :param tuple entry: Tuple (tick label, text size)
+        """
+        with self.__lock:
+            if len(self.__entries) >= self.__maxSize:
+                self.__entries.popitem(last=False)
+            self.__entries[key] = entry
+
+    def evict(self, count):
+        """
+        Remove the least recently used labels from the cache
+
+        :param int count: Number of labels to remove
+        :return: Number of removed labels
+        """
+        with self.__lock:
+            return caches.evict_lru([self.__entries], count)
+
+    def clear(self):
+        """
+        Remove all labels from the cache
+        """
+        with self.__lock:
+            self.__entries.clear()
+
+
+_SHARED_LABEL_CACHE = QwtScaleLabelCache()
+
+
 class QwtAbstractScaleDraw_PrivateData(QObject):
     # QObject base class restored for Qt parent/child ownership semantics.
 
@@ -79,7 +260,8 @@ class QwtAbstractScaleDraw_PrivateData(QObject):
         self.map = QwtScaleMap()
         self.scaleDiv = QwtScaleDiv()
 
-        self.labelCache = {}
+        self.labelCache = _SHARED_LABEL_CACHE
+        self.labelCacheToken = next(_LABEL_CACHE_TOKENS)
 
 
 class QwtAbstractScaleDraw(object):
@@ -111,6 +293,8 @@ class QwtAbstractScaleDraw(object):
 
     def __init__(self):
         self.__data = QwtAbstractScaleDraw_PrivateData()
+        self._metrics_cache = {}
+        _SCALE_DRAWS.add(self)
 
     def extent(self, font):
         """
@@ -183,6 +367,7 @@ class QwtAbstractScaleDraw(object):
             self.__data.components |= component
         else:
             self.__data.components &= ~component
+        self._metrics_cache.clear()
 
     def hasComponent(self, component):
         """
@@ -201,11 +386,19 @@ class QwtAbstractScaleDraw(object):
         """
         Change the scale division
 
+        The cached labels are kept when they don't depend on the scale
+        division, i.e. when `label()` is not reimplemented or when
+        `labelCacheKey()` is reimplemented. Otherwise, the labels of a
+        reimplemented `label()` may depend on the scale division (e.g. on
+        its range) and they are rebuilt.
+
         :param qwt.scale_div.QwtScaleDiv scaleDiv: New scale division
         """
         self.__data.scaleDiv = scaleDiv
         self.__data.map.setScaleInterval(scaleDiv.lowerBound(), scaleDiv.upperBound())
-        self.invalidateCache()
+        if self.labelCacheKey() == self.__data.labelCacheToken:
+            self.__data.labelCacheToken = next(_LABEL_CACHE_TOKENS)
+        self._metrics_cache.clear()
 
     def setTransformation(self, transformation):
         """
@@ -214,6 +407,7 @@ class QwtAbstractScaleDraw(object):
         :param qwt.transform.QwtTransform transformation: New scale transformation
         """
         self.__data.map.setTransformation(transformation)
+        self._metrics_cache.clear()
 
     def scaleMap(self):
         """
@@ -241,6 +435,7 @@ class QwtAbstractScaleDraw(object):
             width = 0
         if width != self.__data.penWidth:
             self.__data.penWidth = width
+            self._metrics_cache.clear()
 
     def penWidth(self):
         """
@@ -321,6 +516,7 @@ class QwtAbstractScaleDraw(object):
         if spacing < 0:
             spacing = 0
         self.__data.spacing = spacing
+        self._metrics_cache.clear()
 
     def spacing(self):
         """
@@ -356,6 +552,7 @@ class QwtAbstractScaleDraw(object):
         if minExtent < 0.0:
             minExtent = 0.0
         self.__data.minExtent = minExtent
+        self._metrics_cache.clear()
 
     def minimumExtent(self):
         """
@@ -383,6 +580,7 @@ class QwtAbstractScaleDraw(object):
         if tick_type not in self.__data.tick_length:
             raise ValueError("Invalid tick type: %r" % tick_type)
         self.__data.tick_length[tick_type] = min([1000.0, max([0.0, length])])
+        self._metrics_cache.clear()
 
     def tickLength(self, tick_type):
         """
@@ -457,29 +655,113 @@ class QwtAbstractScaleDraw(object):
         The conversion between value and label is called very often
         in the layout and painting code. Unfortunately the
         calculation of the label sizes might be slow (really slow
-        for rich text in Qt4), so it's necessary to cache the labels.
+        for rich text in Qt4), so it's necessary to cache the labels
+        and their sizes.
+
+        The returned label is shared with the label cache, and thus with
+        the other scale draws using the same label formatter: it must not be
+        modified.
 
         :param QFont font: Font
         :param float value: Value
         :return: Tuple (tick label, text size)
+
+        .. seealso::
+
+            :py:meth:`labelCache()`, :py:meth:`labelCacheKey()`
         """
-        lbl = self.__data.labelCache.get(value)
-        if lbl is None:
+        key = (self.labelCacheKey(), value, font_key_cached(font))
+        cache = self.__data.labelCache
+        entry = cache.lookup(key)
+        if entry is None:
             lbl = QwtText(self.label(value))
             lbl.setRenderFlags(0)
             lbl.setLayoutAttribute(QwtText.MinimumLayout)
-            self.__data.labelCache[value] = lbl
-        return lbl, lbl.textSize(font)
+            entry = (lbl, lbl.textSize(font))
+            cache.insert(key, entry)
+        lbl, size = entry
+        return lbl, QSizeF(size)
+
+    def labelCacheKey(self):
+        """
+        Return a key identifying the label formatter, i.e. the way values
+        are converted into labels by `label()`
+
+        Scale draws with the same label cache key share their cached labels
+        (provided they also share the same label cache).
+
+        When `label()` is not reimplemented, the labels depend only on
+        the values and all scale draws have the same key. Otherwise, the
+        default key is specific to the scale draw instance and it is renewed
+        by `invalidateCache()` and `setScaleDiv()`: derived classes may
+        reimplement this method to share labels between instances having the
+        same configuration (the labels being then independent of the scale
+        division).
+
+        :return: Hashable key
+
+        .. seealso::
+
+            :py:meth:`tickLabel()`, :py:meth:`setLabelCache()`
+        """
+        if type(self).label is QwtAbstractScaleDraw.label:
+            return QwtAbstractScaleDraw
+        return self.__data.labelCacheToken
+
+    def setLabelCache(self, cache):
+        """
+        Set the cache used by `tickLabel()`
+
+        By default, all scale draws share the same cache.
+
+        :param qwt.scale_draw.QwtScaleLabelCache cache: Label cache
+
+        .. seealso::
+
+            :py:meth:`labelCache()`
+        """
+        self.__data.labelCache = cache
+        self._metrics_cache.clear()
+
+    def labelCache(self):
+        """
+        :return: Cache used by `tickLabel()`
+
+        .. seealso::
+
+            :py:meth:`setLabelCache()`
+        """
+        return self.__data.labelCache
 
     def invalidateCache(self):
         """
         Invalidate the cache used by `tickLabel()`
 
-        The cache is invalidated, when a new `QwtScaleDiv` is set. If
-        the labels need to be changed. while the same `QwtScaleDiv` is set,
-        `invalidateCache()` needs to be called manually.
-        """
-        self.__data.labelCache.clear()
+        Except for a reimplemented `label()` without a reimplemented
+        `labelCacheKey()`, the cached labels don't depend on the `QwtScaleDiv`
+        (see `setScaleDiv()`): if the labels need to be changed (e.g. because the configuration of a reimplemented
+        `label()` has changed), `invalidateCache()` needs to be called manually.
+        This also invalidates the memoized layout metrics (`extent()`,
+        `minLabelDist()`, `getBorderDistHint()` and `minLength()`).
+        """
+        self.__data.labelCacheToken = next(_LABEL_CACHE_TOKENS)
+        if self.labelCacheKey() == QwtAbstractScaleDraw:
+            self.__data.labelCache.clear()
+        self._metrics_cache.clear()
+
+    def _cached_metric(self, name, font, compute):
+        # Layout metrics (extent, border distances, ...) iterate over the
+        # labels of all ticks and are requested several times per layout pass:
+        # they are memoized per font until a setter invalidates them
+        key = (name, font_key_cached(font))
+        try:
+            value = self._metrics_cache[key]
+            _METRICS_STATS.hits += 1
+            return value
+        except KeyError:
+            _METRICS_STATS.misses += 1
+            value = self._metrics_cache[key] = compute(font)
+            return value
 
 
 class QwtScaleDraw_PrivateData(QObject):
@@ -495,7 +777,9 @@ class QwtScaleDraw_PrivateData(QObject):
         self.labelAlignment = 0
         self.labelRotation = 0.0
         self.labelAutoSize = True
+        self.labelPixmapCache = None  # OrderedDict, when enabled
         self.pos = QPointF()
+        _SCALE_DRAW_DATA.add(self)
 
 
 class QwtScaleDraw(QwtAbstractScaleDraw):
@@ -575,6 +859,7 @@ class QwtScaleDraw(QwtAbstractScaleDraw):
             self.__data.orientation = Qt.Horizontal
         else:
             self.__data.orientation = Qt.Vertical
+        self._metrics_cache.clear()
 
     def orientation(self):
         """
@@ -607,6 +892,9 @@ class QwtScaleDraw(QwtAbstractScaleDraw):
             * start: Start border distance
             * end: End border distance
         """
+        return self._cached_metric("getBorderDistHint", font, self.__getBorderDistHint)
+
+    def __getBorderDistHint(self, font):
         start, end = 0, 1
 
         if not self.hasComponent(QwtAbstractScaleDraw.Labels):
@@ -661,6 +949,9 @@ class QwtScaleDraw(QwtAbstractScaleDraw):
 
             :py:meth:`getBorderDistHint()`
         """
+        return self._cached_metric("minLabelDist", font, self.__minLabelDist)
+
+    def __minLabelDist(self, font):
         if not self.hasComponent(QwtAbstractScaleDraw.Labels):
             return 0
 
@@ -731,6 +1022,9 @@ class QwtScaleDraw(QwtAbstractScaleDraw):
 
             :py:meth:`minLength()`
         """
+        return self._cached_metric("extent", font, self.__extent)
+
+    def __extent(self, font):
         d = 0.0
         if self.hasComponent(QwtAbstractScaleDraw.Labels):
             if self.orientation() == Qt.Vertical:
@@ -757,6 +1051,9 @@ class QwtScaleDraw(QwtAbstractScaleDraw):
 
             :py:meth:`extent()`
         """
+        return self._cached_metric("minLength", font, self.__minLength)
+
+    def __minLength(self, font):
         startDist, endDist = self.getBorderDistHint(font)
         sd = self.scaleDiv()
         minorCount = len(sd.ticks(QwtScaleDiv.MinorTick)) + len(
@@ -975,12 +1272,86 @@ class QwtScaleDraw(QwtAbstractScaleDraw):
         if lbl is None or lbl.isEmpty():
             return
         pos = self.labelPosition(value)
+        if self.__data.labelPixmapCache is not None and self.__drawLabelPixmap(
+            painter, lbl, labelSize, pos
+        ):
+            return
         transform = self.labelTransformation(pos, labelSize)
         painter.save()
         painter.setWorldTransform(transform, True)
         lbl.draw(painter, QRect(QPoint(0, 0), labelSize.toSize()))
         painter.restore()
 
+    def __drawLabelPixmap(self, painter, lbl, labelSize, pos):
+        """
+        Draw a label using the label pixmap cache
+
+        :return: False if the label can't be drawn from a pixmap
+        """
+        # Pixmaps are only blitted on raster devices without scaling, so that
+        # vector exports (SVG, PDF, printer) and scaled renderings are
+        # unaffected.
+        if (
+            painter.paintEngine().type() != QPaintEngine.Raster
+            or painter.worldTransform().type()
+            not in (QTransform.TxNone, QTransform.TxTranslate)
+        ):
+            return False
+        device = painter.device()
+        dpr = device.devicePixelRatioF() if device is not None else 1.0
+        flags = self.labelAlignment() or self.Flags[self.alignment()]
+        key = (
+            lbl.text(),
+            font_key_cached(lbl.usedFont(painter.font())),
+            lbl.usedColor(painter.pen().color()).rgba(),
+            self.labelRotation(),
+            int(flags),
+            dpr,
+        )
+        cache = self.__data.labelPixmapCache
+        entry = cache.get(key)
+        if entry is None:
+            _LABEL_PIXMAP_STATS.misses += 1
+            # Label transformation relative to the label position
+            transform = self.labelTransformation(QPointF(0.0, 0.0), labelSize)
+            rect = QRect(QPoint(0, 0), labelSize.toSize())
+            # Text margins (see `QwtText.MinimumLayout`) are drawn outside of
+            # the label rectangle: a font-height margin is kept around it.
+            pad = QFontMetrics(lbl.usedFont(painter.font())).height()
+            br = transform.mapRect(QRectF(rect.adjusted(-pad, -pad, pad, pad)))
+            origin = QPointF(math.floor(br.left()), math.floor(br.top()))
+            width = math.ceil(br.right() - origin.x())
+            height = math.ceil(br.bottom() - origin.y())
+            pixmap = QPixmap(
+                max(1, math.ceil(width * dpr)), max(1, math.ceil(height * dpr))
+            )
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.transparent)
+            pmPainter = QPainter(pixmap)
+            pmPainter.setRenderHints(painter.renderHints())
+            pmPainter.setFont(painter.font())
+            pmPainter.setPen(painter.pen())
+            pmPainter.translate(-origin.x(), -origin.y())
+            pmPainter.setWorldTransform(transform, True)
+            lbl.draw(pmPainter, rect)
+            pmPainter.end()
+            entry = (pixmap, origin)
+            if len(cache) >= _LABEL_PIXMAP_CACHE_LIMIT:
+                cache.popitem(last=False)
+            cache[key] = entry
+        else:
+            _LABEL_PIXMAP_STATS.hits += 1
+            cache.move_to_end(key)
+        pixmap, origin = entry
+        painter.drawPixmap(
+            QPointF(
+                math.floor(pos.x() + 0.5) + origin.x(),
+                math.floor(pos.y() + 0.5) + origin.y(),
+            ),
+            pixmap,
+        )
+        return True
+
     def boundingLabelRect(self, font, value):
         """
         Find the bounding rectangle for the label.
@@ -1115,6 +1486,7 @@ class QwtScaleDraw(QwtAbstractScaleDraw):
             :py:meth:`labelAlignment()`
         """
         self.__data.labelRotation = rotation
+        self._metrics_cache.clear()
 
     def labelRotation(self):
         """
@@ -1159,6 +1531,7 @@ class QwtScaleDraw(QwtAbstractScaleDraw):
             `QwtAbstractScaleDraw.label()`.
         """
         self.__data.labelAlignment = alignment
+        self._metrics_cache.clear()
 
     def labelAlignment(self):
         """
@@ -1192,6 +1565,7 @@ class QwtScaleDraw(QwtAbstractScaleDraw):
             :py:meth:`labelAutoSize()`
         """
         self.__data.labelAutoSize = state
+        self._metrics_cache.clear()
 
     def labelAutoSize(self):
         """
@@ -1203,6 +1577,45 @@ class QwtScaleDraw(QwtAbstractScaleDraw):
         """
         return self.__data.labelAutoSize
 
+    def setLabelPixmapCache(self, state):
+        """
+        Set label pixmap cache option state
+
+        When enabled, `drawLabel()` renders each label once into a pixmap
+        (taking into account the device pixel ratio), which is then simply
+        blitted for the next repaints of the scale, e.g. when streaming data
+        or panning. Pixmaps are cached per text, font, color, rotation and
+        alignment of the label.
+
+        Labels are drawn without the cache on devices which are not raster
+        based (e.g. when exporting to SVG or PDF) or when the painter
+        is scaled or rotated.
+
+        This option is not implemented in Qwt C++ library and is disabled
+        by default.
+
+        :param bool state: On/off
+
+        .. seealso::
+
+            :py:meth:`labelPixmapCache()`
+        """
+        if state:
+            if self.__data.labelPixmapCache is None:
+                self.__data.labelPixmapCache = OrderedDict()
+        else:
+            self.__data.labelPixmapCache = None
+
+    def labelPixmapCache(self):
+        """
+        :return: True if the label pixmap cache is enabled
+
+        .. seealso::
+
+            :py:meth:`setLabelPixmapCache()`
+        """
+        return self.__data.labelPixmapCache is not None
+
     def _get_max_label_size(self, font):
         key = (font.toString(), self.labelRotation())
         size = self._max_label_sizes.get(key)
@@ -1259,9 +1672,12 @@ class QwtScaleDraw(QwtAbstractScaleDraw):
         len_ = self.__data.len
         sm = self.scaleMap()
         if self.orientation() == Qt.Vertical:
-            sm.setPaintInterval(pos.y() + len_, pos.y())
+            p1, p2 = pos.y() + len_, pos.y()
         else:
-            sm.setPaintInterval(pos.x(), pos.x() + len_)
+            p1, p2 = pos.x(), pos.x() + len_
+        if p1 != sm.p1() or p2 != sm.p2():
+            sm.setPaintInterval(p1, p2)
+            self._metrics_cache.clear()
 
 
 class QwtDateTimeScaleDraw(QwtScaleDraw):
@@ -1305,6 +1721,19 @@ class QwtDateTimeScaleDraw(QwtScaleDraw):
             format: Format string for datetime display
         """
         self._format = format
+        self._metrics_cache.clear()
+
+    def labelCacheKey(self):
+        """Return a key identifying the label formatter
+
+        Date/time scale draws with the same format share their cached labels.
+
+        Returns:
+            Hashable key
+        """
+        if type(self).label is QwtDateTimeScaleDraw.label:
+            return (QwtDateTimeScaleDraw, self._format)
+        return super().labelCacheKey()
 
     def label(self, value: float) -> QwtText:
         """Convert a timestamp value to a formatted date/time label
@@ -13,6 +13,7 @@ QwtScaleMap
    :members:
 """
 
+import numpy as np
 from qtpy.QtCore import QPointF, QRectF
 
 from qwt._math import qwtFuzzyCompare
@@ -140,6 +141,54 @@ class QwtScaleMap(object):
             s = self.__transform.transform(s)
         return self.__p1 + (s - self.__ts1) * self.__cnv
 
+    def transform_array(self, values, out=None):
+        """
+        Transform an array of values related to the scale interval into
+        an array of values related to the interval of the paint device
+
+        The affine part of the mapping is evaluated in place, so that no
+        temporary array is created when `out` is provided.
+
+        :param numpy.ndarray values: Values relative to the coordinates of the scale
+        :param numpy.ndarray out: Optional output array (may be a strided view)
+        :return: Transformed values (`out`, if it was provided)
+
+        .. seealso::
+
+            :py:meth:`transform_scalar()`
+        """
+        if self.__transform:
+            if out is None:
+                out = np.empty(np.shape(values), dtype=np.float64)
+            values = self.__transform.transform_array(values, out=out)
+        out = np.subtract(values, self.__ts1, out=out)
+        np.multiply(out, self.__cnv, out=out)
+        np.add(out, self.__p1, out=out)
+        return out
+
+    def invTransform_array(self, values, out=None):
+        """
+        Transform an array of paint device values into an array of values
+        in the interval of the scale.
+
+        :param numpy.ndarray values: Values relative to the coordinates of the paint device
+        :param numpy.ndarray out: Optional output array (may be a strided view)
+        :return: Transformed values (`out`, if it was provided)
+
+        .. seealso::
+
+            :py:meth:`transform_array()`
+        """
+        if self.__cnv == 0:
+            out = np.multiply(values, 0.0, out=out)  # avoid divide by zero
+        else:
+            out = np.subtract(values, self.__p1, out=out)
+            np.divide(out, self.__cnv, out=out)
+        np.add(out, self.__ts1, out=out)
+        if self.__transform:
+            out = self.__transform.invTransform_array(out, out=out)
+        return out
+
     def invTransform_scalar(self, p):
         """
         Transform an paint device value into a value in the
@@ -233,6 +282,10 @@ class QwtScaleMap(object):
 
         :param float scalar: Scalar
 
+        Transfom an array (see :py:meth:`transform_array()`):
+
+        :param numpy.ndarray values: Values
+
         Transfom a rectangle:
 
         :param qwt.scale_map.QwtScaleMap xMap: X map
@@ -254,6 +307,8 @@ class QwtScaleMap(object):
             # Scalar transform: inline the fast path for the dominant case
             # (avoids one Python call frame per tick label).
             s = args[0]
+            if isinstance(s, np.ndarray):
+                return self.transform_array(s)
             if self.__transform:
                 s = self.__transform.transform(s)
             return self.__p1 + (s - self.__ts1) * self.__cnv
@@ -289,10 +344,13 @@ class QwtScaleMap(object):
         """Transform from paint to scale coordinates
 
         Scalar: scalemap.invTransform(scalar)
+        Array (numpy.ndarray): scalemap.invTransform(values)
         Point (QPointF): scalemap.invTransform(xMap, yMap, pos)
         Rectangle (QRectF): scalemap.invTransform(xMap, yMap, rect)
         """
         if len(args) == 1:
+            if isinstance(args[0], np.ndarray):
+                return self.invTransform_array(args[0])
             # Scalar transform
             return self.invTransform_scalar(args[0])
         elif isinstance(args[2], QPointF):
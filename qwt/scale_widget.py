@@ -19,12 +19,13 @@ from qtpy.QtCore import QObject, QRectF, QSize, Qt, Signal
 from qtpy.QtGui import QPainter, QPalette
 from qtpy.QtWidgets import QSizePolicy, QStyle, QStyleOption, QWidget
 
+from qwt import profiling
 from qwt.color_map import QwtColorMap, QwtLinearColorMap
 from qwt.interval import QwtInterval
 from qwt.painter import QwtPainter
 from qwt.scale_draw import QwtScaleDraw
 from qwt.scale_engine import QwtLinearScaleEngine
-from qwt.text import QwtText
+from qwt.text import QwtText, font_key_cached
 
 
 class ColorBar(object):
@@ -47,6 +48,7 @@ class QwtScaleWidget_PrivateData(QObject):
         self.titleOffset = None
         self.spacing = None
         self.title = QwtText()
+        self.titleHeightCache = {}
         self.layoutFlags = None
         self.colorBar = ColorBar()
 
@@ -186,10 +188,12 @@ class QwtScaleWidget(QWidget):
             title.setRenderFlags(flags)
             if title != self.__data.title:
                 self.__data.title = title
+                self.__data.titleHeightCache.clear()
                 self.layoutScale()
         else:
             if self.__data.title.text() != title:
                 self.__data.title.setText(title)
+                self.__data.titleHeightCache.clear()
                 self.layoutScale()
 
     def setAlignment(self, alignment):
@@ -403,12 +407,13 @@ class QwtScaleWidget(QWidget):
         return self.__data.spacing
 
     def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setClipRegion(event.region())
-        opt = QStyleOption()
-        opt.initFrom(self)
-        self.style().drawPrimitive(QStyle.PE_Widget, opt, painter, self)
-        self.draw(painter)
+        with profiling.span("QwtScaleWidget.paintEvent", self.parent(), self):
+            painter = QPainter(self)
+            painter.setClipRegion(event.region())
+            opt = QStyleOption()
+            opt.initFrom(self)
+            self.style().drawPrimitive(QStyle.PE_Widget, opt, painter, self)
+            self.draw(painter)
 
     def draw(self, painter):
         """
@@ -654,7 +659,17 @@ class QwtScaleWidget(QWidget):
         :param int width: Width
         :return: Height
         """
-        return math.ceil(self.__data.title.heightForWidth(width, self.font()))
+        font = self.font()
+        key = (width, font_key_cached(font))
+        cache = self.__data.titleHeightCache
+        height = cache.get(key)
+        if height is None:
+            if len(cache) > 64:
+                cache.clear()
+            height = cache[key] = math.ceil(
+                self.__data.title.heightForWidth(width, font)
+            )
+        return height
 
     def dimForLength(self, length, scaleFont):
         """
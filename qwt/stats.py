@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the Qwt License
+# (see LICENSE file for more details)
+
+"""
+Statistics
+----------
+
+Render counters and cache statistics.
+
+The plot items count the points they transform and send to the painter,
+globally and per plot, and the internal caches of PythonQwt (font metrics,
+tick labels, backing stores, ..., see :py:mod:`qwt.caches`) count their hits
+and misses. Counting is always enabled: it costs an integer increment per
+cache lookup and a function call per item drawn.
+
+A snapshot of all counters is a JSON-serializable dictionary, which may be
+logged or scraped by a monitoring tool (the caches are registered when the
+module owning them is imported)::
+
+    from qwt import stats
+
+    print(stats.snapshot())
+
+Render counters:
+
+  * `points_transformed`: points mapped from plot to paint device coordinates
+  * `points_painted`: points sent to the painter (polyline vertices or dots)
+  * `symbols_drawn`: symbols drawn
+  * `polylines_clipped`: series culled to the canvas (or to the repainted
+    band of a strip chart) before painting: the samples outside are skipped
+  * `polylines_decimated`: polylines decimated before painting
+
+.. autofunction:: snapshot
+
+.. autofunction:: reset
+
+.. autofunction:: count
+
+.. autofunction:: plot_counters
+
+.. autoclass:: QwtRenderCounters
+   :members:
+"""
+
+import threading
+import weakref
+
+from qwt import caches
+from qwt.profiling import object_identity
+
+COUNTERS = (
+    "points_transformed",
+    "points_painted",
+    "symbols_drawn",
+    "polylines_clipped",
+    "polylines_decimated",
+)
+
+
+class QwtRenderCounters(object):
+    """
+    Render counters of a plot (or of all plots)
+    """
+
+    __slots__ = COUNTERS
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """
+        Reset the counters
+        """
+        for name in COUNTERS:
+            setattr(self, name, 0)
+
+    def asDict(self):
+        """
+        :return: Dictionary of the counters
+        """
+        return {name: getattr(self, name) for name in COUNTERS}
+
+
+_COUNTERS = QwtRenderCounters()
+_PLOT_COUNTERS = weakref.WeakKeyDictionary()
+_LOCK = threading.Lock()  # plot items may be drawn by worker threads
+
+
+def plot_counters(plot):
+    """
+    :param plot: Plot
+    :return: Render counters of the plot (`QwtRenderCounters` instance)
+    """
+    counters = _PLOT_COUNTERS.get(plot)
+    if counters is None:
+        counters = _PLOT_COUNTERS[plot] = QwtRenderCounters()
+    return counters
+
+
+def count(
+    plot,
+    points_transformed=0,
+    points_painted=0,
+    symbols_drawn=0,
+    polylines_clipped=0,
+    polylines_decimated=0,
+):
+    """
+    Increment the render counters, globally and for a plot
+
+    :param plot: Plot, or None (global counters only)
+    :param int points_transformed: Points mapped to paint device coordinates
+    :param int points_painted: Points sent to the painter
+    :param int symbols_drawn: Symbols drawn
+    :param int polylines_clipped: Series culled to the canvas or to a band
+    :param int polylines_decimated: Polylines decimated
+    """
+    with _LOCK:
+        targets = (_COUNTERS,) if plot is None else (_COUNTERS, plot_counters(plot))
+        for counters in targets:
+            counters.points_transformed += points_transformed
+            counters.points_painted += points_painted
+            counters.symbols_drawn += symbols_drawn
+            counters.polylines_clipped += polylines_clipped
+            counters.polylines_decimated += polylines_decimated
+
+
+def snapshot():
+    """
+    Return a snapshot of the render counters and of the cache statistics
+
+    :return: Dictionary with `counters` (global render counters), `plots` (render counters of each plot, keyed on the plot identity), `caches` (statistics of each cache, keyed on the cache name) and `cache_memory` (approximate memory used by the caches and memory budget, in bytes) keys
+    """
+    return {
+        "counters": _COUNTERS.asDict(),
+        "plots": {
+            object_identity(plot): counters.asDict()
+            for plot, counters in list(_PLOT_COUNTERS.items())
+        },
+        "caches": {cache.name: cache.asDict() for cache in caches.registered()},
+        "cache_memory": {
+            "usage": caches.memory_usage(),
+            "budget": caches.memory_budget(),
+        },
+    }
+
+
+def reset():
+    """
+    Reset the render counters and the cache hit and miss counters
+    """
+    _COUNTERS.reset()
+    _PLOT_COUNTERS.clear()
+    for cache in caches.registered():
+        cache.resetStats()
@@ -14,6 +14,7 @@ QwtSymbol
 """
 
 import math
+import weakref
 
 from qtpy.QtCore import (
     QLineF,
@@ -34,8 +35,8 @@ from qtpy.QtGui import (
     QPolygonF,
     QTransform,
 )
-from qtpy.QtSvg import QSvgRenderer
 
+from qwt import caches
 from qwt.graphic import QwtGraphic
 
 
@@ -344,9 +345,30 @@ def qwtDrawHexagonSymbols(painter, points, symbol):
         painter.drawPolygon(QPolygonF(hexa))
 
 
+_SYMBOL_DATA = weakref.WeakSet()
+
+
+def _path_graphics():
+    return [data for data in _SYMBOL_DATA if not data.path.graphic.isNull()]
+
+
+def _clear_path_graphics():
+    for data in _path_graphics():
+        data.path.graphic = QwtGraphic()
+
+
+_PATH_GRAPHIC_STATS = caches.register(
+    "symbol_path_graphics",
+    size=lambda: len(_path_graphics()),
+    clear=_clear_path_graphics,
+    entryCost=2000,
+)
+
+
 class QwtSymbol_PrivateData(QObject):
     def __init__(self, st, br, pn, sz):
         QObject.__init__(self)
+        _SYMBOL_DATA.add(self)
         self.style = st
         self.size = sz
         self.brush = br
@@ -371,7 +393,7 @@ class QwtSymbol_PrivateData(QObject):
 
         class SVG(object):
             def __init__(self):
-                self.renderer = QSvgRenderer()
+                self.renderer = None  # Created by `setSvgDocument`
 
         self.svg = SVG()
 
@@ -803,6 +825,8 @@ class QwtSymbol(object):
         """
         self.__data.style = QwtSymbol.SvgDocument
         if self.__data.svg.renderer is None:
+            from qtpy.QtSvg import QSvgRenderer
+
             self.__data.svg.renderer = QSvgRenderer()
         self.__data.svg.renderer.load(svgDocument)
 
@@ -1079,11 +1103,7 @@ class QwtSymbol(object):
         if self.__data.style == QwtSymbol.Graphic:
             self.__data.graphic.graphic.render(painter, rect, Qt.KeepAspectRatio)
         elif self.__data.style == QwtSymbol.Path:
-            if self.__data.path.graphic.isNull():
-                self.__data.path.graphic = qwtPathGraphic(
-                    self.__data.path.path, self.__data.pen, self.__data.brush
-                )
-            self.__data.path.graphic.render(painter, rect, Qt.KeepAspectRatio)
+            self.__pathGraphic().render(painter, rect, Qt.KeepAspectRatio)
             return
         elif self.__data.style == QwtSymbol.SvgDocument:
             if self.__data.svg.renderer is not None:
@@ -1144,11 +1164,7 @@ class QwtSymbol(object):
         elif self.__data.style == QwtSymbol.Hexagon:
             qwtDrawHexagonSymbols(painter, points, self)
         elif self.__data.style == QwtSymbol.Path:
-            if self.__data.path.graphic.isNull():
-                self.__data.path.graphic = qwtPathGraphic(
-                    self.__data.path.path, self.__data.pen, self.__data.brush
-                )
-            qwtDrawGraphicSymbols(painter, points, self.__data.path.graphic, self)
+            qwtDrawGraphicSymbols(painter, points, self.__pathGraphic(), self)
         elif self.__data.style == QwtSymbol.Pixmap:
             qwtDrawPixmapSymbols(painter, points, self)
         elif self.__data.style == QwtSymbol.Graphic:
@@ -1187,11 +1203,7 @@ class QwtSymbol(object):
             rect.setSize(QSizeF(self.__data.size) + QSizeF(2 * pw, 2 * pw))
             rect.moveCenter(QPointF(0.0, 0.0))
         elif self.__data.style == QwtSymbol.Path:
-            if self.__data.path.graphic.isNull():
-                self.__data.path.graphic = qwtPathGraphic(
-                    self.__data.path.path, self.__data.pen, self.__data.brush
-                )
-            rect = qwtScaleBoundingRect(self.__data.path.graphic, self.__data.size)
+            rect = qwtScaleBoundingRect(self.__pathGraphic(), self.__data.size)
             pinPointTranslation = True
         elif self.__data.style == QwtSymbol.Pixmap:
             if self.__data.size.isEmpty():
@@ -1230,6 +1242,19 @@ class QwtSymbol(object):
             r.adjust(-1, -1, 1, 1)
         return r
 
+    def __pathGraphic(self):
+        # The graphic of a `Path` symbol is rendered once, until the path,
+        # the pen or the brush change
+        graphic = self.__data.path.graphic
+        if graphic.isNull():
+            _PATH_GRAPHIC_STATS.misses += 1
+            graphic = self.__data.path.graphic = qwtPathGraphic(
+                self.__data.path.path, self.__data.pen, self.__data.brush
+            )
+        else:
+            _PATH_GRAPHIC_STATS.hits += 1
+        return graphic
+
     def invalidateCache(self):
         """
         Invalidate the cached symbol pixmap
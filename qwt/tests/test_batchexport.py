@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the Qwt License
+# (see LICENSE file for more details)
+
+"""
+Test for the batch export of plots (`qwt.batch`).
+
+Plot specs must be exported to files in the current process and in a pool of
+worker processes, from the API and from the command line, errors being
+reported without stopping the batch.
+"""
+
+import json
+import os.path as osp
+import pickle
+import tempfile
+
+import numpy as np
+from qtpy import QtWidgets as QW
+
+from qwt import QwtPlot, QwtPlotCurve, batch
+
+
+def make_plot(spec):
+    """Plot factory (see the `factory` key of the plot specs)"""
+    plot = QwtPlot(spec["title"])
+    x = np.linspace(0.0, 10.0, 100)
+    QwtPlotCurve.make(x, np.cos(x), "Cosine", plot, linecolor="blue")
+    return plot
+
+
+def make_specs():
+    x = np.linspace(0.1, 10.0, 1000)
+    return [
+        {
+            "filename": "sine.png",
+            "size": [400, 300],
+            "title": "Sine",
+            "footer": "Footer",
+            "background": "white",
+            "grid": {"color": "lightGray"},
+            "legend": "right",
+            "axes": {"bottom": {"title": "Time (s)"}, "left": {"scale": [-1, 1]}},
+            "curves": [
+                {"xdata": x, "ydata": np.sin(x), "title": "sin(x)", "linecolor": "red"},
+                {
+                    "xdata": x.tolist(),
+                    "ydata": np.cos(x).tolist(),
+                    "style": "Sticks",
+                    "linestyle": "DashLine",
+                    "y_axis": "right",
+                },
+            ],
+        },
+        {
+            "filename": "log.svg",
+            "axes": {"left": {"log": True, "scale": [0.1, 100]}},
+            "curves": [{"xdata": x, "ydata": x**2, "antialiased": True}],
+        },
+        {
+            "filename": "factory.pdf",
+            "title": "Factory",
+            "factory": "qwt.tests.test_batchexport:make_plot",
+        },
+        {"filename": "bad.png", "curves": [{"xdata": [1.0, 2.0]}]},  # missing ydata
+    ]
+
+
+def check_report(report, tmpdir, processes):
+    assert report["processes"] == processes
+    assert report["plots"] == 4 and report["failed"] == 1
+    assert report["throughput"] > 0.0
+    results = report["results"]
+    for result, name in zip(results, ("sine.png", "log.svg", "factory.pdf")):
+        assert result["filename"] == osp.join(tmpdir, name)
+        assert result["error"] is None
+        assert result["bytes"] == osp.getsize(result["filename"]) > 0
+    assert "Missing ydata" in results[3]["error"]
+
+
+def test_batchexport():
+    """Plot specs must be exported by the workers and by the CLI."""
+    app = QW.QApplication.instance() or QW.QApplication([])  # noqa: F841
+    specs = make_specs()
+    plot = batch.build_plot(specs[0])
+    assert plot.title().text() == "Sine"
+    assert len(plot.itemList(QwtPlotCurve.Rtti_PlotCurve)) == 2
+    assert plot.axisEnabled(QwtPlot.yRight)
+    assert plot.legend() is not None
+
+    for processes in (0, 2):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            report = batch.export_batch(specs, processes=processes, output_dir=tmpdir)
+            check_report(report, tmpdir, processes)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        json_file = osp.join(tmpdir, "specs.json")
+        pickle_file = osp.join(tmpdir, "specs.pkl")
+        report_file = osp.join(tmpdir, "report.json")
+        with open(json_file, "w") as fdesc:
+            json.dump(specs[2:], fdesc)
+        with open(pickle_file, "wb") as fdesc:
+            pickle.dump(specs[:2], fdesc)
+        args = [pickle_file, json_file, "--processes", "0", "--output-dir", tmpdir]
+        assert batch.main(args + ["--quiet", "--report", report_file]) == 1
+        with open(report_file) as fdesc:
+            report = json.load(fdesc)
+        check_report(report, tmpdir, 0)
+
+
+if __name__ == "__main__":
+    test_batchexport()
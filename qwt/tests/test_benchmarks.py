@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the Qwt License
+# (see LICENSE file for more details)
+
+"""
+Test for the headless benchmark suite (`python -m qwt.benchmarks`).
+
+The suite must save its results to JSON and, in compare mode, flag the
+benchmarks which are slower than the baseline.
+"""
+
+import json
+import os.path as osp
+import tempfile
+
+from qwt.benchmarks import compare_results, main
+
+ARGS = ["--quick", "--repeat", "1", "--min-time", "0.001"]
+ARGS += ["--filter", r"scale_map\.transform\[|divideScale\.linear|layout|replot"]
+
+
+def test_benchmarks():
+    """Benchmark results must be saved and compared to a baseline."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = osp.join(tmpdir, "baseline.json")
+        assert main(ARGS + ["--output", path]) == 0
+        with open(path) as fdesc:
+            baseline = json.load(fdesc)
+        assert sorted(baseline["results"]) == [
+            "plot_layout.activate",
+            "replot[1000]",
+            "scale_engine.divideScale.linear",
+            "scale_map.transform[1000]",
+        ]
+        assert baseline["metadata"]["qt_api"]
+        for stats in baseline["results"].values():
+            assert 0.0 < stats["min"] <= stats["median"]
+
+        # A baseline 10 times faster than the current code: regressions
+        for stats in baseline["results"].values():
+            stats["median"] /= 10.0
+        with open(path, "w") as fdesc:
+            json.dump(baseline, fdesc)
+        assert main(ARGS + ["--compare", path]) == 1
+
+    baseline["results"]["removed"] = {"median": 1.0}
+    results = {"results": dict(baseline["results"], added={"median": 1.0})}
+    results["results"].pop("removed")
+    results["results"]["replot[1000]"] = {"median": 0.0}
+    statuses = {row[0]: row[-1] for row in compare_results(baseline, results)}
+    assert statuses["removed"] == "missing"
+    assert statuses["added"] == "new"
+    assert statuses["replot[1000]"] == "improvement"
+    assert statuses["plot_layout.activate"] == "ok"
+
+
+if __name__ == "__main__":
+    test_benchmarks()
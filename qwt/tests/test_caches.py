@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the Qwt License
+# (see LICENSE file for more details)
+
+"""
+Test for the cache registry (`qwt.caches`).
+
+The internal caches must be registered with their memory cost, emptied by
+`clear_all()` and trimmed when the memory budget is exceeded.
+"""
+
+import collections
+
+import numpy as np
+from qtpy import QtCore as QC
+from qtpy import QtWidgets as QW
+
+from qwt import QwtPlot, QwtPlotCurve, QwtSymbol, caches
+
+
+def make_plot():
+    plot = QwtPlot("Cached plot")
+    x = np.linspace(0, 10, 100)
+    QwtPlotCurve.make(x, np.sin(x), "Sine", plot, symbol=QwtSymbol(QwtSymbol.Ellipse))
+    plot.resize(QC.QSize(400, 300))
+    plot.replot()
+    plot.grab()
+    return plot
+
+
+def test_caches():
+    """Caches must be registered, cleared and trimmed to the memory budget."""
+    app = QW.QApplication.instance() or QW.QApplication([])  # noqa: F841
+    plot = make_plot()
+    names = [cache.name for cache in caches.registered()]
+    assert names == sorted(names)
+    for name in ("font_metrics", "scale_labels", "canvas_backing_store"):
+        assert name in names, name
+    policies = {cache.name: cache.policy for cache in caches.registered()}
+    assert policies["scale_labels"] == "lru"
+    assert policies["font_metrics"] == "fifo"
+    assert caches.memory_usage() > 0
+
+    caches.clear_all()
+    for cache in caches.registered():
+        assert cache.size() == 0 and cache.memory() == 0, cache.name
+
+    plot.grab()
+    usage = caches.memory_usage()
+    assert usage > 0
+    try:
+        caches.set_memory_budget(usage // 4)
+        assert caches.memory_budget() == usage // 4
+        assert caches.memory_usage() <= usage // 4
+        plot.grab()  # Caches are rebuilt on demand
+    finally:
+        caches.set_memory_budget(None)
+    assert caches.enforce_budget() is None
+
+    assert caches.parse_budget("64M") == 64 * 1024 * 1024
+    assert caches.parse_budget(" 1.5k ") == 1536
+    assert caches.parse_budget("1000") == 1000
+
+    first = collections.OrderedDict((key, key) for key in range(3))
+    second = collections.OrderedDict((key, key) for key in "ab")
+    assert caches.evict_lru([first, second], 3) == 3
+    assert list(first) == [2] and list(second) == ["b"]
+    assert caches.evict_lru([first, second], 10) == 2
+    assert not first and not second
+
+
+if __name__ == "__main__":
+    test_caches()
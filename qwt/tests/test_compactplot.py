@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the Qwt License
+# (see LICENSE file for more details)
+
+"""
+Test for `QwtCompactPlot`, the single-widget plot.
+
+The compact plot must lay out and paint its components like `QwtPlot`,
+without showing any sub-widget.
+"""
+
+import os
+
+import numpy as np
+from qtpy import QtCore as QC
+from qtpy import QtGui as QG
+from qtpy import QtWidgets as QW
+
+from qwt import QwtCompactPlot, QwtPlot, QwtPlotCurve
+
+
+def _make_plot(cls):
+    plot = cls("Compact plot")
+    plot.setFooter("Footer")
+    plot.enableAxis(QwtPlot.yRight)
+    x = np.linspace(0, 10, 200)
+    QwtPlotCurve.make(x, np.sin(x), plot=plot, linecolor="red")
+    plot.resize(QC.QSize(400, 300))
+    plot.replot()
+    return plot
+
+
+def _image(pixmap):
+    image = pixmap.toImage().convertToFormat(QG.QImage.Format_RGB32)
+    nbytes = image.height() * image.bytesPerLine()
+    if os.environ["QT_API"].startswith("pyside"):
+        data = bytes(image.constBits())[:nbytes]
+    else:
+        data = image.constBits().asstring(nbytes)
+    array = np.frombuffer(data, np.uint32).reshape(image.height(), -1)
+    return array[:, : image.width()]
+
+
+def test_compact_plot():
+    """Compact plot geometry and rendering must match `QwtPlot`."""
+    app = QW.QApplication.instance() or QW.QApplication([])  # noqa: F841
+    plot = _make_plot(QwtPlot)
+    plot.updateLayout()
+    compact = _make_plot(QwtCompactPlot)
+    compact.activateLayout()
+
+    for child in compact.findChildren(QW.QWidget):
+        assert not child.isVisibleTo(compact)
+    assert compact.canvas().geometry() == plot.canvas().geometry()
+    for axisId in (QwtPlot.xBottom, QwtPlot.yLeft, QwtPlot.yRight):
+        cmap, pmap = compact.canvasMap(axisId), plot.canvasMap(axisId)
+        assert (cmap.p1(), cmap.p2()) == (pmap.p1(), pmap.p2())
+        assert (cmap.s1(), cmap.s2()) == (pmap.s1(), pmap.s2())
+
+    assert compact.backingStore() is None
+    image = _image(compact.grab())
+    assert compact.backingStore() is not None
+    assert np.mean(image != _image(plot.grab())) < 0.001
+    red = (image & 0xFFFFFF) == 0xFF0000
+    assert red.any()
+
+    compact.setAxisScale(QwtPlot.xBottom, 5.0, 10.0)
+    compact.replot()
+    assert compact.backingStore() is None
+    assert compact.canvasMap(QwtPlot.xBottom).s1() == 5.0
+
+
+if __name__ == "__main__":
+    test_compact_plot()
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the Qwt License
+# (see LICENSE file for more details)
+
+"""
+Test for the fused scale transform / polyline packing used by `QwtPlotCurve`.
+
+`series_to_polyline` maps the series coordinates directly into the memory of
+a `QPolygonF` which may be reused from one paint event to the next. This test
+checks the result against the scalar `QwtScaleMap.transform` path and makes
+sure the reused buffer is correctly resized (grown and shrunk).
+"""
+
+import numpy as np
+from qtpy import QtGui as QG
+
+from qwt import QwtScaleMap
+from qwt.plot_curve import qpolygonf_as_array, series_to_polyline
+from qwt.plot_series import QwtPointArrayData
+from qwt.transform import QwtLogTransform
+
+
+def _polyline_to_array(polyline):
+    return np.array([(point.x(), point.y()) for point in polyline])
+
+
+def test_series_to_polyline_matches_scalar_transform():
+    """The fused path must give the same coordinates as the scalar path."""
+    x = np.linspace(1.0, 100.0, 1000)
+    y = np.sin(x)
+    series = QwtPointArrayData(x, y)
+    xMap = QwtScaleMap()
+    xMap.setTransformation(QwtLogTransform())
+    xMap.setScaleInterval(1.0, 100.0)
+    xMap.setPaintInterval(0, 800)
+    yMap = QwtScaleMap(600, 0, -1.0, 1.0)
+    polyline = series_to_polyline(xMap, yMap, series, 10, 499)
+    assert polyline.size() == 490
+    expected = [(xMap.transform(xi), yMap.transform(yi)) for xi, yi in zip(x, y)]
+    assert np.allclose(_polyline_to_array(polyline), expected[10:500])
+
+
+def test_polyline_buffer_reuse():
+    """A reused polyline buffer must follow the requested size."""
+    x = np.arange(2000.0)
+    series = QwtPointArrayData(x, 2 * x)
+    xMap, yMap = QwtScaleMap(), QwtScaleMap()
+    buffer = QG.QPolygonF()
+    for from_, to in ((0, 1999), (5, 14), (0, 0), (100, 1099)):
+        polyline = series_to_polyline(xMap, yMap, series, from_, to, buffer)
+        assert polyline is buffer
+        assert polyline.size() == to - from_ + 1
+        data = _polyline_to_array(polyline)
+        assert np.array_equal(data[:, 0], x[from_ : to + 1])
+        assert np.array_equal(data[:, 1], 2 * x[from_ : to + 1])
+    assert qpolygonf_as_array(buffer, 0).shape == (0, 2)
+    assert buffer.size() == 0
+
+
+if __name__ == "__main__":
+    test_series_to_polyline_matches_scalar_transform()
+    test_polyline_buffer_reuse()
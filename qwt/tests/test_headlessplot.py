@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the Qwt License
+# (see LICENSE file for more details)
+
+"""
+Test for the headless plots (`qwt.plot_headless.QwtHeadlessPlot`).
+
+Plots must be rendered into images, NumPy arrays and PNG data without
+creating any widget (a `QGuiApplication` is enough), at any resolution.
+"""
+
+import numpy as np
+from qtpy import QtCore as QC
+from qtpy import QtGui as QG
+from qtpy import QtWidgets as QW
+
+from qwt import QwtHeadlessPlot, QwtPlotCurve, QwtPlotGrid, QwtPlotMarker, batch
+
+
+def make_plot():
+    plot = QwtHeadlessPlot("Headless plot")
+    plot.setFooter("Footer")
+    plot.setAxisTitle(QwtHeadlessPlot.xBottom, "Time (s)")
+    plot.setAxisTitle(QwtHeadlessPlot.yLeft, "Amplitude")
+    plot.setAxisScale(QwtHeadlessPlot.yLeft, -1.0, 1.0)
+    QwtPlotGrid.make(plot, color=QC.Qt.lightGray)
+    x = np.linspace(0.0, 10.0, 1000)
+    QwtPlotCurve.make(x, np.sin(x), "Sine", plot, linecolor="red", antialiased=True)
+    marker = QwtPlotMarker()
+    marker.setValue(5.0, 0.0)
+    marker.setLabel("Marker")
+    marker.attach(plot)
+    return plot
+
+
+def test_headlessplot():
+    """Headless plots must be rendered without widgets."""
+    app = QG.QGuiApplication.instance() or QG.QGuiApplication([])  # noqa: F841
+    widgets = len(QW.QApplication.allWidgets())
+    plot = make_plot()
+
+    array = plot.toArray(400, 300)
+    assert array.shape == (300, 400, 4) and array.dtype == np.uint8
+    assert (array[..., 3] == 255).all()  # opaque
+    # The curve is drawn in the canvas, with the autoscaled x axis
+    canvasRect = plot.canvasRect()
+    xMap = plot.canvasMap(QwtHeadlessPlot.xBottom)
+    yMap = plot.canvasMap(QwtHeadlessPlot.yLeft)
+    assert xMap.p1() == canvasRect.left() and xMap.p2() == canvasRect.right()
+    assert yMap.p1() == canvasRect.bottom() and yMap.p2() == canvasRect.top()
+    assert yMap.s1() == -1.0 and yMap.s2() == 1.0
+    assert xMap.s1() <= 0.0 and xMap.s2() >= 10.0
+    x, y = int(round(xMap.transform(np.pi / 6))), int(round(yMap.transform(0.5)))
+    blue, green, red = array[y - 1 : y + 2, x - 1 : x + 2, :3].reshape(-1, 3).T
+    assert ((red > 200) & (green < 100) & (blue < 100)).any()
+
+    # The output array is reused and painted in place (zero-copy)
+    out = np.zeros_like(array)
+    assert plot.toArray(400, 300, out=out) is out
+    assert (out == array).all()
+    try:
+        plot.toArray(300, 400, out=out)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Invalid output array must be rejected")
+
+    # Higher resolutions scale the plot: its layout is unchanged
+    image = plot.toImage(800, 600, dpi=192)
+    assert image.width() == 800 and image.dotsPerMeterX() == round(192 / 0.0254)
+    assert plot.canvasRect() == canvasRect
+
+    data = plot.toPng(400, 300)
+    assert data.startswith(b"\x89PNG\r\n\x1a\n")
+    assert QG.QImage.fromData(data).size() == QC.QSize(400, 300)
+
+    spec = {
+        "title": "Spec",
+        "legend": "right",
+        "curves": [{"xdata": [0, 1, 2], "ydata": [1, 3, 2]}],
+    }
+    plot = batch.build_plot(spec, headless=True)
+    assert isinstance(plot, QwtHeadlessPlot) and plot.title().text() == "Spec"
+    assert plot.toArray(200, 100).shape == (100, 200, 4)
+    assert len(QW.QApplication.allWidgets()) == widgets
+
+
+if __name__ == "__main__":
+    test_headlessplot()
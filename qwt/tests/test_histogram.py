@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the Qwt License
+# (see LICENSE file for more details)
+
+"""
+Test for the histograms (`qwt.plot_histogram.QwtPlotHistogram`).
+
+Columns must be painted in batches, the bins outside the canvas must be
+culled, and the bins narrower than a pixel must be merged, so that the
+painting cost of huge histograms is bounded by the size of the canvas.
+"""
+
+SHOW = True  # Show test in GUI-based test launcher
+
+import numpy as np
+from qtpy.QtCore import QRectF, Qt
+from qtpy.QtGui import QPalette
+from qtpy.QtWidgets import QApplication
+
+from qwt import (
+    QwtColumnSymbol,
+    QwtHeadlessPlot,
+    QwtIntervalArrayData,
+    QwtPlot,
+    QwtPlotGrid,
+    QwtPlotHistogram,
+    stats,
+)
+from qwt.tests import utils
+
+
+class HistogramPlot(QwtPlot):
+    def __init__(self, parent=None):
+        QwtPlot.__init__(self, "Histograms", parent)
+        self.setCanvasBackground(Qt.white)
+        QwtPlotGrid.make(self, color=Qt.lightGray)
+        rng = np.random.default_rng(0)
+        data = rng.normal(0.0, 1.0, 100000)
+        QwtPlotHistogram.make(
+            *np.histogram(data, bins=40, range=(-4.0, 4.0)),
+            "Columns",
+            self,
+            linecolor="darkBlue",
+            fillcolor="lightGray",
+        )
+        symbol = QwtColumnSymbol(QwtColumnSymbol.Box)
+        symbol.setPalette(QPalette(Qt.darkCyan))
+        QwtPlotHistogram.make(
+            *np.histogram(data + 8.0, bins=20, range=(4.0, 12.0)),
+            "Raised columns",
+            self,
+            symbol=symbol,
+        )
+        edges = np.linspace(-4.0, 12.0, 1000001)
+        counts = 12000.0 * np.exp(-2.0 * (edges[:-1] - 4.0) ** 2)
+        QwtPlotHistogram.make(
+            counts * rng.uniform(0.8, 1.2, counts.size),
+            edges,
+            "Outline (1,000,000 bins)",
+            self,
+            style=QwtPlotHistogram.Outline,
+            linecolor="red",
+        )
+
+
+def render(item, merge=True, xmax=10.0):
+    plot = QwtHeadlessPlot()
+    plot.setAxisScale(QwtHeadlessPlot.xBottom, 0.0, xmax)
+    plot.setAxisScale(QwtHeadlessPlot.yLeft, 0.0, 100.0)
+    item.setPaintAttribute(QwtPlotHistogram.MergeBins, merge)
+    item.attach(plot)
+    return plot.toArray(400, 300), stats.plot_counters(plot)
+
+
+def test_histogram_data():
+    """Histograms must paint their bins with NumPy."""
+    app = QApplication.instance() or QApplication([])  # noqa: F841
+    item = QwtPlotHistogram.make([3, 5, 4], [1, 2, 3, 4], baseline=1.0)
+    assert item.dataSize() == 3 and item.sample(1).interval.maxValue() == 3.0
+    assert item.boundingRect() == QRectF(1.0, 1.0, 3.0, 4.0)
+    item.setOrientation(Qt.Horizontal)
+    assert item.boundingRect() == QRectF(1.0, 1.0, 4.0, 3.0)
+    assert not QwtPlotHistogram().boundingRect().isValid()
+    try:
+        item.setSamples([1, 2], [0, 1])
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Edges must be one more than counts")
+
+    # Huge histograms: bins outside the canvas are culled, and bins painted
+    # at the same pixel are merged (the outline being painted unchanged)
+    rng = np.random.default_rng(0)
+    counts = rng.uniform(10.0, 90.0, 1000000)
+    edges = np.linspace(-10.0, 20.0, counts.size + 1)
+    gaps = QwtIntervalArrayData(counts, edges[:-1], edges[1:] - 1e-6)
+    for samples in ((counts, edges), (gaps,)):
+        arrays = []
+        for merge in (True, False):
+            item = QwtPlotHistogram()
+            item.setStyle(QwtPlotHistogram.Outline)
+            item.setSamples(*samples)
+            array, counters = render(item, merge)
+            arrays.append(array)
+            assert counters.points_transformed < 3 * counts.size * 0.4
+            assert counters.polylines_clipped == 1
+            assert counters.polylines_decimated == int(merge)
+            if merge:
+                # At most two runs of merged bins per pixel (the bins inside
+                # the pixel, and a bin across its edge), of five points each
+                assert counters.points_painted <= 2 * 5 * 400
+        assert (arrays[0] != arrays[1]).any(axis=-1).sum() < 20
+    symbol = QwtColumnSymbol(QwtColumnSymbol.Box)
+    for sym in (None, symbol):
+        for frameStyle in (QwtColumnSymbol.Plain, QwtColumnSymbol.Raised):
+            symbol.setFrameStyle(frameStyle)
+            item = QwtPlotHistogram.make(counts, edges, symbol=sym)
+            array, counters = render(item)
+            assert counters.symbols_drawn <= 2 * 400
+
+    # Non-uniform bins: only the bins narrower than a pixel are merged, the
+    # wide bins being painted unchanged (Qt may paint the vertical edge of
+    # the outline at the next pixel, depending on the polyline)
+    edges = np.concatenate((np.linspace(0.0, 1.0, 2001), 1.0 + 0.1 * np.arange(1, 91)))
+    counts = np.where(np.arange(edges.size - 1) < 2000, 100.0, 5.0)
+    for style in (
+        QwtPlotHistogram.Columns,
+        QwtPlotHistogram.Outline,
+        QwtPlotHistogram.Lines,
+    ):
+        arrays = []
+        for merge in (True, False):
+            item = QwtPlotHistogram.make(counts, edges, style=style)
+            array, counters = render(item, merge)
+            arrays.append(array)
+            assert counters.polylines_decimated == int(merge)
+        columns = np.unique(np.nonzero((arrays[0] != arrays[1]).any(axis=-1))[1])
+        assert columns.size <= (2 if style == QwtPlotHistogram.Outline else 0)
+
+    # Wide bins, all the styles and orientations
+    counts, edges = np.array([20.0, 60.0, 40.0]), np.array([1.0, 3.0, 6.0, 9.0])
+    for orientation in (Qt.Vertical, Qt.Horizontal):
+        for style in (
+            QwtPlotHistogram.Columns,
+            QwtPlotHistogram.Outline,
+            QwtPlotHistogram.Lines,
+        ):
+            item = QwtPlotHistogram.make(
+                counts, edges, style=style, orientation=orientation
+            )
+            xmax = 10.0 if orientation == Qt.Vertical else 100.0
+            array, counters = render(item, xmax=xmax)
+            assert counters.polylines_clipped == counters.polylines_decimated == 0
+            assert (array[..., :3] == 0).all(axis=-1).any()  # black pixels
+
+
+def test_histogram():
+    """Histogram example"""
+    utils.test_widget(HistogramPlot, size=(640, 480))
+
+
+if __name__ == "__main__":
+    test_histogram()
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the Qwt License
+# (see LICENSE file for more details)
+
+"""
+Test for the import time of the `qwt` package.
+
+The `qwt` package exports its classes lazily: importing it (or using only the
+scale engines and intervals) must neither import the plot widgets nor the
+optional Qt modules (`QtSvg`, `QtPrintSupport`), and must stay within an
+import time budget.
+"""
+
+import json
+import os
+import os.path as osp
+import subprocess
+import sys
+
+# Import time budget (in seconds) of `import qwt` followed by the import of
+# `QwtLinearScaleEngine` and `QwtInterval`, NumPy and Qt being already loaded
+# (it used to take about 160ms, when `import qwt` imported the whole library)
+IMPORT_TIME_BUDGET = 0.1
+
+SCRIPT = """
+import json, sys, time
+import numpy
+from qtpy import QtWidgets
+t0 = time.perf_counter()
+import qwt
+from qwt import QwtInterval, QwtLinearScaleEngine
+elapsed = time.perf_counter() - t0
+light_modules = sorted(sys.modules)
+qwt.QwtPlot
+qwt.QwtPlotCurve
+print(json.dumps([elapsed, light_modules, sorted(sys.modules)]))
+"""
+
+RENDER_SCRIPT = """
+import json, sys
+from qtpy import QtGui, QtWidgets
+app = QtWidgets.QApplication([])
+from qwt import QwtPlot, QwtPlotRenderer
+plot = QwtPlot("Plot")
+plot.replot()
+image = QtGui.QImage(200, 100, QtGui.QImage.Format_ARGB32)
+QwtPlotRenderer().renderTo(plot, image)
+print(json.dumps(sorted(sys.modules)))
+"""
+
+
+def _run_script(script=SCRIPT):
+    env = dict(os.environ)
+    root = osp.dirname(osp.dirname(osp.dirname(osp.abspath(__file__))))
+    env["PYTHONPATH"] = os.pathsep.join(
+        [root] + ([env["PYTHONPATH"]] if env.get("PYTHONPATH") else [])
+    )
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    output = subprocess.check_output([sys.executable, "-c", script], env=env)
+    return json.loads(output.decode().splitlines()[-1])
+
+
+def test_import_time():
+    """`import qwt` must be lazy and fast."""
+    elapsed, light_modules, modules = _run_script()
+    for name in ("qwt.plot", "qwt.legend", "qwt.text", "qwt.plot_renderer"):
+        assert name not in light_modules
+    for name in modules:
+        assert not name.endswith((".QtSvg", ".QtPrintSupport"))
+    assert "qwt._deprecated" in modules
+    assert elapsed < IMPORT_TIME_BUDGET, "import time: %.0fms" % (elapsed * 1e3)
+
+
+def test_render_to_image():
+    """Rendering to an image must not import the optional Qt modules."""
+    for name in _run_script(RENDER_SCRIPT):
+        assert not name.endswith((".QtSvg", ".QtPrintSupport"))
+
+
+def test_lazy_exports():
+    """All exported names must be importable from `qwt`."""
+    import qwt
+
+    for name in qwt.__all__:
+        assert name in dir(qwt)
+        assert getattr(qwt, name) is not None
+    assert qwt.QwtPlotCurve.__name__ == "QwtPlotCurve"
+    assert qwt.plot_marker.QwtPlotMarker is qwt.QwtPlotMarker
+    try:
+        qwt.QwtUnknownClass
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError("AttributeError not raised")
+
+
+if __name__ == "__main__":
+    test_import_time()
+    test_render_to_image()
+    test_lazy_exports()
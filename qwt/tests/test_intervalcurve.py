@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the Qwt License
+# (see LICENSE file for more details)
+
+"""
+Test for the interval curves (`qwt.plot_intervalcurve.QwtPlotIntervalCurve`).
+
+Tubes and error bars must be painted from NumPy arrays, the samples outside
+the canvas must be culled, and dense samples must be decimated without any
+visible change.
+"""
+
+SHOW = True  # Show test in GUI-based test launcher
+
+import numpy as np
+from qtpy.QtCore import QRectF, Qt
+from qtpy.QtGui import QBrush, QPen
+from qtpy.QtWidgets import QApplication
+
+from qwt import (
+    QwtHeadlessPlot,
+    QwtIntervalSymbol,
+    QwtPlot,
+    QwtPlotCurve,
+    QwtPlotGrid,
+    QwtPlotIntervalCurve,
+    stats,
+)
+from qwt.tests import utils
+
+
+class IntervalCurvePlot(QwtPlot):
+    def __init__(self, parent=None):
+        QwtPlot.__init__(self, "Interval curves", parent)
+        self.setCanvasBackground(Qt.white)
+        QwtPlotGrid.make(self, color=Qt.lightGray)
+        x = np.linspace(0.0, 10.0, 1000)
+        y = np.sin(x)
+        QwtPlotIntervalCurve.make(
+            x, y - 0.3, y + 0.3, "Tube", self, linecolor="darkBlue", fillcolor="cyan"
+        )
+        QwtPlotCurve.make(x, y, "Sine", self, linecolor="blue")
+        x = np.arange(0.0, 10.1, 0.5)
+        y = np.cos(x)
+        QwtPlotIntervalCurve.make(
+            x,
+            y - 0.2 * abs(y),
+            y + 0.2 * abs(y),
+            "Error bars",
+            self,
+            style=QwtPlotIntervalCurve.NoCurve,
+            symbol=QwtIntervalSymbol(QwtIntervalSymbol.Bar, 10, QPen(Qt.red, 2)),
+        )
+        QwtPlotIntervalCurve.make(
+            0.5 * y - 1.5,
+            x - 0.2,
+            x + 0.2,
+            "Boxes",
+            self,
+            orientation=Qt.Horizontal,
+            style=QwtPlotIntervalCurve.NoCurve,
+            symbol=QwtIntervalSymbol(
+                QwtIntervalSymbol.Box, 6, QPen(Qt.darkGreen), QBrush(Qt.green)
+            ),
+        )
+
+
+def render(item, decimate=True):
+    plot = QwtHeadlessPlot()
+    plot.setAxisScale(QwtHeadlessPlot.xBottom, 0.0, 10.0)
+    plot.setAxisScale(QwtHeadlessPlot.yLeft, -2.0, 2.0)
+    item.setPaintAttribute(QwtPlotIntervalCurve.Decimate, decimate)
+    item.attach(plot)
+    return plot.toArray(400, 300), stats.plot_counters(plot)
+
+
+def test_intervalcurve_data():
+    """Interval curves must paint their samples with NumPy."""
+    app = QApplication.instance() or QApplication([])  # noqa: F841
+    item = QwtPlotIntervalCurve.make([0, 1, 2, np.nan], [1, 2, 0, 1], [3, 4, 1, 2])
+    assert item.dataSize() == 3 and item.sample(1).interval.maxValue() == 4.0
+    assert item.boundingRect() == QRectF(0.0, 0.0, 2.0, 4.0)
+    item.setOrientation(Qt.Horizontal)
+    assert item.boundingRect() == QRectF(0.0, 0.0, 4.0, 2.0)
+    assert not QwtPlotIntervalCurve().boundingRect().isValid()
+
+    # Dense samples are decimated with the same rendering (the samples are
+    # sorted): only a few pixels of the joins of the tube bounds may differ
+    rng = np.random.default_rng(0)
+    x = np.linspace(-5.0, 15.0, 100000)
+    y = np.sin(x) + rng.normal(0.0, 0.2, x.size)
+    symbol = QwtIntervalSymbol(QwtIntervalSymbol.Bar, 0, QPen(Qt.red))
+    for style, sym in (
+        (QwtPlotIntervalCurve.Tube, None),
+        (QwtPlotIntervalCurve.NoCurve, symbol),
+    ):
+        arrays = []
+        for decimate in (True, False):
+            item = QwtPlotIntervalCurve.make(
+                x, y - 0.5, y + 0.5, style=style, symbol=sym, fillcolor="cyan"
+            )
+            array, counters = render(item, decimate)
+            arrays.append(array)
+            # Samples outside the canvas are culled
+            assert counters.points_transformed < 3 * x.size * 0.6
+            assert counters.polylines_clipped == 1
+            assert counters.polylines_decimated == int(decimate)
+        assert (arrays[0] != arrays[1]).any(axis=-1).sum() < 20
+
+    # Disjoint intervals painted at the same pixel are not merged, and bars
+    # with caps are not decimated: the rendering is unchanged
+    x = np.sort(rng.uniform(0.0, 10.0, 4000))
+    y = rng.normal(0.0, 1.0, x.size)
+    for width in (0, 6):
+        arrays = []
+        for decimate in (True, False):
+            item = QwtPlotIntervalCurve.make(
+                x,
+                y - 0.1,
+                y + 0.1,
+                style=QwtPlotIntervalCurve.NoCurve,
+                symbol=QwtIntervalSymbol(QwtIntervalSymbol.Bar, width, QPen(Qt.red)),
+            )
+            array, counters = render(item, decimate)
+            arrays.append(array)
+            assert counters.polylines_decimated == int(decimate and width == 0)
+        assert (arrays[0] == arrays[1]).all()
+
+    # Unsorted samples and all the symbol styles
+    x = rng.uniform(0.0, 10.0, 500)
+    samples = {
+        Qt.Vertical: (x, x / 5 - 1.0, x / 5 - 0.9),
+        Qt.Horizontal: (x / 5 - 1.0, x, x + 0.1),
+    }
+    for orientation, (value, lower, upper) in samples.items():
+        for symbol in (QwtIntervalSymbol.Bar, QwtIntervalSymbol.Box):
+            item = QwtPlotIntervalCurve.make(
+                value,
+                lower,
+                upper,
+                orientation=orientation,
+                symbol=QwtIntervalSymbol(symbol, 4),
+            )
+            array, counters = render(item)
+            assert counters.symbols_drawn == x.size
+            assert counters.polylines_clipped == counters.polylines_decimated == 0
+            assert (array[..., :3] == 0).all(axis=-1).any()  # black pixels
+
+
+def test_intervalcurve():
+    """Interval curve example"""
+    utils.test_widget(IntervalCurvePlot, size=(640, 480))
+
+
+if __name__ == "__main__":
+    test_intervalcurve()
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the Qwt License
+# (see LICENSE file for more details)
+
+"""
+Test for the render cache of the plot items (`QwtPlotItem.RenderCache`
+item attribute).
+
+A cached item must look like an item drawn directly, and must not be
+redrawn when another item changes, but only when its data or its scale
+maps change.
+"""
+
+import numpy as np
+from qtpy import QtCore as QC
+from qtpy import QtWidgets as QW
+
+from qwt import QwtPlot, QwtPlotCurve, QwtPlotItem, stats
+
+
+def test_item_render_cache():
+    """A cached item must only be redrawn when it or its scale maps change."""
+    app = QW.QApplication.instance() or QW.QApplication([])  # noqa: F841
+    plot = QwtPlot("Render cache")
+    x = np.linspace(0, 10, 100000)
+    reference = QwtPlotCurve.make(x, np.sin(x), "Reference", plot, linecolor="gray")
+    xo = np.linspace(0, 10, 50)
+    overlay = QwtPlotCurve.make(xo, np.cos(xo), "Overlay", plot, linecolor="red")
+    plot.resize(QC.QSize(400, 300))
+    plot.replot()
+    canvas = plot.canvas()
+    image = canvas.grab().toImage()
+
+    reference.setItemAttribute(QwtPlotItem.RenderCache, True)
+    assert canvas.grab().toImage() == image
+
+    def points_transformed():
+        return stats.plot_counters(plot).points_transformed
+
+    count = points_transformed()
+    overlay.setVisible(False)
+    canvas.grab()
+    overlay.setVisible(True)
+    canvas.grab()
+    assert points_transformed() - count == xo.size  # Overlay only
+    assert canvas.grab().toImage() == image
+
+    count = points_transformed()
+    reference.setData(x, np.sin(2 * x))
+    canvas.grab()
+    assert points_transformed() - count == x.size + xo.size
+
+    count = points_transformed()
+    plot.setAxisScale(QwtPlot.xBottom, 2.0, 8.0)
+    plot.replot()
+    canvas.grab()
+    assert points_transformed() - count > xo.size  # Scale maps changed
+
+    reference.setItemAttribute(QwtPlotItem.RenderCache, False)
+    count = points_transformed()
+    canvas.grab()
+    assert points_transformed() - count > xo.size
+
+
+if __name__ == "__main__":
+    test_item_render_cache()
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the Qwt License
+# (see LICENSE file for more details)
+
+"""
+Test for the layered backing store of the plot canvas
+(`QwtPlotCanvas.LayeredBackingStore` paint attribute).
+
+The layered canvas must look like the plain canvas, and only the layers
+holding changed items (or all layers, when the scales change) must be
+redrawn.
+"""
+
+import numpy as np
+from qtpy import QtCore as QC
+from qtpy import QtGui as QG
+from qtpy import QtWidgets as QW
+
+from qwt import (
+    QwtLinearScaleEngine,
+    QwtLogScaleEngine,
+    QwtPlot,
+    QwtPlotCanvas,
+    QwtPlotCurve,
+    QwtPlotGrid,
+    profiling,
+)
+
+
+def test_layered_backing_store():
+    """Only the layers holding changed items must be redrawn."""
+    app = QW.QApplication.instance() or QW.QApplication([])  # noqa: F841
+    plot = QwtPlot("Layered canvas")
+    grid = QwtPlotGrid.make(plot, color=QG.QColor("lightgray"))
+    x = np.linspace(0, 10, 200)
+    sine = QwtPlotCurve.make(x, np.sin(x), "Sine", plot, linecolor="blue")
+    cosine = QwtPlotCurve.make(x, np.cos(x), "Cosine", plot, linecolor="red")
+    plot.resize(QC.QSize(400, 300))
+    plot.replot()
+    canvas = plot.canvas()
+    reference = canvas.grab().toImage()
+
+    canvas.setPaintAttribute(QwtPlotCanvas.LayeredBackingStore, True)
+    assert canvas.testPaintAttribute(QwtPlotCanvas.BackingStore)
+    assert [canvas.layerIndex(item) for item in (grid, sine, cosine)] == [0, 1, 1]
+    assert canvas.grab().toImage() == reference
+
+    drawn = []
+
+    def listener(name, start, end, item):
+        if name == "QwtPlotItem.draw":
+            drawn.append(item)
+
+    profiling.set_listener(plot, listener)
+    try:
+        canvas.grab()
+        assert drawn == []  # Layers are reused as they are
+
+        sine.setData(x, np.sin(x + 1.0))
+        plot.replot()
+        canvas.grab()
+        assert drawn == [sine, cosine]  # The grid layer is not redrawn
+
+        del drawn[:]
+        sine.setCanvasLayer(2)
+        canvas.setLayerBoundaries([20.0, 25.0])
+        canvas.grab()
+        del drawn[:]
+        sine.setData(x, np.sin(x + 2.0))
+        canvas.grab()
+        assert drawn == [sine]
+
+        del drawn[:]
+        plot.setAxisScale(QwtPlot.xBottom, 2.0, 8.0)
+        plot.replot()
+        canvas.grab()
+        assert drawn == [grid, cosine, sine]  # Scales changed: all layers
+
+        del drawn[:]
+        plot.setAxisScaleEngine(QwtPlot.xBottom, QwtLogScaleEngine())
+        plot.replot()
+        canvas.grab()
+        assert drawn == [grid, cosine, sine]
+        del drawn[:]
+        canvas.grab()
+        assert drawn == []  # Non-linear scale maps are compared by value
+        plot.setAxisScaleEngine(QwtPlot.xBottom, QwtLinearScaleEngine())
+        plot.setAxisAutoScale(QwtPlot.xBottom)
+    finally:
+        profiling.set_listener(plot, None)
+
+    sine.setCanvasLayer(None)  # Layers are painted in increasing order
+    canvas.setPaintAttribute(QwtPlotCanvas.LayeredBackingStore, False)
+    plot.replot()
+    reference = canvas.grab().toImage()
+    canvas.setPaintAttribute(QwtPlotCanvas.LayeredBackingStore, True)
+    assert canvas.grab().toImage() == reference
+
+
+if __name__ == "__main__":
+    test_layered_backing_store()
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the Qwt License
+# (see LICENSE file for more details)
+
+"""
+Test for the memoization of the plot layout (`QwtPlotLayout.activate`).
+
+The layout must not be recalculated (and the plot components must not be
+moved) as long as the layout state is unchanged, but any change of the plot
+geometry, texts, axes or components must be taken into account.
+"""
+
+import numpy as np
+from qtpy import QtCore as QC
+from qtpy import QtWidgets as QW
+
+from qwt import QwtPlot, QwtPlotCanvas, QwtPlotCurve
+from qwt.plot_layout import QwtPlotLayout
+
+
+def test_layout_memo():
+    """Layout activation must be skipped only when nothing has changed."""
+    app = QW.QApplication.instance() or QW.QApplication([])  # noqa: F841
+    plot = QwtPlot("Title")
+    plot.resize(QC.QSize(400, 300))
+    x = np.linspace(0, 10, 100)
+    QwtPlotCurve.make(x, np.sin(x), "Sine", plot)
+    layout = plot.plotLayout()
+    # The first update may change the border distances of the scale widgets,
+    # which are an input of the layout: a second update takes them into account
+    plot.updateLayout()
+    plot.updateLayout()
+    state = layout.activatedState()
+    assert state is not None
+    assert plot.get_layout_state() == state
+    plot.updateLayout()
+    assert layout.activatedState() is state
+
+    plot.setAxisTitle(QwtPlot.yLeft, "Amplitude")
+    assert layout.activatedState() is not state
+    state = layout.activatedState()
+    plot.enableAxis(QwtPlot.yRight)
+    assert layout.activatedState() is not state
+    assert plot.axisWidget(QwtPlot.yRight).geometry() == (
+        layout.scaleRect(QwtPlot.yRight).toRect()
+    )
+
+    state = layout.activatedState()
+    plot.resize(QC.QSize(500, 300))
+    plot.updateLayout()
+    assert layout.activatedState() is not state
+    assert plot.canvas().geometry() == layout.canvasRect().toRect()
+
+    canvas = QwtPlotCanvas()
+    plot.setCanvas(canvas)
+    plot.updateLayout()
+    assert canvas.geometry() == layout.canvasRect().toRect()
+
+    # Rendering the plot to a document activates (and invalidates) the layout
+    layout.activate(plot, QC.QRectF(0, 0, 800, 600), QwtPlotLayout.IgnoreScrollbars)
+    assert layout.canvasRect().toRect() != canvas.geometry()
+    layout.invalidate()
+    assert layout.activatedState() is None
+    plot.updateLayout()
+    assert canvas.geometry() == layout.canvasRect().toRect()
+
+
+if __name__ == "__main__":
+    test_layout_memo()
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the Qwt License
+# (see LICENSE file for more details)
+
+"""
+Test for the lazy creation of the `QwtPlot` sub-widgets.
+
+The scale widgets of the disabled axes and the title/footer labels are only
+created on first use, but must then behave exactly as if they had been
+created with the plot.
+"""
+
+import numpy as np
+from qtpy import QtCore as QC
+from qtpy import QtGui as QG
+from qtpy import QtWidgets as QW
+
+from qwt import QwtLegend, QwtPlot, QwtPlotCurve, QwtPlotRenderer
+from qwt.scale_widget import QwtScaleWidget
+from qwt.text import QwtTextLabel
+
+
+def test_lazy_axis_widgets():
+    """Disabled axes must get a fully configured scale widget on demand."""
+    app = QW.QApplication.instance() or QW.QApplication([])  # noqa: F841
+    plot = QwtPlot()
+    plot.resize(QC.QSize(400, 300))
+    x = np.linspace(0, 10, 100)
+    QwtPlotCurve.make(x, np.sin(x), "Sine", plot, y_axis=QwtPlot.yRight)
+    plot.replot()
+    assert len(plot.findChildren(QwtScaleWidget)) == 2
+    assert not plot.findChildren(QwtTextLabel)
+
+    yLeft = plot.axisWidget(QwtPlot.yLeft)
+    yRight = plot.axisWidget(QwtPlot.yRight)
+    assert len(plot.findChildren(QwtScaleWidget)) == 3
+    assert yRight.objectName() == "QwtPlotAxisYRight"
+    assert yRight.font() == yLeft.font()
+    assert yRight.margin() == yLeft.margin()
+    assert yRight.scaleDraw().scaleDiv() == plot.axisScaleDiv(QwtPlot.yRight)
+    assert not yRight.isVisibleTo(plot)
+
+    plot.enableAxis(QwtPlot.yRight)
+    assert yRight.isVisibleTo(plot)
+    assert yRight.geometry() == plot.plotLayout().scaleRect(QwtPlot.yRight).toRect()
+
+
+def test_lazy_text_labels():
+    """Title and footer labels must be created when they get a text."""
+    app = QW.QApplication.instance() or QW.QApplication([])  # noqa: F841
+    plot = QwtPlot()
+    plot.resize(QC.QSize(400, 300))
+    plot.setTitle("")
+    plot.setFooter("")
+    assert plot.title().isEmpty() and plot.footer().isEmpty()
+    assert not plot.findChildren(QwtTextLabel)
+
+    plot.setFooter("Footer")
+    assert plot.footerLabel().objectName() == "QwtPlotFooter"
+    assert plot.footerLabel().isVisibleTo(plot)
+    assert plot.footer().text() == "Footer"
+    assert not plot.plotLayout().footerRect().isEmpty()
+    assert plot.plotLayout().titleRect().isEmpty()
+
+    title_plot = QwtPlot("Title")
+    assert title_plot.titleLabel().text().text() == "Title"
+    assert len(title_plot.findChildren(QwtTextLabel)) == 1
+
+
+class RecordingRenderer(QwtPlotRenderer):
+    """Renderer recording which plot components were rendered"""
+
+    def __init__(self):
+        super(RecordingRenderer, self).__init__()
+        self.rendered = []
+
+    def renderTitle(self, plot, painter, rect):
+        self.rendered.append("title")
+
+    def renderFooter(self, plot, painter, rect):
+        self.rendered.append("footer")
+
+    def renderLegend(self, plot, painter, rect):
+        self.rendered.append("legend")
+
+
+def test_render_without_title():
+    """Footer and legend of a plot without title must be rendered."""
+    app = QW.QApplication.instance() or QW.QApplication([])  # noqa: F841
+    plot = QwtPlot()
+    plot.resize(QC.QSize(400, 300))
+    plot.setFooter("Footer")
+    plot.insertLegend(QwtLegend())
+    plot.replot()
+    image = QG.QImage(400, 300, QG.QImage.Format_ARGB32)
+    renderer = RecordingRenderer()
+    painter = QG.QPainter(image)
+    renderer.render(plot, painter, QC.QRectF(image.rect()))
+    painter.end()
+    assert renderer.rendered == ["footer", "legend"]
+    assert not plot.findChildren(QwtTextLabel, "QwtPlotTitle")
+
+
+if __name__ == "__main__":
+    test_lazy_axis_widgets()
+    test_lazy_text_labels()
+    test_render_without_title()
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the Qwt License
+# (see LICENSE file for more details)
+
+"""
+Test for the persistent font metrics cache (`qwt.text.set_metrics_disk_cache`).
+
+Effective font ascents computed by a process must be saved to the cache file
+and reused (without rendering any glyph) once the in-memory cache is empty,
+as it is when a new process starts.
+"""
+
+import os
+
+from qtpy import QtGui as QG
+from qtpy import QtWidgets as QW
+
+from qwt import text
+
+
+def test_metrics_disk_cache(tmp_path):
+    """Ascents must be read back from the cache file."""
+    app = QW.QApplication.instance() or QW.QApplication([])  # noqa: F841
+    path = str(tmp_path / "PythonQwt" / "metrics.json")
+    engine = text.QwtPlainTextEngine()
+    font = QG.QFont("Sans", 17)
+    ascent = engine.findAscent(font)
+    assert 0 < ascent <= QG.QFontMetrics(font).ascent() + 1
+    text.set_metrics_disk_cache(True, path)
+    try:
+        assert text.metrics_disk_cache().path == path
+        text.ASCENTCACHE.clear()
+        assert engine.effectiveAscent(font) == ascent
+        assert os.path.isfile(path)
+
+        def failing_find_ascent(font):
+            raise AssertionError("ascent must be read from the cache file")
+
+        text.ASCENTCACHE.clear()
+        engine.findAscent = failing_find_ascent
+        text.set_metrics_disk_cache(True, path)  # as in a new process
+        assert engine.effectiveAscent(font) == ascent
+    finally:
+        text.set_metrics_disk_cache(False)
+        text.ASCENTCACHE.clear()
+    assert text.metrics_disk_cache() is None
+
+
+if __name__ == "__main__":
+    import tempfile
+    from pathlib import Path
+
+    test_metrics_disk_cache(Path(tempfile.mkdtemp()))
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the Qwt License
+# (see LICENSE file for more details)
+
+"""
+Test for the performance overlay of the plot canvas
+(`QwtPlotCanvas.PerformanceHud` paint attribute).
+
+The overlay must report the replot steps and the points drawn, and must not
+be painted into the backing store of the canvas.
+"""
+
+import numpy as np
+from qtpy import QtCore as QC
+from qtpy import QtWidgets as QW
+
+from qwt import QwtPlot, QwtPlotCanvas, QwtPlotCurve
+
+
+def test_performance_hud():
+    """The overlay must measure the replot pipeline, outside the backing store."""
+    app = QW.QApplication.instance() or QW.QApplication([])
+    plot = QwtPlot("Performance overlay")
+    x = np.linspace(0, 10, 500)
+    QwtPlotCurve.make(x, np.sin(x), "Sine", plot)
+    canvas = plot.canvas()
+    canvas.setPaintAttribute(QwtPlotCanvas.BackingStore, True)
+    canvas.setPaintAttribute(QwtPlotCanvas.ImmediatePaint, True)
+    assert canvas.performanceHud() is None
+    canvas.setPaintAttribute(QwtPlotCanvas.PerformanceHud, True)
+    hud = canvas.performanceHud()
+    plot.resize(QC.QSize(400, 300))
+    plot.show()
+    app.processEvents()
+    plot.replot()
+
+    lines = hud.lines()
+    assert lines[0].endswith("redrawn")
+    assert lines[2] == "points 500 / 500"
+    assert hud.duration("QwtPlot.updateAxes") is not None
+    assert hud.duration("QwtPlot.updateLayout") is not None
+
+    # Frames copied from the backing store: nothing is redrawn
+    image = canvas.backingStore().toImage()
+    canvas.repaint()
+    assert hud.lines()[0].endswith("backing store")
+    assert hud.lines()[2] == "points 500 / 500"
+    assert canvas.backingStore().toImage() == image
+
+    canvas.setPaintAttribute(QwtPlotCanvas.PerformanceHud, False)
+    assert canvas.performanceHud() is None
+    duration = hud.duration("QwtPlot.updateAxes")
+    plot.replot()
+    assert hud.duration("QwtPlot.updateAxes") == duration
+
+    # Canvas created without a parent, then attached to the plot
+    canvas = QwtPlotCanvas()
+    canvas.setPaintAttribute(QwtPlotCanvas.PerformanceHud, True)
+    hud = canvas.performanceHud()
+    assert canvas.plot() is None and hud.plot() is None
+    plot.setCanvas(canvas)
+    assert canvas.plot() is plot and hud.plot() is plot
+    plot.replot()
+    assert hud.duration("QwtPlot.updateAxes") is not None
+
+
+if __name__ == "__main__":
+    test_performance_hud()
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the Qwt License
+# (see LICENSE file for more details)
+
+"""
+Test for the tracing of the rendering pipeline (`qwt.profiling`).
+
+When enabled, spans must be recorded for the replot pipeline, tagged with
+the plot and the item, and exported in the Chrome trace format.
+"""
+
+import json
+import os.path as osp
+import tempfile
+
+import numpy as np
+from qtpy import QtCore as QC
+from qtpy import QtWidgets as QW
+
+from qwt import QwtPlot, QwtPlotCurve, profiling
+
+
+def test_profiling():
+    """Spans must be recorded and exported only when tracing is enabled."""
+    app = QW.QApplication.instance() or QW.QApplication([])
+    assert not profiling.is_enabled()
+    assert profiling.span("test") is profiling.span("test", object())
+
+    plot = QwtPlot("Traced plot")
+    x = np.linspace(0, 10, 100)
+    curve = QwtPlotCurve.make(x, np.sin(x), "Sine", plot)
+    plot.resize(QC.QSize(400, 300))
+    plot.show()
+    app.processEvents()
+    assert profiling.events() == []
+
+    profiling.enable()
+    try:
+        plot.resize(QC.QSize(500, 350))
+        plot.replot()
+        plot.repaint()
+        app.processEvents()
+        events = profiling.events()
+        names = {event["name"] for event in events}
+        for name in (
+            "QwtPlot.replot",
+            "QwtPlot.updateAxes",
+            "QwtPlot.updateLayout",
+            "QwtPlotCanvas.paintEvent",
+            "QwtPlot.drawItems",
+            "QwtPlotItem.draw",
+            "QwtScaleWidget.paintEvent",
+        ):
+            assert name in names, name
+        for event in events:
+            assert event["ph"] == "X" and event["dur"] >= 0.0
+            assert "Traced plot" in event["args"]["plot"]
+        draws = [event for event in events if event["name"] == "QwtPlotItem.draw"]
+        assert any("QwtPlotCurve('Sine')" in e["args"]["item"] for e in draws)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = osp.join(tmpdir, "trace.json")
+            profiling.export_chrome_trace(path)
+            with open(path) as fdesc:
+                trace = json.load(fdesc)
+        assert len(trace["traceEvents"]) == len(events)
+        profiling.clear()
+        assert profiling.events() == []
+    finally:
+        profiling.disable()
+    plot.replot()
+    assert profiling.events() == []
+    assert curve.plot() is plot
+
+
+if __name__ == "__main__":
+    test_profiling()
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the Qwt License
+# (see LICENSE file for more details)
+
+"""
+Test for the asyncio render service (`qwt.render_service`).
+
+Jobs must be rendered by the workers without blocking the event loop, with
+backpressure when the queue is full, timeouts and errors reported to the
+awaiting coroutines.
+"""
+
+import asyncio
+import time
+
+import numpy as np
+from qtpy.QtWidgets import QApplication
+
+from qwt import QwtHeadlessPlot
+from qwt.render_service import QwtRenderService
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def slow_plot(spec):
+    """Plot factory taking some time (see the `factory` key of the plot specs)"""
+    time.sleep(spec["delay"])
+    return QwtHeadlessPlot(spec.get("title", ""))
+
+
+def make_spec(index):
+    x = np.linspace(0.0, 10.0, 500)
+    return {
+        "title": "Plot %d" % index,
+        "size": [320, 240],
+        "grid": {},
+        "curves": [{"xdata": x, "ydata": np.sin(x + index), "linecolor": "red"}],
+    }
+
+
+SLOW_SPEC = {"factory": "qwt.tests.test_renderservice:slow_plot", "delay": 0.3}
+
+
+async def ticker(ticks):
+    while True:
+        await asyncio.sleep(0.001)
+        ticks.append(None)
+
+
+async def check_threads():
+    async with QwtRenderService(workers=2, maxQueueSize=2) as service:
+        assert service.isRunning()
+        ticks = []
+        task = asyncio.ensure_future(ticker(ticks))
+        images = await asyncio.gather(*[service.render(make_spec(i)) for i in range(8)])
+        task.cancel()
+        assert ticks  # the event loop was not blocked by the rendering
+        assert all(data.startswith(PNG_SIGNATURE) for data in images)
+        assert len(set(images)) == 8
+        jpeg = await service.render(dict(make_spec(0), format="jpg", quality=50))
+        assert jpeg.startswith(b"\xff\xd8")
+
+        # Errors are raised in the awaiting coroutine
+        try:
+            await service.render({"curves": [{"xdata": [1.0, 2.0]}]})
+        except ValueError as exc:
+            assert "ydata" in str(exc)
+        else:
+            raise AssertionError("Bad spec must raise an error")
+
+        # Timeouts
+        try:
+            await service.render(SLOW_SPEC, timeout=0.05)
+        except asyncio.TimeoutError:
+            pass
+        else:
+            raise AssertionError("Slow job must time out")
+        stats = service.stats()
+        assert stats["submitted"] == 11 and stats["failed"] == 1
+        assert stats["timeouts"] == 1
+
+    async with QwtRenderService(workers=1, maxQueueSize=1) as service:
+        # Backpressure: one job is rendered, one is queued, the queue is full
+        running = asyncio.ensure_future(service.render(SLOW_SPEC))
+        await asyncio.sleep(0.05)
+        queued = asyncio.ensure_future(service.render(SLOW_SPEC))
+        await asyncio.sleep(0.05)
+        assert service.queueSize() == 1
+        try:
+            await service.render(make_spec(0), block=False)
+        except asyncio.QueueFull:
+            pass
+        else:
+            raise AssertionError("Full queue must reject jobs")
+        t0 = time.perf_counter()
+        waiting = await service.render(make_spec(0))  # waits for a free slot
+        assert time.perf_counter() - t0 > 0.2
+        assert waiting.startswith(PNG_SIGNATURE)
+        assert all((await running, await queued))
+        assert service.stats()["rejected"] == 1
+    assert not service.isRunning()
+
+    # Closing: all the awaiting coroutines are released, including those
+    # waiting for a free slot
+    service = QwtRenderService(workers=1, maxQueueSize=1)
+    await service.start()
+    jobs = [asyncio.ensure_future(service.render(SLOW_SPEC)) for _i in range(4)]
+    await asyncio.sleep(0.05)
+    await service.close()
+    results = await asyncio.wait_for(asyncio.gather(*jobs, return_exceptions=True), 5)
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+async def check_processes():
+    async with QwtRenderService(workers=1, processes=True) as service:
+        data = await service.render(make_spec(0), timeout=60.0)
+        assert data.startswith(PNG_SIGNATURE)
+
+
+def test_renderservice():
+    """Jobs must be rendered by worker threads and processes."""
+    # The service would create a QGuiApplication, with which the widget tests
+    # running next in the same process would abort
+    app = QApplication.instance() or QApplication([])  # noqa: F841
+    asyncio.run(check_threads())
+    asyncio.run(check_processes())
+
+
+if __name__ == "__main__":
+    test_renderservice()
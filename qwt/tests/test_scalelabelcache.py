@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the Qwt License
+# (see LICENSE file for more details)
+
+"""
+Test for the tick label caches of scale draws.
+
+Cached labels (`QwtScaleLabelCache`) must survive scale division changes (e.g.
+when panning), be shared between scale draws with the same label formatter,
+and be kept apart for scale draws with a different (or reimplemented) label
+formatter. Pre-rendered labels (`QwtScaleDraw.setLabelPixmapCache`) must be
+reused from one repaint to the next.
+"""
+
+import threading
+
+import numpy as np
+from qtpy import QtGui as QG
+from qtpy import QtWidgets as QW
+
+from qwt import QwtPlot, QwtPlotCurve
+from qwt.scale_div import QwtScaleDiv
+from qwt.scale_draw import QwtDateTimeScaleDraw, QwtScaleDraw, QwtScaleLabelCache
+
+
+class PercentScaleDraw(QwtScaleDraw):
+    def label(self, value):
+        return "%d%%" % value
+
+
+class RangeScaleDraw(QwtScaleDraw):
+    def label(self, value):
+        decimals = 0 if self.scaleDiv().range() > 10 else 3
+        return "%.*f" % (decimals, value)
+
+
+def test_label_cache_survives_scale_div_changes():
+    """Labels of ticks still visible after panning must be reused."""
+    app = QW.QApplication.instance() or QW.QApplication([])  # noqa: F841
+    font = QG.QFont()
+    cache = QwtScaleLabelCache()
+    draw1, draw2 = QwtScaleDraw(), QwtScaleDraw()
+    draw1.setLabelCache(cache)
+    draw2.setLabelCache(cache)
+    draw1.setScaleDiv(QwtScaleDiv(0.0, 10.0, [], [], [0.0, 5.0, 10.0]))
+    lbl, size = draw1.tickLabel(font, 5.0)
+    draw1.setScaleDiv(QwtScaleDiv(2.0, 12.0, [], [], [5.0, 10.0]))
+    assert draw1.tickLabel(font, 5.0)[0] is lbl
+    assert draw2.tickLabel(font, 5.0)[0] is lbl
+    assert draw2.tickLabel(font, 5.0)[1] == size
+    assert len(cache) == 1
+
+    percent = PercentScaleDraw()
+    percent.setLabelCache(cache)
+    assert percent.tickLabel(font, 5.0)[0].text() == "5%"
+    assert draw1.tickLabel(font, 5.0)[0].text() == " 5"
+    percent.invalidateCache()
+    assert percent.tickLabel(font, 5.0)[0].text() == "5%"
+    assert len(cache) == 3
+
+    # Reimplemented labels may depend on the scale division
+    ranged = RangeScaleDraw()
+    ranged.setLabelCache(cache)
+    ranged.setScaleDiv(QwtScaleDiv(0.0, 100.0))
+    assert ranged.tickLabel(font, 0.0)[0].text() == "0"
+    ranged.setScaleDiv(QwtScaleDiv(0.0, 1.0))
+    assert ranged.tickLabel(font, 0.0)[0].text() == "0.000"
+
+    date1, date2 = QwtDateTimeScaleDraw("%Y"), QwtDateTimeScaleDraw("%Y")
+    assert date1.labelCacheKey() == date2.labelCacheKey()
+    date2.set_format("%H")
+    assert date1.labelCacheKey() != date2.labelCacheKey()
+
+    cache.setMaxSize(2)
+    assert len(cache) == 2
+    for value in range(10):
+        draw1.tickLabel(font, value)
+    assert len(cache) == 2
+
+
+def test_label_cache_threads():
+    """Scale draws laid out by several threads must share the label cache."""
+    app = QW.QApplication.instance() or QW.QApplication([])  # noqa: F841
+    cache = QwtScaleLabelCache(8)
+    errors = []
+
+    def layout():
+        font = QG.QFont()
+        draw = QwtScaleDraw()
+        draw.setLabelCache(cache)
+        try:
+            for value in range(2000):
+                assert draw.tickLabel(font, value % 16)[0].text()
+        except Exception as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=layout) for _i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors and len(cache) == 8
+
+
+def _image_pixels(image):
+    return [
+        image.pixel(x, y) for x in range(image.width()) for y in range(image.height())
+    ]
+
+
+def test_label_pixmap_cache():
+    """Pre-rendered labels must be reused and look like labels drawn directly."""
+    app = QW.QApplication.instance() or QW.QApplication([])  # noqa: F841
+    plot = QwtPlot()
+    plot.resize(400, 300)
+    x = np.linspace(0, 10, 10)
+    QwtPlotCurve.make(x, x, plot=plot)
+    plot.replot()
+    scale_widget = plot.axisWidget(QwtPlot.xBottom)
+    scale_draw = plot.axisScaleDraw(QwtPlot.xBottom)
+    assert not scale_draw.labelPixmapCache()
+    expected = _image_pixels(scale_widget.grab().toImage())
+    scale_draw.setLabelPixmapCache(True)
+    assert scale_draw.labelPixmapCache()
+    pixels = _image_pixels(scale_widget.grab().toImage())
+    assert _image_pixels(scale_widget.grab().toImage()) == pixels
+    # Labels are blitted at integer positions: only antialiased pixels differ
+    ndiff = sum(pixel != other for pixel, other in zip(pixels, expected))
+    assert len(pixels) == len(expected) and ndiff < 0.05 * len(pixels)
+    scale_draw.setLabelPixmapCache(False)
+    assert _image_pixels(scale_widget.grab().toImage()) == expected
+
+
+if __name__ == "__main__":
+    test_label_cache_survives_scale_div_changes()
+    test_label_cache_threads()
+    test_label_pixmap_cache()
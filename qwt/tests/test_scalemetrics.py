@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the Qwt License
+# (see LICENSE file for more details)
+
+"""
+Test for the memoization of the scale draw layout metrics.
+
+`QwtScaleDraw.extent`, `minLabelDist`, `getBorderDistHint` and `minLength`
+are computed once per font and must be recomputed as soon as the scale
+division, the geometry or the label configuration of the scale draw changes.
+"""
+
+from qtpy import QtGui as QG
+from qtpy import QtWidgets as QW
+
+from qwt import QwtLinearScaleEngine, QwtScaleDraw
+from qwt.scale_widget import QwtScaleWidget
+
+
+def _metrics(scaleDraw, font):
+    return (
+        scaleDraw.extent(font),
+        scaleDraw.minLabelDist(font),
+        scaleDraw.getBorderDistHint(font),
+        scaleDraw.minLength(font),
+    )
+
+
+def _fresh_metrics(scaleDraw, font):
+    scaleDraw.invalidateCache()
+    return _metrics(scaleDraw, font)
+
+
+def test_scale_metrics_cache():
+    """Cached metrics must match freshly computed ones after any setter."""
+    app = QW.QApplication.instance() or QW.QApplication([])  # noqa: F841
+    font = QG.QFont()
+    engine = QwtLinearScaleEngine()
+    scaleDraw = QwtScaleDraw()
+    scaleDraw.setAlignment(QwtScaleDraw.LeftScale)
+    scaleDraw.setScaleDiv(engine.divideScale(0.0, 10.0, 5, 3))
+    scaleDraw.move(50, 10)
+    scaleDraw.setLength(300)
+    metrics = _metrics(scaleDraw, font)
+    assert len(scaleDraw._metrics_cache) == 4
+    assert _metrics(scaleDraw, font) == metrics
+    scaleDraw.move(50, 10)  # No geometry change: the cache is kept
+    assert len(scaleDraw._metrics_cache) == 4
+
+    for setter, args in (
+        (scaleDraw.setScaleDiv, (engine.divideScale(0.0, 1e6, 5, 3),)),
+        (scaleDraw.setLabelRotation, (45.0,)),
+        (scaleDraw.setAlignment, (QwtScaleDraw.BottomScale,)),
+        (scaleDraw.setSpacing, (12,)),
+        (scaleDraw.setLength, (150,)),
+        (scaleDraw.enableComponent, (QwtScaleDraw.Labels, False)),
+    ):
+        setter(*args)
+        assert not scaleDraw._metrics_cache
+        assert _metrics(scaleDraw, font) == _fresh_metrics(scaleDraw, font)
+
+    bold = QG.QFont(font)
+    bold.setPointSize(3 * font.pointSize())
+    scaleDraw.enableComponent(QwtScaleDraw.Labels, True)
+    assert scaleDraw.extent(bold) > scaleDraw.extent(font)
+
+
+def test_scale_widget_title_height():
+    """The title height of the scale widget must follow the title."""
+    app = QW.QApplication.instance() or QW.QApplication([])  # noqa: F841
+    widget = QwtScaleWidget()
+    widget.setTitle("Title")
+    height = widget.titleHeightForWidth(30)
+    assert widget.titleHeightForWidth(30) == height
+    widget.setTitle("A much longer title which has to be wrapped")
+    assert widget.titleHeightForWidth(30) > height
+
+
+if __name__ == "__main__":
+    test_scale_metrics_cache()
+    test_scale_widget_title_height()
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the Qwt License
+# (see LICENSE file for more details)
+
+"""
+Test for the scenario benchmarks (`python -m qwt.benchmarks scenarios`).
+
+Scenarios must report their frame rate, frame times and peak memory, when
+run in the current process as well as in a separate process.
+"""
+
+import json
+import os.path as osp
+import tempfile
+
+from qwt.benchmarks import main
+from qwt.benchmarks.scenarios import run_scenario
+
+
+def test_scenarios():
+    """Scenarios must report frame statistics and peak memory."""
+    result = run_scenario("strip_chart", quick=True)
+    assert result["frames"] == 25
+    assert 0.0 < result["fps"] <= result["target_fps"] * 1.5
+    assert 0.0 < result["median"] <= result["p99"]
+    assert result["peak_rss"] is None or result["peak_rss"] > 0.0
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = osp.join(tmpdir, "scenarios.json")
+        args = ["scenarios", "--quick", "--filter", "export", "--output", path]
+        assert main(args) == 0
+        with open(path) as fdesc:
+            results = json.load(fdesc)["results"]
+    assert len(results) == 1
+    name, result = results.popitem()
+    assert name.startswith("export[")
+    assert result["frames"] == 4  # 2 plots, PDF and PNG
+
+
+if __name__ == "__main__":
+    test_scenarios()
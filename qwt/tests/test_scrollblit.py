@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the Qwt License
+# (see LICENSE file for more details)
+
+"""
+Test for the scrolling of the canvas backing store
+(`QwtPlotCanvas.ScrollBlit` paint attribute).
+
+When the x axis of a strip chart advances by whole pixels, the backing
+store must be scrolled and only the samples around the exposed band must be
+drawn, with the same result as a complete repaint.
+"""
+
+import numpy as np
+from qtpy import QtCore as QC
+from qtpy import QtGui as QG
+from qtpy import QtWidgets as QW
+
+from qwt import QwtPlot, QwtPlotCanvas, QwtPlotCurve, QwtPlotGrid, stats
+
+PIXELS_PER_UNIT = 40.0
+STEP = 3 / PIXELS_PER_UNIT  # Scrolling by 3 pixels
+
+
+def pixels(image):
+    image = image.convertToFormat(QG.QImage.Format_RGB32)
+    bits = image.constBits()
+    size = image.sizeInBytes()
+    data = bits.asstring(size) if hasattr(bits, "asstring") else bytes(bits)[:size]
+    return np.frombuffer(data, np.uint32)
+
+
+def assert_similar(image1, image2):
+    """Scrolled and repainted curves may differ by a few rasterized pixels"""
+    assert image1.size() == image2.size()
+    assert np.count_nonzero(pixels(image1) != pixels(image2)) < 100
+
+
+class StripChart(object):
+    def __init__(self, scroll):
+        self.plot = plot = QwtPlot("Strip chart")
+        QwtPlotGrid.make(plot, color=QG.QColor("lightgray"))
+        self.curve = QwtPlotCurve.make([], [], "Signal", plot, linecolor="blue")
+        plot.setAxisScale(QwtPlot.yLeft, -1.5, 1.5)
+        plot.axisWidget(QwtPlot.xBottom).setMinBorderDist(40, 40)
+        plot.plotLayout().setAlignCanvasToScales(True)
+        plot.resize(QC.QSize(500, 300))
+        plot.replot()
+        canvas = plot.canvas()
+        canvas.setPaintAttribute(QwtPlotCanvas.BackingStore, True)
+        canvas.setPaintAttribute(QwtPlotCanvas.ScrollBlit, scroll)
+        plot.show()
+        QW.QApplication.processEvents()
+        # Grid lines on whole pixels
+        self.window = plot.canvasMap(QwtPlot.xBottom).pDist() / PIXELS_PER_UNIT
+
+    def advance(self, t):
+        """Append samples up to `t`, scroll the x axis to `t` and grab the canvas"""
+        x = np.arange(0.0, t, STEP / 7.0)
+        self.curve.setData(x, np.sin(3 * x) + 0.3 * np.sin(17 * x))
+        self.plot.setAxisScale(QwtPlot.xBottom, t - self.window, t)
+        self.plot.replot()
+        return self.plot.canvas().grab().toImage()
+
+
+def test_scroll_blit():
+    """Scrolling must only draw the exposed band, as a complete repaint does."""
+    app = QW.QApplication.instance() or QW.QApplication([])  # noqa: F841
+    chart = StripChart(True)
+    reference = StripChart(False)
+    counters = stats.plot_counters(chart.plot)
+    t = chart.window
+    chart.advance(t)
+    for _index in range(10):
+        t += STEP
+        count, clipped = counters.points_transformed, counters.polylines_clipped
+        image = chart.advance(t)
+        assert counters.points_transformed - count < 40
+        assert counters.polylines_clipped == clipped + 1
+        assert_similar(image, reference.advance(t))
+
+    # Any other change of the scale maps: complete repaint
+    count = counters.points_transformed
+    for strip in (chart, reference):
+        strip.plot.setAxisScale(QwtPlot.yLeft, -2.0, 2.0)
+    image = chart.advance(t + STEP)
+    assert counters.points_transformed - count > chart.curve.dataSize() // 2
+    assert np.all(pixels(image) == pixels(reference.advance(t + STEP)))
+
+
+if __name__ == "__main__":
+    test_scroll_blit()
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the Qwt License
+# (see LICENSE file for more details)
+
+"""
+Test for the render counters and cache statistics (`qwt.stats`).
+
+The curves must count the points they transform and paint, globally and
+per plot, and the caches must report their hits, misses and sizes.
+"""
+
+import json
+
+import numpy as np
+from qtpy import QtCore as QC
+from qtpy import QtWidgets as QW
+
+from qwt import QwtPlot, QwtPlotCurve, QwtSymbol, stats
+
+
+def test_stats():
+    """Render counters and cache statistics must be reported."""
+    app = QW.QApplication.instance() or QW.QApplication([])  # noqa: F841
+    plot = QwtPlot("Counted plot")
+    x = np.linspace(0, 10, 100)
+    QwtPlotCurve.make(x, np.sin(x), "Lines", plot)
+    symbol = QwtSymbol(QwtSymbol.Ellipse)
+    QwtPlotCurve.make(x, np.cos(x), "Symbols", plot, symbol=symbol)
+    plot.resize(QC.QSize(400, 300))
+    plot.replot()
+
+    stats.reset()
+    plot.grab()
+    snapshot = json.loads(json.dumps(stats.snapshot()))
+    counters = snapshot["counters"]
+    assert counters["points_transformed"] == 300
+    assert counters["points_painted"] == 200
+    assert counters["symbols_drawn"] == 100
+    assert snapshot["plots"]["QwtPlot('Counted plot')@%x" % id(plot)] == counters
+    assert stats.plot_counters(plot).asDict() == counters
+
+    caches = snapshot["caches"]
+    for name in ("font_key", "font_metrics", "font_ascent", "scale_labels"):
+        assert name in caches, name
+    labels = caches["scale_labels"]
+    assert labels["hits"] > 0 and labels["size"] > 0
+    assert labels["hit_rate"] == labels["hits"] / (labels["hits"] + labels["misses"])
+
+    stats.reset()
+    snapshot = stats.snapshot()
+    assert snapshot["counters"]["points_transformed"] == 0
+    assert snapshot["plots"] == {}
+    assert snapshot["caches"]["scale_labels"]["hits"] == 0
+
+
+if __name__ == "__main__":
+    test_stats()
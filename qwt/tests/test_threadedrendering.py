@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the Qwt License
+# (see LICENSE file for more details)
+
+"""
+Test for the threaded rendering of the plot items
+(`QwtPlot.setRenderThreadCount` and `QwtPlotItem.ThreadedRendering`).
+
+The items having the `ThreadedRendering` attribute must be drawn by the
+worker threads of the plot, and the composited canvas must be identical to
+the canvas drawn by the GUI thread.
+"""
+
+import threading
+
+import numpy as np
+from qtpy import QtCore as QC
+from qtpy import QtGui as QG
+from qtpy import QtWidgets as QW
+
+from qwt import QwtPlot, QwtPlotCurve, QwtPlotGrid, QwtPlotItem, QwtPlotMarker
+
+
+class ThreadRecordingCurve(QwtPlotCurve):
+    def __init__(self, *args):
+        QwtPlotCurve.__init__(self, *args)
+        self.threads = set()
+
+    def draw(self, painter, xMap, yMap, canvasRect):
+        self.threads.add(threading.current_thread().name)
+        QwtPlotCurve.draw(self, painter, xMap, yMap, canvasRect)
+
+
+def make_plot(threads):
+    plot = QwtPlot("Threaded rendering")
+    plot.setRenderThreadCount(threads)
+    grid = QwtPlotGrid()
+    grid.attach(plot)
+    x = np.linspace(0, 10, 20000)
+    curves = []
+    for index, color in enumerate((QC.Qt.red, QC.Qt.darkGreen, QC.Qt.blue)):
+        curve = ThreadRecordingCurve("Curve %d" % index)
+        curve.setData(x, np.sin(x * (index + 1)) + 0.1 * np.cos(x * 50))
+        curve.setPen(QG.QPen(QG.QColor(color), 3))
+        curve.setRenderHint(QwtPlotItem.RenderAntialiased, index == 1)
+        curve.setItemAttribute(QwtPlotItem.ThreadedRendering, True)
+        curve.attach(plot)
+        curves.append(curve)
+    marker = QwtPlotMarker()
+    marker.setValue(5.0, 0.0)
+    marker.setLabel("Marker")
+    marker.attach(plot)
+    plot.setAxisScale(QwtPlot.xBottom, 0, 10)
+    plot.setAxisScale(QwtPlot.yLeft, -1.5, 1.5)
+    plot.resize(QC.QSize(600, 400))
+    return plot, curves
+
+
+def canvas_image(plot):
+    canvas = plot.canvas()
+    image = QG.QImage(canvas.size(), QG.QImage.Format_ARGB32)
+    image.fill(QC.Qt.white)
+    painter = QG.QPainter(image)
+    plot.drawCanvas(painter)
+    painter.end()
+    return image
+
+
+def test_threadedrendering():
+    """Threaded items must be drawn by the workers, in z-order."""
+    app = QW.QApplication.instance() or QW.QApplication([])
+    serial, serialCurves = make_plot(0)
+    threaded, threadedCurves = make_plot(2)
+    assert serial.renderThreadCount() == 0
+    assert threaded.renderThreadCount() == 2
+    for plot in (serial, threaded):
+        plot.show()
+    app.processEvents()
+    for plot in (serial, threaded):
+        plot.replot()
+    mainThread = threading.current_thread().name
+    for curve in serialCurves:
+        assert curve.threads == {mainThread}
+    for curve in threadedCurves:
+        curve.threads.clear()
+    reference = canvas_image(serial)
+    image = canvas_image(threaded)
+    for curve in threadedCurves:
+        assert curve.threads and mainThread not in curve.threads
+    assert image == reference
+
+    # Vector paint devices: the items are drawn by the GUI thread
+    for curve in threadedCurves:
+        curve.threads.clear()
+    picture = QG.QPicture()
+    painter = QG.QPainter(picture)
+    threaded.drawCanvas(painter)
+    painter.end()
+    for curve in threadedCurves:
+        assert curve.threads == {mainThread}
+
+    threaded.setRenderThreadCount(0)
+    for curve in threadedCurves:
+        curve.threads.clear()
+    assert canvas_image(threaded) == canvas_image(serial)
+    for curve in threadedCurves:
+        assert curve.threads == {mainThread}
+
+    # The worker threads are stopped when the plot is deleted
+    plot, curves = make_plot(2)
+    canvas_image(plot)
+    workers = [curve.threads for curve in curves]
+    workers = [
+        thread
+        for thread in threading.enumerate()
+        if any(thread.name in names for names in workers)
+    ]
+    assert workers
+    plot.deleteLater()
+    QC.QCoreApplication.sendPostedEvents(None, QC.QEvent.DeferredDelete)
+    for thread in workers:
+        thread.join(5.0)
+        assert not thread.is_alive()
+
+
+if __name__ == "__main__":
+    test_threadedrendering()
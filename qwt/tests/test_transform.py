@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the Qwt License
+# (see LICENSE file for more details)
+
+"""
+Test for the array API of `QwtTransform` and `QwtScaleMap`.
+
+The array methods (`transform_array`/`invTransform_array`) must give the same
+results as the scalar methods, for linear, logarithmic and power scales.
+"""
+
+import numpy as np
+
+from qwt import QwtScaleMap
+from qwt.transform import QwtLogTransform, QwtNullTransform, QwtPowerTransform
+
+
+def _check_transform(transform, values):
+    expected = np.array([transform.transform(v) for v in values.tolist()])
+    assert np.allclose(transform.transform_array(values), expected)
+    out = np.empty_like(values)
+    assert transform.transform_array(values, out=out) is out
+    assert np.allclose(out, expected)
+    assert np.allclose(transform.invTransform_array(out.copy()), values)
+    assert np.allclose(transform.invTransform_array(out, out=out), values)
+
+
+def test_transform_array():
+    """Array and scalar transformations must agree."""
+    _check_transform(QwtNullTransform(), np.linspace(-10.0, 10.0, 51))
+    _check_transform(QwtLogTransform(), np.logspace(-3.0, 3.0, 51))
+    _check_transform(QwtPowerTransform(2.0), np.linspace(-10.0, 10.0, 51))
+    _check_transform(QwtPowerTransform(3.0), np.linspace(-10.0, 10.0, 51))
+    log = QwtLogTransform()
+    assert log.bounded(-1.0) == log.LogMin
+    assert np.array_equal(log.bounded(np.array([-1.0, 2.0])), [log.LogMin, 2.0])
+    assert np.isfinite(log.transform_array(np.arange(5))).all()
+
+
+def test_scalemap_array():
+    """`QwtScaleMap.transform` must dispatch on the value type."""
+    for transform in (None, QwtLogTransform(), QwtPowerTransform(2.0)):
+        smap = QwtScaleMap()
+        smap.setTransformation(transform)
+        smap.setScaleInterval(1.0, 1000.0)
+        smap.setPaintInterval(500, 0)
+        values = np.linspace(1.0, 1000.0, 101)
+        expected = [smap.transform(value) for value in values.tolist()]
+        assert np.allclose(smap.transform(values), expected)
+        assert np.allclose(smap.invTransform(smap.transform(values)), values)
+        view = np.zeros((101, 2))[:, 1]
+        assert smap.transform_array(values, out=view) is view
+        assert np.allclose(view, expected)
+        assert np.array_equal(values, np.linspace(1.0, 1000.0, 101))
+
+
+if __name__ == "__main__":
+    test_transform_array()
+    test_scalemap_array()
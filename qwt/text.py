@@ -41,14 +41,27 @@ QwtRichTextEngine
 
 .. autoclass:: QwtRichTextEngine
    :members:
+
+Font metrics cache
+------------------
+
+.. autofunction:: set_metrics_disk_cache
+
+.. autofunction:: metrics_disk_cache
+
+.. autoclass:: QwtMetricsDiskCache
+   :members:
 """
 
+import json
 import math
 import os
-import struct
+import threading
+import weakref
 from collections import OrderedDict
 
-from qtpy.QtCore import QObject, QRectF, QSize, QSizeF, Qt
+import numpy as np
+from qtpy.QtCore import QObject, QRectF, QSize, QSizeF, QStandardPaths, Qt, qVersion
 from qtpy.QtGui import (
     QAbstractTextDocumentLayout,
     QColor,
@@ -56,6 +69,8 @@ from qtpy.QtGui import (
     QFontInfo,
     QFontMetrics,
     QFontMetricsF,
+    QGuiApplication,
+    QImage,
     QPainter,
     QPalette,
     QPixmap,
@@ -65,6 +80,7 @@ from qtpy.QtGui import (
 )
 from qtpy.QtWidgets import QApplication, QFrame, QSizePolicy, QWidget
 
+from qwt import caches
 from qwt.painter import QwtPainter
 from qwt.qthelpers import qcolor_from_str
 
@@ -213,6 +229,67 @@ ASCENTCACHE = OrderedDict()
 
 _FM_CACHE_LIMIT = 256  # max QFontMetrics / QFontMetricsF / ascent entries
 
+_PLAIN_TEXT_ENGINES = weakref.WeakSet()
+
+# The font metrics caches are shared by all the texts of the process, which
+# may be laid out by several threads (e.g. `qwt.render_service`): lookups are
+# atomic, but insertions and evictions are serialized by this lock
+_CACHE_LOCK = threading.Lock()
+
+
+def _cache_insert(cache, key, value):
+    with _CACHE_LOCK:
+        while len(cache) >= _FM_CACHE_LIMIT:
+            cache.popitem(last=False)
+        cache[key] = value
+
+
+def _clear_caches(dicts):
+    with _CACHE_LOCK:
+        caches.clear_dicts(dicts())
+
+
+def _evict_caches(dicts, count):
+    with _CACHE_LOCK:
+        return caches.evict_lru(dicts(), count)
+
+
+def _fm_caches():
+    dicts = []
+    for engine in list(_PLAIN_TEXT_ENGINES):
+        dicts += [engine._fm_cache, engine._fm_cache_f]
+    return dicts
+
+
+def _margins_caches():
+    return [engine._margins_cache for engine in list(_PLAIN_TEXT_ENGINES)]
+
+
+_FM_STATS = caches.register(
+    "font_metrics",
+    size=lambda: sum(len(cache) for cache in _fm_caches()),
+    clear=lambda: _clear_caches(_fm_caches),
+    evict=lambda count: _evict_caches(_fm_caches, count),
+    policy="fifo",
+    entryCost=200,
+)
+_MARGINS_STATS = caches.register(
+    "text_margins",
+    size=lambda: sum(len(cache) for cache in _margins_caches()),
+    clear=lambda: _clear_caches(_margins_caches),
+    evict=lambda count: _evict_caches(_margins_caches, count),
+    policy="fifo",
+    entryCost=150,
+)
+_ASCENT_STATS = caches.register(
+    "font_ascent",
+    size=lambda: len(ASCENTCACHE),
+    clear=lambda: _clear_caches(lambda: [ASCENTCACHE]),
+    evict=lambda count: _evict_caches(lambda: [ASCENTCACHE], count),
+    policy="fifo",
+    entryCost=120,
+)
+
 
 # Single-slot, leak-free memo for ``QFont.key()``.
 #
@@ -230,9 +307,23 @@ _FM_CACHE_LIMIT = 256  # max QFontMetrics / QFontMetricsF / ascent entries
 # Retaining that one font is precisely what makes the ``id()`` comparison safe
 # against id reuse. On a miss the real ``font.key()`` is recomputed, so the
 # result is always lossless and correct.
-_LAST_FONT = None
-_LAST_FONT_ID = None
-_LAST_FONT_KEY = None
+#
+# The slot is a single ``(font, id, key)`` tuple, replaced at once, so that
+# threads rendering concurrently never pair a font id with another font key.
+_LAST_FONT_SLOT = (None, None, None)
+
+
+def _clear_font_key_memo():
+    global _LAST_FONT_SLOT
+    _LAST_FONT_SLOT = (None, None, None)
+
+
+_FONT_KEY_STATS = caches.register(
+    "font_key",
+    size=lambda: 0 if _LAST_FONT_SLOT[0] is None else 1,
+    clear=_clear_font_key_memo,
+    entryCost=300,
+)
 
 
 def font_key_cached(font):
@@ -244,25 +335,148 @@ def font_key_cached(font):
     :param QFont font: Font
     :return: ``font.key()``
     """
-    global _LAST_FONT, _LAST_FONT_ID, _LAST_FONT_KEY
+    global _LAST_FONT_SLOT
     fid = id(font)
-    if fid == _LAST_FONT_ID:
-        return _LAST_FONT_KEY
+    _font, lastId, lastKey = _LAST_FONT_SLOT
+    if fid == lastId:
+        _FONT_KEY_STATS.hits += 1
+        return lastKey
+    _FONT_KEY_STATS.misses += 1
     key = font.key()
-    _LAST_FONT = font
-    _LAST_FONT_ID = fid
-    _LAST_FONT_KEY = key
+    _LAST_FONT_SLOT = (font, fid, key)
     return key
 
 
+def qwtDesktop():
+    """Return the desktop widget, or None (Qt 6, or no `QApplication`)"""
+    if not isinstance(QGuiApplication.instance(), QApplication):
+        return None  # without QApplication, QDesktopWidget can't be created
+    try:
+        return QApplication.desktop()
+    except AttributeError:
+        return None
+
+
 def get_screen_resolution():
     """Return screen resolution: tuple of floats (DPIx, DPIy)"""
-    try:
-        desktop = QApplication.desktop()
+    desktop = qwtDesktop()
+    if desktop is not None:
         return (desktop.logicalDpiX(), desktop.logicalDpiY())
-    except AttributeError:
-        screen = QApplication.primaryScreen()
-        return (screen.logicalDotsPerInchX(), screen.logicalDotsPerInchY())
+    screen = QGuiApplication.primaryScreen()
+    return (screen.logicalDotsPerInchX(), screen.logicalDotsPerInchY())
+
+
+class QwtMetricsDiskCache(object):
+    """
+    Persistent cache of font metrics which are costly to compute
+
+    The effective ascent of fonts (see `QwtPlainTextEngine.effectiveAscent`)
+    is computed by rendering a glyph into a pixmap. This cache stores the
+    results in a JSON file, so that they may be reused by the next processes
+    instead of being computed again. Entries are keyed on the font key, the
+    Qt version and the screen resolution.
+
+    :param str path: Path of the cache file
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.__entries = None
+        self.__prefix = None
+        self.__lock = threading.Lock()  # threads share the temporary file
+
+    def __key(self, fontKey):
+        if self.__prefix is None:
+            try:
+                dpi = "%gx%g" % get_screen_resolution()
+            except AttributeError:  # no QApplication instance (yet)
+                return None
+            self.__prefix = "%s|%s|" % (qVersion(), dpi)
+        return self.__prefix + fontKey
+
+    def __read(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as fdesc:
+                entries = json.load(fdesc)
+        except (OSError, ValueError):
+            return {}
+        return entries if isinstance(entries, dict) else {}
+
+    def lookup(self, fontKey):
+        """
+        :param str fontKey: Font key (see `QFont.key()`)
+        :return: Cached effective ascent, or None
+        """
+        key = self.__key(fontKey)
+        if key is None:
+            return None
+        if self.__entries is None:
+            self.__entries = self.__read()
+        return self.__entries.get(key)
+
+    def insert(self, fontKey, ascent):
+        """
+        Store the effective ascent of a font, and save the cache file
+
+        :param str fontKey: Font key (see `QFont.key()`)
+        :param int ascent: Effective ascent
+        """
+        key = self.__key(fontKey)
+        if key is None:
+            return
+        with self.__lock:
+            # Merge entries saved in the meantime by other processes
+            entries = self.__read()
+            entries[key] = ascent
+            self.__entries = entries
+            tmppath = "%s.%d.tmp" % (self.path, os.getpid())
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                with open(tmppath, "w", encoding="utf-8") as fdesc:
+                    json.dump(entries, fdesc)
+                os.replace(tmppath, self.path)
+            except OSError:
+                pass
+
+
+_METRICS_DISK_CACHE = None
+
+
+def set_metrics_disk_cache(state, path=None):
+    """
+    Enable or disable the persistent font metrics cache
+
+    The persistent cache is disabled by default. It is useful for
+    applications starting many short-lived processes which are all using
+    the same fonts.
+
+    :param bool state: On/off
+    :param str path: Path of the cache file (default: `PythonQwt/metrics.json`
+     in the user cache directory)
+
+    .. seealso::
+
+        :py:class:`qwt.text.QwtMetricsDiskCache`
+    """
+    global _METRICS_DISK_CACHE
+    if not state:
+        _METRICS_DISK_CACHE = None
+        return
+    if path is None:
+        cachedir = QStandardPaths.writableLocation(QStandardPaths.GenericCacheLocation)
+        path = os.path.join(cachedir, "PythonQwt", "metrics.json")
+    _METRICS_DISK_CACHE = QwtMetricsDiskCache(path)
+
+
+def metrics_disk_cache():
+    """
+    :return: Persistent font metrics cache, or None if disabled
+
+    .. seealso::
+
+        :py:func:`set_metrics_disk_cache()`
+    """
+    return _METRICS_DISK_CACHE
 
 
 def qwtUnscaleFont(painter):
@@ -271,9 +485,10 @@ def qwtUnscaleFont(painter):
     dpix, dpiy = get_screen_resolution()
     pd = painter.device()
     if pd.logicalDpiX() != dpix or pd.logicalDpiY() != dpiy:
-        try:
-            pixelFont = QFont(painter.font(), QApplication.desktop())
-        except AttributeError:
+        desktop = qwtDesktop()
+        if desktop is not None:
+            pixelFont = QFont(painter.font(), desktop)
+        else:
             pixelFont = QFont(painter.font())
         pixelFont.setPixelSize(QFontInfo(pixelFont).pixelSize())
         painter.setFont(pixelFont)
@@ -292,27 +507,31 @@ class QwtPlainTextEngine(QwtTextEngine):
         self._fm_cache = OrderedDict()
         self._fm_cache_f = OrderedDict()
         self._margins_cache = OrderedDict()
+        with _CACHE_LOCK:
+            _PLAIN_TEXT_ENGINES.add(self)
 
     def fontmetrics(self, font):
         fid = font_key_cached(font)
         try:
-            return self._fm_cache[fid]
+            fm = self._fm_cache[fid]
+            _FM_STATS.hits += 1
+            return fm
         except KeyError:
-            if len(self._fm_cache) >= _FM_CACHE_LIMIT:
-                self._fm_cache.popitem(last=False)
+            _FM_STATS.misses += 1
             fm = QFontMetrics(font)
-            self._fm_cache[fid] = fm
+            _cache_insert(self._fm_cache, fid, fm)
             return fm
 
     def fontmetrics_f(self, font):
         fid = font_key_cached(font)
         try:
-            return self._fm_cache_f[fid]
+            fm = self._fm_cache_f[fid]
+            _FM_STATS.hits += 1
+            return fm
         except KeyError:
-            if len(self._fm_cache_f) >= _FM_CACHE_LIMIT:
-                self._fm_cache_f.popitem(last=False)
+            _FM_STATS.misses += 1
             fm = QFontMetricsF(font)
-            self._fm_cache_f[fid] = fm
+            _cache_insert(self._fm_cache_f, fid, fm)
             return fm
 
     def heightForWidth(self, font, flags, text, width):
@@ -346,11 +565,17 @@ class QwtPlainTextEngine(QwtTextEngine):
         fontKey = font_key_cached(font)
         ascent = ASCENTCACHE.get(fontKey)
         if ascent is not None:
+            _ASCENT_STATS.hits += 1
             return ascent
-        if len(ASCENTCACHE) >= _FM_CACHE_LIMIT:
-            ASCENTCACHE.popitem(last=False)
-        ascent = self.findAscent(font)
-        ASCENTCACHE[fontKey] = ascent
+        _ASCENT_STATS.misses += 1
+        diskCache = _METRICS_DISK_CACHE
+        if diskCache is not None:
+            ascent = diskCache.lookup(fontKey)
+        if ascent is None:
+            ascent = self.findAscent(font)
+            if diskCache is not None:
+                diskCache.insert(fontKey, ascent)
+        _cache_insert(ASCENTCACHE, fontKey, ascent)
         return ascent
 
     def findAscent(self, font):
@@ -367,19 +592,18 @@ class QwtPlainTextEngine(QwtTextEngine):
         p.drawText(0, 0, pm.width(), pm.height(), 0, dummy)
         p.end()
 
-        img = pm.toImage()
+        img = pm.toImage().convertToFormat(QImage.Format_RGB32)
 
-        w = pm.width()
-        linebytes = w * 4
-        for row in range(img.height()):
-            if QT_API.startswith("pyside"):
-                line = bytes(img.scanLine(row))
-            else:
-                line = img.scanLine(row).asstring(linebytes)
-            for col in range(w):
-                color = struct.unpack("I", line[col * 4 : (col + 1) * 4])[0]
-                if color != white.rgb():
-                    return fm.ascent() - row + 1
+        # Find the first row containing a non-white pixel
+        nbytes = img.height() * img.bytesPerLine()
+        if QT_API.startswith("pyside"):
+            data = bytes(img.constBits())[:nbytes]
+        else:
+            data = img.constBits().asstring(nbytes)
+        pixels = np.frombuffer(data, np.uint32).reshape(img.height(), -1)
+        rows = np.flatnonzero((pixels[:, : pm.width()] != white.rgb()).any(axis=1))
+        if rows.size:
+            return fm.ascent() - int(rows[0]) + 1
         return fm.ascent()
 
     def textMargins(self, font):
@@ -397,11 +621,12 @@ class QwtPlainTextEngine(QwtTextEngine):
         fkey = font_key_cached(font)
         cached = self._margins_cache.get(fkey)
         if cached is None:
+            _MARGINS_STATS.misses += 1
             fm = self.fontmetrics(font)
             cached = (0, 0, fm.ascent() - self.effectiveAscent(font), fm.descent())
-            if len(self._margins_cache) >= _FM_CACHE_LIMIT:
-                self._margins_cache.popitem(last=False)
-            self._margins_cache[fkey] = cached
+            _cache_insert(self._margins_cache, fkey, cached)
+        else:
+            _MARGINS_STATS.hits += 1
         return cached
 
     def draw(self, painter, rect, flags, text):
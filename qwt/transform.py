@@ -34,6 +34,8 @@ QwtPowerTransform
    :members:
 """
 
+import math
+
 import numpy as np
 
 
@@ -51,6 +53,11 @@ class QwtTransform(object):
 
     where one is is the inverse function of the other.
 
+    Both methods have an array counterpart, `transform_array` and
+    `invTransform_array`, which are used by `QwtScaleMap` to map whole
+    series at once. The scalar methods are reserved to the scalar path
+    (tick positions, markers, ...) and don't have to support arrays.
+
     When p1, p2 are the boundaries of the paint device coordinates
     and s1, s2 the boundaries of the scale, QwtScaleMap uses the
     following calculations::
@@ -95,6 +102,46 @@ class QwtTransform(object):
         """
         raise NotImplementedError
 
+    def transform_array(self, values, out=None):
+        """
+        Transformation function applied to an array
+
+        The default implementation calls `transform()` on the whole array.
+
+        :param numpy.ndarray values: Values
+        :param numpy.ndarray out: Optional output array
+        :return: Modified values (`out`, if it was provided)
+
+        .. seealso::
+
+            :py:meth:`transform()`, :py:meth:`invTransform_array()`
+        """
+        result = self.transform(np.asarray(values, dtype=np.float64))
+        if out is None:
+            return result
+        out[...] = result
+        return out
+
+    def invTransform_array(self, values, out=None):
+        """
+        Inverse transformation function applied to an array
+
+        The default implementation calls `invTransform()` on the whole array.
+
+        :param numpy.ndarray values: Values
+        :param numpy.ndarray out: Optional output array
+        :return: Modified values (`out`, if it was provided)
+
+        .. seealso::
+
+            :py:meth:`invTransform()`, :py:meth:`transform_array()`
+        """
+        result = self.invTransform(np.asarray(values, dtype=np.float64))
+        if out is None:
+            return result
+        out[...] = result
+        return out
+
     def copy(self):
         """
         :return: Clone of the transformation
@@ -131,6 +178,21 @@ class QwtNullTransform(QwtTransform):
         """
         return value
 
+    def transform_array(self, values, out=None):
+        """
+        Transformation function applied to an array
+
+        :param numpy.ndarray values: Values
+        :param numpy.ndarray out: Optional output array
+        :return: Modified values (`out`, if it was provided)
+        """
+        if out is None:
+            return values
+        out[...] = values
+        return out
+
+    invTransform_array = transform_array
+
     def copy(self):
         """
         :return: Clone of the transformation
@@ -166,11 +228,13 @@ class QwtLogTransform(QwtTransform):
         """
         Modify value to be a valid value for the transformation.
 
-        :param float value: Value to be bounded
+        :param value: Value to be bounded
+        :type value: float or numpy.ndarray
         :return: Value modified
         """
-        bval = np.clip(np.asarray(value, dtype=np.float64), self.LogMin, self.LogMax)
-        return bval.item() if bval.ndim == 0 else bval
+        if isinstance(value, np.ndarray):
+            return np.clip(value, self.LogMin, self.LogMax)
+        return min(max(value, self.LogMin), self.LogMax)
 
     def transform(self, value):
         """
@@ -183,7 +247,9 @@ class QwtLogTransform(QwtTransform):
 
             :py:meth:`invTransform()`
         """
-        return np.log(self.bounded(value))
+        if isinstance(value, np.ndarray):
+            return self.transform_array(value)
+        return math.log(min(max(value, self.LogMin), self.LogMax))
 
     def invTransform(self, value):
         """
@@ -198,6 +264,35 @@ class QwtLogTransform(QwtTransform):
         """
         return np.exp(value)
 
+    def transform_array(self, values, out=None):
+        """
+        Transformation function applied to an array
+
+        :param numpy.ndarray values: Values
+        :param numpy.ndarray out: Optional output array
+        :return: Modified values (`out`, if it was provided)
+
+        .. seealso::
+
+            :py:meth:`invTransform_array()`
+        """
+        out = np.clip(values, self.LogMin, self.LogMax, out=out, dtype=np.float64)
+        return np.log(out, out=out)
+
+    def invTransform_array(self, values, out=None):
+        """
+        Inverse transformation function applied to an array
+
+        :param numpy.ndarray values: Values
+        :param numpy.ndarray out: Optional output array
+        :return: Modified values (`out`, if it was provided)
+
+        .. seealso::
+
+            :py:meth:`transform_array()`
+        """
+        return np.exp(values, out=out)
+
     def copy(self):
         """
         :return: Clone of the transformation
@@ -230,10 +325,9 @@ class QwtPowerTransform(QwtTransform):
 
             :py:meth:`invTransform()`
         """
-        if value < 0.0:
-            return -np.pow(-value, 1.0 / self.__exponent)
-        else:
-            return np.pow(value, 1.0 / self.__exponent)
+        if isinstance(value, np.ndarray):
+            return self.transform_array(value)
+        return math.copysign(abs(value) ** (1.0 / self.__exponent), value)
 
     def invTransform(self, value):
         """
@@ -246,10 +340,44 @@ class QwtPowerTransform(QwtTransform):
 
             :py:meth:`transform()`
         """
-        if value < 0.0:
-            return -np.pow(-value, self.__exponent)
-        else:
-            return np.pow(value, self.__exponent)
+        if isinstance(value, np.ndarray):
+            return self.invTransform_array(value)
+        return math.copysign(abs(value) ** self.__exponent, value)
+
+    def __power_array(self, values, exponent, out):
+        if out is not None and np.shares_memory(values, out):
+            values = values.copy()  # the sign is needed after `out` is written
+        out = np.abs(values, out=out, dtype=np.float64)
+        np.power(out, exponent, out=out)
+        return np.copysign(out, values, out=out)
+
+    def transform_array(self, values, out=None):
+        """
+        Transformation function applied to an array
+
+        :param numpy.ndarray values: Values
+        :param numpy.ndarray out: Optional output array
+        :return: Modified values (`out`, if it was provided)
+
+        .. seealso::
+
+            :py:meth:`invTransform_array()`
+        """
+        return self.__power_array(values, 1.0 / self.__exponent, out)
+
+    def invTransform_array(self, values, out=None):
+        """
+        Inverse transformation function applied to an array
+
+        :param numpy.ndarray values: Values
+        :param numpy.ndarray out: Optional output array
+        :return: Modified values (`out`, if it was provided)
+
+        .. seealso::
+
+            :py:meth:`transform_array()`
+        """
+        return self.__power_array(values, self.__exponent, out)
 
     def copy(self):
         """
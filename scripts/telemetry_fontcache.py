@@ -4,8 +4,7 @@ Measures, over repeated build/destroy cycles of a :class:`qwt.QwtPlot`:
 
 * live Qt / Qwt objects (``QFont``, ``QPixmap``, ``QFontMetrics``,
   ``QwtText``, ``QwtScaleDraw``);
-* internal cache sizes (the single-slot font memo plus the metrics caches in
-  :mod:`qwt.text`);
+* internal cache sizes (as reported by :func:`qwt.stats.snapshot`);
 * per-cycle render time.
 
 It is the tool used to verify that the font-key cache no longer retains
@@ -59,14 +58,23 @@ def count(typename: str) -> int:
 
 
 def cache_sizes() -> dict:
-    """Return a snapshot of the relevant cache sizes in :mod:`qwt.text`.
+    """Return a snapshot of the internal cache sizes.
 
-    Works against both the fixed code (single-slot ``_LAST_FONT`` memo) and any
-    older revision that still exposes the retaining ``_FONT_KEY_CACHE`` dict, so
-    the script can be used to compare before/after.
+    The sizes are read from :func:`qwt.stats.snapshot`. Older revisions, which
+    don't provide :mod:`qwt.stats`, are probed through the private caches of
+    :mod:`qwt.text` (single-slot ``_LAST_FONT`` memo or the retaining
+    ``_FONT_KEY_CACHE`` dict), so the script can be used to compare
+    before/after.
 
     :return: Mapping of cache name to current size
     """
+    try:
+        from qwt import stats
+    except ImportError:
+        pass
+    else:
+        caches = stats.snapshot()["caches"]
+        return {name: cache["size"] for name, cache in caches.items()}
     sizes = {}
     if hasattr(qtext, "_LAST_FONT"):
         sizes["memo_font"] = 0 if qtext._LAST_FONT is None else 1